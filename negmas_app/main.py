@@ -8,21 +8,22 @@ import sys
 import time
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, Any
 
 import typer
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 from rich.console import Console
 from rich.panel import Panel
-from rich.prompt import Confirm, IntPrompt, Prompt
+from rich.prompt import Confirm, Prompt
 from rich.table import Table
 from rich import box
 
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
 
 # Lifespan context manager for startup/shutdown events
 @asynccontextmanager
-async def lifespan(app: FastAPI):
+async def lifespan(app: "FastAPI"):
     """Handle startup and shutdown events."""
     # Startup
     from .routers.scenarios import get_loader
@@ -42,6 +43,32 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         console.print(f"[red]✗ Registry initialization failed: {e}[/red]")
 
+    # Revalidate the negotiator manifest (or build it on first start)
+    from .services.negotiator_factory import NegotiatorFactory
+
+    if NegotiatorFactory.start_background_discovery():
+        console.print("[yellow]Discovering negotiators in background...[/yellow]")
+
+    # Inspect negotiator parameters missing from the parameter cache (all of
+    # them after installing or upgrading negotiator packages) so parameter
+    # panels open without importing the negotiators
+    from .services.parameter_inspector import warm_parameter_cache
+
+    async def warm_parameters():
+        try:
+            count = await asyncio.to_thread(warm_parameter_cache)
+            if count:
+                console.print(f"[green]✓ Inspected {count} negotiator types[/green]")
+        except Exception as e:
+            console.print(f"[red]✗ Parameter inspection failed: {e}[/red]")
+
+    asyncio.create_task(warm_parameters())
+
+    # Watch for handlers blocking the event loop (see /api/system/metrics)
+    from .services.server_metrics import start_loop_monitor, stop_loop_monitor
+
+    start_loop_monitor()
+
     # Start background scenario registration
     console.print("[yellow]Starting background scenario registration...[/yellow]")
     loader = get_loader()
@@ -56,75 +83,139 @@ async def lifespan(app: FastAPI):
     # Don't wait for registration to complete - let it run in background
     asyncio.create_task(register_scenarios())
 
+    # Index saved negotiations changed while the server was not running
+    from .services.negotiation_storage import NegotiationStorageService
+
+    async def reconcile_negotiation_index():
+        try:
+            count = await asyncio.to_thread(
+                NegotiationStorageService.reconcile_index, True
+            )
+            if count:
+                console.print(f"[green]✓ Indexed {count} saved negotiations[/green]")
+        except Exception as e:
+            console.print(f"[red]✗ Negotiation indexing failed: {e}[/red]")
+
+    asyncio.create_task(reconcile_negotiation_index())
+
+    # Finish deletions interrupted by a restart
+    from .services import negotiation_storage
+    from .services.deletion_queue import TRASH_DIR_NAME, DeletionQueue
+    from .services.tournament_storage import TournamentStorageService
+
+    for root in (
+        TournamentStorageService.TOURNAMENTS_DIR,
+        negotiation_storage.NEGOTIATIONS_DIR,
+        negotiation_storage.ARCHIVE_DIR,
+    ):
+        DeletionQueue.resume(root / TRASH_DIR_NAME)
+
     yield
 
     # Shutdown
-    # Nothing to clean up currently
-
-
-# Import routers
-from .routers import (
-    scenarios_router,
-    negotiators_router,
-    negotiation_router,
-    settings_router,
-    genius_router,
-    mechanisms_router,
-    tournament_router,
-    sources_router,
-    components_router,
-    cache_router,
-    filters_router,
-)
-from .routers.system import router as system_router
-
-# Create FastAPI app with lifespan
-app = FastAPI(
-    title="NegMAS App",
-    description="Vue.js frontend for NegMAS - Run and monitor negotiations",
-    version="0.1.0",
-    lifespan=lifespan,
-)
+    stop_loop_monitor()
+    from .services.negotiation_preview_service import NegotiationPreviewService
 
-# Add CORS middleware for development (Vite dev server runs on different port)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[
-        "http://localhost:5174",  # Vite dev server
-        "http://127.0.0.1:5174",
-        "http://localhost:8019",  # Backend
-        "http://127.0.0.1:8019",
-    ],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+    NegotiationPreviewService.shutdown()
+    from .services.scenario_metrics import shutdown_metrics_pool
+
+    shutdown_metrics_pool()
+    from .services.parameter_inspector import save_parameter_cache
+
+    save_parameter_cache()
+    # Tournament worker processes (started by the first tournament)
+    from .routers.tournament import get_manager
+
+    get_manager().worker_pool.shutdown()
+
+
+def create_app() -> "FastAPI":
+    """Build the FastAPI application.
 
-# Include routers
-app.include_router(scenarios_router)
-app.include_router(negotiators_router)
-app.include_router(negotiation_router)
-app.include_router(settings_router)
-app.include_router(genius_router)
-app.include_router(mechanisms_router)
-app.include_router(tournament_router)
-app.include_router(sources_router)
-app.include_router(components_router)
-app.include_router(cache_router)
-app.include_router(filters_router)
-app.include_router(system_router)
-
-
-@app.get("/api/identity")
-async def identity():
-    """Return app identity for verification.
-
-    Used by the kill command to verify that the process on a port is negmas-app.
+    FastAPI, the routers and the services they use are imported here rather
+    than at module level so that CLI commands (kill, cache, setup, ...) do not
+    pay for importing the whole backend.
     """
-    return {
-        "app": "negmas-app",
-        "version": app.version,
-    }
+    from fastapi import FastAPI
+    from fastapi.middleware.cors import CORSMiddleware
+
+    from .routers import (
+        scenarios_router,
+        negotiators_router,
+        negotiation_router,
+        settings_router,
+        genius_router,
+        mechanisms_router,
+        tournament_router,
+        sources_router,
+        components_router,
+        cache_router,
+        filters_router,
+    )
+    from .routers.system import router as system_router
+
+    # Create FastAPI app with lifespan
+    app = FastAPI(
+        title="NegMAS App",
+        description="Vue.js frontend for NegMAS - Run and monitor negotiations",
+        version="0.1.0",
+        lifespan=lifespan,
+    )
+
+    # Add CORS middleware for development (Vite dev server runs on different port)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=[
+            "http://localhost:5174",  # Vite dev server
+            "http://127.0.0.1:5174",
+            "http://localhost:8019",  # Backend
+            "http://127.0.0.1:8019",
+        ],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Per-route latency histograms (see /api/system/metrics)
+    from .services.server_metrics import LatencyMiddleware
+
+    app.add_middleware(LatencyMiddleware)
+
+    # Include routers
+    app.include_router(scenarios_router)
+    app.include_router(negotiators_router)
+    app.include_router(negotiation_router)
+    app.include_router(settings_router)
+    app.include_router(genius_router)
+    app.include_router(mechanisms_router)
+    app.include_router(tournament_router)
+    app.include_router(sources_router)
+    app.include_router(components_router)
+    app.include_router(cache_router)
+    app.include_router(filters_router)
+    app.include_router(system_router)
+
+    @app.get("/api/identity")
+    async def identity():
+        """Return app identity for verification.
+
+        Used by the kill command to verify that the process on a port is negmas-app.
+        """
+        return {
+            "app": "negmas-app",
+            "version": app.version,
+        }
+
+    return app
+
+
+def __getattr__(name: str) -> Any:
+    """Create the ASGI app on first access (e.g. uvicorn loading ``main:app``)."""
+    if name == "app":
+        app = create_app()
+        globals()["app"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Typer CLI app
@@ -151,16 +242,22 @@ def main(ctx: typer.Context) -> None:
 
 
 def check_and_setup_scenarios() -> bool:
-    """Check if scenarios are set up, and if not, prompt user to set them up.
+    """Check if scenarios are set up, and if not, serve them from scenarios.zip.
+
+    On first start nothing is extracted: bundled scenarios are registered from
+    the archive and each one is extracted when it is first used. ``negmas-app
+    setup`` still extracts everything up front (and can build caches).
 
     Returns:
-        True if scenarios are ready, False if user declined setup.
+        True if scenarios are ready, False if the bundled scenarios are missing.
     """
     from .services.setup_service import SetupService
-    from .services.scenario_cache_service import ScenarioCacheService
 
     scenarios_dir = Path.home() / "negmas" / "app" / "scenarios"
 
+    if SetupService.lazy_scenarios_enabled(scenarios_dir):
+        return True
+
     # Check if scenarios directory exists and has content
     if scenarios_dir.exists():
         # Count scenario files
@@ -170,139 +267,25 @@ def check_and_setup_scenarios() -> bool:
         if len(scenario_files) > 10:  # Arbitrary threshold - should have hundreds
             return True
 
-    # Scenarios not set up - prompt user
-    console.print()
-    console.print(
-        Panel(
-            "[bold yellow]Scenarios Not Found[/bold yellow]\n\n"
-            "NegMAS App requires scenarios to be extracted from the bundled scenarios.zip file.\n"
-            f"Scenarios will be extracted to: [cyan]{scenarios_dir}[/cyan]",
-            border_style="yellow",
-            padding=(1, 2),
-        )
-    )
-
-    # Ask if user wants to set up
-    if not Confirm.ask("\nWould you like to extract scenarios now?", default=True):
-        console.print(
-            "[yellow]Scenarios not extracted. The app may not function properly.[/yellow]"
-        )
+    try:
+        SetupService.get_bundled_scenarios_zip()
+        SetupService.enable_lazy_scenarios(scenarios_dir)
+    except Exception as e:
+        console.print(f"[red]✗ Error setting up scenarios: {e}[/red]")
         return False
 
-    console.print()
-
-    # Ask about cache options
-    console.print("[bold]Cache Options[/bold]\n")
-
-    # Create explanation table
-    table = Table(show_header=True, header_style="bold cyan", show_lines=True)
-    table.add_column("Cache Type", style="cyan", width=12)
-    table.add_column("Description", width=50)
-    table.add_column("Size", justify="right", width=10)
-
-    table.add_row(
-        "Info",
-        "Basic scenario information (outcomes count, issue names, etc.)\n"
-        "→ Speeds up scenario browsing",
-        "~1 MB",
-    )
-    table.add_row(
-        "Stats",
-        "Pre-calculated statistics (Pareto frontier, Nash, Kalai, etc.)\n"
-        "→ Speeds up initial scenario view and analysis",
-        "~1-5 MB",
-    )
-    table.add_row(
-        "Plots",
-        "Pre-rendered outcome space visualizations\n"
-        "→ Instant plot display, no calculation needed",
-        "~10-20 MB",
-    )
-
-    console.print(table)
-    console.print()
-
-    # Ask about each cache type
-    build_info = Confirm.ask("Build [cyan]info[/cyan] cache?", default=True)
-    build_stats = Confirm.ask("Build [magenta]stats[/magenta] cache?", default=True)
-    build_plots = Confirm.ask("Build [yellow]plots[/yellow] cache?", default=False)
-
-    max_pareto_outcomes = None
-    if build_stats:
-        console.print("\n[dim]Stats Optimization:[/dim]")
-        limit_pareto = Confirm.ask(
-            "  Limit [bold]Pareto frontier[/bold] storage? (saves disk space for large scenarios)",
-            default=False,
-        )
-        if limit_pareto:
-            max_pareto_outcomes = IntPrompt.ask(
-                "  Maximum Pareto outcomes to save",
-                default=10000,
-            )
-
     console.print()
     console.print(
         Panel(
-            "Extracting scenarios and building caches...",
-            title="[bold green]Setup Progress[/bold green]",
+            "[bold green]Scenarios Ready[/bold green]\n\n"
+            "Bundled scenarios are loaded directly from scenarios.zip and extracted to "
+            f"[cyan]{scenarios_dir}[/cyan] the first time they are used.\n"
+            "[dim]To extract all scenarios and build info/stats/plot caches up front, "
+            "run: negmas-app setup[/dim]",
             border_style="green",
+            padding=(1, 2),
         )
     )
-
-    # Extract scenarios (always include cache files if they exist in zip)
-    try:
-        stats = SetupService.copy_bundled_scenarios(
-            target_dir=scenarios_dir,
-            force=False,
-            skip_cache=False,  # Include any pre-built cache files from zip
-        )
-
-        console.print(f"✓ Extracted {stats['copied']} scenario files")
-
-        if stats["errors"]:
-            console.print(
-                f"[yellow]⚠ {len(stats['errors'])} errors during extraction[/yellow]"
-            )
-
-    except Exception as e:
-        console.print(f"[red]✗ Error extracting scenarios: {e}[/red]")
-        return False
-
-    # Build additional caches if requested
-    if build_info or build_stats or build_plots:
-        console.print("\nBuilding caches...")
-        try:
-            cache_service = ScenarioCacheService(scenarios_root=scenarios_dir)
-            cache_results = cache_service.build_caches_with_progress(
-                build_info=build_info,
-                build_stats=build_stats,
-                build_plots=build_plots,
-                max_pareto_outcomes=max_pareto_outcomes,
-                refresh=False,  # Don't rebuild what's already there
-                console=console,
-            )
-
-            if build_info:
-                console.print(
-                    f"✓ Built {cache_results['info_created']} info cache files"
-                )
-            if build_stats:
-                console.print(
-                    f"✓ Built {cache_results['stats_created']} stats cache files"
-                )
-            if build_plots:
-                console.print(
-                    f"✓ Built {cache_results['plots_created']} plot cache files"
-                )
-
-        except Exception as e:
-            console.print(f"[yellow]⚠ Error building caches: {e}[/yellow]")
-            console.print(
-                "[dim]You can build caches later using: negmas-app cache build scenarios --all[/dim]"
-            )
-
-    console.print()
-    console.print("[bold green]✓ Setup complete![/bold green]\n")
     return True
 
 
@@ -900,6 +883,45 @@ def update_scenarios(
         sys.exit(1)
 
 
+@cli.command()
+def worker(
+    shard_dir: Annotated[
+        Path | None,
+        typer.Option(
+            help="Shards directory shared with the app (default ~/negmas/app/shards)"
+        ),
+    ] = None,
+    njobs: Annotated[
+        int | None,
+        typer.Option(help="Parallel jobs on this host (default: the tournament's)"),
+    ] = None,
+    exit_when_idle: Annotated[
+        bool,
+        typer.Option("--exit-when-idle", help="Exit once no batch is waiting"),
+    ] = False,
+) -> None:
+    """Run batches of sharded tournaments on this host.
+
+    Tournaments started with sharding enabled queue their scenarios as
+    batches in the shards directory. Run a worker on every host that can see
+    that directory (and the scenario paths) to share the work.
+
+    Examples:
+        negmas-app worker
+        negmas-app worker --shard-dir /mnt/lab/negmas-shards --njobs 8
+    """
+    from .services.shard_broker import SHARDS_DIR, run_worker
+
+    root = shard_dir or SHARDS_DIR
+    console.print(f"[bold cyan]Shard worker[/bold cyan] watching [bold]{root}[/bold]")
+    try:
+        n_batches = run_worker(root, njobs=njobs, exit_when_idle=exit_when_idle)
+    except KeyboardInterrupt:
+        console.print("\n[dim]Worker stopped.[/dim]")
+        return
+    console.print(f"[bold green]✓[/bold green] Ran {n_batches} batches")
+
+
 # ============================================================================
 # Cache Management Commands
 # ============================================================================
@@ -1286,5 +1308,38 @@ def cache_clear_scenarios(
         console.print("\n[dim]No cache files found to clear.[/dim]")
 
 
+@cache_clear_app.command("results")
+def cache_clear_results(
+    force: Annotated[
+        bool, typer.Option("--force", "-f", help="Skip confirmation prompt")
+    ] = False,
+) -> None:
+    """Clear the tournament result cache (runs reused across tournaments).
+
+    Examples:
+        negmas-app cache clear results
+        negmas-app cache clear results --force
+    """
+    from .services.result_cache import ResultCache
+
+    status = ResultCache.stats()
+    if not status["n_runs"]:
+        console.print("[dim]The result cache is empty.[/dim]")
+        return
+    if not force:
+        console.print(
+            f"\n[yellow]Warning:[/yellow] This will delete {status['n_runs']} "
+            f"cached runs in [bold]{status['path']}[/bold]"
+        )
+        if not typer.confirm("Are you sure you want to continue?"):
+            console.print("[dim]Cancelled.[/dim]")
+            raise typer.Exit(0)
+
+    removed = ResultCache.clear()
+    console.print(
+        f"\n[bold green]✓[/bold green] Removed {removed} runs from the result cache!"
+    )
+
+
 if __name__ == "__main__":
     cli()
@@ -27,6 +27,8 @@ from .scenario import (
     ScenarioInfo,
     IssueInfo,
     ScenarioStatsInfo,
+    ScenarioMetrics,
+    ScenarioQuery,
     ScenarioSource,
     IssueDefinition,
     ValueFunctionDefinition,
@@ -67,6 +69,13 @@ from .settings import (
     DisplayPreset,
     FullSessionPreset,
 )
+from .sweep import (
+    SweepDimension,
+    SweepConfig,
+    SweepPoint,
+    SweepRunResult,
+    SweepPointSummary,
+)
 from .tournament import (
     TournamentStatus,
     TournamentConfig,
@@ -105,6 +114,8 @@ __all__ = [
     "ScenarioInfo",
     "IssueInfo",
     "ScenarioStatsInfo",
+    "ScenarioMetrics",
+    "ScenarioQuery",
     "ScenarioSource",
     "IssueDefinition",
     "ValueFunctionDefinition",
@@ -142,6 +153,12 @@ __all__ = [
     "ParametersPreset",
     "DisplayPreset",
     "FullSessionPreset",
+    # Sweep
+    "SweepDimension",
+    "SweepConfig",
+    "SweepPoint",
+    "SweepRunResult",
+    "SweepPointSummary",
     # Tournament
     "TournamentStatus",
     "TournamentConfig",
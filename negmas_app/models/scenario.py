@@ -75,6 +75,85 @@ class ScenarioInfo:
         return len(self.issues)
 
 
+@dataclass
+class ScenarioMetrics:
+    """Metrics derived from the utility matrix of a scenario.
+
+    Computed by evaluating every ufun once on (a sample of) the outcome space.
+    """
+
+    # Total number of outcomes in the outcome space (None if continuous)
+    n_outcomes: int | None = None
+
+    # Number of outcomes the metrics were computed on
+    n_evaluated: int = 0
+
+    # Whether the outcomes were sampled instead of enumerated
+    sampled: bool = False
+
+    # Fraction of evaluated outcomes rational for all negotiators (0-1)
+    rational_fraction: float | None = None
+
+    # Opposition level: min distance of a rational outcome to (1, 1, ...)
+    opposition: float | None = None
+
+    # Reserved value per negotiator
+    reserved_values: list[float | None] = field(default_factory=list)
+
+    # Fraction of evaluated outcomes rational for each negotiator
+    individual_rational_fractions: list[float] = field(default_factory=list)
+
+    # Utility ranges per negotiator [(min, max), ...] over evaluated outcomes
+    utility_ranges: list[tuple[float, float]] = field(default_factory=list)
+
+
+@dataclass
+class ScenarioQuery:
+    """Filters, sorting and pagination for querying the scenario catalog.
+
+    Range bounds are inclusive; scenarios with an unknown value for a bounded
+    attribute are kept (as in the scenario picker).
+    """
+
+    # Case-insensitive substring of the name or any tag
+    search: str = ""
+
+    # Only scenarios from this source (applied before reverse)
+    source: str | None = None
+
+    # Scenarios must have all of these tags
+    tags: list[str] = field(default_factory=list)
+
+    min_outcomes: float | None = None
+    max_outcomes: float | None = None
+    min_negotiators: float | None = None
+    max_negotiators: float | None = None
+    min_opposition: float | None = None
+    max_opposition: float | None = None
+    min_rational_fraction: float | None = None
+    max_rational_fraction: float | None = None
+
+    # Require (True) or exclude (False) the normalized/anac/file tags
+    normalized: bool | None = None
+    anac: bool | None = None
+    file: bool | None = None
+
+    # Required format tag ("yaml", "xml", "json")
+    format: str | None = None
+
+    # Return the scenarios NOT matching the filters
+    reverse: bool = False
+
+    # Sort key ("name", "n_outcomes", "n_negotiators", "opposition",
+    # "rational_fraction"); None keeps registry order
+    sort_by: str | None = None
+    descending: bool = False
+
+    # Pagination (limit None returns everything after offset)
+    offset: int = 0
+    limit: int | None = None
+
+
 @dataclass
 class ScenarioStatsInfo:
     """Scenario statistics for API responses and display."""
@@ -3,11 +3,9 @@
 from dataclasses import dataclass, field
 from typing import Any
 
-# Try to import from negmas, fall back to local definition
-try:
-    from negmas.plots.util import SUPPORTED_IMAGE_FORMATS
-except ImportError:
-    SUPPORTED_IMAGE_FORMATS = {"webp", "png", "jpg", "jpeg", "svg", "pdf"}
+# Mirrors negmas.plots.util.SUPPORTED_IMAGE_FORMATS; importing that module pulls
+# in matplotlib and plotly, which is too heavy for a settings model.
+SUPPORTED_IMAGE_FORMATS = {"webp", "png", "jpg", "jpeg", "svg", "pdf"}
 
 
 @dataclass
@@ -236,6 +234,28 @@ class PerformanceSettings:
     # CSV is human-readable, parquet is optimized for storage/performance
     offers_storage_format: str = "parquet"
 
+    # Number of worker processes rendering negotiation preview images
+    # Previews are rendered off the save path; matplotlib is not thread-safe so
+    # each worker is a separate process
+    preview_workers: int = 2
+
+    # Number of worker processes for bulk stats calculation (0 = one per core)
+    stats_workers: int = 0
+
+    # Number of processes in the warm pool running tournament negotiations
+    # (0 = one per core). The pool is shared by all tournaments; each still
+    # runs at most as many negotiations at once as its njobs allows
+    tournament_workers: int = 0
+
+    # Tournament pool processes are replaced after running this many
+    # negotiations to bound leaks in negotiators (0 = never)
+    tournament_worker_max_tasks: int = 50
+
+    # Seconds allowed for calculating stats of a scenario with max_outcomes_stats
+    # outcomes; smaller scenarios get a proportional share (at least 30s).
+    # None or 0 disables the timeout
+    stats_timeout: float | None = 600.0
+
     def __post_init__(self) -> None:
         """Validate plot_image_format is supported."""
         if self.plot_image_format not in SUPPORTED_IMAGE_FORMATS:
@@ -484,6 +504,7 @@ class TournamentPreset:
     # Run ordering
     randomize_runs: bool = False
     sort_runs: bool = True
+    order_runs_by_cost: bool = False
     # Information hiding
     id_reveals_type: bool = True
     name_reveals_type: bool = True
@@ -0,0 +1,114 @@
+"""Parameter sweep configuration and result models."""
+
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from .negotiator import NegotiatorConfig
+
+# What a sweep dimension varies
+SweepTarget = Literal["negotiator", "mechanism"]
+# How points are generated from the dimensions
+SweepMode = Literal["grid", "random"]
+
+
+@dataclass
+class SweepDimension:
+    """A single parameter varied by a sweep.
+
+    Either give explicit ``values`` (used as-is for grid search and sampled
+    uniformly for random search) or a numeric range via ``min_value``/``max_value``.
+    Ranges are expanded into ``n_values`` evenly spaced points for grid search
+    and sampled continuously for random search.
+    """
+
+    # "negotiator" for constructor params, "mechanism" for n_steps/time_limit etc.
+    target: SweepTarget
+    # Parameter name (constructor argument or mechanism parameter)
+    name: str
+    # Index of the negotiator whose parameter is swept (target == "negotiator")
+    negotiator_index: int | None = None
+
+    # Explicit values to try
+    values: list[Any] = field(default_factory=list)
+
+    # Numeric range (used when values is empty)
+    min_value: float | None = None
+    max_value: float | None = None
+    n_values: int = 5  # Grid points for ranges
+    log_scale: bool = False
+
+    # UI type from parameter_inspector ('int', 'float', 'bool', 'choice', ...)
+    # Filled in by the sweep runner when not given
+    ui_type: str | None = None
+
+    @property
+    def key(self) -> str:
+        """Column name for this dimension in the results table."""
+        if self.target == "negotiator":
+            return f"{self.negotiator_index}.{self.name}"
+        return self.name
+
+
+@dataclass
+class SweepConfig:
+    """Configuration for a parameter sweep over a base negotiation."""
+
+    # Base negotiation
+    scenario_path: str
+    negotiator_configs: list[NegotiatorConfig]
+    mechanism_type: str = "SAOMechanism"
+    mechanism_params: dict[str, Any] = field(default_factory=dict)
+    scenario_options: dict[str, Any] = field(default_factory=dict)
+    share_ufuns: bool = False
+
+    # Search space
+    dimensions: list[SweepDimension] = field(default_factory=list)
+    mode: SweepMode = "grid"
+    n_samples: int = 20  # Number of points for random search
+    # Seeds to repeat every point with (one run per seed)
+    seeds: list[int] = field(default_factory=lambda: [0])
+    # Seed for random point generation (None = nondeterministic)
+    search_seed: int | None = None
+
+    # Execution (0 or None = all cores)
+    max_workers: int | None = None
+
+
+@dataclass
+class SweepPoint:
+    """One point in the sweep search space."""
+
+    index: int
+    values: dict[str, Any]  # {dimension key: value}
+
+
+@dataclass
+class SweepRunResult:
+    """Result of one run (a point repeated with one seed)."""
+
+    point_index: int
+    seed: int
+    agreement: dict[str, Any] | None = None
+    utilities: list[float] = field(default_factory=list)
+    welfare: float | None = None
+    n_steps: int = 0
+    duration: float = 0.0  # Wall-clock seconds
+    end_reason: str = ""
+    error: str | None = None
+
+
+@dataclass
+class SweepPointSummary:
+    """Aggregates over all runs of a sweep point (one row of the results table)."""
+
+    index: int
+    values: dict[str, Any]
+    n_runs: int = 0
+    n_errors: int = 0
+    n_agreements: int = 0
+    agreement_rate: float = 0.0
+    mean_utilities: list[float] = field(default_factory=list)
+    mean_welfare: float | None = None
+    std_welfare: float | None = None
+    mean_steps: float = 0.0
+    mean_duration: float = 0.0
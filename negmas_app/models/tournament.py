@@ -138,6 +138,8 @@ class TournamentConfig:
     sort_runs: bool = (
         True  # Sort runs by scenario/competitors (ignored if randomize_runs)
     )
+    # Start scenarios predicted to take longest first (overrides the two above)
+    order_runs_by_cost: bool = False
 
     # Information hiding
     id_reveals_type: bool = True  # Whether negotiator ID reveals its type
@@ -177,6 +179,24 @@ class TournamentConfig:
     # Execution
     njobs: int = -1  # -1 = serial (safer for web app), 0 = all cores
 
+    # Choose the number of parallel negotiations while running instead of
+    # njobs: start with one and follow the memory and CPU the negotiations
+    # use, keeping the system's memory under memory_limit_mb (None = 85% of
+    # the physical memory). Runs on the app's worker pool.
+    adaptive_njobs: bool = False
+    memory_limit_mb: int | None = None
+
+    # Reuse records of identical runs from earlier tournaments and negotiate
+    # only the missing pairings (deterministic negotiators only, needs save_path)
+    use_result_cache: bool = False
+
+    # Run batches of scenarios_per_shard scenarios on any host running
+    # `negmas-app worker`, through a work queue in shard_dir (a directory
+    # shared by all hosts, defaults to ~/negmas/app/shards)
+    sharded: bool = False
+    shard_dir: str | None = None
+    scenarios_per_shard: int = 1
+
     # Monitoring
     monitor_negotiations: bool = False  # Enable live monitoring of individual negotiations (requires negmas support)
     progress_sample_rate: int = (
@@ -314,6 +334,28 @@ class TournamentGridInit:
     storage_path: str | None = None  # Path where tournament results are saved
 
 
+@dataclass
+class TournamentGridSnapshot:
+    """State of every run in the grid, sent in one message (e.g. on reconnect).
+
+    Arrays span (competitor, opponent, scenario, repetition, rotation) as given
+    by shape. Each is flattened in C order, stored little endian, compressed
+    with zlib and base64-encoded.
+    """
+
+    competitors: list[str]
+    opponents: list[str]
+    scenarios: list[str]
+    shape: list[int]
+    n_completed: int
+    status: str  # int8 indices into status_codes
+    end_reason: str  # int8 indices into end_reason_codes, -1 while not ended
+    utilities: str  # float32 with a trailing axis of 2, NaN if unknown
+    n_steps: str  # int32, -1 if unknown
+    status_codes: list[str] = field(default_factory=list)
+    end_reason_codes: list[str] = field(default_factory=list)
+
+
 @dataclass
 class TournamentProgress:
     """Progress update for a running tournament."""
@@ -323,6 +365,11 @@ class TournamentProgress:
     current_scenario: str | None = None
     current_partners: list[str] | None = None
     percent: float = 0.0
+    # Estimated seconds until the tournament finishes (None until known)
+    eta_seconds: float | None = None
+    # Negotiations running at once and why (adaptive_njobs only)
+    workers: int | None = None
+    workers_reason: str | None = None
 
 
 @dataclass
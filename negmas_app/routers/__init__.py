@@ -1,16 +1,33 @@
-"""API routers for NegMAS App."""
+"""API routers for NegMAS App.
+
+Routers are imported lazily on first attribute access so that importing a
+single router module does not import every other router and its services.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .scenarios import router as scenarios_router
+    from .negotiators import router as negotiators_router
+    from .negotiation import router as negotiation_router
+    from .settings import router as settings_router
+    from .genius import router as genius_router
+    from .mechanisms import router as mechanisms_router
+    from .tournament import router as tournament_router
+    from .sources import router as sources_router
+    from .components import router as components_router
+    from .cache import router as cache_router
+    from .filters import router as filters_router
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{name.removesuffix('_router')}", __name__)
+    globals()[name] = module.router
+    return module.router
 
-from .scenarios import router as scenarios_router
-from .negotiators import router as negotiators_router
-from .negotiation import router as negotiation_router
-from .settings import router as settings_router
-from .genius import router as genius_router
-from .mechanisms import router as mechanisms_router
-from .tournament import router as tournament_router
-from .sources import router as sources_router
-from .components import router as components_router
-from .cache import router as cache_router
-from .filters import router as filters_router
 
 __all__ = [
     "scenarios_router",
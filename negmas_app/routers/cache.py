@@ -9,6 +9,7 @@ from typing import Annotated
 from fastapi import APIRouter, Query
 from sse_starlette.sse import EventSourceResponse
 
+from ..services.result_cache import ResultCache
 from ..services.scenario_cache_service import ScenarioCacheService
 
 router = APIRouter(prefix="/api/cache", tags=["cache"])
@@ -334,3 +335,16 @@ async def get_scenario_cache_status():
         "success": True,
         "status": stats,
     }
+
+
+@router.get("/results")
+async def get_result_cache_status():
+    """Number of negotiation runs in the tournament result cache and its size."""
+    return {"success": True, "status": await asyncio.to_thread(ResultCache.stats)}
+
+
+@router.delete("/results")
+async def clear_result_cache():
+    """Remove all runs from the tournament result cache."""
+    removed = await asyncio.to_thread(ResultCache.clear)
+    return {"success": True, "removed": removed}
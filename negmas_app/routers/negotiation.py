@@ -3,15 +3,18 @@
 import asyncio
 import json
 import math
+from dataclasses import asdict
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from pydantic import BaseModel
 from sse_starlette.sse import EventSourceResponse
 
-from ..models import NegotiatorConfig, OfferEvent, SessionInitEvent
-from ..services import SessionManager
+from ..models import NegotiatorConfig, OfferEvent, SessionInitEvent, SweepDimension
+from ..services import SessionManager, SweepRunner
+from ..services.bundled_scenarios import BundledScenarioArchive
+from ..services.settings_service import SettingsService
 from ..services.negotiation_storage import NegotiationStorageService
 
 router = APIRouter(prefix="/api/negotiation", tags=["negotiation"])
@@ -28,6 +31,15 @@ def get_manager() -> SessionManager:
     return _manager
 
 
+# Shown while a preview image is being rendered in the background
+PREVIEW_PLACEHOLDER_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="600" height="600" '
+    'viewBox="0 0 600 600"><rect width="600" height="600" fill="#f3f4f6"/>'
+    '<text x="300" y="300" font-family="sans-serif" font-size="24" '
+    'fill="#9ca3af" text-anchor="middle">Rendering preview...</text></svg>'
+)
+
+
 def sanitize_nan_values(obj):
     """Recursively replace NaN and Inf values with None for JSON serialization."""
     if isinstance(obj, dict):
@@ -109,6 +121,33 @@ class ImportNegotiationRequest(BaseModel):
     tags: list[str] | None = None  # Optional tags to add to the imported negotiation
 
 
+class SweepDimensionRequest(BaseModel):
+    """Request model for one swept parameter."""
+
+    target: str  # "negotiator" or "mechanism"
+    name: str  # Parameter name
+    negotiator_index: int | None = None  # Required for target == "negotiator"
+    values: list = []  # Explicit values (takes precedence over the range)
+    min_value: float | None = None
+    max_value: float | None = None
+    n_values: int = 5  # Grid points for ranges
+    log_scale: bool = False
+    ui_type: str | None = None  # Inferred via parameter_inspector if omitted
+
+
+class SweepRequest(BaseModel):
+    """Request model for a parameter sweep."""
+
+    session_id: str | None = None  # Saved negotiation to sweep around
+    preset_name: str | None = None  # Or a FullSessionPreset name
+    dimensions: list[SweepDimensionRequest] = []
+    mode: str = "grid"  # "grid" or "random"
+    n_samples: int = 20  # Points for random search
+    seeds: list[int] = [0]  # Each point is repeated once per seed
+    search_seed: int | None = None  # Seed for random point generation
+    max_workers: int | None = None  # None/0 = all cores
+
+
 class CalculateStatsRequest(BaseModel):
     """Request model for calculating outcome statistics."""
 
@@ -559,18 +598,54 @@ async def get_session(session_id: str):
 
 
 @router.get("/saved/list")
-async def list_saved_negotiations(include_archived: bool = False):
-    """List all saved negotiations from disk.
+async def list_saved_negotiations(
+    include_archived: bool = False,
+    tags: str | None = None,
+    search: str | None = None,
+    offset: int = 0,
+    limit: int | None = None,
+    refresh: bool = False,
+):
+    """List saved negotiations, most recent first.
+
+    Summaries are served from the negotiation index.
 
     Args:
         include_archived: If True, also include archived negotiations.
-
-    Returns summary info for each saved negotiation.
+        tags: Comma-separated tags to filter by (match any).
+        search: Case-insensitive substring of the ID, scenario name or a
+            negotiator name.
+        offset: Number of negotiations to skip.
+        limit: Maximum number of negotiations (all if omitted).
+        refresh: Rescan the storage directories for outside changes first.
+
+    Returns summary info for each listed negotiation and the total number of
+    matches.
     """
-    negotiations = await asyncio.to_thread(
-        NegotiationStorageService.list_saved_negotiations, include_archived
+    tag_list = [t.strip() for t in tags.split(",") if t.strip()] if tags else None
+    negotiations, total = await asyncio.to_thread(
+        NegotiationStorageService.query_saved_negotiations,
+        include_archived=include_archived,
+        tags=tag_list,
+        search=search,
+        offset=offset,
+        limit=limit,
+        refresh=refresh,
     )
-    return {"negotiations": negotiations, "count": len(negotiations)}
+    return {"negotiations": negotiations, "count": len(negotiations), "total": total}
+
+
+@router.get("/storage/stats")
+async def get_negotiation_storage_stats(refresh: bool = False):
+    """Get storage statistics for saved negotiations.
+
+    Args:
+        refresh: Rescan new or changed negotiations before answering.
+
+    Returns:
+        Storage statistics including total size and file breakdown.
+    """
+    return await asyncio.to_thread(NegotiationStorageService.get_storage_stats, refresh)
 
 
 @router.get("/saved/{session_id}")
@@ -775,7 +850,11 @@ async def get_negotiation_preview(session_id: str, panel_type: str):
 
     Panel types: utility2d, timeline, histogram, result
 
-    If the preview doesn't exist, returns 404.
+    Previews are rendered in the background after saving. If a preview is
+    missing it is rendered on first request and a placeholder image is
+    returned with status 202 until it is ready. Returns 404 if the preview
+    cannot be produced, and 500 if rendering failed (with Retry-After while
+    another attempt will be made).
     """
     # Validate panel type
     valid_types = ["utility2d", "timeline", "histogram", "result"]
@@ -787,11 +866,35 @@ async def get_negotiation_preview(session_id: str, panel_type: str):
 
     # Get session directory
     session_dir = NegotiationStorageService.get_session_dir(session_id)
+    if not session_dir.is_dir():
+        raise HTTPException(
+            status_code=404, detail=f"Negotiation '{session_id}' not found"
+        )
 
-    # Find existing preview with any supported format
-    from ..services.negotiation_preview_service import _find_existing_preview
+    # Find existing preview with any supported format, rendering it lazily
+    from ..services.negotiation_preview_service import NegotiationPreviewService
 
-    preview_file = _find_existing_preview(session_dir, panel_type)
+    preview_file, pending, failure = await asyncio.to_thread(
+        NegotiationPreviewService.get_or_schedule_preview, session_dir, panel_type
+    )
+    if failure is not None:
+        retry_in = failure.retry_in
+        raise HTTPException(
+            status_code=500,
+            detail=f"Rendering previews failed ({failure.attempts} attempts): "
+            f"{failure.error}",
+            headers=None
+            if retry_in is None
+            else {"Retry-After": str(max(1, round(retry_in)))},
+        )
+
+    if pending:
+        return Response(
+            content=PREVIEW_PLACEHOLDER_SVG,
+            status_code=202,
+            media_type="image/svg+xml",
+            headers={"Cache-Control": "no-store", "Retry-After": "1"},
+        )
 
     # Check if preview exists
     if not preview_file:
@@ -826,15 +929,13 @@ async def download_negotiation_zip(session_id: str):
     """Download a saved negotiation as a ZIP file.
 
     The offers will always be exported as CSV for better compatibility,
-    even if stored as parquet internally.
+    even if stored as parquet internally. The archive is streamed while it is
+    built, so the download starts immediately.
 
     Returns:
         ZIP file containing the complete negotiation directory.
     """
-    import shutil
-    import tempfile
-    import zipfile
-    from pathlib import Path
+    from ..services.zip_stream import directory_entries, stream_zip
 
     # Get session directory
     session_dir = NegotiationStorageService.get_session_dir(session_id)
@@ -844,55 +945,12 @@ async def download_negotiation_zip(session_id: str):
             status_code=404, detail=f"Negotiation '{session_id}' not found"
         )
 
-    # Create temporary ZIP file
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".zip") as tmp:
-        zip_path = Path(tmp.name)
-
-    try:
-        # Create ZIP archive manually to control file formats
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            # Add all files from session directory
-            for file_path in session_dir.rglob("*"):
-                if file_path.is_file():
-                    # Get relative path for archive
-                    arcname = file_path.relative_to(session_dir.parent)
-
-                    # Special handling for offers: convert parquet to CSV
-                    if file_path.name == "offers.parquet":
-                        # Convert parquet to CSV in memory
-                        try:
-                            import pandas as pd
-
-                            df = pd.read_parquet(file_path)
-
-                            # Create CSV in memory
-                            csv_buffer = df.to_csv(index=False)
-
-                            # Write CSV to zip with different name
-                            csv_arcname = str(arcname).replace(
-                                "offers.parquet", "offers.csv"
-                            )
-                            zipf.writestr(csv_arcname, csv_buffer)
-                            continue  # Skip adding the parquet file
-                        except Exception as e:
-                            print(f"Failed to convert parquet to CSV: {e}")
-                            # Fall back to including parquet file
-
-                    # Add file to archive
-                    zipf.write(file_path, arcname)
-
-        # Return the ZIP file
-        return FileResponse(
-            zip_path,
-            media_type="application/zip",
-            filename=f"{session_id}.zip",
-            headers={"Content-Disposition": f'attachment; filename="{session_id}.zip"'},
-        )
-    except Exception as e:
-        # Clean up temp file on error
-        if zip_path.exists():
-            zip_path.unlink()
-        raise HTTPException(status_code=500, detail=f"Failed to create ZIP: {str(e)}")
+    # A sync iterator: Starlette reads files and compresses in a worker thread
+    return StreamingResponse(
+        stream_zip(directory_entries(session_dir, csv_from_parquet={"offers.parquet"})),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{session_id}.zip"'},
+    )
 
 
 @router.post("/saved/{session_id}/open-folder")
@@ -1106,85 +1164,147 @@ async def rerun_negotiation(session_id: str):
 
     Returns session ID for the new negotiation.
     """
-    # Load the saved negotiation metadata
-    session_dir = NegotiationStorageService.get_session_dir(session_id)
-    metadata_path = session_dir / "metadata.json"
-
-    if not metadata_path.exists():
-        raise HTTPException(
-            status_code=404,
-            detail=f"Saved negotiation not found: {session_id}",
-        )
-
+    # Load the saved negotiation configuration (metadata.yaml + config.yaml)
     try:
-        with open(metadata_path) as f:
-            metadata = json.load(f)
+        run_config = await asyncio.to_thread(
+            NegotiationStorageService.load_run_config, session_id
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to read negotiation metadata: {str(e)}",
         )
 
-    # Extract negotiator configs
-    negotiator_configs_data = metadata.get("negotiator_configs")
-    if not negotiator_configs_data:
+    if run_config is None:
         raise HTTPException(
-            status_code=400,
-            detail="Cannot rerun: negotiation was saved without negotiator configurations",
+            status_code=404,
+            detail=f"Saved negotiation not found: {session_id}",
         )
 
-    # Convert to internal NegotiatorConfig objects
-    configs = [
-        NegotiatorConfig(
-            type_name=c["type_name"],
-            name=c.get("name"),
-            params=c.get("params", {}),
-            time_limit=c.get("time_limit"),
-            n_steps=c.get("n_steps"),
+    configs = run_config["negotiator_configs"]
+    if not configs:
+        raise HTTPException(
+            status_code=400,
+            detail="Cannot rerun: negotiation was saved without negotiator configurations",
         )
-        for c in negotiator_configs_data
-    ]
-
-    # Extract mechanism parameters from metadata
-    # For backwards compatibility, default to empty dict if not present
-    mechanism_params = {}
-    if "n_steps" in metadata and metadata["n_steps"] is not None:
-        mechanism_params["n_steps"] = metadata["n_steps"]
-    if "time_limit" in metadata and metadata["time_limit"] is not None:
-        mechanism_params["time_limit"] = metadata["time_limit"]
 
     # Create new session with same configuration
     new_session = get_manager().create_session(
-        scenario_path=metadata["scenario_path"],
+        scenario_path=run_config["scenario_path"],
         negotiator_configs=configs,
-        mechanism_type=metadata.get("mechanism_type", "SAOMechanism"),
-        mechanism_params=mechanism_params,
-        ignore_discount=False,  # Use defaults for these
-        ignore_reserved=False,
-        normalize=False,
+        mechanism_type=run_config["mechanism_type"],
+        mechanism_params=run_config["mechanism_params"],
+        ignore_discount=run_config["scenario_options"]["ignore_discount"],
+        ignore_reserved=run_config["scenario_options"]["ignore_reserved"],
+        normalize=run_config["scenario_options"]["normalize"],
         auto_save=True,
     )
 
+    share_ufuns = run_config["share_ufuns"]
+
     # Run negotiation in background task (continues even if client disconnects)
     async def run_negotiation_task():
         async for event in get_manager().run_session_stream(
-            new_session.id, configs, step_delay=0.0, share_ufuns=False
+            new_session.id, configs, step_delay=0.0, share_ufuns=share_ufuns
         ):
             pass  # Just consume events, negotiation runs in background
 
     # Start background task
-    import asyncio
-
     asyncio.create_task(run_negotiation_task())
 
     return {
         "session_id": new_session.id,
         "original_session_id": session_id,
         "status": "running",
-        "stream_url": f"/api/negotiation/{new_session.id}/stream?step_delay=0.1&share_ufuns=false",
+        "stream_url": (
+            f"/api/negotiation/{new_session.id}/stream?step_delay=0.1"
+            f"&share_ufuns={str(share_ufuns).lower()}"
+        ),
     }
 
 
+@router.post("/sweep")
+async def run_parameter_sweep(request: SweepRequest):
+    """Run a parameter sweep over a saved negotiation or a session preset.
+
+    Expands the requested dimensions (negotiator constructor params and
+    mechanism params such as n_steps/time_limit) into grid or random points,
+    repeats each point once per seed and runs all negotiations across cores.
+
+    Streams SSE events:
+    - init: points, dimension keys, seeds and total run count
+    - run: one finished run (point_index, seed, utilities, end_reason, ...)
+    - point: updated aggregate row for the point of that run
+    - complete: final results table
+    - error: the sweep failed
+
+    Pending runs are cancelled if the client disconnects.
+    """
+    if (request.session_id is None) == (request.preset_name is None):
+        raise HTTPException(
+            status_code=400,
+            detail="Provide exactly one of session_id or preset_name",
+        )
+
+    sweep_kwargs = {
+        "dimensions": [SweepDimension(**d.model_dump()) for d in request.dimensions],
+        "mode": request.mode,
+        "n_samples": request.n_samples,
+        "seeds": request.seeds,
+        "search_seed": request.search_seed,
+        "max_workers": request.max_workers,
+    }
+
+    try:
+        if request.session_id is not None:
+            config = await asyncio.to_thread(
+                SweepRunner.config_from_saved, request.session_id, **sweep_kwargs
+            )
+            if config is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Saved negotiation not found: {request.session_id}",
+                )
+        else:
+            preset = next(
+                (
+                    p
+                    for p in SettingsService.load_session_presets()
+                    if p.name == request.preset_name
+                ),
+                None,
+            )
+            if preset is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Session preset not found: {request.preset_name}",
+                )
+            config = SweepRunner.config_from_preset(preset, **sweep_kwargs)
+
+        # Validate dimensions before streaming so errors map to HTTP 400
+        points = await asyncio.to_thread(SweepRunner.generate_points, config)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def event_generator():
+        try:
+            async for event_type, data in SweepRunner.run_stream(config, points):
+                if event_type == "init":
+                    data = {**data, "points": [asdict(p) for p in data["points"]]}
+                elif event_type == "complete":
+                    data = {**data, "table": [asdict(row) for row in data["table"]]}
+                else:
+                    data = asdict(data)
+                yield {
+                    "event": event_type,
+                    "data": json.dumps(sanitize_nan_values(data), default=str),
+                }
+        except Exception as e:
+            yield {"event": "error", "data": json.dumps({"error": str(e)})}
+
+    return EventSourceResponse(event_generator())
+
+
 @router.post("/calculate-stats")
 async def calculate_outcome_stats(request: CalculateStatsRequest):
     """Calculate outcome statistics for a negotiation agreement.
@@ -1199,19 +1319,19 @@ async def calculate_outcome_stats(request: CalculateStatsRequest):
     """
     from pathlib import Path
 
-    from negmas import Scenario
-
     from ..services.outcome_analysis import compute_optimality_stats
+    from ..services.scenario_stats_store import ScenarioStatsStore
 
     # Load scenario
     scenario_path = Path(request.scenario_path)
+    BundledScenarioArchive.ensure_scenario_files(scenario_path)
     if not scenario_path.exists():
         raise HTTPException(
             status_code=404, detail=f"Scenario not found: {request.scenario_path}"
         )
 
     try:
-        scenario = Scenario.load(scenario_path, load_stats=True, load_info=True)
+        scenario = ScenarioStatsStore.load_scenario(scenario_path)
     except Exception as e:
         raise HTTPException(
             status_code=400, detail=f"Failed to load scenario: {str(e)}"
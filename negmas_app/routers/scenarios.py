@@ -3,6 +3,8 @@
 import asyncio
 import base64
 import json
+import math
+from contextlib import aclosing
 from dataclasses import asdict
 from pathlib import Path
 from typing import Any
@@ -13,6 +15,7 @@ from pydantic import BaseModel
 from sse_starlette.sse import EventSourceResponse
 
 from ..services import ScenarioLoader, compute_outcome_utilities
+from ..services.bundled_scenarios import BundledScenarioArchive
 from ..services.plot_service import (
     generate_and_save_plot,
     get_plot_path,
@@ -60,29 +63,119 @@ async def get_cached_scenario(
 
     This ensures we only load a scenario once per request.
     """
-    from negmas import Scenario
+    from ..services.scenario_stats_store import ScenarioStatsStore
 
     cache_key = f"{path}:{load_stats}:{load_info}"
     if cache_key not in _scenario_cache:
         scenario = await asyncio.to_thread(
-            Scenario.load, Path(path), load_stats=load_stats, load_info=load_info
+            ScenarioStatsStore.load_scenario,
+            Path(path),
+            load_stats=load_stats,
+            load_info=load_info,
         )
         _scenario_cache[cache_key] = scenario
     return _scenario_cache[cache_key]
 
 
 @router.get("")
-async def list_scenarios(source: str | None = None):
-    """List all available scenarios.
+async def list_scenarios(
+    source: str | None = None,
+    search: str | None = None,
+    tags: list[str] | None = Query(None),
+    min_outcomes: float | None = None,
+    max_outcomes: float | None = None,
+    min_negotiators: float | None = None,
+    max_negotiators: float | None = None,
+    min_opposition: float | None = None,
+    max_opposition: float | None = None,
+    min_rational_fraction: float | None = None,
+    max_rational_fraction: float | None = None,
+    normalized: bool | None = None,
+    anac: bool | None = None,
+    file: bool | None = None,
+    format: str | None = None,
+    reverse: bool | None = None,
+    filter_id: str | None = None,
+    sort_by: str | None = None,
+    descending: bool | None = None,
+    offset: int = Query(0, ge=0),
+    limit: int | None = Query(None, ge=1),
+):
+    """List scenarios, filtered, sorted and paginated on the server.
+
+    Without parameters all scenarios are returned in registry order. Range
+    bounds are inclusive and keep scenarios whose value is unknown.
 
     Args:
-        source: Optional filter by source (e.g., "anac2019").
+        source: Only scenarios from this source (e.g., "anac2019").
+        search: Case-insensitive substring of the name or a tag.
+        tags: Required tags (all must be present).
+        min_outcomes, max_outcomes: Range of n_outcomes.
+        min_negotiators, max_negotiators: Range of n_negotiators.
+        min_opposition, max_opposition: Range of opposition.
+        min_rational_fraction, max_rational_fraction: Range of rational_fraction.
+        normalized, anac, file: Require (true) or exclude (false) the tag.
+        format: Required format tag (yaml, xml, json).
+        reverse: Return the scenarios NOT matching the filters.
+        filter_id: Saved scenario filter to apply; explicit parameters
+            override its values.
+        sort_by: name, n_outcomes, n_negotiators, opposition or rational_fraction.
+        descending: Sort in descending order.
+        offset: Number of matches to skip.
+        limit: Maximum number of scenarios to return.
 
     Returns:
-        List of scenario info objects.
+        Page of scenario info objects with the total number of matches.
     """
-    scenarios = await asyncio.to_thread(get_loader().list_scenarios, source=source)
-    return {"scenarios": [_scenario_to_dict(s) for s in scenarios]}
+    from ..services.scenario_catalog import query_from_filter_data
+
+    filter_data: dict[str, Any] = {}
+    if filter_id is not None:
+        from ..services.filter_service import FilterService
+
+        saved = await asyncio.to_thread(FilterService().get_filter, filter_id)
+        if saved is None or saved.type != "scenario":
+            raise HTTPException(
+                status_code=404, detail=f"Scenario filter not found: {filter_id}"
+            )
+        filter_data = saved.data
+
+    try:
+        query = query_from_filter_data(
+            filter_data,
+            source=source,
+            search=search,
+            tags=tags,
+            min_outcomes=min_outcomes,
+            max_outcomes=max_outcomes,
+            min_negotiators=min_negotiators,
+            max_negotiators=max_negotiators,
+            min_opposition=min_opposition,
+            max_opposition=max_opposition,
+            min_rational_fraction=min_rational_fraction,
+            max_rational_fraction=max_rational_fraction,
+            normalized=normalized,
+            anac=anac,
+            file=file,
+            format=format,
+            reverse=reverse,
+            sort_by=sort_by,
+            descending=descending,
+            offset=offset,
+            limit=limit,
+        )
+        scenarios, total = await asyncio.to_thread(
+            get_loader().query_scenarios, query
+        )
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "scenarios": [_scenario_to_dict(s) for s in scenarios],
+        "total": total,
+        "offset": offset,
+        "limit": limit,
+    }
 
 
 @router.get("/sources")
@@ -117,44 +210,27 @@ async def get_quick_info(scenario_id: str):
         scenario_id: Base64-encoded scenario path.
 
     Returns:
-        Dict with n_outcomes, opposition, rational_fraction
+        Dict with n_outcomes, opposition, rational_fraction and per-negotiator
+        reserved values, rational fractions and utility ranges.
     """
-    from negmas import Scenario
-    from negmas.preferences.ops import opposition_level, is_rational
+    from ..services.scenario_metrics import ScenarioMetricsService
 
     try:
-        # Load scenario
         path = decode_scenario_path(scenario_id)
-        scenario_path = Path(path)
-        scenario = await asyncio.to_thread(Scenario.load, scenario_path)
-
-        # Get total outcome count
-        n_outcomes = scenario.outcome_space.cardinality
-
-        # Sample outcomes for calculations (up to 50k)
-        outcomes = list(
-            scenario.outcome_space.enumerate_or_sample(max_cardinality=50000)
-        )
-
-        # Calculate opposition
-        opposition = 0.0
-        if len(scenario.ufuns) >= 2 and len(outcomes) > 0:
-            opposition = float(
-                await asyncio.to_thread(
-                    opposition_level, scenario.ufuns, outcomes=outcomes, max_tests=50000
-                )
-            )
-
-        # Calculate rational fraction
-        rational_fraction = 0.0
-        if len(outcomes) > 0:
-            n_rational = sum(1 for o in outcomes if is_rational(scenario.ufuns, o))
-            rational_fraction = n_rational / len(outcomes)
+        # Loading and evaluating the ufuns runs in a worker; results are cached
+        # by scenario fingerprint so re-selecting a scenario is instant
+        metrics = await ScenarioMetricsService.get_async(Path(path))
 
         return {
-            "n_outcomes": n_outcomes,
-            "opposition": opposition,
-            "rational_fraction": rational_fraction,
+            "n_outcomes": metrics.n_outcomes,
+            "opposition": sanitize_number(metrics.opposition),
+            "rational_fraction": metrics.rational_fraction,
+            "reserved_values": [sanitize_number(r) for r in metrics.reserved_values],
+            "individual_rational_fractions": metrics.individual_rational_fractions,
+            "utility_ranges": [
+                [sanitize_number(lo), sanitize_number(hi)]
+                for lo, hi in metrics.utility_ranges
+            ],
         }
     except Exception as e:
         raise HTTPException(
@@ -405,19 +481,18 @@ async def get_scenario(scenario_id: str):
     return _scenario_to_dict(info)
 
 
-def _scenario_to_dict(info) -> dict:
-    """Convert ScenarioInfo to dict for JSON response."""
-    import math
+def sanitize_number(val):
+    """Sanitize numeric values for JSON (inf/nan become None)."""
+    if val is None:
+        return None
+    if isinstance(val, (int, float)):
+        if math.isinf(val) or math.isnan(val):
+            return None  # Convert inf/nan to None for JSON compatibility
+    return val
 
-    # Helper to sanitize numeric values for JSON
-    def sanitize_number(val):
-        if val is None:
-            return None
-        if isinstance(val, (int, float)):
-            if math.isinf(val) or math.isnan(val):
-                return None  # Convert inf/nan to None for JSON compatibility
-        return val
 
+def _scenario_to_dict(info) -> dict:
+    """Convert ScenarioInfo to dict for JSON response."""
     return {
         "id": encode_scenario_path(info.path),  # Base64-encoded ID for URLs
         "path": info.path,
@@ -606,64 +681,33 @@ async def get_scenario_info(scenario_id: str):
 async def bulk_calculate_stats(data: dict[str, Any]):
     """Calculate stats for multiple scenarios with SSE progress updates.
 
+    Scenarios are processed in parallel worker processes, largest first.
+    Workers are stopped if the client disconnects.
+
     Args:
-        data: Dict with 'paths' (list of scenario paths) and optional 'force' (bool).
+        data: Dict with 'paths' (list of scenario paths), optional 'force' (bool)
+            and optional 'max_workers' (int, defaults to the stats_workers setting).
 
     Returns:
         SSE stream with progress updates.
     """
+    from ..services.bulk_stats import BulkStatsRunner
+
     paths: list[str] = data.get("paths", [])
     force: bool = data.get("force", False)
+    max_workers: int | None = data.get("max_workers")
 
     if not paths:
         return {"error": "No paths provided"}
 
     async def generate():
-        total = len(paths)
-        completed = 0
-        errors: list[dict[str, str]] = []
-
-        for path in paths:
-            try:
-                # Calculate stats in thread pool
-                stats = await asyncio.to_thread(
-                    get_loader().calculate_and_save_stats, path, force
-                )
-                completed += 1
-
-                # Send progress update
-                progress_data = {
-                    "type": "progress",
-                    "completed": completed,
-                    "total": total,
-                    "current_path": path,
-                    "has_stats": stats.has_stats,
-                    "rational_fraction": stats.rational_fraction,
-                }
-                yield {"event": "progress", "data": json.dumps(progress_data)}
-
-            except Exception as e:
-                completed += 1
-                errors.append({"path": path, "error": str(e)})
-
-                # Send error progress
-                progress_data = {
-                    "type": "progress",
-                    "completed": completed,
-                    "total": total,
-                    "current_path": path,
-                    "error": str(e),
-                }
-                yield {"event": "progress", "data": json.dumps(progress_data)}
-
-        # Send completion event
-        completion_data = {
-            "type": "complete",
-            "completed": completed,
-            "total": total,
-            "errors": errors,
-        }
-        yield {"event": "complete", "data": json.dumps(completion_data)}
+        # Closing the stream (client disconnect) closes the runner, which
+        # kills its workers
+        async with aclosing(
+            BulkStatsRunner.run_stream(paths, force, max_workers)
+        ) as events:
+            async for event in events:
+                yield {"event": event["type"], "data": json.dumps(event)}
 
     return EventSourceResponse(generate())
 
@@ -996,6 +1040,10 @@ async def get_scenario_file_content(scenario_id: str, file_path: str):
                 status_code=403, detail="Access denied: file outside scenario directory"
             )
 
+        # Bundled scenarios are extracted from scenarios.zip on first access
+        await asyncio.to_thread(
+            BundledScenarioArchive.ensure_scenario_files, scenario_path
+        )
         if not full_file_path.exists():
             raise HTTPException(status_code=404, detail=f"File not found: {file_path}")
 
@@ -1060,6 +1108,10 @@ async def update_scenario_file(
                 status_code=403, detail="Access denied: file outside scenario directory"
             )
 
+        # Bundled scenarios are extracted from scenarios.zip on first access
+        await asyncio.to_thread(
+            BundledScenarioArchive.ensure_scenario_files, scenario_path
+        )
         if not full_file_path.exists():
             raise HTTPException(status_code=404, detail=f"File not found: {file_path}")
 
@@ -1125,6 +1177,7 @@ async def open_scenario_folder(scenario_id: str):
     try:
         path = decode_scenario_path(scenario_id)
         scenario_path = Path(path)
+        BundledScenarioArchive.ensure_scenario_files(scenario_path)
 
         if not scenario_path.exists():
             raise HTTPException(status_code=404, detail=f"Scenario not found: {path}")
@@ -1295,13 +1348,13 @@ async def bulk_delete(request: BulkDeleteRequest):
     Returns:
         Dict with results for each scenario.
     """
-    try:
+
+    def delete_all() -> list[dict]:
+        # Each scenario is only renamed into trash, so one thread suffices
         results = []
         for path in request.paths:
             try:
-                success, error = await asyncio.to_thread(
-                    get_loader().delete_scenario, path
-                )
+                success, error = get_loader().delete_scenario(path)
                 results.append(
                     {
                         "path": path,
@@ -1311,6 +1364,10 @@ async def bulk_delete(request: BulkDeleteRequest):
                 )
             except Exception as e:
                 results.append({"path": path, "success": False, "error": str(e)})
+        return results
+
+    try:
+        results = await asyncio.to_thread(delete_all)
 
         successful = sum(1 for r in results if r["success"])
         return {
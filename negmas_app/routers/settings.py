@@ -496,6 +496,7 @@ async def save_tournament_preset(data: dict[str, Any]) -> dict[str, Any]:
         # Run ordering
         randomize_runs=data.get("randomize_runs", False),
         sort_runs=data.get("sort_runs", True),
+        order_runs_by_cost=data.get("order_runs_by_cost", False),
         # Information hiding
         id_reveals_type=data.get("id_reveals_type", True),
         name_reveals_type=data.get("name_reveals_type", True),
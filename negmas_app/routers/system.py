@@ -7,6 +7,7 @@ import subprocess
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 
 router = APIRouter(prefix="/api/system", tags=["system"])
@@ -39,6 +40,57 @@ class BrowseResponse(BaseModel):
     cancelled: bool
 
 
+@router.get("/deletions")
+async def deletion_status() -> dict:
+    """Progress of background deletions (tournaments, negotiations, scenarios).
+
+    Returns:
+        Dict with the number of pending jobs and recent jobs, newest first.
+    """
+    from ..services.deletion_queue import DeletionQueue
+
+    return DeletionQueue.status()
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Server metrics in the Prometheus text format.
+
+    Per-route latency histograms, event loop lag and stalls, cache hit rates
+    and the number of active negotiations and tournaments.
+    """
+    from ..models.session import SessionStatus
+    from ..models.tournament import TournamentStatus
+    from ..services.server_metrics import render_metrics
+    from .negotiation import get_manager as get_session_manager
+    from .tournament import get_manager as get_tournament_manager
+
+    sessions = get_session_manager().sessions.values()
+    tournaments = get_tournament_manager().list_sessions()
+    active = (SessionStatus.RUNNING, SessionStatus.PAUSED)
+    gauges = {
+        "active_negotiations": (
+            "Negotiations running or paused.",
+            sum(s.status in active for s in sessions),
+        ),
+        "active_tournaments": (
+            "Tournaments running.",
+            sum(t.status == TournamentStatus.RUNNING for t in tournaments),
+        ),
+    }
+    return PlainTextResponse(
+        render_metrics(gauges), media_type="text/plain; version=0.0.4"
+    )
+
+
+@router.get("/stalls")
+async def stalls() -> list[dict]:
+    """Recent stalls of the event loop, newest first, with captured stacks."""
+    from ..services.server_metrics import recent_stalls
+
+    return recent_stalls()
+
+
 @router.post("/open-folder")
 async def open_folder(request: OpenFolderRequest) -> dict[str, str]:
     """Open a folder in the system's file explorer.
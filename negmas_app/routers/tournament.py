@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+from dataclasses import asdict
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
@@ -12,11 +13,13 @@ from ..models.tournament import (
     TournamentProgress,
     TournamentSession,
     TournamentGridInit,
+    TournamentGridSnapshot,
     CellUpdate,
     LeaderboardEntry,
     OptimizationLevel,
     StorageFormat,
 )
+from ..services.scenario_stats_store import ScenarioStatsStore
 from ..services.tournament_manager import TournamentManager
 from ..services.tournament_storage import TournamentStorageService
 
@@ -77,6 +80,7 @@ class TournamentConfigRequest(BaseModel):
     # Run ordering
     randomize_runs: bool = False
     sort_runs: bool = True
+    order_runs_by_cost: bool = False  # Longest predicted runs first
 
     # Information hiding
     id_reveals_type: bool = True
@@ -105,6 +109,12 @@ class TournamentConfigRequest(BaseModel):
 
     # Execution
     njobs: int = -1
+    adaptive_njobs: bool = False  # Adapt parallelism to memory and CPU use
+    memory_limit_mb: int | None = None  # System memory ceiling (adaptive_njobs)
+    use_result_cache: bool = False  # Reuse cached runs, negotiate only missing ones
+    sharded: bool = False  # Run batches on `negmas-app worker` hosts
+    shard_dir: str | None = None  # Queue directory shared with the workers
+    scenarios_per_shard: int = 1
     save_path: str | None = None
     verbosity: int = 0
 
@@ -177,6 +187,7 @@ async def start_tournament(request: TournamentConfigRequest):
         else None,
         randomize_runs=request.randomize_runs,
         sort_runs=request.sort_runs,
+        order_runs_by_cost=request.order_runs_by_cost,
         id_reveals_type=request.id_reveals_type,
         name_reveals_type=request.name_reveals_type,
         mask_scenario_names=request.mask_scenario_names,
@@ -192,6 +203,12 @@ async def start_tournament(request: TournamentConfigRequest):
         pass_opponent_ufun=request.pass_opponent_ufun,
         raise_exceptions=request.raise_exceptions,
         njobs=request.njobs,
+        adaptive_njobs=request.adaptive_njobs,
+        memory_limit_mb=request.memory_limit_mb,
+        use_result_cache=request.use_result_cache,
+        sharded=request.sharded,
+        shard_dir=request.shard_dir or None,
+        scenarios_per_shard=request.scenarios_per_shard,
         monitor_negotiations=request.monitor_negotiations,
         save_path=request.save_path,
         verbosity=request.verbosity,
@@ -243,6 +260,7 @@ async def start_tournament_background(request: TournamentConfigRequest):
         else None,
         randomize_runs=request.randomize_runs,
         sort_runs=request.sort_runs,
+        order_runs_by_cost=request.order_runs_by_cost,
         id_reveals_type=request.id_reveals_type,
         name_reveals_type=request.name_reveals_type,
         mask_scenario_names=request.mask_scenario_names,
@@ -258,6 +276,12 @@ async def start_tournament_background(request: TournamentConfigRequest):
         pass_opponent_ufun=request.pass_opponent_ufun,
         raise_exceptions=request.raise_exceptions,
         njobs=request.njobs,
+        adaptive_njobs=request.adaptive_njobs,
+        memory_limit_mb=request.memory_limit_mb,
+        use_result_cache=request.use_result_cache,
+        sharded=request.sharded,
+        shard_dir=request.shard_dir or None,
+        scenarios_per_shard=request.scenarios_per_shard,
         monitor_negotiations=request.monitor_negotiations,
         save_path=request.save_path,
         verbosity=request.verbosity,
@@ -286,6 +310,7 @@ async def stream_tournament(session_id: str):
 
     Events:
     - grid_init: Initial grid structure (competitors, opponents, scenarios)
+    - grid_snapshot: Every run so far in one message (sent on reconnect)
     - run_start: Negotiation run is starting (turn yellow)
     - run_complete: Negotiation run is complete (color based on result)
     - leaderboard: Updated leaderboard standings
@@ -315,6 +340,11 @@ async def stream_tournament(session_id: str):
                             }
                         ),
                     }
+                elif isinstance(event, TournamentGridSnapshot):
+                    yield {
+                        "event": "grid_snapshot",
+                        "data": json.dumps(asdict(event)),
+                    }
                 elif isinstance(event, dict) and "message" in event:
                     # Setup progress event from progress_callback
                     yield {
@@ -395,6 +425,7 @@ async def stream_tournament(session_id: str):
                                 "current_scenario": event.current_scenario,
                                 "current_partners": event.current_partners,
                                 "percent": event.percent,
+                                "eta_seconds": event.eta_seconds,
                             }
                         ),
                     }
@@ -520,104 +551,9 @@ async def get_tournament_state(session_id: str):
 
     # Add cell states (completed and running)
     if state:
-        cell_states = {}
-        for cell in state.completed_cells:
-            # Build cell key
-            if state.grid_init:
-                competitor = (
-                    state.grid_init.competitors[cell.competitor_idx]
-                    if cell.competitor_idx < len(state.grid_init.competitors)
-                    else f"Competitor {cell.competitor_idx}"
-                )
-                opponent = (
-                    state.grid_init.opponents[cell.opponent_idx]
-                    if cell.opponent_idx < len(state.grid_init.opponents)
-                    else f"Opponent {cell.opponent_idx}"
-                )
-                scenario = (
-                    state.grid_init.scenarios[cell.scenario_idx]
-                    if cell.scenario_idx < len(state.grid_init.scenarios)
-                    else f"Scenario {cell.scenario_idx}"
-                )
-                cell_key = f"{competitor}::{opponent}::{scenario}"
-
-                # Initialize or update cell state
-                if cell_key not in cell_states:
-                    total = state.grid_init.n_repetitions * (
-                        2 if state.grid_init.rotate_ufuns else 1
-                    )
-                    cell_states[cell_key] = {
-                        "status": "pending",
-                        "total": total,
-                        "completed": 0,
-                        "agreements": 0,
-                        "timeouts": 0,
-                        "errors": 0,
-                        "running": 0,
-                    }
-
-                # Update based on cell status
-                cell_data = cell_states[cell_key]
-                cell_data["completed"] += 1
-
-                if cell.end_reason:
-                    if cell.end_reason.value == "agreement":
-                        cell_data["agreements"] += 1
-                    elif cell.end_reason.value == "timeout":
-                        cell_data["timeouts"] += 1
-                    elif cell.end_reason.value in ("error", "broken"):
-                        cell_data["errors"] += 1
-
-                # Determine status
-                if cell_data["completed"] >= cell_data["total"]:
-                    if cell_data["errors"] > 0:
-                        cell_data["status"] = "error"
-                    elif cell_data["agreements"] > 0:
-                        cell_data["status"] = "complete"
-                    else:
-                        cell_data["status"] = "timeout"
-                else:
-                    cell_data["status"] = "running"
-
-        # Add current running cell
-        if state.current_cell and state.grid_init:
-            cell = state.current_cell
-            competitor = (
-                state.grid_init.competitors[cell.competitor_idx]
-                if cell.competitor_idx < len(state.grid_init.competitors)
-                else f"Competitor {cell.competitor_idx}"
-            )
-            opponent = (
-                state.grid_init.opponents[cell.opponent_idx]
-                if cell.opponent_idx < len(state.grid_init.opponents)
-                else f"Opponent {cell.opponent_idx}"
-            )
-            scenario = (
-                state.grid_init.scenarios[cell.scenario_idx]
-                if cell.scenario_idx < len(state.grid_init.scenarios)
-                else f"Scenario {cell.scenario_idx}"
-            )
-            cell_key = f"{competitor}::{opponent}::{scenario}"
-
-            if cell_key not in cell_states:
-                total = state.grid_init.n_repetitions * (
-                    2 if state.grid_init.rotate_ufuns else 1
-                )
-                cell_states[cell_key] = {
-                    "status": "running",
-                    "total": total,
-                    "completed": 0,
-                    "agreements": 0,
-                    "timeouts": 0,
-                    "errors": 0,
-                    "running": 1,
-                }
-            else:
-                cell_states[cell_key]["running"] = 1
-                if cell_states[cell_key]["status"] != "complete":
-                    cell_states[cell_key]["status"] = "running"
-
-        response["cell_states"] = cell_states
+        response["cell_states"] = (
+            state.grid.cell_states() if state.grid is not None else {}
+        )
 
     # Add leaderboard
     if state and state.leaderboard:
@@ -641,6 +577,7 @@ async def get_tournament_state(session_id: str):
             "current_scenario": state.progress.current_scenario,
             "current_partners": state.progress.current_partners,
             "percent": state.progress.percent,
+            "eta_seconds": state.progress.eta_seconds,
         }
 
     # Add setup progress (for polling during setup phase)
@@ -693,6 +630,18 @@ async def get_tournament_state(session_id: str):
     return response
 
 
+@router.get("/{session_id}/grid")
+async def get_tournament_grid(session_id: str):
+    """Get the state of every run in a tournament grid in one response.
+
+    See TournamentGridSnapshot for the encoding of the arrays.
+    """
+    state = get_manager().get_tournament_state(session_id)
+    if state is None or state.grid is None:
+        raise HTTPException(status_code=404, detail="Tournament grid not found")
+    return asdict(state.grid.snapshot())
+
+
 class CancelRequest(BaseModel):
     """Request model for cancelling a tournament."""
 
@@ -1452,9 +1401,10 @@ async def get_tournament_scenario_serialized(tournament_id: str, scenario_name:
     """
     from pathlib import Path
 
-    from negmas import Scenario
     from negmas.serialization import serialize
 
+    from .negotiation import sanitize_nan_values
+
     scenario_path = (
         TournamentStorageService.TOURNAMENTS_DIR
         / tournament_id
@@ -1467,7 +1417,7 @@ async def get_tournament_scenario_serialized(tournament_id: str, scenario_name:
 
     try:
         scenario = await asyncio.to_thread(
-            Scenario.load, scenario_path, load_info=True, load_stats=True
+            ScenarioStatsStore.load_scenario, scenario_path
         )
 
         serialized = await asyncio.to_thread(
@@ -1480,7 +1430,8 @@ async def get_tournament_scenario_serialized(tournament_id: str, scenario_name:
 
         return {
             "success": True,
-            "data": serialized,
+            # Reserved values and stats may be infinite
+            "data": sanitize_nan_values(serialized),
             "name": scenario_name,
             "object_type": "scenario",
         }
@@ -1624,6 +1575,40 @@ async def get_tournament_files(tournament_id: str):
     return files
 
 
+@router.get("/saved/{tournament_id}/download")
+async def download_tournament_zip(tournament_id: str):
+    """Download a saved tournament as a ZIP file.
+
+    The archive is streamed while it is built, so the download starts
+    immediately regardless of the tournament's size.
+
+    Args:
+        tournament_id: Tournament ID.
+
+    Returns:
+        ZIP file containing the complete tournament directory.
+    """
+    from fastapi.responses import StreamingResponse
+
+    from ..services.zip_stream import directory_entries, stream_zip
+
+    tournaments_dir = TournamentStorageService.TOURNAMENTS_DIR
+    tournament_dir = tournaments_dir / tournament_id
+    if (
+        not tournament_dir.is_dir()
+        or tournament_dir.resolve().parent != tournaments_dir.resolve()
+    ):
+        raise HTTPException(status_code=404, detail="Tournament not found")
+
+    return StreamingResponse(
+        stream_zip(directory_entries(tournament_dir)),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f'attachment; filename="{tournament_id}.zip"'
+        },
+    )
+
+
 @router.get("/saved/{tournament_id}/config")
 async def get_tournament_config(tournament_id: str):
     """Get tournament configuration from config.yaml.
@@ -1863,6 +1848,11 @@ async def combine_tournaments(request: CombineTournamentsRequest):
     if not result.success:
         raise HTTPException(status_code=400, detail=result.error or "Combine failed")
 
+    return _combine_response(result)
+
+
+def _combine_response(result) -> dict:
+    """Response body for a successful CombineResult."""
     return {
         "success": True,
         "output_path": result.output_path,
@@ -1875,6 +1865,72 @@ async def combine_tournaments(request: CombineTournamentsRequest):
     }
 
 
+@router.post("/combine/stream")
+async def combine_tournaments_stream(request: CombineTournamentsRequest):
+    """Combine tournaments, streaming progress via SSE.
+
+    Events:
+    - progress: phase ("read", "write", "scores" or "link"), completed, total
+      and path
+    - complete: the same fields as the /combine response
+    - error: error message
+
+    Args:
+        request: CombineTournamentsRequest with tournament_ids or input_paths
+
+    Returns:
+        SSE stream of combine events.
+    """
+    if not request.tournament_ids and not request.input_paths:
+        raise HTTPException(
+            status_code=400,
+            detail="Must provide either tournament_ids or input_paths",
+        )
+
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[dict] = asyncio.Queue()
+
+    def progress(event: dict) -> None:
+        # Called from the worker thread
+        loop.call_soon_threadsafe(queue.put_nowait, event)
+
+    async def event_generator():
+        # The combine keeps running if the client disconnects
+        task = asyncio.ensure_future(
+            asyncio.to_thread(
+                TournamentStorageService.combine_tournaments,
+                tournament_ids=request.tournament_ids,
+                input_paths=request.input_paths,
+                output_name=request.output_name,
+                output_path=request.output_path,
+                recursive=request.recursive,
+                metadata=request.metadata,
+                copy=request.copy_data,
+                progress=progress,
+            )
+        )
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+            if not getter.done():
+                getter.cancel()
+                break
+            event = getter.result()
+            yield {"event": event["type"], "data": json.dumps(event)}
+        while not queue.empty():
+            event = queue.get_nowait()
+            yield {"event": event["type"], "data": json.dumps(event)}
+
+        result = task.result()
+        if result.success:
+            event = {"type": "complete", **_combine_response(result)}
+        else:
+            event = {"type": "error", "error": result.error or "Combine failed"}
+        yield {"event": event["type"], "data": json.dumps(event)}
+
+    return EventSourceResponse(event_generator())
+
+
 class PreviewCombineRequest(BaseModel):
     """Request model for previewing tournament combination."""
 
@@ -2158,11 +2214,14 @@ async def cleanup_storage(request: CleanupStorageRequest):
 
 
 @router.get("/storage/stats")
-async def get_storage_stats():
+async def get_storage_stats(refresh: bool = False):
     """Get storage statistics for all saved tournaments.
 
+    Args:
+        refresh: Rescan new or changed tournaments before answering.
+
     Returns:
         Storage statistics including total size, file breakdown, and redundant files.
     """
-    stats = await asyncio.to_thread(TournamentStorageService.get_storage_stats)
+    stats = await asyncio.to_thread(TournamentStorageService.get_storage_stats, refresh)
     return stats
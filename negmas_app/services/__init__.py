@@ -1,51 +1,117 @@
-"""Business logic services for NegMAS App."""
+"""Business logic services for NegMAS App.
 
-from .scenario_loader import ScenarioLoader, clear_scenario_cache
-from .negotiator_factory import NegotiatorFactory, NEGOTIATOR_REGISTRY, BOAFactory
-from .mechanism_factory import MechanismFactory
-from .session_manager import SessionManager
-from .outcome_analysis import compute_outcome_space_data, compute_outcome_utilities
-from .parameter_inspector import (
-    get_negotiator_parameters,
-    clear_parameter_cache,
-    clear_parameter_cache_for_type,
-    ParameterInfo,
-)
-from .virtual_negotiator_service import VirtualNegotiatorService
-from .virtual_mechanism_service import VirtualMechanismService
-from .module_inspector import (
-    inspect_module_ast,
-    inspect_module_dynamic,
-    validate_scenario_path,
-    list_scenario_folders,
-    ClassInfo,
-    ModuleInspectionResult,
-)
+Services are imported lazily on first attribute access so that importing one
+service (e.g. from a short CLI command) does not pull in negmas, matplotlib
+and every other service.
+"""
 
-# Optional services that may have additional dependencies
-try:
-    from .negotiation_storage import NegotiationStorageService
-except ImportError:
-    NegotiationStorageService = None  # type: ignore
+import importlib
+from typing import TYPE_CHECKING, Any
 
-try:
+if TYPE_CHECKING:
+    from .scenario_loader import ScenarioLoader, clear_scenario_cache
+    from .scenario_stats_store import ScenarioStatsStore
+    from .scenario_metrics import ScenarioMetricsService
+    from .bundled_scenarios import BundledScenarioArchive
+    from .negotiator_factory import NegotiatorFactory, NEGOTIATOR_REGISTRY, BOAFactory
+    from .mechanism_factory import MechanismFactory
+    from .session_manager import SessionManager
+    from .sweep_runner import SweepRunner
+    from .bulk_stats import BulkStatsRunner
+    from .outcome_analysis import compute_outcome_space_data, compute_outcome_utilities
+    from .parameter_inspector import (
+        get_negotiator_parameters,
+        clear_parameter_cache,
+        clear_parameter_cache_for_type,
+        save_parameter_cache,
+        warm_parameter_cache,
+        ParameterInfo,
+    )
+    from .virtual_negotiator_service import VirtualNegotiatorService
+    from .virtual_mechanism_service import VirtualMechanismService
+    from .module_inspector import (
+        inspect_module_ast,
+        inspect_module_dynamic,
+        validate_scenario_path,
+        list_scenario_folders,
+        ClassInfo,
+        ModuleInspectionResult,
+    )
+    from .negotiation_storage import NegotiationStorageService
     from .tournament_manager import TournamentManager
-except ImportError:
-    TournamentManager = None  # type: ignore
-
-try:
     from .tournament_storage import TournamentStorageService
-except ImportError:
-    TournamentStorageService = None  # type: ignore
+
+# Exported name -> submodule defining it
+_LAZY_IMPORTS: dict[str, str] = {
+    "ScenarioLoader": "scenario_loader",
+    "clear_scenario_cache": "scenario_loader",
+    "ScenarioStatsStore": "scenario_stats_store",
+    "ScenarioMetricsService": "scenario_metrics",
+    "BundledScenarioArchive": "bundled_scenarios",
+    "NegotiatorFactory": "negotiator_factory",
+    "NEGOTIATOR_REGISTRY": "negotiator_factory",
+    "BOAFactory": "negotiator_factory",
+    "MechanismFactory": "mechanism_factory",
+    "SessionManager": "session_manager",
+    "SweepRunner": "sweep_runner",
+    "BulkStatsRunner": "bulk_stats",
+    "compute_outcome_space_data": "outcome_analysis",
+    "compute_outcome_utilities": "outcome_analysis",
+    "get_negotiator_parameters": "parameter_inspector",
+    "clear_parameter_cache": "parameter_inspector",
+    "clear_parameter_cache_for_type": "parameter_inspector",
+    "save_parameter_cache": "parameter_inspector",
+    "warm_parameter_cache": "parameter_inspector",
+    "ParameterInfo": "parameter_inspector",
+    "VirtualNegotiatorService": "virtual_negotiator_service",
+    "VirtualMechanismService": "virtual_mechanism_service",
+    "inspect_module_ast": "module_inspector",
+    "inspect_module_dynamic": "module_inspector",
+    "validate_scenario_path": "module_inspector",
+    "list_scenario_folders": "module_inspector",
+    "ClassInfo": "module_inspector",
+    "ModuleInspectionResult": "module_inspector",
+    # Optional services that may have additional dependencies
+    "NegotiationStorageService": "negotiation_storage",
+    "TournamentManager": "tournament_manager",
+    "TournamentStorageService": "tournament_storage",
+}
+
+# Services that resolve to None when their dependencies are missing
+_OPTIONAL = {"NegotiationStorageService", "TournamentManager", "TournamentStorageService"}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    except ImportError:
+        if name not in _OPTIONAL:
+            raise
+        value = None
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
 
 __all__ = [
     "ScenarioLoader",
     "clear_scenario_cache",
+    "ScenarioStatsStore",
+    "ScenarioMetricsService",
+    "BundledScenarioArchive",
     "NegotiatorFactory",
     "NEGOTIATOR_REGISTRY",
     "BOAFactory",
     "MechanismFactory",
     "SessionManager",
+    "SweepRunner",
+    "BulkStatsRunner",
     "TournamentManager",
     "NegotiationStorageService",
     "TournamentStorageService",
@@ -56,6 +122,8 @@ __all__ = [
     "get_negotiator_parameters",
     "clear_parameter_cache",
     "clear_parameter_cache_for_type",
+    "save_parameter_cache",
+    "warm_parameter_cache",
     "ParameterInfo",
     "inspect_module_ast",
     "inspect_module_dynamic",
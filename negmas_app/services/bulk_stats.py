@@ -0,0 +1,235 @@
+"""Bulk scenario stats calculation in a process pool.
+
+Stats for many scenarios are calculated in parallel worker processes, largest
+scenarios first so that a big scenario picked last does not leave the other
+cores idle at the end. Each item gets a timeout proportional to its size
+(relative to ``PerformanceSettings.max_outcomes_stats``); an item that runs out
+of time is reported as an error and its worker is killed. Stopping the stream
+(e.g. because the SSE client disconnected) kills all workers.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from collections.abc import AsyncGenerator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from ..models import ScenarioStatsInfo
+from ..models.settings import PerformanceSettings
+from .scenario_loader import invalidate_scenario_cache
+from .scenario_metrics import scenario_fingerprint
+from .settings_service import SettingsService
+
+# Lower bound for the per-item timeout (loading alone can take a few seconds)
+MIN_ITEM_TIMEOUT = 30.0
+
+
+def _calculate_stats_in_worker(path: str, force: bool) -> ScenarioStatsInfo:
+    """Calculate and save stats for one scenario (runs in a pool process)."""
+    from .scenario_loader import ScenarioLoader
+
+    return ScenarioLoader(Path(path).parent).calculate_and_save_stats(path, force)
+
+
+def _new_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Create a pool of fresh (spawned) worker processes."""
+    # Spawn fresh workers: forking the server (threads, open sockets) is unsafe
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _kill_pool(executor: ProcessPoolExecutor) -> None:
+    """Stop a pool immediately, terminating workers that are still busy."""
+    # ProcessPoolExecutor cannot interrupt a running task; terminating its
+    # processes is the only way to stop a long stats calculation
+    processes = list((getattr(executor, "_processes", None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+
+
+def _cached_n_outcomes(path: Path) -> int | None:
+    """Read n_outcomes from the scenario's cached _info file, if any."""
+    for name in ("_info.yml", "_info.yaml"):
+        info_file = path / name
+        if not info_file.exists():
+            continue
+        try:
+            with open(info_file) as f:
+                data = yaml.safe_load(f) or {}
+        except (OSError, yaml.YAMLError):
+            return None
+        n_outcomes = data.get("n_outcomes") if isinstance(data, dict) else None
+        return int(n_outcomes) if isinstance(n_outcomes, (int, float)) else None
+    return None
+
+
+class BulkStatsRunner:
+    """Calculate stats for many scenarios in parallel."""
+
+    @staticmethod
+    def estimate_size(path: str | Path) -> tuple[int, int]:
+        """Estimate how expensive calculating stats for a scenario is.
+
+        Returns:
+            Tuple of (n_outcomes, bytes): the outcome count from the cached info
+            (0 if unknown) and the size of the scenario's definition files.
+        """
+        path = Path(path)
+        try:
+            size = sum(entry[1] for entry in scenario_fingerprint(path))
+        except OSError:
+            size = 0
+        return _cached_n_outcomes(path) or 0, size
+
+    @staticmethod
+    def order_paths(paths: list[str]) -> list[tuple[str, int | None]]:
+        """Order scenarios largest first.
+
+        Returns:
+            List of (path, n_outcomes) with n_outcomes None when not cached.
+        """
+        sizes = {path: BulkStatsRunner.estimate_size(path) for path in paths}
+        ordered = sorted(paths, key=lambda p: sizes[p], reverse=True)
+        return [(p, sizes[p][0] or None) for p in ordered]
+
+    @staticmethod
+    def item_timeout(
+        n_outcomes: int | None, settings: PerformanceSettings
+    ) -> float | None:
+        """Seconds allowed for one scenario (None for no timeout).
+
+        Scenarios with max_outcomes_stats outcomes get the full stats_timeout,
+        smaller ones a proportional share; scenarios of unknown size get the
+        full timeout.
+        """
+        if not settings.stats_timeout:
+            return None
+        limit = settings.max_outcomes_stats
+        if not limit or n_outcomes is None:
+            return settings.stats_timeout
+        share = min(1.0, n_outcomes / limit)
+        return max(MIN_ITEM_TIMEOUT, settings.stats_timeout * share)
+
+    @staticmethod
+    async def run_stream(
+        paths: list[str], force: bool = False, max_workers: int | None = None
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Calculate stats for all paths, yielding events as items finish.
+
+        Events are dicts with a "type" key:
+        - progress: completed, total, current_path and either has_stats and
+          rational_fraction or error
+        - complete: completed, total and the list of errors
+
+        Workers are killed when the consumer stops iterating.
+
+        Args:
+            paths: Scenario directories.
+            force: Recalculate stats even if they exist.
+            max_workers: Number of worker processes (defaults to the
+                stats_workers setting, 0 meaning one per core).
+        """
+        settings = SettingsService.load_performance()
+        total = len(paths)
+        ordered = await asyncio.to_thread(BulkStatsRunner.order_paths, paths)
+        max_workers = max_workers or settings.stats_workers or os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, total))
+
+        completed = 0
+        errors: list[dict[str, str]] = []
+        queue = list(reversed(ordered))  # pop() takes the largest next
+        # Running items: asyncio future -> (path, n_outcomes, deadline)
+        running: dict[asyncio.Future, tuple[str, int | None, float | None]] = {}
+        executor = _new_pool(max_workers)
+
+        def submit(path: str, n_outcomes: int | None) -> None:
+            future: Future = executor.submit(_calculate_stats_in_worker, path, force)
+            timeout = BulkStatsRunner.item_timeout(n_outcomes, settings)
+            deadline = None if timeout is None else time.monotonic() + timeout
+            running[asyncio.wrap_future(future)] = (path, n_outcomes, deadline)
+
+        def progress(path: str, **data: Any) -> dict[str, Any]:
+            return {
+                "type": "progress",
+                "completed": completed,
+                "total": total,
+                "current_path": path,
+                **data,
+            }
+
+        try:
+            while queue or running:
+                # Keep exactly max_workers items in flight so that deadlines
+                # start (roughly) when an item starts running
+                while queue and len(running) < max_workers:
+                    submit(*queue.pop())
+
+                deadlines = [d for _, _, d in running.values() if d is not None]
+                wait_for = (
+                    max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                )
+                done, _ = await asyncio.wait(
+                    running, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    path, _, _ = running.pop(task)
+                    completed += 1
+                    invalidate_scenario_cache(path)
+                    try:
+                        stats: ScenarioStatsInfo = task.result()
+                    except Exception as e:
+                        errors.append({"path": path, "error": str(e)})
+                        yield progress(path, error=str(e))
+                        continue
+                    yield progress(
+                        path,
+                        has_stats=stats.has_stats,
+                        rational_fraction=stats.rational_fraction,
+                    )
+
+                now = time.monotonic()
+                expired = [
+                    task
+                    for task, (_, _, deadline) in running.items()
+                    if deadline is not None and deadline <= now and not task.done()
+                ]
+                if not expired:
+                    continue
+
+                # A running task cannot be interrupted: restart the pool and
+                # resubmit the items that were still within their time budget
+                for task in expired:
+                    task.cancel()
+                    path, _, _ = running.pop(task)
+                    completed += 1
+                    error = "Timed out calculating stats"
+                    errors.append({"path": path, "error": error})
+                    yield progress(path, error=error)
+                survivors = [(p, n) for p, n, _ in running.values()]
+                for task in running:
+                    task.cancel()
+                running.clear()
+                _kill_pool(executor)
+                executor = _new_pool(max_workers)
+                for path, n_outcomes in survivors:
+                    submit(path, n_outcomes)
+
+            yield {
+                "type": "complete",
+                "completed": completed,
+                "total": total,
+                "errors": errors,
+            }
+        finally:
+            for task in running:
+                task.cancel()
+            _kill_pool(executor)
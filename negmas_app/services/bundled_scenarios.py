@@ -0,0 +1,405 @@
+"""Lazy access to the scenarios bundled in scenarios.zip.
+
+Instead of extracting the whole archive on first start, scenarios can be
+registered straight from the archive's central directory: each scenario's
+members are indexed once (no member is decompressed) and a scenario is
+extracted to its directory under ~/negmas/app/scenarios/ the first time it is
+loaded. Extracted scenarios are ordinary directories, so edits and cache files
+(_info.yaml, _stats.yaml, ...) work as before.
+
+Lazy mode is enabled by a marker file in the scenarios directory. A full copy
+(``negmas-app setup``) extracts all scenarios with a pool of threads.
+"""
+
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from math import prod
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# Marks a scenarios directory whose missing bundled scenarios are read from the zip
+MARKER_FILE = ".bundled.json"
+
+# App cache files that may be bundled with scenarios
+CACHE_FILENAMES = {
+    "_info.yaml",
+    "_info.yml",
+    "_stats.yaml",
+    "_stats_pareto_utils.npy",
+    "_stats_pareto_outcomes.npy",
+    "_plot.webp",
+}
+
+_SCENARIO_SUFFIXES = {".yml", ".yaml", ".xml", ".json"}
+
+# Top-level "type:" of a YAML scenario file
+_TYPE_RE = re.compile(r"^type:\s*(\S+)", re.MULTILINE)
+
+# zip path -> ((size, mtime_ns), {scenario dir relative to the root: members})
+_INDEX: dict[str, tuple[tuple[int, int], dict[str, list[zipfile.ZipInfo]]]] = {}
+_index_lock = threading.Lock()
+# One lock per scenario so concurrent first loads extract it only once
+_extract_locks: dict[str, threading.Lock] = {}
+
+
+def _member_name(filename: str) -> str | None:
+    """Path of a member relative to the scenarios root (None to skip it)."""
+    if filename.endswith("/"):
+        return None
+    if filename.startswith("scenarios/"):
+        filename = filename[len("scenarios/") :]
+    parts = filename.split("/")
+    if parts[0] == "__MACOSX" or any(p.startswith(".") for p in parts):
+        return None
+    return filename
+
+
+def _is_cache_member(name: str) -> bool:
+    """Whether a member is an app cache file."""
+    return Path(name).name in CACHE_FILENAMES or "/_plots/" in f"/{name}"
+
+
+def _default_zip() -> Path:
+    from .setup_service import SetupService
+
+    return SetupService.get_bundled_scenarios_zip()
+
+
+def _default_root() -> Path:
+    from .setup_service import SetupService
+
+    return SetupService.get_user_scenarios_path()
+
+
+def _count_outcomes(domain: Any) -> int | None:
+    """Number of outcomes of a YAML domain definition (None if unknown)."""
+    issues = domain.get("issues") if isinstance(domain, dict) else None
+    if not issues:
+        return None
+    sizes = []
+    for issue in issues:
+        values = issue.get("values") if isinstance(issue, dict) else None
+        if not isinstance(values, list) or not values:
+            return None
+        if "Contiguous" in str(issue.get("type", "")) and len(values) == 2:
+            sizes.append(int(values[1]) - int(values[0]) + 1)
+        else:
+            sizes.append(len(values))
+    return prod(sizes)
+
+
+class BundledScenarioArchive:
+    """Register, load and extract scenarios from the bundled scenarios.zip."""
+
+    @staticmethod
+    def index(zip_path: Path | None = None) -> dict[str, list[zipfile.ZipInfo]]:
+        """Map each scenario directory in the archive to its members.
+
+        Only the central directory is read; the index is cached until the
+        archive changes.
+
+        Args:
+            zip_path: Archive (defaults to the bundled scenarios.zip).
+
+        Returns:
+            Dict of scenario directory (relative, e.g. "anac2010/Travel") to
+            the ZipInfo of its files.
+        """
+        zip_path = Path(zip_path) if zip_path else _default_zip()
+        st = zip_path.stat()
+        key = str(zip_path.resolve())
+        with _index_lock:
+            cached = _INDEX.get(key)
+            if cached is not None and cached[0] == (st.st_size, st.st_mtime_ns):
+                return cached[1]
+
+        scenarios: dict[str, list[zipfile.ZipInfo]] = {}
+        with zipfile.ZipFile(zip_path) as zf:
+            for info in zf.infolist():
+                name = _member_name(info.filename)
+                if name is None or "/" not in name:
+                    continue
+                # Cache files may sit in a nested _plots/ directory
+                parent = name.split("/_plots/")[0].rsplit("/", 1)[0]
+                scenarios.setdefault(parent, []).append(info)
+
+        # Keep directories that hold scenario definitions (not only cache files)
+        scenarios = {
+            rel: members
+            for rel, members in scenarios.items()
+            if any(
+                not _is_cache_member(_member_name(m.filename) or "")
+                and Path(m.filename).suffix.lower() in _SCENARIO_SUFFIXES
+                for m in members
+            )
+        }
+        with _index_lock:
+            _INDEX[key] = ((st.st_size, st.st_mtime_ns), scenarios)
+        return scenarios
+
+    @staticmethod
+    def is_enabled(scenarios_root: Path | None = None) -> bool:
+        """Whether missing bundled scenarios are read from the archive."""
+        root = Path(scenarios_root) if scenarios_root else _default_root()
+        return (root / MARKER_FILE).exists()
+
+    @staticmethod
+    def enable(scenarios_root: Path | None = None) -> Path:
+        """Turn on lazy mode for a scenarios directory.
+
+        Returns:
+            Path of the marker file.
+        """
+        root = Path(scenarios_root) if scenarios_root else _default_root()
+        root.mkdir(parents=True, exist_ok=True)
+        marker = root / MARKER_FILE
+        marker.write_text(json.dumps({"zip": str(_default_zip())}, indent=2))
+        return marker
+
+    @staticmethod
+    def describe(
+        rel: str, members: list[zipfile.ZipInfo], zf: zipfile.ZipFile
+    ) -> dict[str, Any]:
+        """Registry metadata of an archived scenario.
+
+        Reads the (small) definition files to tell the domain from the
+        utility functions and count outcomes.
+
+        Returns:
+            Dict with name, tags, n_outcomes and n_negotiators.
+        """
+        category = rel.split("/", 1)[0]
+        files = [
+            m
+            for m in members
+            if not _is_cache_member(_member_name(m.filename) or "")
+            and Path(m.filename).suffix.lower() in _SCENARIO_SUFFIXES
+        ]
+        suffixes = {Path(m.filename).suffix.lower() for m in files}
+        fmt = "xml" if ".xml" in suffixes else "json" if ".json" in suffixes else "yaml"
+
+        n_outcomes = None
+        if fmt == "yaml":
+            # Classify files by their top-level type the way negmas does
+            domain = None
+            n_negotiators = 0
+            for member in files:
+                text = zf.read(member).decode("utf-8", errors="replace")
+                match = _TYPE_RE.search(text)
+                kind = match.group(1) if match else ""
+                if "OutcomeSpace" in kind:
+                    domain = text
+                elif "fun" in kind.lower():
+                    n_negotiators += 1
+            if domain is not None:
+                try:
+                    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                    n_outcomes = _count_outcomes(yaml.load(domain, Loader=loader))
+                except (yaml.YAMLError, ValueError, TypeError):
+                    n_outcomes = None
+        else:
+            domains = [m for m in files if "domain" in Path(m.filename).stem.lower()]
+            n_negotiators = len(files) - len(domains)
+
+        tags = {category, fmt, "bilateral" if n_negotiators == 2 else "multilateral"}
+        if category.lower().startswith("anac"):
+            tags.add("anac")
+        return {
+            "name": rel.rsplit("/", 1)[-1],
+            "tags": tags,
+            "n_outcomes": n_outcomes,
+            "n_negotiators": n_negotiators or 2,
+        }
+
+    @staticmethod
+    def register_lazy(
+        scenarios_root: Path | None = None, zip_path: Path | None = None
+    ) -> int:
+        """Register archived scenarios that are not extracted yet.
+
+        Each scenario is registered at the directory it will be extracted to,
+        so it is indistinguishable from an extracted one.
+
+        Returns:
+            Number of scenarios registered.
+        """
+        from negmas import scenario_registry
+
+        root = Path(scenarios_root) if scenarios_root else _default_root()
+        zip_path = Path(zip_path) if zip_path else _default_zip()
+        scenarios = BundledScenarioArchive.index(zip_path)
+
+        registered = 0
+        with zipfile.ZipFile(zip_path) as zf:
+            for rel, members in scenarios.items():
+                path = root / rel
+                if path.exists() or str(path.resolve()) in scenario_registry:
+                    continue
+                meta = BundledScenarioArchive.describe(rel, members, zf)
+                scenario_registry.register(
+                    path,
+                    name=meta["name"],
+                    source="app",
+                    tags=meta["tags"],
+                    n_outcomes=meta["n_outcomes"],
+                    n_negotiators=meta["n_negotiators"],
+                    read_only=False,
+                )
+                registered += 1
+        return registered
+
+    @staticmethod
+    def ensure_scenario_files(
+        path: Path | str,
+        scenarios_root: Path | None = None,
+        zip_path: Path | None = None,
+    ) -> bool:
+        """Extract a bundled scenario on first use.
+
+        Does nothing if the directory exists or lazy mode is off.
+
+        Args:
+            path: Scenario directory.
+            scenarios_root: Root the archive is mapped to.
+            zip_path: Archive (defaults to the bundled scenarios.zip).
+
+        Returns:
+            True if the scenario was extracted now.
+        """
+        path = Path(path)
+        if path.exists():
+            return False
+        root = Path(scenarios_root) if scenarios_root else _default_root()
+        if not BundledScenarioArchive.is_enabled(root):
+            return False
+        try:
+            rel = path.resolve().relative_to(root.resolve()).as_posix()
+        except ValueError:
+            return False
+        try:
+            zip_path = Path(zip_path) if zip_path else _default_zip()
+            members = BundledScenarioArchive.index(zip_path).get(rel)
+        except (FileNotFoundError, zipfile.BadZipFile):
+            return False
+        if not members:
+            return False
+
+        with _index_lock:
+            lock = _extract_locks.setdefault(rel, threading.Lock())
+        with lock:
+            if path.exists():
+                return False
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Extract next to the target and rename so a partially extracted
+            # scenario is never visible
+            tmp = Path(tempfile.mkdtemp(prefix=f".{path.name}-", dir=path.parent))
+            try:
+                with zipfile.ZipFile(zip_path) as zf:
+                    for member in members:
+                        name = _member_name(member.filename)
+                        target = tmp / name[len(rel) + 1 :]
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                        with zf.open(member) as src, open(target, "wb") as dst:
+                            shutil.copyfileobj(src, dst)
+                os.replace(tmp, path)
+            finally:
+                if tmp.exists():
+                    shutil.rmtree(tmp, ignore_errors=True)
+        return True
+
+    @staticmethod
+    def extract_all(
+        target_dir: Path,
+        zip_path: Path | None = None,
+        force: bool = False,
+        skip_cache: bool = False,
+        workers: int | None = None,
+    ) -> dict[str, Any]:
+        """Extract all archived files, one scenario per task on a thread pool.
+
+        Args:
+            target_dir: Scenarios root to extract to.
+            zip_path: Archive (defaults to the bundled scenarios.zip).
+            force: Overwrite existing files.
+            skip_cache: Skip app cache files.
+            workers: Number of threads (defaults to one per core, at most 8).
+
+        Returns:
+            Dict with total_files, copied, skipped and errors.
+        """
+        zip_path = Path(zip_path) if zip_path else _default_zip()
+        stats: dict[str, Any] = {
+            "total_files": 0,
+            "copied": 0,
+            "skipped": 0,
+            "errors": [],
+        }
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+        # Group members by top-level entry so each task writes its own files
+        groups: dict[str, list[tuple[zipfile.ZipInfo, str]]] = {}
+        try:
+            with zipfile.ZipFile(zip_path) as zf:
+                for info in zf.infolist():
+                    name = _member_name(info.filename)
+                    if name is None or (skip_cache and _is_cache_member(name)):
+                        continue
+                    group = name.rsplit("/", 1)[0] if "/" in name else ""
+                    groups.setdefault(group, []).append((info, name))
+        except zipfile.BadZipFile as e:
+            stats["errors"].append(f"Invalid zip file: {str(e)}")
+            return stats
+
+        # One directory walk instead of an exists() call per file
+        existing: set[str] = set()
+        if not force:
+            for dirpath, _, filenames in os.walk(target_dir):
+                rel_dir = Path(dirpath).relative_to(target_dir).as_posix()
+                prefix = "" if rel_dir == "." else f"{rel_dir}/"
+                existing.update(prefix + f for f in filenames)
+
+        local = threading.local()
+        handles: list[zipfile.ZipFile] = []
+
+        def extract_group(items: list[tuple[zipfile.ZipInfo, str]]) -> dict[str, Any]:
+            # ZipFile handles are not thread-safe: one per thread
+            if getattr(local, "zf", None) is None:
+                local.zf = zipfile.ZipFile(zip_path)
+                handles.append(local.zf)
+            result: dict[str, Any] = {"copied": 0, "skipped": 0, "errors": []}
+            for info, name in items:
+                if name in existing:
+                    result["skipped"] += 1
+                    continue
+                target = target_dir / name
+                try:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    with local.zf.open(info) as src, open(target, "wb") as dst:
+                        shutil.copyfileobj(src, dst)
+                    result["copied"] += 1
+                except Exception as e:
+                    result["errors"].append(f"{name}: {str(e)}")
+            return result
+
+        workers = workers or min(8, os.cpu_count() or 1)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(extract_group, groups.values()))
+        finally:
+            for handle in handles:
+                handle.close()
+
+        stats["total_files"] = sum(len(items) for items in groups.values())
+        for result in results:
+            stats["copied"] += result["copied"]
+            stats["skipped"] += result["skipped"]
+            stats["errors"].extend(result["errors"])
+        return stats
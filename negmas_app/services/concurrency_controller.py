@@ -0,0 +1,237 @@
+"""Number of negotiations a tournament runs at once, chosen while it runs.
+
+A fixed njobs is a guess: too many parallel negotiations on big scenarios
+exhaust memory, too few leave cores idle while negotiators wait (on Genius
+bridges, LLM calls, ...). With ``adaptive_njobs`` a tournament starts with a
+single negotiation and a ``ConcurrencyController`` decides after every
+finished negotiation how many may run next, from what the negotiations
+measured in their workers (``measured``):
+
+* memory: the most a negotiation added to its worker's resident memory (RSS
+  after the negotiation minus RSS before it), and the memory the system has
+  left under the ceiling (``memory_limit``, defaulting to
+  ``DEFAULT_MEMORY_SHARE`` of the physical memory).
+* CPU: the share of its wall time a negotiation spent computing. Negotiations
+  using a quarter of a core each can run four per core.
+
+Memory is read with psutil (a dependency of negmas), which works the same on
+Linux, macOS and Windows. Without memory information only CPU counts.
+"""
+
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import psutil
+
+# Share of the physical memory tournaments may use without an explicit ceiling
+DEFAULT_MEMORY_SHARE = 0.85
+
+# Negotiations using less CPU than this share count as using this much
+MIN_CPU_SHARE = 0.05
+
+# Memory assumed for a negotiation that did not grow its worker
+MIN_RUN_MEMORY = 16 * 1024 * 1024
+
+# Negotiations failing without measurements (timeouts, dead workers) after
+# which the controller decides without them
+UNMEASURED_FAILURES = 3
+
+MB = 1024 * 1024
+
+
+@dataclass
+class RunUsage:
+    """Resources used by one negotiation in its worker process."""
+
+    # Bytes the negotiation added to the worker's resident memory
+    memory: int
+    # Seconds of CPU time and of wall time the negotiation took
+    cpu: float
+    wall: float
+
+
+def _rss() -> int | None:
+    """Resident memory of this process in bytes (None if unknown)."""
+    try:
+        return psutil.Process().memory_info().rss
+    except (psutil.Error, OSError):
+        return None
+
+
+def measured(
+    function: Callable[..., Any], args: tuple, kwargs: dict[str, Any]
+) -> tuple[Any, RunUsage]:
+    """Call a function (in a worker) and measure the resources it used.
+
+    The memory a call used is how much the worker's resident memory grew
+    during it. Unlike the process's peak RSS, which only ever grows and so
+    hides the memory of every negotiation after the largest one, this
+    measures each negotiation on its own.
+
+    Exceptions raised by the function carry the RunUsage in a ``usage``
+    attribute, as failed negotiations count too.
+
+    Returns:
+        The function's result and its RunUsage.
+    """
+    rss = _rss()
+    cpu, start = time.process_time(), time.perf_counter()
+
+    def usage() -> RunUsage:
+        after = _rss()
+        return RunUsage(
+            memory=max(0, after - rss) if rss is not None and after else 0,
+            cpu=time.process_time() - cpu,
+            wall=time.perf_counter() - start,
+        )
+
+    try:
+        result = function(*args, **kwargs)
+    except Exception as e:
+        e.usage = usage()  # type: ignore[attr-defined]
+        raise
+    return result, usage()
+
+
+def system_memory() -> tuple[int, int] | None:
+    """Total and available physical memory in bytes (None if unknown)."""
+    try:
+        memory = psutil.virtual_memory()
+    except (psutil.Error, OSError):
+        return None
+    return memory.total, memory.available
+
+
+class ConcurrencyController:
+    """Chooses how many negotiations of a tournament run at once.
+
+    Starts with one negotiation. After each finished negotiation (``record``)
+    the number grows towards what keeps all cores busy while the memory the
+    next negotiations need fits under the ceiling, and shrinks when the
+    system uses more memory than the ceiling.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        memory_limit: int | None = None,
+        cores: int | None = None,
+        on_change: Callable[[int, str], None] | None = None,
+    ) -> None:
+        """Create a controller.
+
+        Args:
+            max_workers: Most negotiations to run at once (the pool's size).
+            memory_limit: Bytes the whole system may use, or None for
+                DEFAULT_MEMORY_SHARE of the physical memory.
+            cores: Cores to keep busy (default: all).
+            on_change: Called with the new number of negotiations and the
+                reason whenever it changes.
+        """
+        self.max_workers = max(1, max_workers)
+        if memory_limit is None:
+            memory = system_memory()
+            if memory is not None:
+                memory_limit = int(memory[0] * DEFAULT_MEMORY_SHARE)
+        self.memory_limit = memory_limit
+        self.cores = max(1, cores or os.cpu_count() or 1)
+        self.on_change = on_change
+        self.workers = 1
+        self.reason = "measuring the first negotiation"
+        self.n_runs = 0
+        self.n_unmeasured = 0
+        # Most memory a negotiation needed, total CPU and wall seconds
+        self._run_memory = 0
+        self._cpu = 0.0
+        self._wall = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def run_memory(self) -> int:
+        """Memory to reserve for each negotiation, in bytes."""
+        return max(self._run_memory, MIN_RUN_MEMORY)
+
+    @property
+    def cpu_share(self) -> float:
+        """Share of a core a negotiation uses on average."""
+        if self._wall <= 0:
+            return 1.0
+        return min(1.0, max(self._cpu / self._wall, MIN_CPU_SHARE))
+
+    def record(self, usage: RunUsage) -> int:
+        """Account for a finished negotiation and decide again.
+
+        Returns:
+            The number of negotiations to run at once from now on.
+        """
+        with self._lock:
+            self.n_runs += 1
+            self._run_memory = max(self._run_memory, usage.memory)
+            self._cpu += usage.cpu
+            self._wall += usage.wall
+            return self._update(*self._decide())
+
+    def failed(self) -> int:
+        """Account for a negotiation that failed without measurements.
+
+        Until a negotiation was measured, the controller assumes negotiations
+        use a whole core and MIN_RUN_MEMORY after UNMEASURED_FAILURES such
+        failures, instead of staying at one negotiation.
+
+        Returns:
+            The number of negotiations to run at once from now on.
+        """
+        with self._lock:
+            self.n_unmeasured += 1
+            if self.n_runs or self.n_unmeasured < UNMEASURED_FAILURES:
+                return self.workers
+            workers, reason = self._decide()
+            reason = f"{reason}; {self.n_unmeasured} negotiations failed unmeasured"
+            return self._update(workers, reason)
+
+    def _update(self, workers: int, reason: str) -> int:
+        """Apply a decision (called with the lock held)."""
+        changed = workers != self.workers
+        previous, self.workers, self.reason = self.workers, workers, reason
+        if changed:
+            print(
+                f"[ConcurrencyController] {previous} -> {workers} parallel "
+                f"negotiations: {reason}"
+            )
+            if self.on_change is not None:
+                self.on_change(workers, reason)
+        return workers
+
+    def _decide(self) -> tuple[int, str]:
+        wanted = math.ceil(self.cores / self.cpu_share)
+        for_cores = min(self.max_workers, wanted)
+        if wanted > self.max_workers:
+            reason = f"all {self.max_workers} workers of the pool"
+        else:
+            reason = (
+                f"{wanted} keep {self.cores} cores busy "
+                f"({self.cpu_share:.0%} CPU per negotiation)"
+            )
+        memory = system_memory()
+        if memory is None or self.memory_limit is None:
+            return for_cores, reason
+        total, available = memory
+        headroom = self.memory_limit - (total - available)
+        need = self.run_memory
+        limit_text = (
+            f"{need // MB} MB per negotiation, "
+            f"{self.memory_limit // MB} MB ceiling"
+        )
+        if headroom < 0:
+            fewer = math.ceil(-headroom / need)
+            reason = f"over the memory ceiling ({limit_text})"
+            return max(1, self.workers - fewer), reason
+        # Running negotiations already hold their memory: add what still fits
+        fits = self.workers + headroom // need
+        if fits < for_cores:
+            return max(1, fits), f"memory bound ({limit_text})"
+        return for_cores, reason
@@ -0,0 +1,293 @@
+"""Background deletion of large directory trees.
+
+Deleting a tournament or thousands of saved negotiations with shutil.rmtree
+inside a request can take minutes. Instead, targets are renamed into a hidden
+``.trash`` directory next to them, which is atomic and instant because the
+rename stays on the same filesystem, and callers update their indexes right
+away. A background thread then reclaims the space, unlinking files with a
+pool of workers, and keeps per-job progress for the API.
+
+Hidden directories are skipped by scenario discovery, tournament and
+negotiation listings and the storage ledger, so trashed items disappear from
+the app immediately.
+"""
+
+import os
+import queue
+import threading
+import time
+import uuid
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+TRASH_DIR_NAME = ".trash"
+
+# Threads unlinking files
+UNLINK_WORKERS = 8
+# Files handed to the unlink workers at a time
+UNLINK_BATCH = 512
+# Finished jobs kept for status reports
+MAX_FINISHED_JOBS = 50
+
+
+@dataclass
+class DeletionJob:
+    """Progress of one deletion request."""
+
+    id: str
+    label: str
+    n_targets: int
+    status: str = "queued"  # queued, deleting, done
+    targets_done: int = 0
+    files_deleted: int = 0
+    bytes_freed: int = 0
+    errors: list[str] = field(default_factory=list)
+    created_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
+
+
+_lock = threading.Lock()
+_jobs: dict[str, DeletionJob] = {}
+_queue: "queue.Queue[tuple[DeletionJob, list[Path]]]" = queue.Queue()
+# job id -> trashed paths still to delete
+_pending: dict[str, list[Path]] = {}
+_worker: threading.Thread | None = None
+# Trash directories whose leftovers (e.g. from a crash) were queued
+_resumed: set[str] = set()
+
+
+def _unlink(item: tuple[str, int]) -> tuple[int, str | None]:
+    path, size = item
+    try:
+        os.unlink(path)
+        return size, None
+    except FileNotFoundError:
+        return 0, None
+    except OSError as e:
+        return -1, f"{path}: {e}"
+
+
+class DeletionQueue:
+    """Move targets to trash instantly and delete them in the background."""
+
+    @staticmethod
+    def trash_dir_for(path: Path) -> Path:
+        """Trash directory used for a target (next to it, same filesystem)."""
+        return path.parent / TRASH_DIR_NAME
+
+    @staticmethod
+    def move_to_trash(path: Path, trash_dir: Path | None = None) -> Path:
+        """Atomically rename a file or directory into a trash directory.
+
+        Raises:
+            FileNotFoundError: If the path does not exist.
+            OSError: If the rename fails.
+        """
+        path = Path(path)
+        trash_dir = trash_dir or DeletionQueue.trash_dir_for(path)
+        trash_dir.mkdir(parents=True, exist_ok=True)
+        target = trash_dir / f"{uuid.uuid4().hex[:12]}_{path.name}"
+        os.rename(path, target)
+        return target
+
+    @staticmethod
+    def delete(
+        paths: Iterable[str | Path],
+        label: str = "",
+        trash_dir: Path | None = None,
+    ) -> DeletionJob:
+        """Remove paths from view now and reclaim their space in the background.
+
+        Args:
+            paths: Files or directories to delete.
+            label: Description shown in status reports.
+            trash_dir: Trash directory (defaults to .trash next to each path).
+                Must be on the same filesystem as the paths.
+
+        Returns:
+            The job. Paths that could not be moved are listed in its errors
+            and are not deleted.
+        """
+        trashed: list[Path] = []
+        errors: list[str] = []
+        paths = [Path(p) for p in paths]
+        for path in paths:
+            try:
+                trashed.append(DeletionQueue.move_to_trash(path, trash_dir))
+            except OSError as e:
+                errors.append(f"{path}: {e}")
+        if not label:
+            label = paths[0].name if len(paths) == 1 else f"{len(paths)} items"
+        job = DeletionJob(
+            id=uuid.uuid4().hex[:12],
+            label=label,
+            n_targets=len(trashed),
+            errors=errors,
+        )
+        DeletionQueue._submit(job, trashed)
+        for trash in {t.parent for t in trashed}:
+            DeletionQueue.resume(trash)
+        return job
+
+    @staticmethod
+    def resume(trash_dir: Path) -> DeletionJob | None:
+        """Queue items left in a trash directory by an earlier process.
+
+        Each trash directory is checked once per process.
+
+        Returns:
+            The job, or None if there was nothing to resume.
+        """
+        key = str(trash_dir)
+        with _lock:
+            if key in _resumed:
+                return None
+            _resumed.add(key)
+        try:
+            with os.scandir(trash_dir) as it:
+                leftovers = [Path(e.path) for e in it]
+        except OSError:
+            return None
+        # Items queued by this process are not leftovers
+        with _lock:
+            queued = {str(p) for job_paths in _pending.values() for p in job_paths}
+        leftovers = [p for p in leftovers if str(p) not in queued]
+        if not leftovers:
+            return None
+        job = DeletionJob(
+            id=uuid.uuid4().hex[:12],
+            label=f"leftovers in {trash_dir}",
+            n_targets=len(leftovers),
+        )
+        DeletionQueue._submit(job, leftovers)
+        return job
+
+    @staticmethod
+    def _submit(job: DeletionJob, paths: list[Path]) -> None:
+        global _worker
+        with _lock:
+            _jobs[job.id] = job
+            DeletionQueue._prune()
+            if not paths:
+                job.status = "done"
+                job.finished_at = time.time()
+                return
+            _pending[job.id] = paths
+            _queue.put((job, paths))
+            if _worker is None:
+                _worker = threading.Thread(
+                    target=DeletionQueue._run, daemon=True, name="deletion-queue"
+                )
+                _worker.start()
+
+    @staticmethod
+    def _prune() -> None:
+        """Forget the oldest finished jobs (call with the lock held)."""
+        finished = [j for j in _jobs.values() if j.finished_at is not None]
+        finished.sort(key=lambda j: j.finished_at or 0)
+        for job in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del _jobs[job.id]
+
+    @staticmethod
+    def _run() -> None:
+        global _worker
+        with ThreadPoolExecutor(UNLINK_WORKERS, thread_name_prefix="unlink") as pool:
+            while True:
+                try:
+                    job, paths = _queue.get(timeout=5)
+                except queue.Empty:
+                    with _lock:
+                        # Nothing was queued since the timeout: stop
+                        if _queue.empty():
+                            _worker = None
+                            return
+                    continue
+                job.status = "deleting"
+                for path in paths:
+                    try:
+                        DeletionQueue._reclaim(path, job, pool)
+                    except Exception as e:
+                        job.errors.append(f"{path}: {e}")
+                    job.targets_done += 1
+                with _lock:
+                    _pending.pop(job.id, None)
+                    job.status = "done"
+                    job.finished_at = time.time()
+
+    @staticmethod
+    def _reclaim(path: Path, job: DeletionJob, pool: ThreadPoolExecutor) -> None:
+        """Delete a trashed file or tree, unlinking files in parallel."""
+        if not path.is_dir() or path.is_symlink():
+            size, error = _unlink((str(path), path.lstat().st_size))
+            job.files_deleted += 1
+            job.bytes_freed += max(size, 0)
+            if error:
+                job.errors.append(error)
+            return
+
+        batch: list[tuple[str, int]] = []
+
+        def flush() -> None:
+            for size, error in pool.map(_unlink, batch):
+                if error:
+                    job.errors.append(error)
+                    continue
+                job.files_deleted += 1
+                job.bytes_freed += size
+            batch.clear()
+
+        dirs: list[str] = []
+        stack = [str(path)]
+        while stack:
+            directory = stack.pop()
+            dirs.append(directory)
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        size = entry.stat(follow_symlinks=False).st_size
+                        batch.append((entry.path, size))
+                        if len(batch) >= UNLINK_BATCH:
+                            flush()
+        flush()
+        # Children were listed after their parents
+        for directory in reversed(dirs):
+            try:
+                os.rmdir(directory)
+            except OSError as e:
+                job.errors.append(f"{directory}: {e}")
+
+    @staticmethod
+    def wait(timeout: float | None = None) -> bool:
+        """Block until all queued deletions finished (mainly for tests).
+
+        Returns:
+            True if the queue drained within the timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with _lock:
+                if not _pending:
+                    return True
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+
+    @staticmethod
+    def status() -> dict[str, Any]:
+        """Progress of running and recent deletion jobs.
+
+        Returns:
+            Dict with the number of pending jobs and the jobs, newest first.
+        """
+        with _lock:
+            jobs = sorted(_jobs.values(), key=lambda j: j.created_at, reverse=True)
+            return {
+                "pending": len(_pending),
+                "jobs": [asdict(job) for job in jobs],
+            }
+
@@ -0,0 +1,280 @@
+"""Append-only parquet segments of results written while a tournament runs.
+
+negmas only writes a tournament's details and scores when it finishes (or
+every ``save_every`` negotiations). To make running tournaments readable,
+each negotiation record passed to the after-end callback is buffered and
+written to small parquet segment files under ``live_results/`` in the
+tournament directory. A segment is written to a temporary name and renamed
+when complete, so readers only ever see finished segments, and a crash loses
+at most the records not yet flushed. Buffered records are written after
+``SEGMENT_SECONDS`` even if no further negotiation ends (slow negotiations).
+
+Records hold tuples, lists and dicts (partners, agreement, utilities, ...).
+Columns with such values, or with mixed value types, are stored as JSON and
+listed in the segment's schema metadata so they can be decoded on reading.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+LIVE_RESULTS_DIR = "live_results"
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".parquet"
+
+# A segment is written after this many records or seconds (whichever first)
+SEGMENT_ROWS = 256
+SEGMENT_SECONDS = 10.0
+
+_JSON_COLUMNS_KEY = b"json_columns"
+_SCALAR_KINDS = ({bool}, {int}, {float}, {int, float}, {str})
+
+
+def _json_default(value: Any) -> Any:
+    if hasattr(value, "item"):
+        # numpy scalars
+        return value.item()
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+def _normalize(value: Any) -> Any:
+    """Plain Python value for a record entry (numpy scalars become Python)."""
+    if hasattr(value, "item") and not isinstance(value, (list, tuple, dict)):
+        try:
+            return value.item()
+        except (TypeError, ValueError):
+            return value
+    return value
+
+
+def segment_paths(path: str | Path) -> list[Path]:
+    """Finished segments of a tournament directory, in write order."""
+    directory = Path(path) / LIVE_RESULTS_DIR
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+    return [
+        directory / name
+        for name in sorted(names)
+        if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX)
+    ]
+
+
+def _to_table(records: list[dict[str, Any]]) -> pa.Table:
+    columns: dict[str, list[Any]] = {}
+    for i, record in enumerate(records):
+        for key in record:
+            if key not in columns:
+                columns[key] = [None] * i
+        for key, values in columns.items():
+            values.append(_normalize(record.get(key)))
+    arrays: dict[str, pa.Array] = {}
+    json_columns: list[str] = []
+    for key, values in columns.items():
+        kinds = {type(v) for v in values if v is not None}
+        if not kinds or kinds in _SCALAR_KINDS:
+            try:
+                arrays[str(key)] = pa.array(values)
+                continue
+            except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+                pass
+        json_columns.append(str(key))
+        encoded = [
+            None if v is None else json.dumps(v, default=_json_default) for v in values
+        ]
+        arrays[str(key)] = pa.array(encoded, type=pa.string())
+    table = pa.table(arrays)
+    return table.replace_schema_metadata(
+        {_JSON_COLUMNS_KEY: json.dumps(json_columns).encode()}
+    )
+
+
+def read_table(path: str | Path) -> pa.Table | None:
+    """Union of the finished segments of a tournament (JSON columns encoded).
+
+    Returns:
+        The records as a table, or None if there are no segments.
+    """
+    from .tournament_combiner import _conform, unify_schemas
+
+    tables: list[tuple[pa.Table, set[str]]] = []
+    for segment in segment_paths(path):
+        try:
+            table = pq.read_table(segment)
+        except (OSError, pa.ArrowInvalid):
+            # Deleted or being replaced while listing
+            continue
+        metadata = table.schema.metadata or {}
+        encoded = set(json.loads(metadata.get(_JSON_COLUMNS_KEY, b"[]")))
+        tables.append((table.replace_schema_metadata(None), encoded))
+    if not tables:
+        return None
+    json_columns = set().union(*(encoded for _, encoded in tables))
+    # A column stored as JSON in any segment is JSON in all of them
+    conformed = []
+    for table, encoded in tables:
+        for name in (json_columns - encoded) & set(table.column_names):
+            values = [
+                None if v is None else json.dumps(v)
+                for v in table.column(name).to_pylist()
+            ]
+            table = table.set_column(
+                table.column_names.index(name), name, pa.array(values, pa.string())
+            )
+        conformed.append(table)
+    schema = unify_schemas(t.schema for t in conformed)
+    combined = pa.concat_tables([_conform(t, schema) for t in conformed])
+    return combined.replace_schema_metadata(
+        {_JSON_COLUMNS_KEY: json.dumps(sorted(json_columns)).encode()}
+    )
+
+
+def _decode(table: pa.Table) -> list[dict[str, Any]]:
+    metadata = table.schema.metadata or {}
+    json_columns = set(json.loads(metadata.get(_JSON_COLUMNS_KEY, b"[]")))
+    records = table.to_pylist()
+    for record in records:
+        for name in json_columns:
+            value = record.get(name)
+            if value is not None:
+                record[name] = json.loads(value)
+    return records
+
+
+def read_records(path: str | Path) -> list[dict[str, Any]]:
+    """Records of the finished segments of a tournament, decoded."""
+    table = read_table(path)
+    return [] if table is None else _decode(table)
+
+
+def read_segment(segment: str | Path) -> list[dict[str, Any]]:
+    """Records of one finished segment, decoded."""
+    return _decode(pq.read_table(segment))
+
+
+def read_tables(path: str | Path) -> tuple[pa.Table, pa.Table] | None:
+    """Details and per-negotiator scores of the finished segments.
+
+    The tables correspond to negmas' details and all_scores. Columns holding
+    tuples, lists or dicts are JSON strings.
+
+    Returns:
+        Tuple of (details, scores), or None if there are no segments.
+    """
+    from negmas.tournaments.neg.simple.cartesian import make_scores
+
+    table = read_table(path)
+    if table is None:
+        return None
+    scores = [
+        score
+        for record in _decode(table)
+        for score in make_scores(record, scored_indices=record.get("scored_indices"))
+    ]
+    details = table.replace_schema_metadata(None)
+    return details, _to_table(scores).replace_schema_metadata(None)
+
+
+class LiveResultsWriter:
+    """Buffers negotiation records and appends them as parquet segments."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        resume: bool = False,
+        segment_rows: int = SEGMENT_ROWS,
+        segment_seconds: float = SEGMENT_SECONDS,
+    ) -> None:
+        """Start writing segments for a tournament directory.
+
+        Args:
+            path: Tournament directory.
+            resume: Keep existing segments (continued tournament). Otherwise
+                segments left by an earlier run of the same directory are
+                removed.
+            segment_rows: Records per segment.
+            segment_seconds: Maximum age of buffered records before they are
+                written.
+        """
+        self.directory = Path(path) / LIVE_RESULTS_DIR
+        if not resume:
+            shutil.rmtree(self.directory, ignore_errors=True)
+        self.segment_rows = segment_rows
+        self.segment_seconds = segment_seconds
+        self.n_records = 0
+        self._buffer: list[dict[str, Any]] = []
+        self._first_buffered = 0.0
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+        existing = segment_paths(path)
+        self._next_segment = (
+            int(existing[-1].name[len(SEGMENT_PREFIX) : -len(SEGMENT_SUFFIX)]) + 1
+            if existing
+            else 0
+        )
+
+    def append(self, record: dict[str, Any]) -> None:
+        """Buffer a record, writing a segment when the buffer is full or old."""
+        with self._lock:
+            if not self._buffer:
+                self._first_buffered = time.monotonic()
+                # Written when old even if no further record arrives
+                self._timer = threading.Timer(self.segment_seconds, self._on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+            self._buffer.append(dict(record))
+            self.n_records += 1
+            if (
+                len(self._buffer) >= self.segment_rows
+                or time.monotonic() - self._first_buffered >= self.segment_seconds
+            ):
+                self._flush()
+
+    def flush(self) -> None:
+        """Write buffered records as a segment."""
+        with self._lock:
+            self._flush()
+
+    def _on_timer(self) -> None:
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"[LiveResults] Failed to write segment: {e}")
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _flush(self) -> None:
+        self._cancel_timer()
+        if not self._buffer:
+            return
+        table = _to_table(self._buffer)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        name = f"{SEGMENT_PREFIX}{self._next_segment:06d}{SEGMENT_SUFFIX}"
+        tmp = self.directory / f".{name}.tmp"
+        pq.write_table(table, tmp)
+        os.replace(tmp, self.directory / name)
+        self._next_segment += 1
+        self._buffer = []
+
+    def discard(self) -> None:
+        """Drop buffered records and remove all segments.
+
+        Used once negmas saved the complete results of the tournament.
+        """
+        with self._lock:
+            self._cancel_timer()
+            self._buffer = []
+            shutil.rmtree(self.directory, ignore_errors=True)
@@ -1,12 +1,25 @@
-"""Module inspection service for discovering classes in Python files."""
+"""Module inspection service for discovering classes in Python files.
+
+Inspection results are cached by file content hash, so inspecting an
+unchanged file again neither parses nor imports it. Before custom paths
+are registered (which executes their modules), ``screen_modules`` checks
+their source concurrently for classes that may be negotiators, mechanisms
+or BOA components. Only those modules are imported. Screening results
+are kept across restarts in SCREEN_CACHE_FILE, by content hash too.
+"""
 
 import ast
+import hashlib
 import importlib.util
 import inspect
+import json
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from negmas.inout import (
     find_domain_and_utility_files_geniusweb,
@@ -14,6 +27,8 @@ from negmas.inout import (
     find_domain_and_utility_files_yaml,
 )
 
+from .server_metrics import record_cache
+
 # Parameters from base Negotiator class that should be ignored
 # These are set by the app, not configured by users
 IGNORED_BASE_PARAMS = frozenset(
@@ -27,6 +42,22 @@ IGNORED_BASE_PARAMS = frozenset(
     }
 )
 
+# Inspection results kept in memory, by path, content hash and mode
+INSPECTION_CACHE_SIZE = 256
+# Screening results by content hash, kept across restarts
+SCREEN_CACHE_FILE = Path.home() / "negmas" / "app" / "cache" / "module_screen.json"
+SCREEN_CACHE_VERSION = 1
+SCREEN_CACHE_SIZE = 20_000
+# Threads reading, hashing and parsing the files of custom paths
+SCREEN_WORKERS = 8
+
+_inspection_cache: "OrderedDict[tuple[str, str, bool], ModuleInspectionResult]" = (
+    OrderedDict()
+)
+_screen_cache: dict[str, bool] | None = None
+_screen_cache_dirty = False
+_cache_lock = threading.Lock()
+
 
 @dataclass
 class ClassInfo:
@@ -118,11 +149,16 @@ def _is_boa_component(bases: list[str]) -> bool:
     )
 
 
-def inspect_module_ast(file_path: str) -> ModuleInspectionResult:
-    """Inspect a Python module using AST (static analysis, no execution).
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
 
-    This is safer but provides less information than dynamic inspection.
-    """
+
+def _cached(
+    file_path: str,
+    dynamic: bool,
+    inspect_source: Callable[[str, bytes], ModuleInspectionResult],
+) -> ModuleInspectionResult:
+    """Check a file and inspect it, reusing results for the same content."""
     path = Path(file_path)
     if not path.exists():
         return ModuleInspectionResult(
@@ -134,12 +170,44 @@ def inspect_module_ast(file_path: str) -> ModuleInspectionResult:
             path=file_path, module_name="", error="Not a Python file"
         )
 
-    module_name = path.stem
-
     try:
-        with open(path, encoding="utf-8") as f:
-            source = f.read()
+        source = path.read_bytes()
+    except OSError as e:
+        return ModuleInspectionResult(
+            path=file_path, module_name=path.stem, error=str(e)
+        )
+    key = (str(path.resolve()), _digest(source), dynamic)
+    with _cache_lock:
+        result = _inspection_cache.get(key)
+        if result is not None:
+            _inspection_cache.move_to_end(key)
+            record_cache("module_inspections", True)
+            return result
+    record_cache("module_inspections", False)
+    result = inspect_source(file_path, source)
+    if dynamic and result.error:
+        # May depend on packages installed later
+        return result
+    with _cache_lock:
+        _inspection_cache[key] = result
+        while len(_inspection_cache) > INSPECTION_CACHE_SIZE:
+            _inspection_cache.popitem(last=False)
+    return result
+
 
+def inspect_module_ast(file_path: str) -> ModuleInspectionResult:
+    """Inspect a Python module using AST (static analysis, no execution).
+
+    This is safer but provides less information than dynamic inspection.
+    Results are cached by file content (callers must not modify them).
+    """
+    return _cached(file_path, False, _inspect_ast)
+
+
+def _inspect_ast(file_path: str, source: bytes) -> ModuleInspectionResult:
+    module_name = Path(file_path).stem
+
+    try:
         tree = ast.parse(source)
         classes: list[ClassInfo] = []
 
@@ -186,20 +254,19 @@ def inspect_module_dynamic(file_path: str) -> ModuleInspectionResult:
     """Inspect a Python module by actually importing it.
 
     This provides more accurate information but executes the module code.
-    Use with caution for untrusted code.
+    Use with caution for untrusted code. Modules that cannot define
+    negotiators, mechanisms or BOA components (see ``screen_module``) are
+    not executed. Results are cached by file content (callers must not
+    modify them).
     """
-    path = Path(file_path)
-    if not path.exists():
-        return ModuleInspectionResult(
-            path=file_path, module_name="", error=f"File not found: {file_path}"
-        )
+    return _cached(file_path, True, _inspect_dynamic)
 
-    if not path.suffix == ".py":
-        return ModuleInspectionResult(
-            path=file_path, module_name="", error="Not a Python file"
-        )
 
+def _inspect_dynamic(file_path: str, source: bytes) -> ModuleInspectionResult:
+    path = Path(file_path)
     module_name = path.stem
+    if not screen_module(path, source=source):
+        return ModuleInspectionResult(path=file_path, module_name=module_name)
 
     try:
         # Import negmas to have base classes available when loading custom modules
@@ -288,6 +355,159 @@ def inspect_module_dynamic(file_path: str) -> ModuleInspectionResult:
             del sys.modules[module_name]
 
 
+def _is_candidate_base(base: str) -> bool:
+    bases = [base]
+    return (
+        _is_negotiator_class(bases)
+        or _is_mechanism_class(bases)
+        or _is_boa_component(bases)
+    )
+
+
+def _local_modules(directory: Path) -> frozenset[str]:
+    """Names of the modules and packages next to a custom module."""
+    try:
+        return frozenset(
+            p.stem
+            for p in directory.iterdir()
+            if p.suffix == ".py" or (p / "__init__.py").exists()
+        )
+    except OSError:
+        return frozenset()
+
+
+def _may_define_classes(tree: ast.AST, local_modules: frozenset[str]) -> bool:
+    """Whether a module may define negotiators, mechanisms or BOA components.
+
+    A class may be one if a base looks like one (by name, as in
+    inspect_module_ast), is such a class of the module, or is imported from
+    a local module (whose classes are unknown without importing it).
+    """
+    local_names: set[str] = set()
+    classes: list[ast.ClassDef] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            classes.append(node)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level or (node.module or "").split(".")[0] in local_modules:
+                local_names.update(a.asname or a.name for a in node.names)
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name.split(".")[0] in local_modules:
+                    local_names.add((alias.asname or alias.name).split(".")[0])
+
+    candidates: set[str] = set()
+    changed = True
+    while changed:
+        changed = False
+        for node in classes:
+            if node.name in candidates:
+                continue
+            if any(
+                _is_candidate_base(base)
+                or base in candidates
+                or base.split(".")[0] in local_names
+                for base in _get_base_class_names(node)
+            ):
+                candidates.add(node.name)
+                changed = True
+    return bool(candidates)
+
+
+def _get_screen_cache() -> dict[str, bool]:
+    global _screen_cache
+    with _cache_lock:
+        if _screen_cache is None:
+            _screen_cache = {}
+            try:
+                with open(SCREEN_CACHE_FILE) as f:
+                    data = json.load(f)
+                if data.get("version") == SCREEN_CACHE_VERSION:
+                    _screen_cache = dict(data["entries"])
+            except FileNotFoundError:
+                pass
+            except (json.JSONDecodeError, OSError, KeyError, TypeError) as e:
+                print(f"Warning: Ignoring invalid module screen cache: {e}")
+        return _screen_cache
+
+
+def screen_module(
+    path: Path,
+    local_modules: frozenset[str] | None = None,
+    source: bytes | None = None,
+) -> bool:
+    """Check without importing whether a module may define relevant classes.
+
+    Args:
+        path: Python file.
+        local_modules: Modules next to it (found if not given).
+        source: Its content, if already read.
+
+    Returns:
+        False only if the module surely defines no negotiator, mechanism or
+        BOA component. Unreadable or invalid files pass, so importing them
+        reports the error.
+    """
+    global _screen_cache_dirty
+    if local_modules is None:
+        local_modules = _local_modules(path.parent)
+    try:
+        if source is None:
+            source = path.read_bytes()
+    except OSError:
+        return True
+    key = f"{_digest(source)}:{_digest(','.join(sorted(local_modules)).encode())}"
+    cache = _get_screen_cache()
+    with _cache_lock:
+        result = cache.get(key)
+    if result is not None:
+        return result
+    try:
+        result = _may_define_classes(ast.parse(source), local_modules)
+    except (SyntaxError, ValueError):
+        result = True
+    with _cache_lock:
+        cache[key] = result
+        _screen_cache_dirty = True
+    return result
+
+
+def screen_modules(paths: list[Path]) -> dict[Path, bool]:
+    """Screen many modules concurrently (see ``screen_module``).
+
+    Returns:
+        Whether each module may define relevant classes.
+    """
+    local_modules = {d: _local_modules(d) for d in {p.parent for p in paths}}
+    results: dict[Path, bool] = {}
+    if paths:
+        with ThreadPoolExecutor(min(SCREEN_WORKERS, len(paths))) as pool:
+            screened = pool.map(
+                lambda p: screen_module(p, local_modules[p.parent]), paths
+            )
+            results = dict(zip(paths, screened))
+    save_screen_cache()
+    return results
+
+
+def save_screen_cache() -> None:
+    """Write the screening results atomically if there are new ones."""
+    global _screen_cache_dirty
+    with _cache_lock:
+        if not _screen_cache_dirty or _screen_cache is None:
+            return
+        entries = list(_screen_cache.items())[-SCREEN_CACHE_SIZE:]
+        _screen_cache_dirty = False
+    try:
+        SCREEN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = SCREEN_CACHE_FILE.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump({"version": SCREEN_CACHE_VERSION, "entries": dict(entries)}, f)
+        tmp_file.replace(SCREEN_CACHE_FILE)
+    except OSError as e:
+        print(f"Warning: Failed to save module screen cache: {e}")
+
+
 def validate_scenario_path(path: str) -> dict[str, Any]:
     """Validate a scenario path (file or directory).
 
@@ -0,0 +1,351 @@
+"""SQLite index of saved negotiation summaries and tags.
+
+Listing saved negotiations used to load the config and metadata YAML files of
+every negotiation on every request. Summaries are now kept in a small SQLite
+database next to the negotiations. Each entry is updated when a negotiation is
+saved, imported, archived, tagged or deleted. A reconciliation pass picks up
+changes made outside the app, and listings and tags become indexed queries.
+
+Entries are keyed by (archived, name), where name is the directory (or file)
+name within the negotiations or archive directory. The summary is stored as
+JSON together with the columns used for filtering and sorting.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+INDEX_FILE = ".negotiation_index.sqlite"
+SCHEMA_VERSION = 1
+
+# Single-file negotiations stored directly in a negotiations directory
+FILE_SUFFIXES = (".csv", ".parquet")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS negotiations (
+    archived INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    id TEXT NOT NULL,
+    scenario_name TEXT,
+    end_time TEXT,
+    mtime_ns INTEGER,
+    summary TEXT NOT NULL,
+    PRIMARY KEY (archived, name)
+);
+CREATE INDEX IF NOT EXISTS ix_negotiations_end_time
+    ON negotiations (archived, end_time DESC);
+CREATE TABLE IF NOT EXISTS tags (
+    archived INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (archived, name, tag)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_tags_tag ON tags (tag);
+"""
+
+# db path -> connection (shared across threads, guarded by _lock)
+_connections: dict[str, sqlite3.Connection] = {}
+_lock = threading.RLock()
+# db paths reconciled since the process started
+_reconciled: set[str] = set()
+_reconcile_lock = threading.Lock()
+
+Summarize = Callable[[Path, bool], dict[str, Any] | None]
+
+
+def entry_mtime(path: Path) -> int | None:
+    """Modification time that changes whenever a negotiation's summary can.
+
+    For directories this is metadata.yaml (rewritten by tag and archive
+    updates) or, without one, the directory itself.
+    """
+    try:
+        if path.is_dir():
+            metadata = path / "metadata.yaml"
+            if metadata.exists():
+                return metadata.stat().st_mtime_ns
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def list_entries(directory: Path) -> dict[str, int | None]:
+    """Negotiation entries of a directory (name -> mtime)."""
+    entries: dict[str, int | None] = {}
+    if not directory.exists():
+        return entries
+    with os.scandir(directory) as it:
+        for item in it:
+            if item.name.startswith("."):
+                continue
+            try:
+                is_dir = item.is_dir()
+            except OSError:
+                continue
+            if is_dir or item.name.endswith(FILE_SUFFIXES):
+                entries[item.name] = entry_mtime(Path(item.path))
+    return entries
+
+
+class NegotiationIndex:
+    """Persistent, queryable index of saved negotiations."""
+
+    @staticmethod
+    def _open(db_path: Path) -> sqlite3.Connection:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            # Derived data: rebuild instead of migrating
+            conn.executescript(
+                "DROP TABLE IF EXISTS negotiations; DROP TABLE IF EXISTS tags;"
+            )
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.executescript(_SCHEMA)
+        conn.commit()
+        return conn
+
+    @staticmethod
+    def _connection(db_path: Path) -> sqlite3.Connection:
+        """Shared connection to an index (call with the lock held)."""
+        key = str(db_path)
+        conn = _connections.get(key)
+        if conn is not None and db_path.exists():
+            return conn
+        if conn is not None:
+            # The file was deleted (e.g. the storage directory was removed)
+            conn.close()
+            _reconciled.discard(key)
+        try:
+            conn = NegotiationIndex._open(db_path)
+        except sqlite3.DatabaseError:
+            # Corrupt file: start over, reconciliation refills it
+            db_path.unlink(missing_ok=True)
+            conn = NegotiationIndex._open(db_path)
+            _reconciled.discard(key)
+        _connections[key] = conn
+        return conn
+
+    @staticmethod
+    def _upsert(
+        conn: sqlite3.Connection,
+        archived: bool,
+        name: str,
+        summary: dict[str, Any],
+        mtime_ns: int | None,
+    ) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO negotiations "
+            "(archived, name, id, scenario_name, end_time, mtime_ns, summary) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                int(archived),
+                name,
+                str(summary.get("id", name)),
+                summary.get("scenario_name"),
+                summary.get("end_time"),
+                mtime_ns,
+                json.dumps(summary, default=str),
+            ),
+        )
+        conn.execute(
+            "DELETE FROM tags WHERE archived = ? AND name = ?", (int(archived), name)
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO tags (archived, name, tag) VALUES (?, ?, ?)",
+            [(int(archived), name, str(tag)) for tag in summary.get("tags") or []],
+        )
+
+    @staticmethod
+    def _delete(conn: sqlite3.Connection, archived: bool, name: str) -> None:
+        for table in ("negotiations", "tags"):
+            conn.execute(
+                f"DELETE FROM {table} WHERE archived = ? AND name = ?",
+                (int(archived), name),
+            )
+
+    @staticmethod
+    def update(
+        db_path: Path, path: Path, archived: bool, summarize: Summarize
+    ) -> dict[str, Any] | None:
+        """Index (or re-index) one negotiation.
+
+        Args:
+            db_path: Index file.
+            path: Negotiation directory or file.
+            archived: Whether path is in the archive directory.
+            summarize: Builds the summary of a negotiation (None if it cannot
+                be read).
+
+        Returns:
+            The indexed summary, or None if the entry was removed.
+        """
+        summary = summarize(path, archived) if path.exists() else None
+        with _lock:
+            conn = NegotiationIndex._connection(db_path)
+            with conn:
+                if summary is None:
+                    NegotiationIndex._delete(conn, archived, path.name)
+                else:
+                    NegotiationIndex._upsert(
+                        conn, archived, path.name, summary, entry_mtime(path)
+                    )
+        return summary
+
+    @staticmethod
+    def remove(db_path: Path, name: str, archived: bool | None = None) -> None:
+        """Drop a negotiation from the index (from both roots by default)."""
+        with _lock:
+            conn = NegotiationIndex._connection(db_path)
+            with conn:
+                for flag in (False, True) if archived is None else (archived,):
+                    NegotiationIndex._delete(conn, flag, name)
+
+    @staticmethod
+    def reconcile(
+        db_path: Path, roots: dict[bool, Path], summarize: Summarize
+    ) -> int:
+        """Bring the index in line with the negotiation directories.
+
+        Entries that are new or whose modification time changed are
+        summarized again and entries that no longer exist are dropped. Only
+        the directory listings and one stat per entry are needed otherwise.
+
+        Args:
+            db_path: Index file.
+            roots: Directory per archived flag.
+            summarize: Builds the summary of a negotiation.
+
+        Returns:
+            Number of entries (re)summarized.
+        """
+        with _lock:
+            conn = NegotiationIndex._connection(db_path)
+            recorded = {
+                (bool(archived), name): mtime
+                for archived, name, mtime in conn.execute(
+                    "SELECT archived, name, mtime_ns FROM negotiations"
+                )
+            }
+        present = {
+            (archived, name): mtime
+            for archived, root in roots.items()
+            for name, mtime in list_entries(root).items()
+        }
+        stale = [
+            key
+            for key, mtime in present.items()
+            if key not in recorded or recorded[key] != mtime or mtime is None
+        ]
+        summaries = [
+            (archived, name, summarize(roots[archived] / name, archived))
+            for archived, name in stale
+        ]
+        with _lock:
+            conn = NegotiationIndex._connection(db_path)
+            with conn:
+                for key in recorded.keys() - present.keys():
+                    NegotiationIndex._delete(conn, *key)
+                for archived, name, summary in summaries:
+                    if summary is None:
+                        # Unreadable entries are not listed
+                        NegotiationIndex._delete(conn, archived, name)
+                    else:
+                        mtime = present[(archived, name)]
+                        NegotiationIndex._upsert(conn, archived, name, summary, mtime)
+            _reconciled.add(str(db_path))
+        return len(stale)
+
+    @staticmethod
+    def ensure_reconciled(
+        db_path: Path,
+        roots: dict[bool, Path],
+        summarize: Summarize,
+        force: bool = False,
+    ) -> int:
+        """Reconcile once per process (or again if forced).
+
+        Concurrent callers wait for a running reconciliation instead of
+        starting another one.
+
+        Returns:
+            Number of entries (re)summarized by this call.
+        """
+        with _reconcile_lock:
+            if not force and str(db_path) in _reconciled and db_path.exists():
+                return 0
+            return NegotiationIndex.reconcile(db_path, roots, summarize)
+
+    @staticmethod
+    def query(
+        db_path: Path,
+        include_archived: bool = False,
+        tags: list[str] | None = None,
+        search: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Summaries of indexed negotiations, most recent first.
+
+        Args:
+            db_path: Index file.
+            include_archived: Also return archived negotiations.
+            tags: Only negotiations with any of these tags.
+            search: Case-insensitive substring of the id, scenario name or
+                a negotiator name.
+            offset: Number of matches to skip.
+            limit: Maximum number of summaries (all if None).
+
+        Returns:
+            Tuple of (page of summaries, total number of matches).
+        """
+        where = [] if include_archived else ["n.archived = 0"]
+        params: list[Any] = []
+        if tags:
+            where.append(
+                "EXISTS (SELECT 1 FROM tags t WHERE t.archived = n.archived "
+                f"AND t.name = n.name AND t.tag IN ({', '.join('?' * len(tags))}))"
+            )
+            params.extend(tags)
+        if search:
+            where.append(
+                "(n.id LIKE ? ESCAPE '!' OR n.scenario_name LIKE ? ESCAPE '!' "
+                "OR EXISTS (SELECT 1 FROM json_each(n.summary, '$.negotiator_names') "
+                "WHERE json_each.value LIKE ? ESCAPE '!'))"
+            )
+            escaped = "".join(f"!{c}" if c in "!%_" else c for c in search)
+            params.extend([f"%{escaped}%"] * 3)
+        clause = f"WHERE {' AND '.join(where)}" if where else ""
+        with _lock:
+            conn = NegotiationIndex._connection(db_path)
+            total = conn.execute(
+                f"SELECT COUNT(*) FROM negotiations n {clause}", params
+            ).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT summary FROM negotiations n {clause} "
+                "ORDER BY COALESCE(n.end_time, '') DESC, n.name "
+                "LIMIT ? OFFSET ?",
+                [*params, -1 if limit is None else limit, max(0, offset)],
+            ).fetchall()
+        return [json.loads(summary) for (summary,) in rows], total
+
+    @staticmethod
+    def all_tags(db_path: Path) -> list[str]:
+        """All tags used by indexed negotiations, sorted."""
+        with _lock:
+            conn = NegotiationIndex._connection(db_path)
+            rows = conn.execute("SELECT DISTINCT tag FROM tags ORDER BY tag").fetchall()
+        return [tag for (tag,) in rows]
+
+    @staticmethod
+    def close_all() -> None:
+        """Close all connections (the index files are kept)."""
+        with _lock:
+            for conn in _connections.values():
+                conn.close()
+            _connections.clear()
+            _reconciled.clear()
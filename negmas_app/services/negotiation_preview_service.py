@@ -1,12 +1,12 @@
 """Preview generation service for negotiation panels."""
 
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
-import matplotlib
-import matplotlib.pyplot as plt
-
-matplotlib.use("Agg")  # Non-interactive backend
-
 from ..models.session import NegotiationSession, OutcomeSpaceData
 from .settings_service import SettingsService
 
@@ -49,9 +49,234 @@ def _find_existing_preview(session_dir: Path, preview_type: str) -> Path | None:
     return None
 
 
+# Panel types rendered by generate_all_previews (result previews are disabled)
+RENDERED_PREVIEW_TYPES = ("utility2d", "timeline", "histogram")
+
+# Bounded process pool for rendering previews off the save path.
+# Processes (not threads) because matplotlib is not thread-safe.
+_preview_pool: ProcessPoolExecutor | None = None
+# Pending renders keyed by session directory
+_preview_jobs: dict[str, Future] = {}
+_preview_lock = threading.Lock()
+
+# Failed renders are retried on request after PREVIEW_RETRY_DELAY seconds,
+# doubling after every failure, until MAX_PREVIEW_ATTEMPTS renders failed
+PREVIEW_RETRY_DELAY = 5.0
+MAX_PREVIEW_ATTEMPTS = 3
+
+
+@dataclass
+class PreviewFailure:
+    """Why previews of a negotiation could not be rendered."""
+
+    error: str
+    attempts: int
+    # time.monotonic() after which rendering is tried again
+    retry_at: float
+
+    @property
+    def retry_in(self) -> float | None:
+        """Seconds until the next attempt, or None if given up."""
+        if self.attempts >= MAX_PREVIEW_ATTEMPTS:
+            return None
+        return max(0.0, self.retry_at - time.monotonic())
+
+
+# Failed renders and the panels a negotiation has no data for (no offers,
+# no outcome space), keyed by session directory
+_preview_failures: dict[str, PreviewFailure] = {}
+_preview_unavailable: dict[str, set[str]] = {}
+
+
+def _get_preview_pool() -> ProcessPoolExecutor:
+    """Get or create the preview rendering pool."""
+    global _preview_pool
+    if _preview_pool is None:
+        workers = max(1, SettingsService.load_performance().preview_workers)
+        _preview_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _preview_pool
+
+
+def _on_settings_changed(name: str) -> None:
+    """Resize the preview pool on the next render if preview_workers changed."""
+    global _preview_pool
+    if name != "performance":
+        return
+    workers = max(1, SettingsService.load_performance().preview_workers)
+    with _preview_lock:
+        pool = _preview_pool
+        if pool is None or pool._max_workers == workers:  # type: ignore[attr-defined]
+            return
+        _preview_pool = None
+    # Let in-flight renders finish in the old pool
+    pool.shutdown(wait=False)
+
+
+SettingsService.add_change_listener(_on_settings_changed)
+
+
+def _render_previews_in_worker(
+    session_dir: str, session: NegotiationSession | None = None
+) -> dict[str, bool]:
+    """Render all previews for a saved negotiation (runs in a pool process).
+
+    Args:
+        session_dir: Directory of the saved negotiation.
+        session: The session, or None to load it from session_dir.
+
+    Returns:
+        Dictionary mapping preview type to success status.
+    """
+    if session is None:
+        from .negotiation_storage import NegotiationStorageService
+
+        session = NegotiationStorageService.load_from_path(session_dir)
+        if session is None:
+            return {}
+    return NegotiationPreviewService.generate_all_previews(session, Path(session_dir))
+
+
+def _record_failure(key: str, error: str) -> None:
+    """Remember a failed render and when to try again (lock held)."""
+    previous = _preview_failures.get(key)
+    attempts = previous.attempts + 1 if previous is not None else 1
+    delay = PREVIEW_RETRY_DELAY * 2 ** (attempts - 1)
+    _preview_failures[key] = PreviewFailure(
+        error=error, attempts=attempts, retry_at=time.monotonic() + delay
+    )
+    print(
+        f"Warning: Failed to generate preview images for {key} "
+        f"(attempt {attempts}/{MAX_PREVIEW_ATTEMPTS}): {error}"
+    )
+
+
+def _on_preview_job_done(key: str, future: Future) -> None:
+    """Forget finished jobs, recording failed and unavailable panels."""
+    with _preview_lock:
+        if _preview_jobs.get(key) is not future:
+            # Dropped by shutdown
+            return
+        del _preview_jobs[key]
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            _record_failure(key, str(error) or type(error).__name__)
+            return
+        results = future.result()
+        if not results:
+            _record_failure(key, "the negotiation could not be loaded")
+            return
+        unavailable = {t for t in RENDERED_PREVIEW_TYPES if t not in results}
+        if unavailable:
+            _preview_unavailable[key] = unavailable
+        else:
+            _preview_unavailable.pop(key, None)
+        failed = [t for t in RENDERED_PREVIEW_TYPES if results.get(t) is False]
+        if failed:
+            _record_failure(key, f"could not render {', '.join(failed)}")
+        else:
+            _preview_failures.pop(key, None)
+
+
 class NegotiationPreviewService:
     """Service for generating WebP preview images of negotiation panels."""
 
+    @staticmethod
+    def schedule_previews(
+        session_dir: Path, session: NegotiationSession | None = None
+    ) -> Future:
+        """Render previews for a saved negotiation in the background.
+
+        Returns immediately; rendering happens in the preview process pool.
+        If a render for the same directory is already pending it is reused.
+
+        Args:
+            session_dir: Directory of the saved negotiation.
+            session: The in-memory session (avoids reloading it from disk).
+
+        Returns:
+            Future resolving to the generate_all_previews result.
+        """
+        key = str(session_dir)
+        with _preview_lock:
+            job = _preview_jobs.get(key)
+            if job is not None and not job.done():
+                return job
+            if session is not None:
+                # Saved again: earlier failures may not apply any more
+                _preview_failures.pop(key, None)
+                _preview_unavailable.pop(key, None)
+            job = _get_preview_pool().submit(
+                _render_previews_in_worker, key, session
+            )
+            _preview_jobs[key] = job
+        job.add_done_callback(lambda f: _on_preview_job_done(key, f))
+        return job
+
+    @staticmethod
+    def shutdown() -> None:
+        """Stop the preview pool, dropping renders that have not started."""
+        global _preview_pool
+        with _preview_lock:
+            pool, _preview_pool = _preview_pool, None
+            _preview_jobs.clear()
+            _preview_failures.clear()
+            _preview_unavailable.clear()
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def is_rendering(session_dir: Path) -> bool:
+        """Whether previews for a negotiation are currently being rendered."""
+        job = _preview_jobs.get(str(session_dir))
+        return job is not None and not job.done()
+
+    @staticmethod
+    def get_or_schedule_preview(
+        session_dir: Path, preview_type: str
+    ) -> tuple[Path | None, bool, PreviewFailure | None]:
+        """Get a preview image, rendering it lazily if missing.
+
+        Failed renders are retried with a growing delay (see
+        PREVIEW_RETRY_DELAY); until then, and after MAX_PREVIEW_ATTEMPTS
+        failures, the failure is returned instead.
+
+        Args:
+            session_dir: Directory of the saved negotiation.
+            preview_type: Type of preview.
+
+        Returns:
+            Tuple of (path, pending, failure): the existing preview path (or
+            None), whether a render that may still produce it is in progress,
+            and why the last render failed if it cannot be retried yet.
+        """
+        preview_file = _find_existing_preview(session_dir, preview_type)
+        if preview_file is not None:
+            return preview_file, False, None
+        if preview_type not in RENDERED_PREVIEW_TYPES:
+            return None, False, None
+
+        key = str(session_dir)
+        with _preview_lock:
+            job = _preview_jobs.get(key)
+            if job is not None and not job.done():
+                return None, True, None
+            if preview_type in _preview_unavailable.get(key, ()):
+                # Rendered without producing this panel (no data for it)
+                return None, False, None
+            failure = _preview_failures.get(key)
+            if failure is not None and (
+                failure.retry_in is None or failure.retry_in > 0
+            ):
+                return None, False, failure
+
+        NegotiationPreviewService.schedule_previews(session_dir)
+        return None, True, None
+
     @staticmethod
     def generate_all_previews(
         session: NegotiationSession, session_dir: Path
@@ -65,6 +290,12 @@ class NegotiationPreviewService:
         Returns:
             Dictionary mapping preview type to success status.
         """
+        # Imported here (normally in a preview worker) to keep matplotlib out
+        # of the app's import path
+        import matplotlib
+
+        matplotlib.use("Agg")  # Non-interactive backend
+
         results = {}
 
         # Generate 2D utility space preview
@@ -273,6 +504,8 @@ class NegotiationPreviewService:
     @staticmethod
     def _generate_timeline_preview(session: NegotiationSession, session_dir: Path):
         """Generate timeline preview using matplotlib."""
+        import matplotlib.pyplot as plt
+
         plot_file = _get_preview_path(session_dir, "timeline")
         image_format = _get_preview_format()
 
@@ -357,6 +590,8 @@ class NegotiationPreviewService:
     @staticmethod
     def _generate_histogram_preview(session: NegotiationSession, session_dir: Path):
         """Generate histogram preview (per-issue value distribution) using matplotlib."""
+        import matplotlib.pyplot as plt
+
         plot_file = _get_preview_path(session_dir, "histogram")
         image_format = _get_preview_format()
 
@@ -516,6 +751,8 @@ class NegotiationPreviewService:
     @staticmethod
     def _generate_result_preview(session: NegotiationSession, session_dir: Path):
         """Generate result preview (text-based summary as image) using matplotlib."""
+        import matplotlib.pyplot as plt
+
         plot_file = _get_preview_path(session_dir, "result")
         image_format = _get_preview_format()
 
@@ -21,7 +21,11 @@ from ..models.session import (
     SessionNegotiatorInfo,
 )
 from ..models.negotiator import NegotiatorConfig
+from .deletion_queue import DeletionQueue
+from .negotiation_index import INDEX_FILE, NegotiationIndex
 from .negotiation_preview_service import NegotiationPreviewService
+from .scenario_stats_store import ScenarioStatsStore
+from .storage_ledger import StorageLedger, format_size
 
 # Storage directory paths
 NEGOTIATIONS_DIR = Path.home() / "negmas" / "app" / "negotiations"
@@ -81,7 +85,8 @@ class NegotiationStorageService:
         - archived: app archive feature
         - negotiator_infos: includes UI colors
         - start_time, end_time: absolute timestamps
-        - scenario_options: normalize, ignore_discount, ignore_reserved flags
+        - scenario_options: normalize, ignore_discount, ignore_reserved and
+          share_ufuns flags
         - negotiator_configs: for rerun feature
         """
         scenario_opts = scenario_options or {}
@@ -113,6 +118,7 @@ class NegotiationStorageService:
             "normalize": scenario_opts.get("normalize", False),
             "ignore_discount": scenario_opts.get("ignore_discount", False),
             "ignore_reserved": scenario_opts.get("ignore_reserved", False),
+            "share_ufuns": scenario_opts.get("share_ufuns", False),
         }
 
         # Store negotiator configs if provided (needed for rerun feature)
@@ -150,7 +156,7 @@ class NegotiationStorageService:
                 - save_config: Save mechanism config (default True)
                 - source: History source (default "full_trace")
                 - storage_format: Table format (default "parquet")
-                - generate_previews: Generate preview images (default True)
+                - generate_previews: Render preview images in the background (default True)
 
         Returns:
             Path to the saved file or directory.
@@ -201,13 +207,17 @@ class NegotiationStorageService:
                 shutil.move(str(trace_file), str(new_trace_path))
             saved_path = session_dir
 
-        # Generate preview images if requested
+        # Render preview images in the background (the trace is already on disk)
         session_dir = saved_path if saved_path.is_dir() else saved_path.parent
         if generate_previews and not single_file:
             try:
-                NegotiationPreviewService.generate_all_previews(session, session_dir)
+                NegotiationPreviewService.schedule_previews(session_dir, session)
             except Exception as e:
-                print(f"Warning: Failed to generate preview images: {e}")
+                print(f"Warning: Failed to schedule preview images: {e}")
+
+        if session_dir.parent == NEGOTIATIONS_DIR:
+            StorageLedger.record_in_background(NEGOTIATIONS_DIR, session_dir.name)
+            NegotiationStorageService._reindex(session_dir)
 
         return saved_path
 
@@ -316,13 +326,17 @@ class NegotiationStorageService:
             storage_format=storage_format,
         )
 
-        # Generate preview images
+        # Render preview images in the background (the trace is already on disk)
         session_dir = saved_path if saved_path.is_dir() else saved_path.parent
         if generate_previews:
             try:
-                NegotiationPreviewService.generate_all_previews(session, session_dir)
+                NegotiationPreviewService.schedule_previews(session_dir, session)
             except Exception as e:
-                print(f"Warning: Failed to generate preview images: {e}")
+                print(f"Warning: Failed to schedule preview images: {e}")
+
+        if session_dir.parent == NEGOTIATIONS_DIR:
+            StorageLedger.record_in_background(NEGOTIATIONS_DIR, session_dir.name)
+            NegotiationStorageService._reindex(session_dir)
 
         return saved_path
 
@@ -347,6 +361,69 @@ class NegotiationStorageService:
 
         return NegotiationStorageService.load_from_path(session_dir)
 
+    @staticmethod
+    def load_run_config(session_id: str) -> dict[str, Any] | None:
+        """Load the configuration needed to re-execute a saved negotiation.
+
+        Reads negotiator configs and scenario options from metadata.yaml
+        (run.metadata) and mechanism type/limits from config.yaml (run.config).
+
+        Args:
+            session_id: The session ID to load.
+
+        Returns:
+            Dict with scenario_path, mechanism_type, mechanism_params,
+            negotiator_configs (list of NegotiatorConfig, empty if the run was
+            saved without them), scenario_options and share_ufuns, or None if
+            not found.
+        """
+        session_dir = NegotiationStorageService.get_session_dir(session_id)
+        if not session_dir.exists():
+            session_dir = ARCHIVE_DIR / session_id
+            if not session_dir.exists():
+                return None
+
+        run = CompletedRun.load(
+            session_dir,
+            load_scenario=False,
+            load_scenario_stats=False,
+            load_agreement_stats=False,
+            load_config=True,
+        )
+        config = run.config or {}
+        run_metadata = run.metadata or {}
+
+        negotiator_configs = [
+            NegotiatorConfig(
+                type_name=c["type_name"],
+                name=c.get("name"),
+                source=c.get("source", "native"),
+                params=c.get("params") or {},
+                time_limit=c.get("time_limit"),
+                n_steps=c.get("n_steps"),
+            )
+            for c in run_metadata.get("negotiator_configs") or []
+        ]
+
+        mechanism_params: dict[str, Any] = {}
+        if config.get("n_steps") is not None:
+            mechanism_params["n_steps"] = config["n_steps"]
+        if config.get("time_limit") is not None:
+            mechanism_params["time_limit"] = config["time_limit"]
+
+        return {
+            "scenario_path": run_metadata.get("scenario_path"),
+            "mechanism_type": config.get("mechanism_type", "SAOMechanism"),
+            "mechanism_params": mechanism_params,
+            "negotiator_configs": negotiator_configs,
+            "scenario_options": {
+                "normalize": run_metadata.get("normalize", False),
+                "ignore_discount": run_metadata.get("ignore_discount", False),
+                "ignore_reserved": run_metadata.get("ignore_reserved", False),
+            },
+            "share_ufuns": run_metadata.get("share_ufuns", False),
+        }
+
     @staticmethod
     def load_from_path(path: str | Path) -> NegotiationSession | None:
         """Load a negotiation from an arbitrary path (file or directory).
@@ -567,17 +644,14 @@ class NegotiationStorageService:
         scenario_path_from_meta = run_metadata.get("scenario_path")
         if scenario is None and scenario_path_from_meta:
             try:
-                from negmas import Scenario
-
                 scenario_path_obj = Path(scenario_path_from_meta)
                 if scenario_path_obj.exists():
-                    scenario = Scenario.load(  # type: ignore[attr-defined]
-                        scenario_path_obj,
-                        load_stats=True,
-                        load_info=True,
-                    )
+                    scenario = ScenarioStatsStore.load_scenario(scenario_path_obj)
             except Exception as e:
                 print(f"Failed to load scenario from {scenario_path_from_meta}: {e}")
+        elif scenario is not None and scenario_path_from_meta:
+            # Stats saved with the run may lack the frontier kept in sidecars
+            ScenarioStatsStore.attach_pareto(scenario, scenario_path_from_meta)
 
         if scenario:
             session.outcome_space_data = (
@@ -901,101 +975,143 @@ class NegotiationStorageService:
             return None
 
     @staticmethod
-    def list_saved_negotiations(include_archived: bool = False) -> list[dict]:
-        """List all saved negotiations.
+    def _index_path() -> Path:
+        """Location of the saved negotiations index."""
+        return NEGOTIATIONS_DIR / INDEX_FILE
+
+    @staticmethod
+    def _index_roots() -> dict[bool, Path]:
+        """Indexed directories by archived flag."""
+        return {False: NEGOTIATIONS_DIR, True: ARCHIVE_DIR}
+
+    @staticmethod
+    def _reindex(path: Path, archived: bool = False) -> None:
+        """Update the index entry of one negotiation (removed if it is gone)."""
+        try:
+            NegotiationIndex.update(
+                NegotiationStorageService._index_path(),
+                path,
+                archived,
+                NegotiationStorageService._summarize,
+            )
+        except Exception as e:
+            print(f"Warning: Failed to index negotiation {path.name}: {e}")
+
+    @staticmethod
+    def reconcile_index(force: bool = False) -> int:
+        """Index negotiations added, changed or removed outside the app.
+
+        Runs once per process unless forced; later calls return immediately.
+
+        Returns:
+            Number of negotiations (re)indexed.
+        """
+        return NegotiationIndex.ensure_reconciled(
+            NegotiationStorageService._index_path(),
+            NegotiationStorageService._index_roots(),
+            NegotiationStorageService._summarize,
+            force=force,
+        )
+
+    @staticmethod
+    def query_saved_negotiations(
+        include_archived: bool = False,
+        tags: list[str] | None = None,
+        search: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        refresh: bool = False,
+    ) -> tuple[list[dict], int]:
+        """Page through saved negotiations, most recent first.
 
         Args:
             include_archived: If True, also include archived negotiations.
+            tags: Only negotiations with any of these tags.
+            search: Case-insensitive substring of the ID, scenario name or a
+                negotiator name.
+            offset: Number of negotiations to skip.
+            limit: Maximum number of negotiations (all if None).
+            refresh: Rescan the storage directories for outside changes.
 
         Returns:
-            List of dictionaries with summary info for each negotiation.
+            Tuple of (summaries, total number of matching negotiations).
         """
-        negotiations = []
-
-        # List from main directory
-        if NEGOTIATIONS_DIR.exists():
-            negotiations.extend(
-                NegotiationStorageService._list_from_dir(
-                    NEGOTIATIONS_DIR, archived=False
-                )
-            )
+        NegotiationStorageService.reconcile_index(force=refresh)
+        return NegotiationIndex.query(
+            NegotiationStorageService._index_path(),
+            include_archived=include_archived,
+            tags=tags,
+            search=search,
+            offset=offset,
+            limit=limit,
+        )
 
-        # List from archive if requested
-        if include_archived and ARCHIVE_DIR.exists():
-            negotiations.extend(
-                NegotiationStorageService._list_from_dir(ARCHIVE_DIR, archived=True)
-            )
+    @staticmethod
+    def list_saved_negotiations(include_archived: bool = False) -> list[dict]:
+        """List all saved negotiations.
 
-        # Sort by end_time descending (most recent first)
-        negotiations.sort(key=lambda x: x.get("end_time") or "", reverse=True)
+        Args:
+            include_archived: If True, also include archived negotiations.
 
+        Returns:
+            List of dictionaries with summary info for each negotiation,
+            most recent first.
+        """
+        negotiations, _ = NegotiationStorageService.query_saved_negotiations(
+            include_archived
+        )
         return negotiations
 
     @staticmethod
-    def _list_from_dir(directory: Path, archived: bool = False) -> list[dict]:
-        """List negotiations from a specific directory.
+    def _summarize(session_path: Path, archived: bool = False) -> dict | None:
+        """Summary of one saved negotiation, or None if it cannot be loaded.
 
         Uses CompletedRun standard files (config.yaml, metadata.yaml, outcome_stats.yaml).
         All app-specific data is in metadata.yaml (run.metadata).
         """
-        negotiations = []
-
-        for session_path in directory.iterdir():
-            if not session_path.is_dir() and not session_path.suffix in (
-                ".csv",
-                ".parquet",
-            ):
-                continue
-
-            # Try to load from CompletedRun (standard format)
-            try:
-                run = CompletedRun.load(
-                    session_path,
-                    load_scenario=False,
-                    load_scenario_stats=False,
-                    load_agreement_stats=False,
-                    load_config=True,
-                )
-                config = run.config or {}
-                outcome_stats = run.outcome_stats or {}
-                run_metadata = run.metadata or {}
-
-                # Get scenario info from run.metadata
-                scenario_path = run_metadata.get("scenario_path", "")
-                scenario_name = run_metadata.get("scenario_name") or (
-                    Path(scenario_path).name if scenario_path else session_path.stem
-                )
-
-                summary = {
-                    "id": run_metadata.get("session_id", session_path.stem),
-                    "status": run_metadata.get("status", "completed"),
-                    "scenario_name": scenario_name,
-                    "scenario_path": scenario_path,
-                    "mechanism_type": config.get("mechanism_type"),
-                    # From config.yaml (standard CompletedRun)
-                    "negotiator_names": config.get("negotiator_names", []),
-                    "negotiator_types": config.get("negotiator_types", []),
-                    # From metadata.yaml (run.metadata)
-                    "start_time": run_metadata.get("start_time"),
-                    "end_time": run_metadata.get("end_time"),
-                    "n_steps": config.get("n_steps"),
-                    "tags": run_metadata.get("tags", []),
-                    "archived": archived or run_metadata.get("archived", False),
-                    "created_at": run_metadata.get("start_time"),
-                    "completed_at": run_metadata.get("end_time"),
-                    # From outcome_stats.yaml (standard CompletedRun)
-                    "agreement": outcome_stats.get("agreement"),
-                    "has_agreement": outcome_stats.get("agreement") is not None,
-                    "final_utilities": outcome_stats.get("utilities"),
-                }
+        try:
+            run = CompletedRun.load(
+                session_path,
+                load_scenario=False,
+                load_scenario_stats=False,
+                load_agreement_stats=False,
+                load_config=True,
+            )
+        except Exception:
+            return None
 
-                negotiations.append(summary)
+        config = run.config or {}
+        outcome_stats = run.outcome_stats or {}
+        run_metadata = run.metadata or {}
 
-            except Exception:
-                # If CompletedRun.load fails, skip this entry
-                pass
+        # Get scenario info from run.metadata
+        scenario_path = run_metadata.get("scenario_path", "")
+        scenario_name = run_metadata.get("scenario_name") or (
+            Path(scenario_path).name if scenario_path else session_path.stem
+        )
 
-        return negotiations
+        return {
+            "id": run_metadata.get("session_id", session_path.stem),
+            "status": run_metadata.get("status", "completed"),
+            "scenario_name": scenario_name,
+            "scenario_path": scenario_path,
+            "mechanism_type": config.get("mechanism_type"),
+            # From config.yaml (standard CompletedRun)
+            "negotiator_names": config.get("negotiator_names", []),
+            "negotiator_types": config.get("negotiator_types", []),
+            # From metadata.yaml (run.metadata)
+            "start_time": run_metadata.get("start_time"),
+            "end_time": run_metadata.get("end_time"),
+            "n_steps": config.get("n_steps"),
+            "tags": run_metadata.get("tags", []),
+            "archived": archived or run_metadata.get("archived", False),
+            "created_at": run_metadata.get("start_time"),
+            "completed_at": run_metadata.get("end_time"),
+            # From outcome_stats.yaml (standard CompletedRun)
+            "agreement": outcome_stats.get("agreement"),
+            "has_agreement": outcome_stats.get("agreement") is not None,
+            "final_utilities": outcome_stats.get("utilities"),
+        }
 
     @staticmethod
     def archive_negotiation(session_id: str) -> bool:
@@ -1009,7 +1125,15 @@ class NegotiationStorageService:
         shutil.move(str(session_dir), str(archive_dest))
 
         # Update metadata.yaml to mark as archived
-        NegotiationStorageService._update_metadata_field(archive_dest, "archived", True)
+        if not NegotiationStorageService._update_metadata_field(
+            archive_dest, "archived", True
+        ):
+            NegotiationStorageService._reindex(archive_dest, archived=True)
+        StorageLedger.forget(NEGOTIATIONS_DIR, session_id)
+        StorageLedger.record_in_background(ARCHIVE_DIR, session_id)
+        NegotiationIndex.remove(
+            NegotiationStorageService._index_path(), session_id, archived=False
+        )
 
         return True
 
@@ -1025,7 +1149,15 @@ class NegotiationStorageService:
         shutil.move(str(archive_dir), str(dest))
 
         # Update metadata.yaml
-        NegotiationStorageService._update_metadata_field(dest, "archived", False)
+        if not NegotiationStorageService._update_metadata_field(
+            dest, "archived", False
+        ):
+            NegotiationStorageService._reindex(dest, archived=False)
+        StorageLedger.forget(ARCHIVE_DIR, session_id)
+        StorageLedger.record_in_background(NEGOTIATIONS_DIR, session_id)
+        NegotiationIndex.remove(
+            NegotiationStorageService._index_path(), session_id, archived=True
+        )
 
         return True
 
@@ -1042,10 +1174,13 @@ class NegotiationStorageService:
             metadata = load(metadata_path) or {}
             metadata[field] = value
             dump(metadata, metadata_path)
-            return True
         except Exception as e:
             print(f"Warning: Failed to update metadata: {e}")
             return False
+        NegotiationStorageService._reindex(
+            session_dir, archived=session_dir.parent == ARCHIVE_DIR
+        )
+        return True
 
     @staticmethod
     def update_tags(session_id: str, tags: list[str]) -> bool:
@@ -1117,27 +1252,8 @@ class NegotiationStorageService:
     @staticmethod
     def get_all_tags() -> list[str]:
         """Get all unique tags used across all negotiations."""
-        all_tags: set[str] = set()
-
-        for directory in [NEGOTIATIONS_DIR, ARCHIVE_DIR]:
-            if not directory.exists():
-                continue
-
-            for session_dir in directory.iterdir():
-                if not session_dir.is_dir():
-                    continue
-
-                metadata_path = session_dir / "metadata.yaml"
-                if metadata_path.exists():
-                    try:
-                        from negmas.helpers.inout import load
-
-                        metadata = load(metadata_path) or {}
-                        all_tags.update(metadata.get("tags", []))
-                    except Exception:
-                        pass
-
-        return sorted(all_tags)
+        NegotiationStorageService.reconcile_index()
+        return NegotiationIndex.all_tags(NegotiationStorageService._index_path())
 
     @staticmethod
     def import_negotiation(
@@ -1235,6 +1351,8 @@ class NegotiationStorageService:
 
             # Load and return the session
             session_dir = saved_path if saved_path.is_dir() else saved_path.parent
+            StorageLedger.record_in_background(NEGOTIATIONS_DIR, session_dir.name)
+            NegotiationStorageService._reindex(session_dir)
             return NegotiationStorageService.load_from_path(session_dir)
 
         except Exception as e:
@@ -1253,24 +1371,81 @@ class NegotiationStorageService:
         if not session_dir.exists():
             return False
 
-        shutil.rmtree(session_dir)
+        job = DeletionQueue.delete([session_dir], label=f"negotiation {session_id}")
+        if job.errors:
+            print(f"Failed to delete negotiation {session_id}: {job.errors[0]}")
+            return False
+        StorageLedger.forget(session_dir.parent, session_id)
+        NegotiationIndex.remove(
+            NegotiationStorageService._index_path(),
+            session_id,
+            archived=session_dir.parent == ARCHIVE_DIR,
+        )
         return True
 
     @staticmethod
     def clear_all_negotiations(include_archived: bool = False) -> int:
-        """Delete all saved negotiations."""
-        count = 0
+        """Delete all saved negotiations.
 
-        if NEGOTIATIONS_DIR.exists():
-            for session_dir in NEGOTIATIONS_DIR.iterdir():
-                if session_dir.is_dir():
-                    shutil.rmtree(session_dir)
-                    count += 1
+        Negotiations are moved to trash right away and their files are
+        deleted in the background (see DeletionQueue.status()).
+        """
+        roots = [NEGOTIATIONS_DIR] + ([ARCHIVE_DIR] if include_archived else [])
+        targets = [
+            session_dir
+            for root in roots
+            if root.exists()
+            for session_dir in root.iterdir()
+            if session_dir.is_dir() and not session_dir.name.startswith(".")
+        ]
+        job = DeletionQueue.delete(targets, label="all saved negotiations")
+        count = job.n_targets
 
-        if include_archived and ARCHIVE_DIR.exists():
-            for session_dir in ARCHIVE_DIR.iterdir():
-                if session_dir.is_dir():
-                    shutil.rmtree(session_dir)
-                    count += 1
+        # Drops the entries of the deleted directories
+        StorageLedger.reconcile(NEGOTIATIONS_DIR)
+        if include_archived:
+            StorageLedger.reconcile(ARCHIVE_DIR)
+        NegotiationStorageService.reconcile_index(force=True)
 
         return count
+
+    @staticmethod
+    def get_storage_stats(refresh: bool = False) -> dict[str, Any]:
+        """Get storage statistics for saved negotiations.
+
+        Statistics are read from the storage ledger. Negotiations that are new
+        or changed since they were recorded are rescanned by a background job
+        (and counted in "pending" until then).
+
+        Args:
+            refresh: Rescan new or changed negotiations before answering.
+
+        Returns:
+            Dict with total size, number of negotiations, breakdown by file
+            type and the size of the archive.
+        """
+        pending = 0
+        for root in (NEGOTIATIONS_DIR, ARCHIVE_DIR):
+            rescan, gone = StorageLedger.stale(root)
+            if refresh:
+                StorageLedger.reconcile(root)
+            elif rescan or gone:
+                pending += len(rescan)
+                StorageLedger.reconcile_in_background(root)
+
+        summary = StorageLedger.summary(NEGOTIATIONS_DIR)
+        archive = StorageLedger.summary(ARCHIVE_DIR)
+        return {
+            "total_negotiations": summary["count"],
+            "total_size_bytes": summary["total_size_bytes"],
+            "total_size_human": format_size(summary["total_size_bytes"]),
+            "file_breakdown": summary["file_breakdown"],
+            "archived": {
+                "count": archive["count"],
+                "size_bytes": archive["total_size_bytes"],
+                "size_human": format_size(archive["total_size_bytes"]),
+            },
+            "pending": pending,
+            "reconciling": StorageLedger.is_reconciling(NEGOTIATIONS_DIR)
+            or StorageLedger.is_reconciling(ARCHIVE_DIR),
+        }
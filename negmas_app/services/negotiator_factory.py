@@ -11,10 +11,14 @@ Discovers and manages negotiators from multiple sources:
 """
 
 import importlib
+import importlib.metadata
 import importlib.util
 import inspect
+import json
 import re
-from dataclasses import dataclass
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
 
 from negmas import Scenario
 from negmas.sao import SAONegotiator
@@ -28,6 +32,7 @@ from ..models import (
     BOAComponentInfo,
     BOANegotiatorConfig,
 )
+from ..models.settings import NegotiatorSourcesSettings
 from .settings_service import SettingsService
 
 
@@ -45,6 +50,34 @@ NEGOTIATOR_REGISTRY: dict[str, NegotiatorEntry] = {}
 # Cache for package availability checks
 _PACKAGE_AVAILABLE_CACHE: dict[str, bool] = {}
 
+# Persisted discovery results, loaded at startup instead of re-discovering
+MANIFEST_FILE = Path.home() / "negmas" / "app" / "cache" / "negotiator_manifest.json"
+MANIFEST_VERSION = 1
+
+# Distributions whose versions decide whether the manifest is still valid
+_MANIFEST_DISTRIBUTIONS = (
+    "negmas",
+    "negmas-negolog",
+    "negmas-genius-agents",
+    "negmas-llm",
+    "negmas-rl",
+)
+
+# Guards swapping NEGOTIATOR_REGISTRY contents
+_registry_lock = threading.Lock()
+# Serializes discovery runs
+_discovery_lock = threading.Lock()
+# Set once NEGOTIATOR_REGISTRY holds a full registry (from manifest or discovery)
+_registry_ready = threading.Event()
+# Set when the loaded registry no longer matches installed packages/settings
+_registry_stale = threading.Event()
+# Set when sources change while a discovery is running, which then runs again
+_rerun_requested = threading.Event()
+# Guards _discovering and _rerun_requested so no change falls between them
+_discovery_state_lock = threading.Lock()
+_discovering = False
+_discovery_thread: threading.Thread | None = None
+
 
 def _is_package_available(package_name: str) -> bool:
     """Check if a package is importable."""
@@ -376,9 +409,11 @@ def _discover_all_negotiators() -> None:
 
     Uses negmas built-in registry as primary source (has rich metadata),
     then supplements with additional sources not in the registry.
+
+    The registry is swapped in atomically once discovery finishes and the
+    result is persisted as the discovery manifest.
     """
-    global NEGOTIATOR_REGISTRY
-    NEGOTIATOR_REGISTRY.clear()
+    registry: dict[str, NegotiatorEntry] = {}
 
     # Load settings to check disabled sources and custom sources
     settings = SettingsService.load_negotiator_sources()
@@ -387,22 +422,35 @@ def _discover_all_negotiators() -> None:
     # Track which sources we've populated from registry
     registry_sources_found: set[str] = set()
 
+    # Plugin libraries add their negotiators to the negmas registry when
+    # imported; import them first so the result does not depend on what
+    # happened to be imported before discovery ran
+    for source_id, library in (
+        ("genius-reimplemented", "negmas_genius_agents"),
+        ("llm", "negmas_llm"),
+    ):
+        if source_id not in disabled and _is_package_available(library):
+            try:
+                importlib.import_module(library)
+            except ImportError:
+                pass
+
     # First: Try negmas built-in registry (preferred - has rich metadata)
     if "native" not in disabled or "genius" not in disabled:
         for entry in _discover_from_negmas_registry():
-            NEGOTIATOR_REGISTRY[entry.info.type_name] = entry
+            registry[entry.info.type_name] = entry
             registry_sources_found.add(entry.info.source)
 
     # Fall back to manual discovery if registry didn't have them
     # Native negotiators (if registry didn't provide)
     if "native" not in disabled and "native" not in registry_sources_found:
         for entry in _discover_native_negotiators():
-            NEGOTIATOR_REGISTRY[entry.info.type_name] = entry
+            registry[entry.info.type_name] = entry
 
     # Genius bridge negotiators (if registry didn't provide)
     if "genius" not in disabled and "genius" not in registry_sources_found:
         for entry in _discover_genius_negotiators():
-            NEGOTIATOR_REGISTRY[entry.info.type_name] = entry
+            registry[entry.info.type_name] = entry
 
     # Negolog - agents are in negmas_negolog.agents (requires nenv)
     if "negolog" not in disabled and _is_package_available("negmas_negolog"):
@@ -447,7 +495,7 @@ def _discover_all_negotiators() -> None:
                 available=True,
                 module_path="negmas_negolog.agents",
             )
-            NEGOTIATOR_REGISTRY[type_name] = NegotiatorEntry(cls=None, info=info)  # type: ignore[arg-type]
+            registry[type_name] = NegotiatorEntry(cls=None, info=info)  # type: ignore[arg-type]
 
     # Genius reimplemented
     if "genius-reimplemented" not in disabled and _is_package_available(
@@ -456,12 +504,12 @@ def _discover_all_negotiators() -> None:
         for entry in _discover_from_library(
             "genius-reimplemented", "negmas_genius_agents"
         ):
-            NEGOTIATOR_REGISTRY[entry.info.type_name] = entry
+            registry[entry.info.type_name] = entry
 
     # LLM negotiators
     if "llm" not in disabled and _is_package_available("negmas_llm"):
         for entry in _discover_from_library("llm", "negmas_llm"):
-            NEGOTIATOR_REGISTRY[entry.info.type_name] = entry
+            registry[entry.info.type_name] = entry
 
     # RL negotiators - create entries without importing (torch dependency)
     if "rl" not in disabled and _is_package_available("negmas_rl"):
@@ -498,7 +546,7 @@ def _discover_all_negotiators() -> None:
                 module_path="negmas_rl.negotiators",
             )
             # Store with None cls - will be loaded on demand
-            NEGOTIATOR_REGISTRY[type_name] = NegotiatorEntry(cls=None, info=info)  # type: ignore[arg-type]
+            registry[type_name] = NegotiatorEntry(cls=None, info=info)  # type: ignore[arg-type]
 
     # Custom sources from settings
     for custom in settings.custom_sources:
@@ -514,7 +562,145 @@ def _discover_all_negotiators() -> None:
             mechanisms=custom.mechanisms,
             requires_bridge=custom.requires_bridge,
         ):
-            NEGOTIATOR_REGISTRY[entry.info.type_name] = entry
+            registry[entry.info.type_name] = entry
+
+    with _registry_lock:
+        NEGOTIATOR_REGISTRY.clear()
+        NEGOTIATOR_REGISTRY.update(registry)
+        _registry_ready.set()
+    _save_manifest(registry, settings)
+
+
+def _distribution_version(name: str) -> str | None:
+    """Get the installed version of a distribution without importing it."""
+    for candidate in (name, name.replace("_", "-"), name.replace("-", "_")):
+        try:
+            return importlib.metadata.version(candidate)
+        except importlib.metadata.PackageNotFoundError:
+            continue
+    return None
+
+
+def _manifest_fingerprint(settings: NegotiatorSourcesSettings) -> dict:
+    """Describe everything a discovery result depends on.
+
+    A manifest is valid only while installed package versions and the
+    negotiator source settings match the fingerprint it was written with.
+    """
+    distributions = list(_MANIFEST_DISTRIBUTIONS)
+    distributions.extend(c.library for c in settings.custom_sources if c.library)
+    return {
+        "packages": {name: _distribution_version(name) for name in distributions},
+        "sources": asdict(settings),
+    }
+
+
+def _save_manifest(
+    registry: dict[str, NegotiatorEntry], settings: NegotiatorSourcesSettings
+) -> None:
+    """Persist discovery results so the next startup can skip discovery."""
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "fingerprint": _manifest_fingerprint(settings),
+        "entries": [
+            {"key": key, "info": asdict(entry.info)} for key, entry in registry.items()
+        ],
+    }
+    try:
+        MANIFEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = MANIFEST_FILE.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(manifest, f)
+        tmp_file.replace(MANIFEST_FILE)
+    except OSError as e:
+        print(f"Warning: Failed to save negotiator manifest: {e}")
+
+
+def _load_manifest() -> bool:
+    """Populate the registry from the persisted manifest without importing classes.
+
+    Entries are loaded with cls=None and imported on first instantiation.
+    Marks the registry stale if the manifest was written for different
+    package versions or source settings.
+
+    Returns:
+        True if a manifest was loaded (fresh or stale).
+    """
+    if not MANIFEST_FILE.exists():
+        return False
+    try:
+        with open(MANIFEST_FILE) as f:
+            manifest = json.load(f)
+        if manifest.get("version") != MANIFEST_VERSION:
+            return False
+        registry = {
+            item["key"]: NegotiatorEntry(cls=None, info=NegotiatorInfo(**item["info"]))
+            for item in manifest["entries"]
+        }
+    except (json.JSONDecodeError, OSError, KeyError, TypeError) as e:
+        print(f"Warning: Ignoring invalid negotiator manifest: {e}")
+        return False
+
+    settings = SettingsService.load_negotiator_sources()
+    if manifest.get("fingerprint") != _manifest_fingerprint(settings):
+        _registry_stale.set()
+
+    with _registry_lock:
+        NEGOTIATOR_REGISTRY.clear()
+        NEGOTIATOR_REGISTRY.update(registry)
+        _registry_ready.set()
+    return True
+
+
+def _run_discovery() -> None:
+    """Run discovery, serialized with any concurrent discovery.
+
+    Runs again if the negotiator sources changed while it was running, as the
+    finished discovery used the old settings.
+    """
+    global _discovering
+    with _discovery_lock:
+        while True:
+            with _discovery_state_lock:
+                _discovering = True
+                _rerun_requested.clear()
+                _registry_stale.clear()
+            try:
+                _discover_all_negotiators()
+            finally:
+                with _discovery_state_lock:
+                    rerun = _rerun_requested.is_set()
+                    _discovering = rerun
+            if not rerun:
+                break
+            print("[NegotiatorFactory] Sources changed during discovery, rerunning")
+
+
+def _ensure_registry() -> None:
+    """Make sure the registry is populated, discovering synchronously if needed.
+
+    Only blocks when there is neither a manifest nor a finished discovery
+    (e.g. the very first start); a running background discovery is awaited.
+    """
+    if _registry_ready.is_set():
+        return
+    thread = _discovery_thread
+    if thread is not None and thread.is_alive():
+        thread.join()
+    if not _registry_ready.is_set():
+        _run_discovery()
+
+
+def _on_settings_changed(name: str) -> None:
+    """Rediscover in the background when negotiator sources change."""
+    if name == "negotiator_sources":
+        with _discovery_state_lock:
+            _registry_stale.set()
+            if _discovering:
+                # The running discovery read the old settings
+                _rerun_requested.set()
+                return
+        NegotiatorFactory.start_background_discovery()
 
 
 def _get_class_for_type(type_name: str) -> type | None:
@@ -527,8 +713,8 @@ def _get_class_for_type(type_name: str) -> type | None:
         # Lazy load - cls is None, need to import
         # Fall through to dynamic import
 
-    # Try dynamic import
-    parts = type_name.rsplit(".", 1)
+    # Try dynamic import (registry keys may carry a "#hash" suffix)
+    parts = type_name.split("#", 1)[0].rsplit(".", 1)
     if len(parts) == 2:
         module_path, class_name = parts
         try:
@@ -544,8 +730,11 @@ def _get_class_for_type(type_name: str) -> type | None:
     return None
 
 
-# Run discovery on module load
-_discover_all_negotiators()
+# Load the persisted manifest on module load (cheap, imports no negotiators).
+# Full discovery runs in the background via start_background_discovery() or
+# on first use if no manifest exists yet.
+_load_manifest()
+SettingsService.add_change_listener(_on_settings_changed)
 
 
 class NegotiatorFactory:
@@ -554,7 +743,33 @@ class NegotiatorFactory:
     @staticmethod
     def refresh_registry() -> None:
         """Re-discover all negotiators. Call after settings change."""
-        _discover_all_negotiators()
+        _run_discovery()
+
+    @staticmethod
+    def ensure_registry() -> None:
+        """Block until the negotiator registry is populated."""
+        _ensure_registry()
+
+    @staticmethod
+    def start_background_discovery() -> bool:
+        """Revalidate the registry in a background thread if needed.
+
+        Discovery runs if no manifest was loaded or the loaded manifest was
+        written for different package versions or source settings.
+
+        Returns:
+            True if a background discovery was started.
+        """
+        global _discovery_thread
+        if _registry_ready.is_set() and not _registry_stale.is_set():
+            return False
+        if _discovery_thread is not None and _discovery_thread.is_alive():
+            return False
+        _discovery_thread = threading.Thread(
+            target=_run_discovery, name="negotiator-discovery", daemon=True
+        )
+        _discovery_thread.start()
+        return True
 
     @staticmethod
     def get_available_sources() -> list[NegotiatorSource]:
@@ -653,9 +868,10 @@ class NegotiatorFactory:
         Returns:
             List of matching NegotiatorInfo objects.
         """
+        _ensure_registry()
         results = []
 
-        for type_name, entry in NEGOTIATOR_REGISTRY.items():
+        for type_name, entry in list(NEGOTIATOR_REGISTRY.items()):
             info = entry.info
 
             # Apply filters
@@ -686,6 +902,8 @@ class NegotiatorFactory:
         Also supports partial name matching for short names like "y2019.agent_gg.AgentGG"
         which map to full names like "negmas_genius_agents.negotiators.anac.y2019.agent_gg.AgentGG".
         """
+        _ensure_registry()
+
         # Try exact match first
         entry = NEGOTIATOR_REGISTRY.get(type_name)
         if entry is not None:
@@ -22,6 +22,7 @@ from negmas.preferences.ops import (
 )
 
 from ..models import AnalysisPoint, OutcomeSpaceData
+from .scenario_stats_store import ScenarioStatsStore
 
 
 def compute_outcome_utilities(
@@ -86,7 +87,7 @@ def compute_outcome_space_data(
 
     # Use cached stats if available
     if use_cached_stats and scenario.stats is not None:
-        return _from_cached_stats(scenario, max_samples)
+        return _from_cached_stats(scenario, max_samples, scenario_path)
 
     # Check if we should auto-calculate stats for small scenarios
     total_outcomes = scenario.outcome_space.cardinality
@@ -110,12 +111,13 @@ def compute_outcome_space_data(
                 try:
                     # Check if scenario is under app directory
                     scenario_dir.relative_to(app_dir.resolve())
-                    # Save stats and info to disk
+                    # Save info with the scenario and stats as header + sidecars
                     scenario.dumpas(
                         scenario_dir,
-                        save_stats=True,
+                        save_stats=False,
                         save_info=True,
                     )
+                    ScenarioStatsStore.save(scenario, scenario_dir)
                 except (ValueError, OSError):
                     # Not under app dir or save failed - continue without caching
                     pass
@@ -131,9 +133,14 @@ def compute_outcome_space_data(
     return _compute_from_scratch(scenario, max_samples)
 
 
-def _from_cached_stats(scenario: Scenario, max_samples: int) -> OutcomeSpaceData:
+def _from_cached_stats(
+    scenario: Scenario, max_samples: int, scenario_path: str | None = None
+) -> OutcomeSpaceData:
     """Build OutcomeSpaceData from cached scenario.stats.
 
+    If the frontier is not in scenario.stats and scenario_path is given, it is
+    read from the memory-mapped Pareto sidecar written by ScenarioStatsStore.
+
     Note: The scenario passed in should already be in the desired state
     (normalized if needed). We use the scenario's ufuns directly without
     any additional normalization.
@@ -162,6 +169,10 @@ def _from_cached_stats(scenario: Scenario, max_samples: int) -> OutcomeSpaceData
     if stats.pareto_utils:
         for utils in stats.pareto_utils:
             pareto_utilities.append(tuple(float(u) for u in utils))
+    elif scenario_path:
+        sidecar = ScenarioStatsStore.load_pareto_utils(scenario_path)
+        if sidecar is not None:
+            pareto_utilities = [tuple(row) for row in sidecar.tolist()]
 
     data = OutcomeSpaceData(
         outcome_utilities=outcome_utilities,
@@ -1,17 +1,46 @@
-"""Service for inspecting negotiator class parameters dynamically."""
-
+"""Service for inspecting negotiator class parameters dynamically.
+
+Inspection imports the negotiator's module, so results are kept in a
+manifest file keyed by type name and the version of the package defining
+the type. The manifest is read once per process and written atomically,
+in batches: inspections made on demand are saved together after
+SAVE_DELAY seconds, and ``warm_parameter_cache`` (run in the background at
+startup) inspects every negotiator and BOA component missing from the
+manifest or inspected with another package version, then saves once.
+"""
+
+import functools
 import importlib
+import importlib.metadata
 import inspect
-from dataclasses import dataclass
+import threading
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
 from typing import Any, get_type_hints, get_origin, get_args, Union
 from pathlib import Path
 import json
 
+from .server_metrics import record_cache
+
 # Cache for parameter info to avoid repeated inspection
 _PARAMETER_CACHE: dict[str, list["ParameterInfo"]] = {}
 
 # Cache file path
 CACHE_FILE = Path.home() / "negmas" / "app" / "cache" / "negotiator_params.json"
+# Format of the cache file (files of other versions are ignored)
+MANIFEST_VERSION = 2
+# Seconds to wait for more inspections before writing the manifest
+SAVE_DELAY = 2.0
+
+# type name -> {"package": "dist==version" or None, "params": [...]};
+# loaded from CACHE_FILE on first use
+_manifest: dict[str, dict[str, Any]] | None = None
+_manifest_dirty = False
+_manifest_lock = threading.RLock()
+_save_timer: threading.Timer | None = None
+
+# Prefix of the BOA components' type names
+BOA_COMPONENTS_MODULE = "negmas.gb.components."
 
 # Parameters from base Negotiator class that should be ignored
 # These are set by the app, not configured by users
@@ -329,7 +358,9 @@ def get_negotiator_parameters(
     """
     # Check memory cache first
     if use_cache and type_name in _PARAMETER_CACHE:
+        record_cache("negotiator_parameters", True)
         return _PARAMETER_CACHE[type_name]
+    record_cache("negotiator_parameters", False)
 
     # Check file cache
     if use_cache:
@@ -348,6 +379,71 @@ def get_negotiator_parameters(
     return params
 
 
+def warm_parameter_cache(type_names: Iterable[str] | None = None) -> int:
+    """Inspect the types missing from the manifest and save it once.
+
+    Args:
+        type_names: Types to inspect, or None for every registered negotiator
+            and BOA component.
+
+    Returns:
+        Number of types inspected.
+    """
+    if type_names is None:
+        type_names = _warm_up_types()
+    inspected = 0
+    for type_name in type_names:
+        if type_name in _PARAMETER_CACHE:
+            continue
+        cached = _load_from_file_cache(type_name)
+        if cached is None:
+            cached = _inspect_negotiator_class(type_name)
+            _save_to_file_cache(type_name, cached, save=False)
+            inspected += 1
+        _PARAMETER_CACHE[type_name] = cached
+    if inspected:
+        save_parameter_cache()
+    return inspected
+
+
+def _warm_up_types() -> list[str]:
+    """Registered negotiators, and BOA components unless all are current.
+
+    BOA components change only with negmas, so they are listed (which imports
+    them) only when the manifest has none inspected with the installed negmas.
+    """
+    from .negotiator_factory import BOAFactory, NegotiatorFactory
+
+    types = [info.type_name for info in NegotiatorFactory.list_available()]
+    manifest = _get_manifest()
+    with _manifest_lock:
+        boa_current = any(
+            name.startswith(BOA_COMPONENTS_MODULE)
+            and entry.get("package") == _package_version(name)
+            for name, entry in manifest.items()
+        )
+    if not boa_current:
+        for components in BOAFactory.list_components().values():
+            types.extend(c.type_name for c in components)
+    return types
+
+
+@functools.cache
+def _distributions() -> dict[str, list[str]]:
+    return importlib.metadata.packages_distributions()
+
+
+@functools.cache
+def _package_version(type_name: str) -> str | None:
+    """Distribution and version defining a type (None if not installed)."""
+    for name in _distributions().get(type_name.split(".", 1)[0], []):
+        try:
+            return f"{name}=={importlib.metadata.version(name)}"
+        except importlib.metadata.PackageNotFoundError:
+            continue
+    return None
+
+
 def _inspect_negotiator_class(type_name: str) -> list[ParameterInfo]:
     """Actually inspect a negotiator class for its parameters."""
     parts = type_name.rsplit(".", 1)
@@ -368,19 +464,32 @@ def _inspect_negotiator_class(type_name: str) -> list[ParameterInfo]:
         return []
 
 
+def _get_manifest() -> dict[str, dict[str, Any]]:
+    """The manifest's entries, read from CACHE_FILE once per process."""
+    global _manifest
+    with _manifest_lock:
+        if _manifest is None:
+            _manifest = {}
+            try:
+                with open(CACHE_FILE) as f:
+                    data = json.load(f)
+                if data.get("version") == MANIFEST_VERSION:
+                    _manifest = dict(data["entries"])
+            except FileNotFoundError:
+                pass
+            except (json.JSONDecodeError, OSError, KeyError, TypeError) as e:
+                print(f"Warning: Ignoring invalid parameter cache: {e}")
+        return _manifest
+
+
 def _load_from_file_cache(type_name: str) -> list[ParameterInfo] | None:
-    """Load parameter info from file cache."""
-    if not CACHE_FILE.exists():
+    """Load parameter info from the manifest (None if missing or outdated)."""
+    manifest = _get_manifest()
+    with _manifest_lock:
+        entry = manifest.get(type_name)
+    if entry is None or entry.get("package") != _package_version(type_name):
         return None
-
     try:
-        with open(CACHE_FILE) as f:
-            cache = json.load(f)
-
-        if type_name not in cache:
-            return None
-
-        data = cache[type_name]
         return [
             ParameterInfo(
                 name=p["name"],
@@ -394,44 +503,56 @@ def _load_from_file_cache(type_name: str) -> list[ParameterInfo] | None:
                 max_value=p.get("max_value"),
                 is_complex=p.get("is_complex", False),
             )
-            for p in data
+            for p in entry["params"]
         ]
-    except (json.JSONDecodeError, KeyError):
+    except (KeyError, TypeError):
         return None
 
 
-def _save_to_file_cache(type_name: str, params: list[ParameterInfo]) -> None:
-    """Save parameter info to file cache."""
-    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+def _save_to_file_cache(
+    type_name: str, params: list[ParameterInfo], save: bool = True
+) -> None:
+    """Add parameter info to the manifest.
 
-    # Load existing cache
-    cache = {}
-    if CACHE_FILE.exists():
-        try:
-            with open(CACHE_FILE) as f:
-                cache = json.load(f)
-        except json.JSONDecodeError:
-            cache = {}
-
-    # Add new entry
-    cache[type_name] = [
-        {
-            "name": p.name,
-            "type": p.type,
-            "default": p.default,
-            "required": p.required,
-            "description": p.description,
-            "ui_type": p.ui_type,
-            "choices": p.choices,
-            "min_value": p.min_value,
-            "max_value": p.max_value,
-            "is_complex": p.is_complex,
+    Args:
+        type_name: Inspected type.
+        params: Its parameters.
+        save: Write the manifest after SAVE_DELAY seconds (batching the
+            inspections made meanwhile). Otherwise the caller saves.
+    """
+    global _manifest_dirty, _save_timer
+    manifest = _get_manifest()
+    with _manifest_lock:
+        manifest[type_name] = {
+            "package": _package_version(type_name),
+            "params": [asdict(p) for p in params],
         }
-        for p in params
-    ]
-
-    with open(CACHE_FILE, "w") as f:
-        json.dump(cache, f, indent=2)
+        _manifest_dirty = True
+        if save and _save_timer is None:
+            _save_timer = threading.Timer(SAVE_DELAY, save_parameter_cache)
+            _save_timer.daemon = True
+            _save_timer.start()
+
+
+def save_parameter_cache() -> None:
+    """Write the manifest atomically if it changed since it was last saved."""
+    global _manifest_dirty, _save_timer
+    with _manifest_lock:
+        if _save_timer is not None:
+            _save_timer.cancel()
+            _save_timer = None
+        if not _manifest_dirty or _manifest is None:
+            return
+        data = {"version": MANIFEST_VERSION, "entries": dict(_manifest)}
+        _manifest_dirty = False
+        try:
+            CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = CACHE_FILE.with_suffix(".tmp")
+            with open(tmp_file, "w") as f:
+                json.dump(data, f, default=str)
+            tmp_file.replace(CACHE_FILE)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Warning: Failed to save parameter cache: {e}")
 
 
 def clear_parameter_cache() -> int:
@@ -440,19 +561,15 @@ def clear_parameter_cache() -> int:
     Returns:
         Number of entries cleared.
     """
-    global _PARAMETER_CACHE
-    count = len(_PARAMETER_CACHE)
-    _PARAMETER_CACHE.clear()
-
-    if CACHE_FILE.exists():
-        try:
-            with open(CACHE_FILE) as f:
-                cache = json.load(f)
-            count = max(count, len(cache))
-        except json.JSONDecodeError:
-            pass
-        CACHE_FILE.unlink()
-
+    global _manifest, _manifest_dirty
+    with _manifest_lock:
+        count = max(len(_PARAMETER_CACHE), len(_get_manifest()))
+        _PARAMETER_CACHE.clear()
+        _manifest = {}
+        _manifest_dirty = False
+        if _save_timer is not None:
+            save_parameter_cache()
+        CACHE_FILE.unlink(missing_ok=True)
     return count
 
 
@@ -462,22 +579,12 @@ def clear_parameter_cache_for_type(type_name: str) -> bool:
     Returns:
         True if entry was found and removed.
     """
-    found = False
-
-    if type_name in _PARAMETER_CACHE:
-        del _PARAMETER_CACHE[type_name]
-        found = True
-
-    if CACHE_FILE.exists():
-        try:
-            with open(CACHE_FILE) as f:
-                cache = json.load(f)
-            if type_name in cache:
-                del cache[type_name]
-                with open(CACHE_FILE, "w") as f:
-                    json.dump(cache, f, indent=2)
-                found = True
-        except json.JSONDecodeError:
-            pass
-
+    global _manifest_dirty
+    found = _PARAMETER_CACHE.pop(type_name, None) is not None
+    manifest = _get_manifest()
+    with _manifest_lock:
+        if manifest.pop(type_name, None) is not None:
+            found = True
+            _manifest_dirty = True
+            save_parameter_cache()
     return found
@@ -299,45 +299,64 @@ def register_custom_module(module_path: str | Path, source: str = "app") -> int:
     Returns:
         Number of classes registered
     """
-    module_path = Path(module_path)
-    if not module_path.exists():
-        return 0
+    return register_custom_modules([(module_path, source)])
 
-    registered = 0
 
-    # Add parent directory to sys.path temporarily
-    parent_dir = str(module_path.parent)
-    if parent_dir not in sys.path:
-        sys.path.insert(0, parent_dir)
-        _registered_custom_modules.add(parent_dir)
+def _module_files(module_path: Path) -> list[Path]:
+    """Python files registered for a custom path (a file or a directory)."""
+    if module_path.is_file() and module_path.suffix == ".py":
+        return [module_path]
+    if module_path.is_dir():
+        return sorted(
+            p for p in module_path.glob("*.py") if not p.name.startswith("_")
+        )
+    return []
+
 
-    try:
-        if module_path.is_file() and module_path.suffix == ".py":
-            # Import single file
-            module_name = module_path.stem
-            spec = importlib.util.spec_from_file_location(module_name, module_path)
+def register_custom_modules(module_paths: list[tuple[str | Path, str]]) -> int:
+    """Register all negotiators and mechanisms from several custom paths.
+
+    The files of all paths are screened concurrently without executing them
+    (see module_inspector.screen_modules); only files that may define
+    negotiators, mechanisms or BOA components are imported.
+
+    Args:
+        module_paths: (path, source identifier) pairs
+
+    Returns:
+        Number of classes registered
+    """
+    from .module_inspector import screen_modules
+
+    files: list[tuple[Path, str]] = []
+    for module_path, source in module_paths:
+        module_path = Path(module_path)
+        if not module_path.exists():
+            continue
+
+        # Add parent directory to sys.path temporarily
+        parent_dir = str(module_path.parent)
+        if parent_dir not in sys.path:
+            sys.path.insert(0, parent_dir)
+            _registered_custom_modules.add(parent_dir)
+
+        files.extend((py_file, source) for py_file in _module_files(module_path))
+
+    screened = screen_modules([py_file for py_file, _ in files])
+    registered = 0
+    for py_file, source in files:
+        if not screened[py_file]:
+            continue
+        try:
+            module_name = py_file.stem
+            spec = importlib.util.spec_from_file_location(module_name, py_file)
             if spec and spec.loader:
                 module = importlib.util.module_from_spec(spec)
                 sys.modules[module_name] = module
                 spec.loader.exec_module(module)
                 registered += _register_from_module(module, source)
-        elif module_path.is_dir():
-            # Import all Python files in directory
-            for py_file in module_path.glob("*.py"):
-                if py_file.name.startswith("_"):
-                    continue
-                try:
-                    module_name = py_file.stem
-                    spec = importlib.util.spec_from_file_location(module_name, py_file)
-                    if spec and spec.loader:
-                        module = importlib.util.module_from_spec(spec)
-                        sys.modules[module_name] = module
-                        spec.loader.exec_module(module)
-                        registered += _register_from_module(module, source)
-                except Exception as e:
-                    print(f"Error loading module {py_file}: {e}")
-    except Exception as e:
-        print(f"Error registering custom module {module_path}: {e}")
+        except Exception as e:
+            print(f"Error loading module {py_file}: {e}")
 
     return registered
 
@@ -421,17 +440,17 @@ def register_all_custom_paths() -> int:
     from .settings_service import SettingsService
 
     sources = SettingsService.load_negotiator_sources()
-    count = 0
 
-    # Register from custom negotiator sources
+    # Register from custom negotiator sources (screened together)
+    module_paths: list[tuple[str | Path, str]] = []
     for custom_source in sources.custom_sources:
         path = getattr(custom_source, "path", None)
         if path:
             # Use the source name if available, otherwise "app"
             source_name = getattr(custom_source, "name", None) or "app"
-            count += register_custom_module(path, source=source_name)
+            module_paths.append((path, source_name))
 
-    return count
+    return register_custom_modules(module_paths)
 
 
 def initialize_registry() -> dict[str, int]:
@@ -0,0 +1,419 @@
+"""Cache of negotiation results shared across tournaments.
+
+Leagues are rerun often with overlapping contents: the same scenarios and
+baseline opponents with one competitor added. When a tournament enables the
+cache, the record of every run is stored under a key made of everything that
+determines its outcome: the scenario definition files, the ufun rotation, the
+types and parameters of both partners, the mechanism and its settings, the
+negmas version and the repetition (the only seed a cartesian tournament has).
+
+A later tournament reuses the records of matching runs. Only the
+(first, second, scenario) cells with a missing run are negotiated, as
+cartesian sub-tournaments of the competitors and opponents involved, and the
+records of both are merged into the tournament's results.
+
+Reusing a record is only correct when the negotiators are deterministic, so
+the cache is opt-in per tournament and is not used when mechanism settings are
+drawn from ranges. Failed runs are not cached.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterable
+from contextlib import closing
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..models.tournament import TournamentConfig
+from .tournament_grid import split_rotation
+
+CACHE_FILE = Path.home() / "negmas" / "app" / "cache" / "tournament_results.sqlite"
+SCHEMA_VERSION = 1
+
+# Keys per SQL query (below SQLite's variable limit)
+_QUERY_BATCH = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    key TEXT PRIMARY KEY,
+    record TEXT NOT NULL,
+    created_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+# Settings that change the outcome of a run (besides scenario and partners)
+_RUN_SETTINGS = (
+    "mechanism_type",
+    "n_steps",
+    "time_limit",
+    "step_time_limit",
+    "negotiator_time_limit",
+    "hidden_time_limit",
+    "pend",
+    "pend_per_second",
+    "normalization",
+    "ignore_discount",
+    "ignore_reserved",
+    "id_reveals_type",
+    "name_reveals_type",
+    "mask_scenario_names",
+    "pass_opponent_ufun",
+    "opponent_modeling_metrics",
+)
+
+_lock = threading.Lock()
+
+
+def _json_default(value: Any) -> Any:
+    if hasattr(value, "item"):
+        # numpy scalars
+        return value.item()
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+def _digest(value: Any) -> str:
+    payload = json.dumps(value, sort_keys=True, default=_json_default)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def is_deterministic(config: TournamentConfig) -> bool:
+    """Whether no mechanism setting of a tournament is drawn from a range."""
+    return not any(
+        isinstance(getattr(config, name), (tuple, list))
+        for name in _RUN_SETTINGS
+        if name != "opponent_modeling_metrics"
+    )
+
+
+def scenario_fingerprint(path: str | Path) -> str:
+    """Hash of the files defining a scenario.
+
+    Caches written by the app (names starting with "_") and hidden files are
+    ignored, so building stats or plots does not change the fingerprint.
+    """
+    path = Path(path)
+    digest = hashlib.sha256()
+    if path.is_file():
+        files = [path]
+    else:
+        files = sorted(
+            p
+            for p in path.rglob("*")
+            if p.is_file()
+            and not any(
+                part.startswith(("_", ".")) for part in p.relative_to(path).parts
+            )
+        )
+    for file in files:
+        name = file.name if file == path else file.relative_to(path).as_posix()
+        digest.update(name.encode())
+        digest.update(b"\0")
+        digest.update(file.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def negotiator_names(types: list[type], params: list[dict]) -> list[str]:
+    """Names negmas gives negotiators in a cartesian tournament."""
+    from negmas.helpers import shortest_unique_names
+    from negmas.helpers.strings import encode_params
+    from negmas.helpers.types import get_full_type_name
+
+    return shortest_unique_names(
+        [get_full_type_name(t) + encode_params(p) for t, p in zip(types, params)]
+    )
+
+
+class ResultCache:
+    """SQLite store of negotiation records keyed by run."""
+
+    @staticmethod
+    def _connect(db_path: Path) -> sqlite3.Connection:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(db_path, timeout=30)
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS runs")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    @staticmethod
+    def get(keys: Iterable[str], db_path: Path | None = None) -> dict[str, dict]:
+        """Cached records of the given run keys (missing keys are left out)."""
+        db_path = db_path or CACHE_FILE
+        keys = list(keys)
+        if not keys or not db_path.exists():
+            return {}
+        found: dict[str, dict] = {}
+        with _lock, closing(ResultCache._connect(db_path)) as conn:
+            for i in range(0, len(keys), _QUERY_BATCH):
+                batch = keys[i : i + _QUERY_BATCH]
+                rows = conn.execute(
+                    "SELECT key, record FROM runs WHERE key IN "
+                    f"({','.join('?' * len(batch))})",
+                    batch,
+                )
+                for key, record in rows:
+                    found[key] = json.loads(record)
+        return found
+
+    @staticmethod
+    def put(records: dict[str, dict], db_path: Path | None = None) -> int:
+        """Store records by run key (replacing existing ones).
+
+        Returns:
+            Number of records stored.
+        """
+        if not records:
+            return 0
+        now = time.time()
+        rows = [
+            (key, json.dumps(record, default=_json_default), now)
+            for key, record in records.items()
+        ]
+        with _lock, closing(ResultCache._connect(db_path or CACHE_FILE)) as conn:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO runs (key, record, created_at) "
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+        return len(rows)
+
+    @staticmethod
+    def stats(db_path: Path | None = None) -> dict[str, Any]:
+        """Number of cached runs and size of the cache file."""
+        db_path = db_path or CACHE_FILE
+        if not db_path.exists():
+            return {"path": str(db_path), "n_runs": 0, "size_bytes": 0}
+        with _lock, closing(ResultCache._connect(db_path)) as conn:
+            n_runs = conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+        return {
+            "path": str(db_path),
+            "n_runs": n_runs,
+            "size_bytes": db_path.stat().st_size,
+        }
+
+    @staticmethod
+    def clear(db_path: Path | None = None) -> int:
+        """Remove all cached runs.
+
+        Returns:
+            Number of runs removed.
+        """
+        db_path = db_path or CACHE_FILE
+        if not db_path.exists():
+            return 0
+        with _lock, closing(ResultCache._connect(db_path)) as conn:
+            with conn:
+                n_runs = conn.execute("DELETE FROM runs").rowcount
+            conn.execute("VACUUM")
+        return n_runs
+
+
+@dataclass
+class TournamentPart:
+    """A cartesian sub-tournament covering runs missing from the cache.
+
+    Indices refer to the first-position roster (competitors), the
+    second-position roster (opponents, or competitors when they play each
+    other) and the tournament's scenarios.
+    """
+
+    competitors: list[int]
+    opponents: list[int]
+    scenarios: list[int]
+
+
+@dataclass
+class ResultCachePlan:
+    """Runs of a tournament taken from the cache and runs still to negotiate."""
+
+    cached: list[dict[str, Any]] = field(default_factory=list)
+    parts: list[TournamentPart] = field(default_factory=list)
+    n_runs: int = 0
+
+
+class TournamentResultCache:
+    """Result cache lookups and updates for one tournament."""
+
+    def __init__(
+        self,
+        config: TournamentConfig,
+        scenario_paths: list[str],
+        scenario_names: list[str],
+        competitors: list[type],
+        opponents: list[type] | None = None,
+        db_path: Path | None = None,
+    ) -> None:
+        """Describe the runs of a tournament.
+
+        Args:
+            config: Tournament configuration.
+            scenario_paths: Paths of the loaded scenarios.
+            scenario_names: Names negmas uses for the scenarios (same order).
+            competitors: Competitor classes.
+            opponents: Opponent classes (None: competitors play each other).
+            db_path: Cache file (defaults to CACHE_FILE).
+        """
+        import negmas
+        from negmas.helpers.types import get_full_type_name
+
+        self.db_path = db_path or CACHE_FILE
+        self.n_repetitions = max(1, config.n_repetitions)
+        self.rotations = [0, 1] if config.rotate_ufuns else [0]
+        self.self_play = config.self_play
+        self.settings = {name: getattr(config, name) for name in _RUN_SETTINGS}
+        self.settings["negmas"] = getattr(negmas, "__version__", "")
+        self.scenario_names = list(scenario_names)
+        self.scenario_index = {name: i for i, name in enumerate(scenario_names)}
+        self.fingerprints = [scenario_fingerprint(p) for p in scenario_paths]
+
+        competitor_params = [dict(p or {}) for p in config.competitor_params or []]
+        competitor_params += [{}] * (len(competitors) - len(competitor_params))
+        self.first = [
+            (get_full_type_name(t), p) for t, p in zip(competitors, competitor_params)
+        ]
+        self.competitor_names = negotiator_names(competitors, competitor_params)
+        self.explicit_opponents = opponents is not None
+        if opponents is not None:
+            opponent_params = [dict(p or {}) for p in config.opponent_params or []]
+            opponent_params += [{}] * (len(opponents) - len(opponent_params))
+            self.second = [
+                (get_full_type_name(t), p) for t, p in zip(opponents, opponent_params)
+            ]
+            self.opponent_names = negotiator_names(opponents, opponent_params)
+        else:
+            self.second = self.first
+            self.opponent_names = []
+        self.first_index = {n: i for i, n in enumerate(self.competitor_names)}
+        self.second_index = {
+            n: i for i, n in enumerate(self.opponent_names or self.competitor_names)
+        }
+
+    @property
+    def second_names(self) -> list[str]:
+        """Names of the second-position roster."""
+        return self.opponent_names or self.competitor_names
+
+    def key(
+        self, scenario: int, rotation: int, first: int, second: int, rep: int
+    ) -> str:
+        """Cache key of a run."""
+        return _digest(
+            [
+                self.settings,
+                self.fingerprints[scenario],
+                rotation,
+                self.first[first],
+                self.second[second],
+                rep,
+            ]
+        )
+
+    def scored_indices(self, partners: list[str]) -> list[int] | None:
+        """Positions scored in this tournament (None: all of them)."""
+        if not self.explicit_opponents:
+            return None
+        return [
+            i
+            for i, name in enumerate(partners)
+            if i == 0 or name in self.first_index
+        ]
+
+    def _pairs(self) -> list[tuple[int, int]]:
+        return [
+            (a, b)
+            for a in range(len(self.first))
+            for b in range(len(self.second))
+            if self.self_play or self.first[a] != self.second[b]
+        ]
+
+    def plan(self) -> ResultCachePlan:
+        """Split the tournament's runs into cached records and parts to run.
+
+        A (first, second, scenario) cell is taken from the cache only if all
+        of its rotations and repetitions are cached. Missing cells are grouped
+        into as few cartesian sub-tournaments as possible: first-position
+        negotiators missing the same opponents on the same scenarios share
+        one.
+        """
+        cells: dict[tuple[int, int, int], list[tuple[int, int, str]]] = {}
+        for a, b in self._pairs():
+            for s in range(len(self.fingerprints)):
+                cells[(a, b, s)] = [
+                    (rotation, rep, self.key(s, rotation, a, b, rep))
+                    for rotation in self.rotations
+                    for rep in range(self.n_repetitions)
+                ]
+        found = ResultCache.get(
+            (key for runs in cells.values() for _, _, key in runs), self.db_path
+        )
+
+        plan = ResultCachePlan(n_runs=sum(len(runs) for runs in cells.values()))
+        missing: dict[int, dict[int, set[int]]] = defaultdict(lambda: defaultdict(set))
+        for (a, b, s), runs in cells.items():
+            if not all(key in found for _, _, key in runs):
+                missing[a][b].add(s)
+                continue
+            partners = [self.competitor_names[a], self.second_names[b]]
+            for rotation, rep, key in runs:
+                record = dict(found[key])
+                name = self.scenario_names[s]
+                record["scenario"] = f"{name}-{rotation}" if rotation else name
+                record["partners"] = list(partners)
+                record["rep"] = rep
+                record["scored_indices"] = self.scored_indices(partners)
+                plan.cached.append(record)
+
+        groups: dict[tuple[frozenset[int], frozenset[int]], list[int]] = defaultdict(
+            list
+        )
+        for a, seconds in missing.items():
+            by_scenarios: dict[frozenset[int], set[int]] = defaultdict(set)
+            for b, scenarios in seconds.items():
+                by_scenarios[frozenset(scenarios)].add(b)
+            for scenarios, bs in by_scenarios.items():
+                groups[(frozenset(bs), scenarios)].append(a)
+        plan.parts = [
+            TournamentPart(sorted(firsts), sorted(bs), sorted(scenarios))
+            for (bs, scenarios), firsts in groups.items()
+        ]
+        return plan
+
+    def record_key(self, record: dict[str, Any]) -> str | None:
+        """Cache key of a record from this tournament (None if unknown)."""
+        partners = list(record.get("partners") or [])
+        if len(partners) != 2:
+            return None
+        a = self.first_index.get(partners[0])
+        b = self.second_index.get(partners[1])
+        base, rotated = split_rotation(str(record.get("scenario") or ""))
+        s = self.scenario_index.get(base)
+        rep = record.get("rep", (record.get("annotation") or {}).get("rep"))
+        if a is None or b is None or s is None or rep is None:
+            return None
+        return self.key(s, int(rotated), a, b, int(rep))
+
+    def store(self, records: Iterable[dict[str, Any]]) -> int:
+        """Add successful runs of this tournament to the cache.
+
+        Returns:
+            Number of records stored.
+        """
+        entries: dict[str, dict] = {}
+        for record in records:
+            if record.get("has_error"):
+                continue
+            key = self.record_key(record)
+            if key is not None:
+                entries[key] = record
+        return ResultCache.put(entries, self.db_path)
@@ -0,0 +1,450 @@
+"""Predict how long tournament negotiations take from saved tournaments.
+
+The details of every saved tournament record the wall-clock time of each
+negotiation (``execution_time``, or ``time``), its step limit (``n_steps``),
+the negotiator types and the scenario. A log-linear model is fitted to them:
+
+    log(seconds) = a + b * log(n_outcomes) + c * log(1 + n_steps)
+                   + sum of the effects of the negotiator types
+
+Type effects are ridge-regularized, so types seen in few runs stay close to
+the average and unseen types get no effect. The fit is cached until a saved
+tournament's details change.
+
+Predictions are used to start the longest runs first (better packing of
+parallel runs) and to estimate the remaining time of a running tournament.
+"""
+
+import ast
+import json
+import os
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from math import isfinite, log
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .tournament_grid import split_rotation
+
+# Most recent saved tournaments used for fitting and rows sampled from each
+MAX_TOURNAMENTS = 50
+MAX_ROWS_PER_TOURNAMENT = 2000
+
+# Shrinks the effects of rarely seen negotiator types toward the average
+RIDGE = 1.0
+
+# Minimum number of runs to fit a model
+MIN_SAMPLES = 10
+
+_DETAIL_COLUMNS = (
+    "execution_time",
+    "time",
+    "n_steps",
+    "step",
+    "negotiator_types",
+    "scenario",
+    "has_error",
+)
+
+# tournaments directory -> (details files it was fitted to, fitted model)
+_FIT_CACHE: dict[str, tuple[tuple, "RuntimePredictor | None"]] = {}
+_fit_lock = threading.Lock()
+
+
+def _parse_list(value: Any) -> list[str]:
+    """A list column value (a list, JSON or a Python literal string)."""
+    if isinstance(value, (list, tuple)):
+        return [str(v) for v in value]
+    if not isinstance(value, str) or not value:
+        return []
+    try:
+        parsed = json.loads(value)
+    except ValueError:
+        try:
+            parsed = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return []
+    return [str(v) for v in parsed] if isinstance(parsed, (list, tuple)) else []
+
+
+def _n_outcomes(scenario: Any) -> int | None:
+    """Number of outcomes of a loaded scenario (None if infinite/unknown)."""
+    try:
+        n = float(scenario.outcome_space.cardinality)
+    except Exception:
+        return None
+    return int(n) if isfinite(n) and n > 0 else None
+
+
+def saved_scenario_size(path: Path) -> int | None:
+    """Number of outcomes of a scenario saved in a tournament directory."""
+    import yaml
+
+    from .bundled_scenarios import _count_outcomes
+
+    try:
+        files = sorted(path.glob("*.yml")) + sorted(path.glob("*.yaml"))
+    except OSError:
+        return None
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    for file in files:
+        try:
+            with open(file) as f:
+                if not any(line.startswith("issues:") for line in f):
+                    continue
+            with open(file) as f:
+                return _count_outcomes(yaml.load(f, Loader=loader))
+        except (OSError, yaml.YAMLError, ValueError, TypeError):
+            continue
+    return None
+
+
+def _read_details(path: Path) -> Any:
+    """Timing columns of a saved tournament's details (None if unreadable)."""
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+
+    from .tournament_combiner import _table_name
+
+    try:
+        name = _table_name(set(os.listdir(path)), "details")
+    except OSError:
+        return None
+    if name is None:
+        return None
+    try:
+        if name.endswith(".parquet"):
+            available = set(pq.read_schema(path / name).names)
+            table = pq.read_table(
+                path / name, columns=[c for c in _DETAIL_COLUMNS if c in available]
+            )
+        else:
+            table = pacsv.read_csv(
+                path / name,
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=list(_DETAIL_COLUMNS),
+                    include_missing_columns=True,
+                    strings_can_be_null=True,
+                ),
+            )
+    except (OSError, pa.ArrowException):
+        return None
+    return table.to_pandas()
+
+
+def _column(details: Any, name: str, numeric: bool = False) -> Any:
+    """A details column (all missing if the tournament did not save it)."""
+    import pandas as pd
+
+    if name not in details:
+        return pd.Series([None] * len(details), index=details.index, dtype=object)
+    if numeric:
+        return pd.to_numeric(details[name], errors="coerce")
+    return details[name]
+
+
+def _signature(paths: Iterable[Path]) -> tuple:
+    """What a fit depends on: the saved tournaments and their details files."""
+    signature = []
+    for path in paths:
+        try:
+            stats = [
+                (entry.name, entry.stat().st_size, entry.stat().st_mtime_ns)
+                for entry in os.scandir(path)
+                if entry.name.startswith("details.")
+            ]
+        except OSError:
+            continue
+        if stats:
+            signature.append((str(path), tuple(sorted(stats))))
+    return tuple(signature)
+
+
+def log1p_steps(n_steps: float) -> float:
+    """Step-limit feature of the model (unlimited counts as 10^6 steps)."""
+    if not isfinite(n_steps):
+        n_steps = 1e6
+    return log(1 + max(0.0, n_steps))
+
+
+@dataclass
+class RuntimePredictor:
+    """Log-linear model of negotiation wall-clock time."""
+
+    intercept: float = 0.0
+    size_coef: float = 0.0
+    steps_coef: float = 0.0
+    type_effects: dict[str, float] = field(default_factory=dict)
+    default_steps: float = 100.0
+    n_samples: int = 0
+
+    @classmethod
+    def fit(
+        cls,
+        seconds: Sequence[float],
+        n_outcomes: Sequence[float],
+        n_steps: Sequence[float],
+        types: Sequence[Sequence[str]],
+    ) -> "RuntimePredictor | None":
+        """Fit the model to timed runs.
+
+        Args:
+            seconds: Wall-clock time of each run.
+            n_outcomes: Outcome-space size of each run's scenario.
+            n_steps: Step limit of each run.
+            types: Negotiator type names of each run.
+
+        Returns:
+            The fitted predictor, or None with fewer than MIN_SAMPLES valid
+            runs.
+        """
+        rows = [
+            (s, o, n, t)
+            for s, o, n, t in zip(seconds, n_outcomes, n_steps, types)
+            if s > 0 and o > 0 and n >= 0 and isfinite(s) and isfinite(n)
+        ]
+        if len(rows) < MIN_SAMPLES:
+            return None
+        names = sorted({name for *_, t in rows for name in t})
+        column = {name: i + 3 for i, name in enumerate(names)}
+        X = np.zeros((len(rows), 3 + len(names)))
+        y = np.empty(len(rows))
+        for i, (s, o, n, t) in enumerate(rows):
+            X[i, :3] = (1.0, log(o), log1p_steps(n))
+            for name in t:
+                X[i, column[name]] += 1.0
+            y[i] = log(s)
+        # A size or step limit shared by all runs says nothing about its
+        # effect: assume none for the size and proportional time for steps
+        fixed = {}
+        if np.ptp(X[:, 1]) < 1e-9:
+            fixed[1] = 0.0
+        if np.ptp(X[:, 2]) < 1e-9:
+            fixed[2] = 1.0
+        for i, value in fixed.items():
+            y -= value * X[:, i]
+        free = [i for i in range(X.shape[1]) if i not in fixed]
+        # Ridge regression as least squares on rows penalizing type effects
+        penalty = np.zeros((X.shape[1], X.shape[1]))
+        penalty[3:, 3:] = np.sqrt(RIDGE) * np.eye(len(names))
+        A = np.vstack([X, penalty])[:, free]
+        b = np.concatenate([y, np.zeros(X.shape[1])])
+        coef = np.zeros(X.shape[1])
+        coef[free] = np.linalg.lstsq(A, b, rcond=None)[0]
+        for i, value in fixed.items():
+            coef[i] = value
+        return cls(
+            intercept=float(coef[0]),
+            size_coef=float(coef[1]),
+            steps_coef=float(coef[2]),
+            type_effects={name: float(coef[column[name]]) for name in names},
+            default_steps=float(np.median([n for _, _, n, _ in rows])),
+            n_samples=len(rows),
+        )
+
+    def predict(
+        self,
+        types: Sequence[str],
+        n_outcomes: int | None,
+        n_steps: int | None = None,
+        time_limit: float | None = None,
+    ) -> float:
+        """Predicted wall-clock seconds of a run.
+
+        Args:
+            types: Full type names of the negotiators.
+            n_outcomes: Outcome-space size (None: unknown, taken as 1).
+            n_steps: Step limit (None: the typical one of the fitted runs).
+            time_limit: Time limit of the run, capping the prediction.
+        """
+        steps = self.default_steps if n_steps is None else n_steps
+        value = (
+            self.intercept
+            + self.size_coef * log(max(1, n_outcomes or 1))
+            + self.steps_coef * log1p_steps(steps)
+            + sum(self.type_effects.get(name, 0.0) for name in types)
+        )
+        seconds = float(np.exp(min(value, 50.0)))
+        if time_limit is not None and isfinite(time_limit):
+            seconds = min(seconds, time_limit)
+        return seconds
+
+    @classmethod
+    def from_saved_tournaments(
+        cls, tournaments_dir: Path | None = None
+    ) -> "RuntimePredictor | None":
+        """Predictor fitted to the most recent saved tournaments.
+
+        Args:
+            tournaments_dir: Directory of saved tournaments (defaults to the
+                app's tournaments directory).
+
+        Returns:
+            The predictor, or None if there are too few timed runs.
+        """
+        if tournaments_dir is None:
+            from .tournament_storage import TournamentStorageService
+
+            tournaments_dir = TournamentStorageService.TOURNAMENTS_DIR
+        try:
+            paths = sorted(
+                (p for p in Path(tournaments_dir).iterdir() if p.is_dir()),
+                key=lambda p: p.stat().st_mtime,
+                reverse=True,
+            )[:MAX_TOURNAMENTS]
+        except OSError:
+            return None
+        signature = _signature(paths)
+        with _fit_lock:
+            cached = _FIT_CACHE.get(str(tournaments_dir))
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+
+        started = time.perf_counter()
+        seconds: list[float] = []
+        n_outcomes: list[float] = []
+        n_steps: list[float] = []
+        types: list[list[str]] = []
+        for path_name, _ in signature:
+            path = Path(path_name)
+            details = _read_details(path)
+            if details is None or len(details) == 0 or "scenario" not in details:
+                continue
+            if len(details) > MAX_ROWS_PER_TOURNAMENT:
+                details = details.sample(MAX_ROWS_PER_TOURNAMENT, random_state=0)
+            elapsed = _column(details, "execution_time", numeric=True).fillna(
+                _column(details, "time", numeric=True)
+            )
+            limit = _column(details, "n_steps", numeric=True).fillna(
+                _column(details, "step", numeric=True)
+            )
+            failed = _column(details, "has_error").fillna(False).astype(bool)
+            sizes: dict[str, int | None] = {}
+            for scenario in details["scenario"].dropna().unique():
+                sizes[scenario] = saved_scenario_size(
+                    path / "scenarios" / scenario
+                ) or saved_scenario_size(
+                    path / "scenarios" / split_rotation(scenario)[0]
+                )
+            size = details["scenario"].map(sizes)
+            valid = ~failed & elapsed.notna() & limit.notna() & size.notna()
+            seconds += elapsed[valid].astype(float).tolist()
+            n_outcomes += size[valid].astype(float).tolist()
+            n_steps += limit[valid].astype(float).tolist()
+            types += [
+                _parse_list(v) for v in _column(details, "negotiator_types")[valid]
+            ]
+        predictor = cls.fit(seconds, n_outcomes, n_steps, types)
+        if predictor is not None:
+            print(
+                f"[RuntimePredictor] Fitted to {predictor.n_samples} runs in "
+                f"{time.perf_counter() - started:.2f}s"
+            )
+        with _fit_lock:
+            _FIT_CACHE[str(tournaments_dir)] = (signature, predictor)
+        return predictor
+
+
+def scenario_costs(
+    predictor: RuntimePredictor | None,
+    scenarios: Sequence[Any],
+    first_types: Sequence[str],
+    second_types: Sequence[str],
+    n_steps: int | tuple[int, int] | None = None,
+    time_limit: float | tuple[float, float] | None = None,
+    self_play: bool = True,
+) -> list[float]:
+    """Mean predicted seconds of a run on each scenario.
+
+    The mean is over the tournament's (first, second) pairings, so it accounts
+    for slow negotiator types. Without a predictor every run costs 1.
+
+    Args:
+        predictor: Fitted predictor (or None).
+        scenarios: Loaded scenarios.
+        first_types: Full type names of the first-position roster.
+        second_types: Full type names of the second-position roster.
+        n_steps: Step limit of the tournament (a range counts as its maximum).
+        time_limit: Time limit of the tournament (a range counts as its
+            maximum).
+        self_play: Whether a roster member plays against itself (pass True
+            with explicit opponents).
+    """
+    if predictor is None:
+        return [1.0] * len(scenarios)
+    if isinstance(n_steps, (tuple, list)):
+        n_steps = n_steps[-1]
+    if isinstance(time_limit, (tuple, list)):
+        time_limit = time_limit[-1]
+    pairs = [
+        (a, b)
+        for i, a in enumerate(first_types)
+        for j, b in enumerate(second_types)
+        if self_play or i != j
+    ]
+    costs = []
+    for scenario in scenarios:
+        size = _n_outcomes(scenario)
+        costs.append(
+            sum(
+                predictor.predict((a, b), size, n_steps, time_limit) for a, b in pairs
+            )
+            / max(1, len(pairs))
+        )
+    return costs
+
+
+def longest_first(costs: Sequence[float]) -> list[int]:
+    """Indices ordered by decreasing cost (stable for equal costs)."""
+    return sorted(range(len(costs)), key=lambda i: -costs[i])
+
+
+class EtaTracker:
+    """Remaining time of a tournament from predicted run costs.
+
+    The observed time per unit of predicted cost calibrates the prediction to
+    this machine and its parallelism: ETA = elapsed * remaining / done.
+    """
+
+    def __init__(self, costs: dict[str, float], runs_per_scenario: int) -> None:
+        """Track a tournament.
+
+        Args:
+            costs: Mean predicted seconds of a run on each scenario (by name).
+            runs_per_scenario: Runs of each scenario, rotations included.
+        """
+        self.costs = dict(costs)
+        self.total = sum(costs.values()) * runs_per_scenario
+        self._default = (sum(costs.values()) / len(costs)) if costs else 1.0
+        self.done = 0.0
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+
+    def completed(self, scenario: str) -> None:
+        """Count a finished run (rotated names are accepted)."""
+        cost = self.costs.get(split_rotation(scenario)[0], self._default)
+        with self._lock:
+            self.done += cost
+
+    def restart(self) -> None:
+        """Start timing anew, counting finished runs as not part of the total.
+
+        Used after runs that took no time (e.g. records from the result cache).
+        """
+        with self._lock:
+            self.total = max(0.0, self.total - self.done)
+            self.done = 0.0
+            self._started = time.monotonic()
+
+    def eta(self) -> float | None:
+        """Estimated seconds until the tournament finishes (None: unknown)."""
+        with self._lock:
+            if self.done <= 0:
+                return None
+            elapsed = time.monotonic() - self._started
+            return max(0.0, elapsed * (self.total - self.done) / self.done)
@@ -7,6 +7,7 @@ import yaml
 from negmas import Scenario
 
 from ..services.settings_service import SettingsService
+from .scenario_stats_store import STATS_FILE_NAME, STATS_FILE_NAMES, ScenarioStatsStore
 
 
 class ScenarioCacheService:
@@ -60,7 +61,7 @@ class ScenarioCacheService:
                     if f.is_file() and not f.name.startswith("_")
                 )
                 has_cache_files = any(
-                    f.name in {"_info.yaml", "_info.yml", "_stats.yaml", "_plot.webp"}
+                    f.name in {"_info.yaml", "_info.yml", "_plot.webp", *STATS_FILE_NAMES}
                     for f in item.iterdir()
                     if f.is_file()
                 )
@@ -466,9 +467,7 @@ class ScenarioCacheService:
 
                     # Clear stats
                     if clear_stats:
-                        stats_file = scenario_dir / "_stats.yaml"
-                        if stats_file.exists():
-                            stats_file.unlink()
+                        if ScenarioStatsStore.remove(scenario_dir):
                             results["stats_deleted"] += 1
 
                     # Clear plots
@@ -546,7 +545,7 @@ class ScenarioCacheService:
 
         try:
             # Load scenario with appropriate flags
-            scenario = Scenario.load(
+            scenario = ScenarioStatsStore.load_scenario(
                 scenario_dir,
                 load_info=build_info,
                 load_stats=build_stats,
@@ -621,7 +620,7 @@ class ScenarioCacheService:
 
             # Build stats cache
             if build_stats and not skip_stats:
-                stats_file = scenario_dir / "_stats.yaml"
+                stats_file = scenario_dir / STATS_FILE_NAME
                 if refresh or not stats_file.exists():
                     try:
                         # Calculate stats using negmas built-in method
@@ -687,13 +686,13 @@ class ScenarioCacheService:
                                 else:
                                     result["pareto_utils_saved"] = True
 
-                        # Stats will be saved via scenario.update() if refresh=True
+                        # Stats will be saved after scenario.update() if refresh=True
                         # For non-refresh, save individually
                         if not refresh:
-                            # Save stats with separate control over utils and outcomes
-                            scenario.save_stats(
+                            # Header + binary Pareto sidecars (see ScenarioStatsStore)
+                            ScenarioStatsStore.save(
+                                scenario,
                                 scenario_dir,
-                                compact=False,
                                 include_pareto_utils=include_pareto_utils,
                                 include_pareto_outcomes=include_pareto_outcomes,
                             )
@@ -734,12 +733,11 @@ class ScenarioCacheService:
                 else:
                     # If stats are being built or already exist, ensure they're loaded
                     # so we can include special points in plots
-                    if build_stats or (scenario_dir / "_stats.yaml").exists():
+                    if build_stats or ScenarioStatsStore.exists(scenario_dir):
                         if not hasattr(scenario, "stats") or scenario.stats is None:
                             # Load stats from file if they exist
-                            stats_file = scenario_dir / "_stats.yaml"
-                            if stats_file.exists():
-                                scenario = Scenario.load(
+                            if ScenarioStatsStore.exists(scenario_dir):
+                                scenario = ScenarioStatsStore.load_scenario(
                                     scenario_dir, load_stats=True, load_info=False
                                 )
                         # If stats are being built, they're already calculated above
@@ -823,11 +821,16 @@ class ScenarioCacheService:
 
                     scenario.update(
                         save_info=build_info,
-                        save_stats=build_stats,
+                        save_stats=False,  # Written below in the split format
                         save_plot=False,  # We handle plots separately above
-                        include_pareto_utils=include_pareto_utils,
-                        include_pareto_outcomes=include_pareto_outcomes,
                     )
+                    if build_stats:
+                        ScenarioStatsStore.save(
+                            scenario,
+                            scenario_dir,
+                            include_pareto_utils=include_pareto_utils,
+                            include_pareto_outcomes=include_pareto_outcomes,
+                        )
                 except Exception as e:
                     # Ignore update errors (may be read-only scenario)
                     pass
@@ -930,9 +933,7 @@ class ScenarioCacheService:
 
                 # Clear stats
                 if clear_stats:
-                    stats_file = scenario_dir / "_stats.yaml"
-                    if stats_file.exists():
-                        stats_file.unlink()
+                    if ScenarioStatsStore.remove(scenario_dir):
                         results["stats_deleted"] += 1
 
                 # Clear plots
@@ -0,0 +1,292 @@
+"""In-memory columnar catalog of scenarios for server-side picker queries.
+
+The catalog keeps numeric attributes (n_outcomes, n_negotiators, opposition,
+rational_fraction) in NumPy columns with a sorted index each, and an inverted
+index from tags (and sources) to rows. Range filters are binary searches on the
+sorted indexes and tag filters are set lookups, so a query costs a few
+vectorized passes over the rows instead of a Python loop over ScenarioInfo
+objects.
+
+Rows are updated in place when a scenario changes; indexes are rebuilt lazily
+on the next query.
+"""
+
+import re
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import yaml
+
+from ..models import ScenarioInfo, ScenarioQuery
+
+# Numeric columns: query/sort key -> ScenarioInfo attribute
+NUMERIC_COLUMNS = {
+    "n_outcomes": "n_outcomes",
+    "n_negotiators": "n_negotiators",
+    "opposition": "opposition",
+    "rational_fraction": "rational_fraction",
+}
+
+# Range filters: column -> (ScenarioQuery min field, ScenarioQuery max field)
+_RANGE_FILTERS = {
+    "n_outcomes": ("min_outcomes", "max_outcomes"),
+    "n_negotiators": ("min_negotiators", "max_negotiators"),
+    "opposition": ("min_opposition", "max_opposition"),
+    "rational_fraction": ("min_rational_fraction", "max_rational_fraction"),
+}
+
+# Boolean tag filters: ScenarioQuery field -> tag
+_TAG_FLAGS = {"normalized": "normalized", "anac": "anac", "file": "file"}
+
+SORT_KEYS = ("name", *NUMERIC_COLUMNS)
+
+# Saved scenario filter keys (as stored by the scenario picker) -> query fields
+_FILTER_DATA_KEYS = {
+    "search": "search",
+    "source": "source",
+    "minOutcomes": "min_outcomes",
+    "maxOutcomes": "max_outcomes",
+    "minNegotiators": "min_negotiators",
+    "maxNegotiators": "max_negotiators",
+    "minOpposition": "min_opposition",
+    "maxOpposition": "max_opposition",
+    "minRationalFraction": "min_rational_fraction",
+    "maxRationalFraction": "max_rational_fraction",
+    "normalized": "normalized",
+    "anac": "anac",
+    "file": "file",
+    "format": "format",
+    "reverseFilter": "reverse",
+}
+
+_OPPOSITION_RE = re.compile(r"^opposition:\s*([0-9.eE+-]+)", re.MULTILINE)
+
+
+def _to_float(value: Any) -> float:
+    """Convert a column value to float (NaN for unknown)."""
+    if value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def enrich_from_sidecars(info: ScenarioInfo) -> ScenarioInfo:
+    """Fill values missing from the registry from the _info/_stats sidecars."""
+    path = Path(info.path)
+    if info.n_outcomes is None or info.rational_fraction is None:
+        for name in ("_info.yml", "_info.yaml"):
+            info_file = path / name
+            if not info_file.exists():
+                continue
+            try:
+                with open(info_file) as f:
+                    data = yaml.safe_load(f) or {}
+            except (OSError, yaml.YAMLError):
+                break
+            if isinstance(data, dict):
+                if info.n_outcomes is None:
+                    info.n_outcomes = data.get("n_outcomes")
+                if info.rational_fraction is None:
+                    info.rational_fraction = data.get("rational_fraction")
+                info.has_info = info.rational_fraction is not None
+            break
+
+    stats_file = path / "_stats.yaml"
+    if stats_file.exists():
+        info.has_stats = True
+        if info.opposition is None:
+            try:
+                # Only the small header; the frontier lives in .npy sidecars
+                with open(stats_file) as f:
+                    match = _OPPOSITION_RE.search(f.read(64 * 1024))
+                if match:
+                    info.opposition = float(match.group(1))
+            except (OSError, ValueError):
+                pass
+    return info
+
+
+def query_from_filter_data(data: dict[str, Any], **overrides: Any) -> ScenarioQuery:
+    """Build a query from saved scenario filter data.
+
+    Args:
+        data: SavedFilter.data as stored by the scenario picker.
+        **overrides: Query fields that take precedence (None values ignored).
+
+    Returns:
+        The equivalent ScenarioQuery.
+    """
+    fields: dict[str, Any] = {}
+    for key, field_name in _FILTER_DATA_KEYS.items():
+        value = data.get(key)
+        # The picker stores "" for unset selects
+        if value is None or value == "":
+            continue
+        fields[field_name] = value
+    fields.update({k: v for k, v in overrides.items() if v is not None})
+    return ScenarioQuery(**fields)
+
+
+class ScenarioCatalog:
+    """Columnar, indexed collection of ScenarioInfo rows."""
+
+    def __init__(self, infos: list[ScenarioInfo]):
+        self._infos: list[ScenarioInfo] = list(infos)
+        self._rows: dict[str, int] = {
+            info.path: row for row, info in enumerate(self._infos)
+        }
+        self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._infos)
+
+    def __contains__(self, path: str) -> bool:
+        return str(path) in self._rows
+
+    def upsert(self, info: ScenarioInfo) -> None:
+        """Add or replace the row for info.path."""
+        row = self._rows.get(info.path)
+        if row is None:
+            self._rows[info.path] = len(self._infos)
+            self._infos.append(info)
+        else:
+            self._infos[row] = info
+        self._dirty = True
+
+    def remove(self, path: str | Path) -> bool:
+        """Remove the row for a path, returning whether it existed."""
+        row = self._rows.pop(str(path), None)
+        if row is None:
+            return False
+        del self._infos[row]
+        self._rows = {info.path: i for i, info in enumerate(self._infos)}
+        self._dirty = True
+        return True
+
+    def _build(self) -> None:
+        """(Re)build the columns and indexes from the rows."""
+        n = len(self._infos)
+        self._columns: dict[str, np.ndarray] = {}
+        # column -> (row ids sorted by value, sorted values) for known values
+        self._sorted: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        # column -> row order with unknown values last (for sorting)
+        self._orders: dict[str, np.ndarray] = {}
+        for key, attr in NUMERIC_COLUMNS.items():
+            column = np.fromiter(
+                (_to_float(getattr(info, attr)) for info in self._infos),
+                dtype=np.float64,
+                count=n,
+            )
+            order = np.argsort(column, kind="stable")  # NaN sorts last
+            n_known = int(np.count_nonzero(~np.isnan(column)))
+            self._columns[key] = column
+            self._sorted[key] = (order[:n_known], column[order[:n_known]])
+            self._orders[key] = order
+
+        names = [info.name.lower() for info in self._infos]
+        self._orders["name"] = np.array(
+            sorted(range(n), key=names.__getitem__), dtype=np.intp
+        )
+
+        tag_rows: dict[str, list[int]] = {}
+        source_rows: dict[str, list[int]] = {}
+        for row, info in enumerate(self._infos):
+            for tag in set(info.tags or []):
+                tag_rows.setdefault(tag, []).append(row)
+            source_rows.setdefault(info.source, []).append(row)
+        self._tags = {k: np.array(v, dtype=np.intp) for k, v in tag_rows.items()}
+        self._sources = {k: np.array(v, dtype=np.intp) for k, v in source_rows.items()}
+
+        # Name and tags, lowercased, for substring search
+        self._text = np.array(
+            [
+                "\x00".join([info.name, *(info.tags or [])]).lower()
+                for info in self._infos
+            ],
+            dtype=np.str_,
+        )
+        self._dirty = False
+
+    def _rows_mask(self, rows: np.ndarray | None) -> np.ndarray:
+        """Boolean mask with the given rows set."""
+        mask = np.zeros(len(self._infos), dtype=bool)
+        if rows is not None:
+            mask[rows] = True
+        return mask
+
+    def _range_mask(
+        self, key: str, low: float | None, high: float | None
+    ) -> np.ndarray:
+        """Rows within [low, high] (rows with unknown values always match)."""
+        rows, values = self._sorted[key]
+        start = 0 if low is None else int(np.searchsorted(values, low, side="left"))
+        stop = (
+            len(values)
+            if high is None
+            else int(np.searchsorted(values, high, side="right"))
+        )
+        mask = np.isnan(self._columns[key])
+        mask[rows[start:stop]] = True
+        return mask
+
+    def match(self, query: ScenarioQuery) -> np.ndarray:
+        """Row ids matching the query's filters, in sort order."""
+        if self._dirty:
+            self._build()
+        n = len(self._infos)
+
+        scope = (
+            self._rows_mask(self._sources.get(query.source))
+            if query.source
+            else np.ones(n, dtype=bool)
+        )
+        mask = scope.copy()
+
+        if query.search:
+            mask &= np.char.find(self._text, query.search.lower()) >= 0
+        for tag in query.tags:
+            mask &= self._rows_mask(self._tags.get(tag))
+        for field_name, tag in _TAG_FLAGS.items():
+            flag = getattr(query, field_name)
+            if flag is not None:
+                has_tag = self._rows_mask(self._tags.get(tag))
+                mask &= has_tag if flag else ~has_tag
+        if query.format:
+            mask &= self._rows_mask(self._tags.get(query.format))
+        for key, (low_field, high_field) in _RANGE_FILTERS.items():
+            low, high = getattr(query, low_field), getattr(query, high_field)
+            if low is not None or high is not None:
+                mask &= self._range_mask(key, low, high)
+
+        if query.reverse:
+            mask = scope & ~mask
+
+        if query.sort_by is None:
+            return np.flatnonzero(mask)
+        if query.sort_by not in self._orders:
+            raise ValueError(
+                f"Cannot sort by {query.sort_by!r}; expected one of {SORT_KEYS}"
+            )
+        order = self._orders[query.sort_by]
+        if query.descending:
+            if query.sort_by == "name":
+                order = order[::-1]
+            else:
+                # Reverse known values but keep unknown values last
+                n_known = len(self._sorted[query.sort_by][0])
+                order = np.concatenate([order[:n_known][::-1], order[n_known:]])
+        return order[mask[order]]
+
+    def query(self, query: ScenarioQuery) -> tuple[list[ScenarioInfo], int]:
+        """Run a query.
+
+        Returns:
+            Tuple of (page of matching scenarios, total number of matches).
+        """
+        rows = self.match(query)
+        stop = None if query.limit is None else query.offset + query.limit
+        page = rows[query.offset : stop]
+        return [self._infos[row] for row in page.tolist()], len(rows)
@@ -2,6 +2,7 @@
 
 import json
 import re
+import threading
 import time
 from pathlib import Path
 from typing import Any
@@ -14,23 +15,43 @@ from negmas.inout import (
     find_domain_and_utility_files_xml,
     find_domain_and_utility_files_yaml,
 )
-from negmas.preferences.ops import is_rational
 
-# Try to import scenario registry features (available in dev version, not PyPI)
-try:
-    from negmas import scenario_registry, register_all_scenarios
+# negmas' scenario registry is imported on first use: importing it pulls in
+# negmas.models (and scikit-learn), which dominates app startup otherwise.
+_EMPTY_REGISTRY: dict[str, Any] = {}
 
-    HAS_SCENARIO_REGISTRY = True
-except ImportError:
-    scenario_registry: Any = {}
-    HAS_SCENARIO_REGISTRY = False
 
-    def register_all_scenarios() -> None:
-        """No-op stub when scenario registry is not available."""
-        pass
+def _scenario_registry() -> Any:
+    """Get negmas' scenario registry (available in dev version, not PyPI)."""
+    try:
+        from negmas import scenario_registry
+    except ImportError:
+        return _EMPTY_REGISTRY
+    return scenario_registry
+
+
+def register_all_scenarios(*args: Any, **kwargs: Any) -> Any:
+    """Register scenarios with negmas, or do nothing if unsupported."""
+    try:
+        from negmas import register_all_scenarios as _register_all
+    except ImportError:
+        return None
+    return _register_all(*args, **kwargs)
 
 
-from ..models import ScenarioInfo, IssueInfo, ScenarioStatsInfo, ScenarioDefinition
+from ..models import (
+    ScenarioInfo,
+    IssueInfo,
+    ScenarioStatsInfo,
+    ScenarioDefinition,
+    ScenarioQuery,
+)
+from .bundled_scenarios import BundledScenarioArchive
+from .deletion_queue import DeletionQueue
+from .scenario_catalog import ScenarioCatalog, enrich_from_sidecars
+from .scenario_metrics import ScenarioMetricsService
+from .scenario_stats_store import ScenarioStatsStore
+from .server_metrics import record_cache
 from .settings_service import SettingsService
 
 
@@ -49,11 +70,32 @@ _CACHE_TTL = 300.0
 _OPPOSITION_RE = re.compile(r"^opposition:\s*([0-9.eE+-]+)", re.MULTILINE)
 
 
+# Indexed catalog backing server-side scenario queries (built on first query)
+_CATALOG: ScenarioCatalog | None = None
+# Scenarios whose catalog rows must be refreshed before the next query
+_CATALOG_DIRTY: set[str] = set()
+# Registry size the catalog corresponds to
+_CATALOG_SIZE = 0
+_catalog_lock = threading.Lock()
+
+
 def clear_scenario_cache() -> None:
     """Clear the in-memory scenario info cache."""
-    global _SCENARIO_INFO_CACHE, _SCENARIO_DETAIL_CACHE
+    global _SCENARIO_INFO_CACHE, _SCENARIO_DETAIL_CACHE, _CATALOG
     _SCENARIO_INFO_CACHE.clear()
     _SCENARIO_DETAIL_CACHE.clear()
+    with _catalog_lock:
+        _CATALOG = None
+        _CATALOG_DIRTY.clear()
+
+
+def invalidate_scenario_cache(path: str | Path) -> None:
+    """Drop cached info for one scenario (e.g. after stats were recalculated)."""
+    path_str = str(path)
+    _SCENARIO_INFO_CACHE.pop(path_str, None)
+    _SCENARIO_DETAIL_CACHE.pop(path_str, None)
+    with _catalog_lock:
+        _CATALOG_DIRTY.add(path_str)
 
 
 def calculate_rational_fraction(
@@ -71,14 +113,7 @@ def calculate_rational_fraction(
         Fraction of rational outcomes (0.0 to 1.0), or None if calculation fails.
     """
     try:
-        outcomes = list(
-            scenario.outcome_space.enumerate_or_sample(max_cardinality=max_samples)
-        )
-        if not outcomes:
-            return 0.0
-
-        n_rational = sum(1 for o in outcomes if is_rational(scenario.ufuns, o))
-        return n_rational / len(outcomes)
+        return ScenarioMetricsService.compute(scenario, max_samples).rational_fraction
     except (KeyError, ValueError, TypeError) as e:
         # Some scenarios have malformed utility functions that can't be evaluated
         # Return None to indicate the calculation failed
@@ -171,10 +206,7 @@ class ScenarioLoader:
         self._save_statuses()
 
         # Invalidate caches
-        if path_str in _SCENARIO_INFO_CACHE:
-            del _SCENARIO_INFO_CACHE[path_str]
-        if path_str in _SCENARIO_DETAIL_CACHE:
-            del _SCENARIO_DETAIL_CACHE[path_str]
+        invalidate_scenario_cache(path_str)
 
         return True
 
@@ -187,8 +219,6 @@ class ScenarioLoader:
         Returns:
             Tuple of (success, error_message)
         """
-        import shutil
-
         path = Path(path)
         path_str = str(path)
 
@@ -198,17 +228,16 @@ class ScenarioLoader:
 
         # Check if scenario is read-only
         self.ensure_scenarios_registered()
-        for reg_info in scenario_registry.values():
+        for reg_info in _scenario_registry().values():
             if str(reg_info.path) == path_str:
                 if getattr(reg_info, "read_only", False):
                     return False, "Cannot delete read-only scenario"
                 break
 
-        # Delete from disk
-        try:
-            shutil.rmtree(path)
-        except Exception as e:
-            return False, f"Failed to delete scenario: {e}"
+        # Move to trash now, the files are deleted in the background
+        job = DeletionQueue.delete([path], label=f"scenario {path.name}")
+        if job.errors:
+            return False, f"Failed to delete scenario: {job.errors[0]}"
 
         # Remove from status tracking
         if path_str in self._statuses:
@@ -216,14 +245,11 @@ class ScenarioLoader:
             self._save_statuses()
 
         # Invalidate caches
-        if path_str in _SCENARIO_INFO_CACHE:
-            del _SCENARIO_INFO_CACHE[path_str]
-        if path_str in _SCENARIO_DETAIL_CACHE:
-            del _SCENARIO_DETAIL_CACHE[path_str]
+        invalidate_scenario_cache(path_str)
 
         # Remove from registry
-        if path_str in scenario_registry:
-            del scenario_registry[path_str]
+        if path_str in _scenario_registry():
+            del _scenario_registry()[path_str]
 
         return True, None
 
@@ -236,7 +262,7 @@ class ScenarioLoader:
             # Serialize registry data
             cache_data = {"version": "1.0", "timestamp": time.time(), "scenarios": []}
 
-            for path_str, reg_info in scenario_registry.items():
+            for path_str, reg_info in _scenario_registry().items():
                 try:
                     scenario_data = {
                         "path": str(reg_info.path),
@@ -322,7 +348,7 @@ class ScenarioLoader:
                     )
 
                     # Add to registry using the path as key
-                    scenario_registry[str(info.path)] = info
+                    _scenario_registry()[str(info.path)] = info
                     loaded_count += 1
 
                 except Exception as e:
@@ -349,14 +375,14 @@ class ScenarioLoader:
             Number of scenarios registered.
         """
         if self._registered:
-            return len(scenario_registry)
+            return len(_scenario_registry())
 
         if self._registration_in_progress:
-            return len(scenario_registry)  # Return current count if in progress
+            return len(_scenario_registry())  # Return current count if in progress
 
         # Try loading from cache first (instant startup on subsequent runs)
         if self._load_registry_cache():
-            return len(scenario_registry)
+            return len(_scenario_registry())
 
         self._registration_in_progress = True
         self._registration_progress["status"] = "registering"
@@ -410,6 +436,16 @@ class ScenarioLoader:
                 print(f"Warning: Failed to register scenarios from {category_dir}: {e}")
                 self._registration_progress["current"] += 1
 
+        # Bundled scenarios not extracted yet are registered from scenarios.zip
+        # and extracted on first load
+        if BundledScenarioArchive.is_enabled(self.scenarios_root):
+            try:
+                total_registered += BundledScenarioArchive.register_lazy(
+                    self.scenarios_root
+                )
+            except Exception as e:
+                print(f"Warning: Failed to register bundled scenarios: {e}")
+
         # Register from custom scenario_paths
         # Each path gets scanned recursively, and scenarios use the folder name as source
         for path in custom_paths:
@@ -447,7 +483,7 @@ class ScenarioLoader:
             "registered": self._registered,
             "in_progress": self._registration_in_progress,
             "progress": self._registration_progress.copy(),
-            "total_scenarios": len(scenario_registry),
+            "total_scenarios": len(_scenario_registry()),
         }
 
     def list_sources(self) -> list[str]:
@@ -456,7 +492,7 @@ class ScenarioLoader:
 
         # Get unique actual sources from registry
         sources = set()
-        for info in scenario_registry.values():
+        for info in _scenario_registry().values():
             if info.source:
                 sources.add(info.source)
 
@@ -524,9 +560,9 @@ class ScenarioLoader:
 
         # Query registry by actual source
         if source:
-            results = scenario_registry.query(source=source)
+            results = _scenario_registry().query(source=source)
         else:
-            results = dict(scenario_registry.items())
+            results = dict(_scenario_registry().items())
 
         # Convert negmas ScenarioInfo to our ScenarioInfo model
         scenarios = []
@@ -537,6 +573,51 @@ class ScenarioLoader:
 
         return scenarios
 
+    def get_catalog(self) -> ScenarioCatalog:
+        """Get the indexed scenario catalog, building or refreshing it as needed.
+
+        The catalog is built from the registry (plus _info/_stats sidecars for
+        values the registry lacks) once; afterwards only scenarios invalidated
+        via invalidate_scenario_cache are re-read.
+        """
+        global _CATALOG, _CATALOG_SIZE
+        self.ensure_scenarios_registered()
+        registry = _scenario_registry()
+
+        def row(reg_info: Any) -> ScenarioInfo | None:
+            info = self._convert_registry_info(reg_info)
+            return enrich_from_sidecars(info) if info else None
+
+        with _catalog_lock:
+            if _CATALOG is not None:
+                for path_str in _CATALOG_DIRTY:
+                    reg_info = registry.get(path_str)
+                    info = row(reg_info) if reg_info is not None else None
+                    if info is None:
+                        _CATALOG_SIZE -= _CATALOG.remove(path_str)
+                    else:
+                        _CATALOG_SIZE += path_str not in _CATALOG
+                        _CATALOG.upsert(info)
+            _CATALOG_DIRTY.clear()
+            # Registration may still be adding scenarios: rebuild when the
+            # registry changed in ways not covered by invalidated paths
+            if _CATALOG is None or len(registry) != _CATALOG_SIZE:
+                infos = [row(reg_info) for reg_info in registry.values()]
+                _CATALOG = ScenarioCatalog([i for i in infos if i is not None])
+                _CATALOG_SIZE = len(registry)
+            return _CATALOG
+
+    def query_scenarios(self, query: ScenarioQuery) -> tuple[list[ScenarioInfo], int]:
+        """Filter, sort and paginate scenarios using the indexed catalog.
+
+        Args:
+            query: Filters, sort key and page.
+
+        Returns:
+            Tuple of (page of scenarios, total number of matches).
+        """
+        return self.get_catalog().query(query)
+
     def _load_scenario_info_lightweight(
         self, path: Path, source: str
     ) -> ScenarioInfo | None:
@@ -552,7 +633,9 @@ class ScenarioLoader:
         if path_str in _SCENARIO_INFO_CACHE:
             cached_info, cache_time = _SCENARIO_INFO_CACHE[path_str]
             if current_time - cache_time < _CACHE_TTL:
+                record_cache("scenario_info", True)
                 return cached_info
+        record_cache("scenario_info", False)
 
         try:
             # Read _info.yml for n_outcomes, n_issues, and rational_fraction (small file, full YAML is fine)
@@ -573,7 +656,8 @@ class ScenarioLoader:
                     )
 
             # Extract opposition from _stats.yaml using regex (fast, avoids full YAML parsing)
-            # The _stats.yaml files can be large (2MB+) due to pareto data
+            # Legacy _stats.yaml files can be large (2MB+) due to inline pareto
+            # data; files written by ScenarioStatsStore are a small header
             opposition = None
             has_stats = False
             stats_file = path / "_stats.yaml"
@@ -623,11 +707,14 @@ class ScenarioLoader:
         if path_str in _SCENARIO_DETAIL_CACHE:
             cached_info, cache_time = _SCENARIO_DETAIL_CACHE[path_str]
             if current_time - cache_time < _CACHE_TTL:
+                record_cache("scenario_detail", True)
                 return cached_info
+        record_cache("scenario_detail", False)
 
         # Load full scenario - NO stats needed here, just issues/ufuns
         # Stats are only loaded on-demand in get_scenario_stats()
         try:
+            BundledScenarioArchive.ensure_scenario_files(path)
             scenario = Scenario.load(path, load_stats=False, load_info=True)  # type: ignore[attr-defined]
             if scenario is None:
                 return None
@@ -727,7 +814,7 @@ class ScenarioLoader:
             # Negmas package scenarios have read_only=True
             readonly = False
             self.ensure_scenarios_registered()
-            for reg_info in scenario_registry.values():
+            for reg_info in _scenario_registry().values():
                 if str(reg_info.path) == str(path):
                     readonly = getattr(reg_info, "read_only", False)
                     break
@@ -770,6 +857,7 @@ class ScenarioLoader:
         ignore_discount: bool = False,
         load_stats: bool = True,
         load_info: bool = True,
+        load_pareto: bool = True,
     ) -> Any:
         """Load a full scenario from path.
 
@@ -778,16 +866,18 @@ class ScenarioLoader:
             ignore_discount: If True, ignore discount factors in utility functions.
             load_stats: If True, load cached stats if available.
             load_info: If True, load cached info if available.
+            load_pareto: If True, also load the cached Pareto frontier.
 
         Returns:
             Loaded Scenario or None if loading fails.
         """
-        return Scenario.load(
-            Path(path),
+        return ScenarioStatsStore.load_scenario(
+            path,
             ignore_discount=ignore_discount,
             load_stats=load_stats,
             load_info=load_info,
-        )  # type: ignore[attr-defined]
+            load_pareto=load_pareto,
+        )
 
     def get_scenario_info(self, path: str | Path) -> ScenarioInfo | None:
         """Get info for a specific scenario (with full details including issues)."""
@@ -808,11 +898,17 @@ class ScenarioLoader:
         Returns:
             ScenarioStatsInfo with stats if available.
         """
-        scenario = self.load_scenario(path, load_stats=True, load_info=True)
+        # Only the stats header is parsed; the frontier size comes from the
+        # header of the binary sidecar
+        scenario = self.load_scenario(
+            path, load_stats=True, load_info=True, load_pareto=False
+        )
         if scenario is None:
             return ScenarioStatsInfo(has_stats=False)
 
-        return self._extract_stats(scenario)
+        return self._extract_stats(
+            scenario, n_pareto_outcomes=ScenarioStatsStore.count_pareto(path)
+        )
 
     def calculate_and_save_stats(
         self,
@@ -903,16 +999,19 @@ class ScenarioLoader:
                             if n_pareto > max_pareto_outcomes:
                                 include_pareto = False
 
-                        # Use scenario.update() for atomic save of info and stats
-                        # This is more reliable than separate save_info() and save_stats() calls
                         scenario.update(
                             save_info=needs_info and scenario.info is not None,
-                            save_stats=needs_stats
-                            and can_calc_stats
-                            and scenario.stats is not None,
+                            save_stats=False,
                             save_plot=False,  # Don't save plots here
-                            include_pareto_frontier=include_pareto,
                         )
+                        # Stats are saved as a small header plus binary sidecars
+                        if needs_stats and can_calc_stats and scenario.stats is not None:
+                            ScenarioStatsStore.save(
+                                scenario,
+                                path,
+                                include_pareto_utils=include_pareto,
+                                include_pareto_outcomes=include_pareto,
+                            )
                     except Exception as e:
                         # Log error but don't fail - may be filesystem issues
                         print(f"Warning: Could not save stats/info for {path}: {e}")
@@ -921,16 +1020,20 @@ class ScenarioLoader:
                     pass
 
             # Invalidate in-memory caches so next list_scenarios picks up new stats
-            path_str = str(path)
-            if path_str in _SCENARIO_INFO_CACHE:
-                del _SCENARIO_INFO_CACHE[path_str]
-            if path_str in _SCENARIO_DETAIL_CACHE:
-                del _SCENARIO_DETAIL_CACHE[path_str]
+            invalidate_scenario_cache(path)
 
         return self._extract_stats(scenario)
 
-    def _extract_stats(self, scenario: Scenario) -> ScenarioStatsInfo:
-        """Extract stats from a scenario into ScenarioStatsInfo."""
+    def _extract_stats(
+        self, scenario: Scenario, n_pareto_outcomes: int | None = None
+    ) -> ScenarioStatsInfo:
+        """Extract stats from a scenario into ScenarioStatsInfo.
+
+        Args:
+            scenario: Scenario with stats loaded.
+            n_pareto_outcomes: Frontier size, when the frontier itself was not
+                loaded (defaults to the size of stats.pareto_utils).
+        """
         if scenario.stats is None:
             return ScenarioStatsInfo(has_stats=False)
 
@@ -987,7 +1090,11 @@ class ScenarioLoader:
             utility_ranges=[(float(lo), float(hi)) for lo, hi in stats.utility_ranges]
             if stats.utility_ranges
             else None,
-            n_pareto_outcomes=len(stats.pareto_utils) if stats.pareto_utils else 0,
+            n_pareto_outcomes=n_pareto_outcomes
+            if n_pareto_outcomes is not None
+            else len(stats.pareto_utils)
+            if stats.pareto_utils
+            else 0,
             nash_utils=to_list(stats.nash_utils),
             kalai_utils=to_list(stats.kalai_utils),
             ks_utils=to_list(getattr(stats, "ks_utils", None)),
@@ -1150,11 +1257,7 @@ class ScenarioLoader:
             scenario.dumpas(save_path)
 
             # Invalidate caches so the new scenario appears in lists
-            path_str = str(save_path)
-            if path_str in _SCENARIO_INFO_CACHE:
-                del _SCENARIO_INFO_CACHE[path_str]
-            if path_str in _SCENARIO_DETAIL_CACHE:
-                del _SCENARIO_DETAIL_CACHE[path_str]
+            invalidate_scenario_cache(save_path)
 
             return scenario, save_path, None
 
@@ -0,0 +1,374 @@
+"""Batched scenario metrics computed from a single utility matrix.
+
+Rational fraction, opposition and reserved-value statistics all need the
+utility of every outcome for every negotiator. Instead of calling
+``is_rational``/``opposition_level`` per outcome (which evaluate each ufun
+several times over), the ufuns are evaluated once into an
+(n_outcomes, n_negotiators) matrix and everything else is derived with NumPy.
+Linear additive (and affine) ufuns are evaluated once per issue value and
+combined with array lookups; other ufuns are called per outcome.
+
+Results are cached in memory by scenario fingerprint (the names, sizes and
+modification times of the scenario's definition files), so re-selecting a
+scenario in the picker does not recompute anything. ``get_async`` computes
+missing metrics in a small process pool, as evaluating ufuns holds the GIL.
+"""
+
+import asyncio
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+
+from ..models import ScenarioMetrics
+from .bundled_scenarios import BundledScenarioArchive
+
+# Maximum number of outcomes evaluated (larger spaces are sampled)
+DEFAULT_MAX_SAMPLES = 50000
+
+# Worker processes computing metrics for get_async
+METRICS_WORKERS = 2
+
+# Key: (scenario path, max_samples), Value: (fingerprint, metrics)
+_METRICS_CACHE: dict[tuple[str, int], tuple[tuple, ScenarioMetrics]] = {}
+_cache_lock = threading.Lock()
+
+# Spawned on first use; computations in flight by cache key
+_metrics_pool: ProcessPoolExecutor | None = None
+_pending: dict[tuple[str, int], Future] = {}
+
+
+def scenario_fingerprint(path: Path | str) -> tuple:
+    """Fingerprint a scenario directory by its definition files.
+
+    Cache files written by the app (``_stats.yaml``, ``_info.yaml``, ``_plots/``,
+    ...) start with an underscore and are ignored so that saving stats does not
+    invalidate the metrics.
+    """
+    entries = []
+    stack = [Path(path)]
+    while stack:
+        folder = stack.pop()
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.name.startswith(("_", ".")):
+                    continue
+                if entry.is_dir():
+                    stack.append(Path(entry.path))
+                    continue
+                st = entry.stat()
+                entries.append((entry.path, st.st_size, st.st_mtime_ns))
+    return tuple(sorted(entries))
+
+
+def _encode_outcomes(outcomes: Sequence[Any]) -> list[tuple[list, np.ndarray]]:
+    """Per issue: its distinct values and each outcome's index into them."""
+    encoded = []
+    for column in zip(*outcomes):
+        index: dict[Any, int] = {}
+        codes = np.fromiter(
+            (index.setdefault(v, len(index)) for v in column),
+            dtype=np.intp,
+            count=len(outcomes),
+        )
+        encoded.append((list(index), codes))
+    return encoded
+
+
+def _value_utility(value_fun: Any, value: Any) -> float:
+    utility = value_fun(value)
+    return math.nan if utility is None else float(utility)
+
+
+def _linear_utilities(
+    ufun: Any, encoded: list[tuple[list, np.ndarray]], n: int
+) -> np.ndarray | None:
+    """Utilities of a linear additive or affine ufun, from per-value lookups.
+
+    Discounted ufuns outside a negotiation evaluate the ufun they wrap, so
+    linear ufuns loaded with a discount factor are looked up as well.
+
+    Returns:
+        The utility of every outcome, or None if the ufun must be called per
+        outcome (other types, constraints, outcome-space checks, overrides).
+    """
+    from negmas.preferences import (
+        AffineUtilityFunction,
+        LinearAdditiveUtilityFunction,
+    )
+    from negmas.preferences.discounted import ExpDiscountedUFun, LinDiscountedUFun
+
+    def checked(ufun: Any) -> bool:
+        return bool(
+            getattr(ufun, "_constraints", None)
+            or getattr(ufun, "_invalid_value", None) is not None
+        )
+
+    while type(ufun) in (ExpDiscountedUFun, LinDiscountedUFun):
+        owner = getattr(ufun, "owner", None)
+        if checked(ufun) or (owner is not None and owner.nmi is not None):
+            return None
+        ufun = ufun._ufun
+    for base in (LinearAdditiveUtilityFunction, AffineUtilityFunction):
+        if isinstance(ufun, base):
+            break
+    else:
+        return None
+    cls = type(ufun)
+    if cls.eval is not base.eval or cls.__call__ is not base.__call__ or checked(ufun):
+        return None
+    utils = np.full(n, float(ufun._bias), dtype=np.float64)
+    if base is LinearAdditiveUtilityFunction:
+        for (values, codes), weight, value_fun in zip(
+            encoded, ufun.weights, ufun.values
+        ):
+            table = np.array([_value_utility(value_fun, v) for v in values])
+            utils += weight * table[codes]
+    else:
+        for (values, codes), weight in zip(encoded, ufun._weights):
+            table = np.array([float(v) for v in values], dtype=np.float64)
+            utils += weight * table[codes]
+    return utils
+
+
+def compute_utility_matrix(ufuns: Sequence[Any], outcomes: Sequence[Any]) -> np.ndarray:
+    """Evaluate every ufun once on every outcome.
+
+    Args:
+        ufuns: Utility functions (one column each).
+        outcomes: Outcomes to evaluate (one row each).
+
+    Returns:
+        Float array of shape (len(outcomes), len(ufuns)).
+
+    Raises:
+        TypeError: If a ufun returns a non-numeric value (e.g. None).
+    """
+    n = len(outcomes)
+    utils = np.empty((n, len(ufuns)), dtype=np.float64)
+    encoded: list[tuple[list, np.ndarray]] | None = None
+    for col, ufun in enumerate(ufuns):
+        column = None
+        if n:
+            try:
+                if encoded is None:
+                    encoded = _encode_outcomes(outcomes)
+                column = _linear_utilities(ufun, encoded, n)
+            except (TypeError, ValueError):
+                # Unhashable or non-numeric issue values
+                column = None
+        if column is None:
+            column = np.fromiter(
+                (float(ufun(o)) for o in outcomes), dtype=np.float64, count=n
+            )
+        utils[:, col] = column
+    return utils
+
+
+def _reserved_value(ufun: Any) -> float | None:
+    """Get a ufun's reserved value as a float (None if not set)."""
+    reserved = getattr(ufun, "reserved_value", None)
+    return None if reserved is None else float(reserved)
+
+
+def metrics_from_utilities(
+    utils: np.ndarray, reserved_values: Sequence[float | None]
+) -> ScenarioMetrics:
+    """Derive scenario metrics from a utility matrix.
+
+    Follows negmas' conventions: an outcome is rational for a negotiator unless
+    its utility is below the reserved value, and opposition is the minimum
+    distance of a rational outcome to (1, 1, ...).
+
+    Args:
+        utils: Array of shape (n_outcomes, n_negotiators).
+        reserved_values: Reserved value per negotiator (None means no limit).
+
+    Returns:
+        ScenarioMetrics (n_outcomes and sampled are left to the caller).
+    """
+    n, k = utils.shape
+    reserved = np.array(
+        [-math.inf if r is None else r for r in reserved_values], dtype=np.float64
+    )
+    metrics = ScenarioMetrics(n_evaluated=n, reserved_values=list(reserved_values))
+    if n == 0:
+        metrics.rational_fraction = 0.0
+        return metrics
+
+    # NaN utilities compare False, which treats them as rational like negmas does
+    irrational = utils < reserved
+    rational = ~irrational.any(axis=1)
+    metrics.rational_fraction = float(rational.mean())
+    metrics.individual_rational_fractions = (1.0 - irrational.mean(axis=0)).tolist()
+
+    finite = np.where(np.isfinite(utils), utils, np.nan)
+    with np.errstate(all="ignore"):
+        for col in range(k):
+            column = finite[:, col]
+            if np.isnan(column).all():
+                metrics.utility_ranges.append((math.nan, math.nan))
+            else:
+                metrics.utility_ranges.append(
+                    (float(np.nanmin(column)), float(np.nanmax(column)))
+                )
+
+        if k >= 2:
+            distances = ((1.0 - utils[rational]) ** 2).sum(axis=1)
+            distances = distances[~np.isnan(distances)]
+            metrics.opposition = (
+                float(math.sqrt(distances.min())) if len(distances) else math.inf
+            )
+        else:
+            metrics.opposition = 0.0
+    return metrics
+
+
+class ScenarioMetricsService:
+    """Compute and cache utility-matrix based scenario metrics."""
+
+    @staticmethod
+    def compute(
+        scenario: Any, max_samples: int = DEFAULT_MAX_SAMPLES
+    ) -> ScenarioMetrics:
+        """Compute metrics for a loaded scenario (not cached).
+
+        Args:
+            scenario: The negmas Scenario.
+            max_samples: Maximum number of outcomes to evaluate; larger outcome
+                spaces are sampled.
+
+        Returns:
+            ScenarioMetrics for the scenario.
+        """
+        outcome_space = scenario.outcome_space
+        cardinality = outcome_space.cardinality
+        outcomes = list(outcome_space.enumerate_or_sample(max_cardinality=max_samples))
+        utils = compute_utility_matrix(scenario.ufuns, outcomes)
+        metrics = metrics_from_utilities(
+            utils, [_reserved_value(u) for u in scenario.ufuns]
+        )
+        metrics.n_outcomes = int(cardinality) if math.isfinite(cardinality) else None
+        metrics.sampled = len(outcomes) < cardinality
+        return metrics
+
+    @staticmethod
+    def _lookup(
+        path: Path | str, max_samples: int
+    ) -> tuple[tuple[str, int], tuple, ScenarioMetrics | None]:
+        """Cache key, current fingerprint and cached metrics (if current)."""
+        BundledScenarioArchive.ensure_scenario_files(path)
+        key = (str(Path(path).resolve()), max_samples)
+        fingerprint = scenario_fingerprint(path)
+        with _cache_lock:
+            cached = _METRICS_CACHE.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return key, fingerprint, cached[1]
+        return key, fingerprint, None
+
+    @staticmethod
+    def get(
+        path: Path | str, max_samples: int = DEFAULT_MAX_SAMPLES
+    ) -> ScenarioMetrics:
+        """Get metrics for a scenario directory, using the fingerprint cache.
+
+        Args:
+            path: Scenario directory.
+            max_samples: Maximum number of outcomes to evaluate.
+
+        Returns:
+            ScenarioMetrics for the scenario.
+        """
+        key, fingerprint, metrics = ScenarioMetricsService._lookup(path, max_samples)
+        if metrics is not None:
+            return metrics
+        metrics = _compute_for_path(str(path), max_samples)
+        with _cache_lock:
+            _METRICS_CACHE[key] = (fingerprint, metrics)
+        return metrics
+
+    @staticmethod
+    async def get_async(
+        path: Path | str, max_samples: int = DEFAULT_MAX_SAMPLES
+    ) -> ScenarioMetrics:
+        """Get metrics without blocking the event loop or the server's GIL.
+
+        Cached metrics are checked in a thread; missing ones are computed in
+        a worker process. Concurrent requests for the same scenario share
+        one computation.
+        """
+        key, fingerprint, metrics = await asyncio.to_thread(
+            ScenarioMetricsService._lookup, path, max_samples
+        )
+        if metrics is not None:
+            return metrics
+        metrics = await asyncio.wrap_future(_submit(key, str(path), max_samples))
+        with _cache_lock:
+            _METRICS_CACHE[key] = (fingerprint, metrics)
+        return metrics
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear cached metrics."""
+        with _cache_lock:
+            _METRICS_CACHE.clear()
+
+
+def _compute_for_path(path: str, max_samples: int) -> ScenarioMetrics:
+    """Load a scenario and compute its metrics (also in pool processes)."""
+    from negmas import Scenario
+
+    scenario = Scenario.load(Path(path), load_stats=False, load_info=False)
+    if scenario is None:
+        raise ValueError(f"Failed to load scenario from {path}")
+    return ScenarioMetricsService.compute(scenario, max_samples)
+
+
+def _submit(key: tuple[str, int], path: str, max_samples: int) -> Future:
+    """Compute metrics in the pool, joining a computation already running."""
+    global _metrics_pool
+    with _cache_lock:
+        future = _pending.get(key)
+        if future is not None:
+            return future
+        if _metrics_pool is None:
+            _metrics_pool = ProcessPoolExecutor(
+                max_workers=METRICS_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        pool = _metrics_pool
+        try:
+            future = pool.submit(_compute_for_path, path, max_samples)
+        except BrokenProcessPool:
+            # A worker died (e.g. out of memory): start over with a new pool
+            _metrics_pool = None
+            raise
+        _pending[key] = future
+
+    def done(future: Future) -> None:
+        global _metrics_pool
+        with _cache_lock:
+            _pending.pop(key, None)
+            broken = not future.cancelled() and isinstance(
+                future.exception(), BrokenProcessPool
+            )
+            if broken and _metrics_pool is pool:
+                _metrics_pool = None
+
+    future.add_done_callback(done)
+    return future
+
+
+def shutdown_metrics_pool() -> None:
+    """Stop the worker processes (they start again when needed)."""
+    global _metrics_pool
+    with _cache_lock:
+        pool, _metrics_pool = _metrics_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,259 @@
+"""Compact on-disk storage for cached scenario statistics.
+
+negmas writes ``_stats.yaml`` with the whole Pareto frontier inline, which can
+exceed 2 MB and has to be parsed in full just to read a handful of scalars.
+This store splits the file:
+
+- ``_stats.yaml``: a small header with the scalars and special points
+  (opposition, utility ranges, Nash/Kalai/... points). The Pareto fields are
+  written as empty lists so negmas' own ``Scenario.load`` still reads it.
+- ``_stats_pareto_utils.npy``: float64 array of shape (n_pareto, n_negotiators).
+- ``_stats_pareto_outcomes.npy``: int32 array of shape (n_pareto, n_issues)
+  holding the index of each issue value (outcomes are not numeric in general).
+
+The ``.npy`` sidecars are memory-mapped on load. Legacy files with the frontier
+inline are still read; their frontier is used as-is.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from negmas import Scenario
+from negmas.helpers.inout import dump, load
+from negmas.outcomes import Outcome
+
+from .bundled_scenarios import BundledScenarioArchive
+
+STATS_FILE_NAME = "_stats.yaml"
+PARETO_UTILS_FILE_NAME = "_stats_pareto_utils.npy"
+PARETO_OUTCOMES_FILE_NAME = "_stats_pareto_outcomes.npy"
+
+# All files making up the stats cache of a scenario
+STATS_FILE_NAMES = (STATS_FILE_NAME, PARETO_UTILS_FILE_NAME, PARETO_OUTCOMES_FILE_NAME)
+
+
+def _issue_values(issue: Any) -> list | None:
+    """Enumerate the values of a discrete issue, or None if not enumerable."""
+    try:
+        if not issue.is_discrete():
+            return None
+        return list(issue.all)
+    except Exception:
+        return None
+
+
+def _encode_outcomes(
+    outcomes: list[Outcome], outcome_space: Any
+) -> np.ndarray | None:
+    """Encode outcomes as per-issue value indices (None if not encodable)."""
+    issues = list(getattr(outcome_space, "issues", None) or [])
+    if not issues:
+        return None
+    lookups = []
+    for issue in issues:
+        values = _issue_values(issue)
+        if values is None:
+            return None
+        lookups.append({v: i for i, v in enumerate(values)})
+
+    encoded = np.empty((len(outcomes), len(issues)), dtype=np.int32)
+    try:
+        for row, outcome in enumerate(outcomes):
+            for col, value in enumerate(outcome):
+                encoded[row, col] = lookups[col][value]
+    except (KeyError, IndexError, TypeError):
+        return None
+    return encoded
+
+
+def _decode_outcomes(encoded: np.ndarray, outcome_space: Any) -> list[Outcome] | None:
+    """Decode per-issue value indices back into outcome tuples."""
+    issues = list(getattr(outcome_space, "issues", None) or [])
+    if len(issues) != encoded.shape[1]:
+        return None
+    values = [_issue_values(issue) for issue in issues]
+    if any(v is None for v in values):
+        return None
+    return [
+        tuple(values[col][idx] for col, idx in enumerate(row))  # type: ignore[index]
+        for row in encoded.tolist()
+    ]
+
+
+def _write_npy(path: Path, array: np.ndarray) -> None:
+    """Write an array atomically so readers never map a partial file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        np.save(f, array)
+    tmp_path.replace(path)
+
+
+class ScenarioStatsStore:
+    """Read and write scenario stats as a YAML header plus binary sidecars."""
+
+    @staticmethod
+    def exists(folder: Path | str) -> bool:
+        """Check whether cached stats exist for a scenario."""
+        return (Path(folder) / STATS_FILE_NAME).exists()
+
+    @staticmethod
+    def save(
+        scenario: Scenario,
+        folder: Path | str,
+        include_pareto_utils: bool = True,
+        include_pareto_outcomes: bool = True,
+    ) -> bool:
+        """Save scenario.stats as a header and binary frontier sidecars.
+
+        Args:
+            scenario: Scenario with computed stats.
+            folder: Scenario directory.
+            include_pareto_utils: Save the Pareto frontier utilities.
+            include_pareto_outcomes: Save the Pareto frontier outcomes.
+
+        Returns:
+            True if stats were saved.
+        """
+        stats = scenario.stats
+        if stats is None:
+            return False
+        folder = Path(folder)
+        folder.mkdir(parents=True, exist_ok=True)
+
+        utils_file = folder / PARETO_UTILS_FILE_NAME
+        outcomes_file = folder / PARETO_OUTCOMES_FILE_NAME
+
+        pareto_utils = list(stats.pareto_utils or [])
+        pareto_outcomes = list(stats.pareto_outcomes or [])
+
+        if include_pareto_utils and pareto_utils:
+            _write_npy(utils_file, np.asarray(pareto_utils, dtype=np.float64))
+        else:
+            utils_file.unlink(missing_ok=True)
+
+        # Outcomes of continuous issues cannot be index-encoded; those stay
+        # inline in the header (rare, and such frontiers are usually skipped)
+        inline_outcomes = False
+        encoded = None
+        if include_pareto_outcomes and pareto_outcomes:
+            encoded = _encode_outcomes(pareto_outcomes, scenario.outcome_space)
+            inline_outcomes = encoded is None
+        if encoded is not None:
+            _write_npy(outcomes_file, encoded)
+        else:
+            outcomes_file.unlink(missing_ok=True)
+
+        header = stats.to_dict(
+            include_pareto_utils=False, include_pareto_outcomes=inline_outcomes
+        )
+        dump(header, folder / STATS_FILE_NAME, compact=False)
+        return True
+
+    @staticmethod
+    def remove(folder: Path | str) -> int:
+        """Delete the stats header and sidecars.
+
+        Returns:
+            Number of files removed.
+        """
+        removed = 0
+        for name in STATS_FILE_NAMES:
+            path = Path(folder) / name
+            if path.exists():
+                path.unlink()
+                removed += 1
+        return removed
+
+    @staticmethod
+    def load_header(folder: Path | str) -> dict[str, Any] | None:
+        """Load the stats header (the full legacy file if not yet split)."""
+        path = Path(folder) / STATS_FILE_NAME
+        if not path.exists():
+            return None
+        data = load(path)
+        return data if isinstance(data, dict) else None
+
+    @staticmethod
+    def load_pareto_utils(folder: Path | str, mmap: bool = True) -> np.ndarray | None:
+        """Load Pareto frontier utilities from the sidecar.
+
+        Args:
+            folder: Scenario directory.
+            mmap: Memory-map the file instead of reading it.
+
+        Returns:
+            Array of shape (n_pareto, n_negotiators), or None if no sidecar.
+        """
+        path = Path(folder) / PARETO_UTILS_FILE_NAME
+        if not path.exists():
+            return None
+        return np.load(path, mmap_mode="r" if mmap else None)
+
+    @staticmethod
+    def count_pareto(folder: Path | str) -> int | None:
+        """Number of Pareto points in the sidecar (reads only the .npy header)."""
+        utils = ScenarioStatsStore.load_pareto_utils(folder)
+        return None if utils is None else int(utils.shape[0])
+
+    @staticmethod
+    def load_pareto_outcomes(
+        folder: Path | str, outcome_space: Any
+    ) -> list[Outcome] | None:
+        """Load and decode Pareto frontier outcomes from the sidecar."""
+        path = Path(folder) / PARETO_OUTCOMES_FILE_NAME
+        if not path.exists():
+            return None
+        return _decode_outcomes(np.load(path, mmap_mode="r"), outcome_space)
+
+    @staticmethod
+    def attach_pareto(
+        scenario: Scenario, folder: Path | str, outcomes: bool = True
+    ) -> None:
+        """Fill scenario.stats' Pareto fields from the sidecars if missing."""
+        stats = scenario.stats
+        if stats is None:
+            return
+        if not stats.pareto_utils:
+            utils = ScenarioStatsStore.load_pareto_utils(folder)
+            if utils is not None:
+                stats.pareto_utils = tuple(tuple(row) for row in utils.tolist())
+        if outcomes and not stats.pareto_outcomes:
+            decoded = ScenarioStatsStore.load_pareto_outcomes(
+                folder, scenario.outcome_space
+            )
+            if decoded is not None:
+                stats.pareto_outcomes = decoded
+
+    @staticmethod
+    def load_scenario(
+        path: Path | str,
+        ignore_discount: bool = False,
+        load_stats: bool = True,
+        load_info: bool = True,
+        load_pareto: bool = True,
+    ) -> Scenario | None:
+        """Load a scenario, reading stats from the header and sidecars.
+
+        Args:
+            path: Scenario directory.
+            ignore_discount: Ignore discount factors in utility functions.
+            load_stats: Load cached stats if available.
+            load_info: Load cached info if available.
+            load_pareto: Also load the Pareto frontier. Disable when only the
+                scalar stats are needed (the frontier is then left empty).
+
+        Returns:
+            Loaded Scenario or None if loading fails.
+        """
+        # Bundled scenarios are extracted from scenarios.zip on first load
+        BundledScenarioArchive.ensure_scenario_files(path)
+        scenario = Scenario.load(
+            Path(path),
+            ignore_discount=ignore_discount,
+            load_stats=load_stats,
+            load_info=load_info,
+        )  # type: ignore[attr-defined]
+        if scenario is not None and load_stats and load_pareto:
+            ScenarioStatsStore.attach_pareto(scenario, path)
+        return scenario
@@ -0,0 +1,349 @@
+"""Latency, event-loop and cache metrics of the running server.
+
+Many handlers still do synchronous work inside ``async def`` routes. These
+metrics show which ones are slow and which ones stall the event loop:
+
+* ``LatencyMiddleware`` records how long each route takes until its response
+  starts (streaming responses count until their headers are sent).
+* ``LoopMonitor`` measures how late the event loop runs a periodic callback.
+  When the loop is blocked longer than ``STALL_THRESHOLD``, a thread captures
+  the stack of the loop thread and the task that was running, and prints it
+  once the loop is free again.
+* ``record_cache`` counts hits and misses of the in-memory caches.
+
+``render_metrics`` returns all of them in the Prometheus text format, served
+by ``GET /api/system/metrics``.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+# Upper bounds (seconds) of the latency and loop lag histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+# Seconds between two event loop heartbeats
+LAG_INTERVAL = 0.1
+
+# Seconds the loop may be blocked before its stack is captured
+STALL_THRESHOLD = 0.25
+
+# Stalls kept for /api/system/stalls
+MAX_STALLS = 20
+
+PREFIX = "negmas_app"
+
+
+@dataclass
+class Histogram:
+    """Cumulative histogram of observed durations."""
+
+    buckets: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * len(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Add one observation."""
+        self.total += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def lines(self, name: str, labels: str = "") -> list[str]:
+        """Prometheus samples of this histogram."""
+        sep = "," if labels else ""
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels}{sep}le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels}{sep}le="+Inf"}} {self.count}')
+        suffix = f"{{{labels}}}" if labels else ""
+        lines.append(f"{name}_sum{suffix} {self.total:.6f}")
+        lines.append(f"{name}_count{suffix} {self.count}")
+        return lines
+
+
+@dataclass
+class Stall:
+    """The event loop being blocked by one callback or task step."""
+
+    started_at: float  # time.time() when the stall was detected
+    task: str | None  # The task that was running, if any
+    stack: str  # Stack of the loop thread when the stall was detected
+    duration: float | None = None  # Seconds, once the loop ran again
+
+
+_lock = threading.Lock()
+_latency: dict[tuple[str, str], Histogram] = {}
+_responses: dict[tuple[str, str, int], int] = {}
+_cache: dict[str, list[int]] = {}  # name -> [hits, misses]
+
+
+def record_request(method: str, route: str, status: int, seconds: float) -> None:
+    """Record the latency of one request."""
+    with _lock:
+        histogram = _latency.get((method, route))
+        if histogram is None:
+            histogram = _latency[(method, route)] = Histogram(LATENCY_BUCKETS)
+        histogram.observe(seconds)
+        key = (method, route, status)
+        _responses[key] = _responses.get(key, 0) + 1
+
+
+def record_cache(name: str, hit: bool) -> None:
+    """Count a lookup in the in-memory cache ``name``."""
+    with _lock:
+        counts = _cache.setdefault(name, [0, 0])
+        counts[0 if hit else 1] += 1
+
+
+def reset_metrics() -> None:
+    """Forget all recorded requests, cache lookups and stalls."""
+    with _lock:
+        _latency.clear()
+        _responses.clear()
+        _cache.clear()
+    if _monitor is not None:
+        _monitor.reset()
+
+
+class LatencyMiddleware:
+    """ASGI middleware recording per-route latency histograms.
+
+    Requests are grouped by their route template (``/api/scenarios/{id}``), so
+    path parameters do not create a histogram each. Requests no route matched
+    are grouped under ``unmatched``.
+    """
+
+    def __init__(self, app: Callable[..., Awaitable[None]]) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+        status = 500
+        latency: float | None = None
+
+        async def timed_send(message: dict) -> None:
+            nonlocal status, latency
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                latency = time.perf_counter() - start
+            await send(message)
+
+        try:
+            await self.app(scope, receive, timed_send)
+        finally:
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "unmatched"
+            if latency is None:
+                latency = time.perf_counter() - start
+            record_request(scope["method"], template, status, latency)
+
+
+class LoopMonitor:
+    """Measures the event loop's lag and captures what blocks it.
+
+    A task on the loop sleeps LAG_INTERVAL and records how much later than
+    that it woke up. A daemon thread checks when the task last woke up; when
+    that is more than ``threshold`` ago, the loop is blocked and the thread
+    captures the loop thread's stack.
+    """
+
+    def __init__(
+        self,
+        threshold: float = STALL_THRESHOLD,
+        interval: float = LAG_INTERVAL,
+    ) -> None:
+        self.threshold = threshold
+        self.interval = interval
+        self.lag = Histogram(LAG_BUCKETS)
+        self.stalls: deque[Stall] = deque(maxlen=MAX_STALLS)
+        self.n_stalls = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        self._last_beat = time.monotonic()
+        self._pending: Stall | None = None
+        self._task: asyncio.Task | None = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start monitoring the running event loop."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._task = self._loop.create_task(self._beat())
+        threading.Thread(
+            target=self._watch, name="loop-monitor", daemon=True
+        ).start()
+
+    def stop(self) -> None:
+        """Stop monitoring."""
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def reset(self) -> None:
+        """Forget the measured lag and stalls."""
+        with self._lock:
+            self.lag = Histogram(LAG_BUCKETS)
+            self.stalls.clear()
+            self.n_stalls = 0
+
+    async def _beat(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            with self._lock:
+                self._last_beat = time.monotonic()
+                self.lag.observe(lag)
+                stall, self._pending = self._pending, None
+            if stall is not None:
+                stall.duration = lag + self.interval
+                print(
+                    f"[LoopMonitor] Event loop blocked for {stall.duration:.2f}s"
+                    f" (task: {stall.task or 'none'}):\n{stall.stack}"
+                )
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                blocked = time.monotonic() - self._last_beat
+                if blocked < self.threshold or self._pending is not None:
+                    continue
+                self._pending = self._capture()
+                self.stalls.append(self._pending)
+                self.n_stalls += 1
+
+    def _capture(self) -> Stall:
+        """Stack of the loop thread and its current task (lock held)."""
+        frame = sys._current_frames().get(self._loop_thread or 0)
+        stack = "".join(traceback.format_stack(frame)) if frame else ""
+        task = None
+        try:
+            current = asyncio.current_task(self._loop)
+        except RuntimeError:
+            current = None
+        if current is not None:
+            task = f"{current.get_name()} {current.get_coro()!r}"
+        return Stall(started_at=time.time(), task=task, stack=stack)
+
+
+_monitor: LoopMonitor | None = None
+
+
+def start_loop_monitor(threshold: float = STALL_THRESHOLD) -> LoopMonitor:
+    """Monitor the running event loop (once per process)."""
+    global _monitor
+    if _monitor is None:
+        _monitor = LoopMonitor(threshold)
+        _monitor.start()
+    return _monitor
+
+
+def stop_loop_monitor() -> None:
+    """Stop the monitor started by start_loop_monitor."""
+    global _monitor
+    if _monitor is not None:
+        _monitor.stop()
+        _monitor = None
+
+
+def recent_stalls() -> list[dict[str, Any]]:
+    """Stalls of the event loop detected recently, newest first."""
+    if _monitor is None:
+        return []
+    with _monitor._lock:
+        stalls = list(_monitor.stalls)
+    return [
+        {
+            "started_at": s.started_at,
+            "duration": s.duration,
+            "task": s.task,
+            "stack": s.stack,
+        }
+        for s in reversed(stalls)
+    ]
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_metrics(gauges: dict[str, tuple[str, float]] | None = None) -> str:
+    """All metrics in the Prometheus text exposition format.
+
+    Args:
+        gauges: Extra gauges as {name: (help, value)}, e.g. the number of
+            active negotiations. Names get the ``negmas_app_`` prefix.
+    """
+    lines: list[str] = []
+    name = f"{PREFIX}_request_duration_seconds"
+    lines.append(f"# HELP {name} Time until the response started, per route.")
+    lines.append(f"# TYPE {name} histogram")
+    with _lock:
+        for (method, route), histogram in sorted(_latency.items()):
+            labels = f'method="{method}",route="{_label(route)}"'
+            lines.extend(histogram.lines(name, labels))
+        name = f"{PREFIX}_responses_total"
+        lines.append(f"# HELP {name} Responses per route and status code.")
+        lines.append(f"# TYPE {name} counter")
+        for (method, route, status), count in sorted(_responses.items()):
+            lines.append(
+                f'{name}{{method="{method}",route="{_label(route)}",'
+                f'status="{status}"}} {count}'
+            )
+        name = f"{PREFIX}_cache_lookups_total"
+        lines.append(f"# HELP {name} Lookups in the in-memory caches.")
+        lines.append(f"# TYPE {name} counter")
+        for cache, (hits, misses) in sorted(_cache.items()):
+            lines.append(f'{name}{{cache="{cache}",result="hit"}} {hits}')
+            lines.append(f'{name}{{cache="{cache}",result="miss"}} {misses}')
+        name = f"{PREFIX}_cache_hit_ratio"
+        lines.append(f"# HELP {name} Share of the lookups that were hits.")
+        lines.append(f"# TYPE {name} gauge")
+        for cache, (hits, misses) in sorted(_cache.items()):
+            ratio = hits / (hits + misses) if hits + misses else 0.0
+            lines.append(f'{name}{{cache="{cache}"}} {ratio:.4f}')
+
+    if _monitor is not None:
+        with _monitor._lock:
+            name = f"{PREFIX}_event_loop_lag_seconds"
+            lines.append(f"# HELP {name} How late the event loop ran a timer.")
+            lines.append(f"# TYPE {name} histogram")
+            lines.extend(_monitor.lag.lines(name))
+            name = f"{PREFIX}_event_loop_stalls_total"
+            lines.append(
+                f"# HELP {name} Times the loop was blocked longer than "
+                f"{_monitor.threshold}s."
+            )
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name} {_monitor.n_stalls}")
+
+    for gauge, (help_text, value) in sorted((gauges or {}).items()):
+        name = f"{PREFIX}_{gauge}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"{name} {value}")
+    return "\n".join(lines) + "\n"
@@ -24,6 +24,105 @@ from .outcome_analysis import compute_outcome_space_data, compute_optimality_sta
 from .negotiation_storage import NegotiationStorageService
 
 
+def _prepare_negotiation(
+    scenario_path: str,
+    mechanism_type: str,
+    mechanism_params: dict,
+    negotiator_configs: list,
+    scenario_options: dict,
+    share_ufuns: bool,
+):
+    """Load the scenario and build a mechanism with all negotiators added.
+
+    Shared by interactive sessions and headless runs (e.g. parameter sweeps).
+
+    Returns:
+        Tuple of (scenario, mechanism, negotiators, scenario_modified), or None
+        if the scenario could not be loaded.
+    """
+    # Load scenario
+    scenario_loader = ScenarioLoader()
+    ignore_discount = scenario_options.get("ignore_discount", False)
+    scenario = scenario_loader.load_scenario(scenario_path, ignore_discount)
+
+    if scenario is None:
+        return None
+
+    # Apply scenario options
+    ignore_reserved = scenario_options.get("ignore_reserved", False)
+    if ignore_reserved:
+        for ufun in scenario.ufuns:
+            if hasattr(ufun, "reserved_value"):
+                ufun.reserved_value = float("-inf")
+
+    normalize = scenario_options.get("normalize", False)
+    if normalize:
+        scenario.normalize()
+
+    # Note: ignore_discount is typically handled at ufun level if needed
+
+    # Track if scenario was modified - cached stats won't match modified ufuns
+    scenario_modified = ignore_reserved or normalize or ignore_discount
+
+    # Ensure one_offer_per_step for SAO
+    if mechanism_type == "SAOMechanism" and "one_offer_per_step" not in mechanism_params:
+        mechanism_params = {**mechanism_params, "one_offer_per_step": True}
+
+    # Create mechanism
+    mechanism = MechanismFactory.create_from_scenario_params(
+        scenario, mechanism_type, mechanism_params
+    )
+
+    # Create negotiators
+    negotiators = NegotiatorFactory.create_for_scenario(negotiator_configs, scenario)
+
+    # Add negotiators with time limits
+    has_unsupported_features = False
+    for neg, ufun, config in zip(negotiators, scenario.ufuns, negotiator_configs):
+        add_kwargs = {"ufun": ufun}
+
+        if config.time_limit is not None:
+            add_kwargs["time_limit"] = config.time_limit
+        if config.n_steps is not None:
+            add_kwargs["n_steps"] = config.n_steps
+
+        try:
+            mechanism.add(neg, **add_kwargs)
+        except TypeError as e:
+            if "time_limit" in str(e) or "n_steps" in str(e):
+                has_unsupported_features = True
+                mechanism.add(neg, ufun=ufun)
+            else:
+                raise
+
+    if has_unsupported_features:
+        import warnings
+
+        warnings.warn(
+            "Negotiator-specific time constraints (time_limit, n_steps) are not supported "
+            "by the installed version of negmas. Falling back to mechanism-level time constraints.",
+            UserWarning,
+            stacklevel=2,
+        )
+
+    # Share utility functions if requested
+    if share_ufuns:
+        n_negs = len(negotiators)
+        if n_negs == 2:
+            negotiators[0].private_info["opponent_ufun"] = scenario.ufuns[1]
+            negotiators[1].private_info["opponent_ufun"] = scenario.ufuns[0]
+        else:
+            for i, neg in enumerate(negotiators):
+                opponent_ufuns = [
+                    ufun for j, ufun in enumerate(scenario.ufuns) if j != i
+                ]
+                neg.private_info["opponent_ufuns"] = opponent_ufuns
+                if opponent_ufuns:
+                    neg.private_info["opponent_ufun"] = opponent_ufuns[0]
+
+    return scenario, mechanism, negotiators, scenario_modified
+
+
 # Module-level function for running negotiations in background thread (pickle-safe)
 def _run_negotiation_in_thread(
     session_id: str,
@@ -49,94 +148,20 @@ def _run_negotiation_in_thread(
     session = sessions_dict[session_id]
 
     try:
-        # Load scenario
-        scenario_loader = ScenarioLoader()
-        ignore_discount = scenario_options.get("ignore_discount", False)
-        scenario = scenario_loader.load_scenario(scenario_path, ignore_discount)
-
-        if scenario is None:
+        prepared = _prepare_negotiation(
+            scenario_path,
+            mechanism_type,
+            mechanism_params,
+            negotiator_configs,
+            scenario_options,
+            share_ufuns,
+        )
+        if prepared is None:
             session.status = SessionStatus.FAILED
             session.error = "Failed to load scenario"
             session.end_time = datetime.now()
             return
-
-        # Apply scenario options
-        ignore_reserved = scenario_options.get("ignore_reserved", False)
-        if ignore_reserved:
-            for ufun in scenario.ufuns:
-                if hasattr(ufun, "reserved_value"):
-                    ufun.reserved_value = float("-inf")
-
-        normalize = scenario_options.get("normalize", False)
-        if normalize:
-            scenario.normalize()
-
-        ignore_discount = scenario_options.get("ignore_discount", False)
-        # Note: ignore_discount is typically handled at ufun level if needed
-
-        # Track if scenario was modified - cached stats won't match modified ufuns
-        scenario_modified = ignore_reserved or normalize or ignore_discount
-
-        # Ensure one_offer_per_step for SAO
-        if (
-            mechanism_type == "SAOMechanism"
-            and "one_offer_per_step" not in mechanism_params
-        ):
-            mechanism_params = {**mechanism_params, "one_offer_per_step": True}
-
-        # Create mechanism
-        mechanism = MechanismFactory.create_from_scenario_params(
-            scenario, mechanism_type, mechanism_params
-        )
-
-        # Create negotiators
-        negotiators = NegotiatorFactory.create_for_scenario(
-            negotiator_configs, scenario
-        )
-
-        # Add negotiators with time limits
-        has_unsupported_features = False
-        for neg, ufun, config in zip(negotiators, scenario.ufuns, negotiator_configs):
-            add_kwargs = {"ufun": ufun}
-
-            if config.time_limit is not None:
-                add_kwargs["time_limit"] = config.time_limit
-            if config.n_steps is not None:
-                add_kwargs["n_steps"] = config.n_steps
-
-            try:
-                mechanism.add(neg, **add_kwargs)
-            except TypeError as e:
-                if "time_limit" in str(e) or "n_steps" in str(e):
-                    has_unsupported_features = True
-                    mechanism.add(neg, ufun=ufun)
-                else:
-                    raise
-
-        if has_unsupported_features:
-            import warnings
-
-            warnings.warn(
-                "Negotiator-specific time constraints (time_limit, n_steps) are not supported "
-                "by the installed version of negmas. Falling back to mechanism-level time constraints.",
-                UserWarning,
-                stacklevel=2,
-            )
-
-        # Share utility functions if requested
-        if share_ufuns:
-            n_negs = len(negotiators)
-            if n_negs == 2:
-                negotiators[0].private_info["opponent_ufun"] = scenario.ufuns[1]
-                negotiators[1].private_info["opponent_ufun"] = scenario.ufuns[0]
-            else:
-                for i, neg in enumerate(negotiators):
-                    opponent_ufuns = [
-                        ufun for j, ufun in enumerate(scenario.ufuns) if j != i
-                    ]
-                    neg.private_info["opponent_ufuns"] = opponent_ufuns
-                    if opponent_ufuns:
-                        neg.private_info["opponent_ufun"] = opponent_ufuns[0]
+        scenario, mechanism, negotiators, scenario_modified = prepared
 
         # Store initial data for visualization
         session.scenario_name = scenario.name or Path(scenario_path).stem
@@ -287,7 +312,11 @@ def _run_negotiation_in_thread(
         if auto_save:
             try:
                 NegotiationStorageService.save_negotiation(
-                    session, negotiator_configs, None, scenario_options, save_options
+                    session,
+                    negotiator_configs,
+                    None,
+                    {**scenario_options, "share_ufuns": share_ufuns},
+                    save_options,
                 )
             except Exception as e:
                 print(f"Failed to auto-save negotiation {session_id}: {e}")
@@ -887,7 +916,7 @@ class SessionManager:
                         session,
                         configs,
                         None,  # tags
-                        scenario_options,
+                        {**scenario_options, "share_ufuns": share_ufuns},
                     )
                     # Remove from memory after successful save to free resources
                     self.remove_completed_session(session_id)
@@ -1,11 +1,15 @@
 """Settings service for persisting app settings to ~/negmas/app/settings/."""
 
+import copy
 import io
 import json
+import threading
 import zipfile
+from collections.abc import Callable
 from dataclasses import asdict, fields
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 from ..models.settings import (
     AppSettings,
@@ -66,22 +70,89 @@ def _ensure_presets_dir() -> None:
     PRESETS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# Process-wide cache of parsed settings files: path -> ((mtime_ns, size), data)
+# A file is only re-read when its stat signature changes.
+_json_cache: dict[Path, tuple[tuple[int, int], Any]] = {}
+_cache_lock = threading.Lock()
+
+# Callbacks notified with the settings name (e.g. "performance",
+# "presets/sessions") whenever a settings file changes
+_change_listeners: list[Callable[[str], None]] = []
+
+
+def _settings_name(path: Path) -> str:
+    """Get the listener-facing name of a settings file."""
+    try:
+        return path.relative_to(SETTINGS_DIR).with_suffix("").as_posix()
+    except ValueError:
+        return path.stem
+
+
+def _notify_change(path: Path) -> None:
+    """Notify change listeners that a settings file changed."""
+    name = _settings_name(path)
+    for listener in list(_change_listeners):
+        try:
+            listener(name)
+        except Exception as e:
+            print(f"Warning: settings change listener failed for {name}: {e}")
+
+
+def _stat_signature(path: Path) -> tuple[int, int] | None:
+    """Get (mtime_ns, size) for a file, or None if it doesn't exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def _load_json(path: Path) -> dict | None:
-    """Load JSON from a file, return None if file doesn't exist."""
-    if not path.exists():
+    """Load JSON from a file, return None if file doesn't exist.
+
+    Parsed contents are cached per file and revalidated against the file's
+    mtime/size, so repeated loads of unchanged settings cost one stat call.
+    A copy is returned so callers may mutate the result freely.
+    """
+    signature = _stat_signature(path)
+    with _cache_lock:
+        cached = _json_cache.get(path)
+    if signature is None:
+        if cached is not None:
+            with _cache_lock:
+                _json_cache.pop(path, None)
+            _notify_change(path)
         return None
+    if cached is not None and cached[0] == signature:
+        return copy.deepcopy(cached[1])
+
     try:
         with open(path) as f:
-            return json.load(f)
+            data = json.load(f)
     except (json.JSONDecodeError, OSError):
         return None
 
+    with _cache_lock:
+        _json_cache[path] = (signature, data)
+    if cached is not None:
+        # Changed on disk by something other than _save_json
+        _notify_change(path)
+    return copy.deepcopy(data)
+
 
 def _save_json(path: Path, data: dict | list) -> None:
     """Save dict or list as JSON to a file."""
     _ensure_settings_dir()
     with open(path, "w") as f:
         json.dump(data, f, indent=2)
+    signature = _stat_signature(path)
+    with _cache_lock:
+        if signature is None:
+            _json_cache.pop(path, None)
+        else:
+            # Round-trip through JSON so the cache matches what a reload returns
+            _json_cache[path] = (signature, json.loads(json.dumps(data)))
+    _notify_change(path)
 
 
 def _dataclass_from_dict[T](cls: type[T], data: dict | None) -> T:
@@ -96,7 +167,35 @@ def _dataclass_from_dict[T](cls: type[T], data: dict | None) -> T:
 
 
 class SettingsService:
-    """Service for loading and saving application settings."""
+    """Service for loading and saving application settings.
+
+    Loads are served from an in-memory cache that is invalidated on save and
+    whenever a settings file's mtime/size changes on disk.
+    """
+
+    @staticmethod
+    def add_change_listener(listener: Callable[[str], None]) -> None:
+        """Register a callback invoked when a settings file changes.
+
+        The callback receives the settings name relative to the settings
+        directory without extension (e.g. "performance", "presets/sessions").
+        Changes made through save_* are reported immediately; external edits
+        are reported the next time the file is loaded.
+        """
+        if listener not in _change_listeners:
+            _change_listeners.append(listener)
+
+    @staticmethod
+    def remove_change_listener(listener: Callable[[str], None]) -> None:
+        """Unregister a settings change callback."""
+        if listener in _change_listeners:
+            _change_listeners.remove(listener)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached settings so the next loads re-read from disk."""
+        with _cache_lock:
+            _json_cache.clear()
 
     @staticmethod
     def load_general() -> GeneralSettings:
@@ -687,6 +786,9 @@ class SettingsService:
                             # Validate JSON
                             json.loads(content)
                             target_path.write_bytes(content)
+                            with _cache_lock:
+                                _json_cache.pop(target_path, None)
+                            _notify_change(target_path)
                             imported_files.append(rel_path)
                         except json.JSONDecodeError:
                             errors.append(f"Invalid JSON in {rel_path}")
@@ -1,7 +1,5 @@
 """Setup service for initializing user directories and copying bundled resources."""
 
-import shutil
-import zipfile
 from pathlib import Path
 from typing import Any
 
@@ -62,13 +60,17 @@ class SetupService:
         target_dir: Path | None = None,
         force: bool = False,
         skip_cache: bool = False,
+        workers: int | None = None,
     ) -> dict[str, Any]:
         """Extract bundled scenarios from scenarios.zip to user directory.
 
+        Scenarios are extracted in parallel, one scenario per task.
+
         Args:
             target_dir: Target directory (defaults to ~/negmas/app/scenarios/)
             force: If True, overwrite existing files
             skip_cache: If True, skip extracting cache files (_info.yaml, _stats.yaml, _plot.webp)
+            workers: Number of extraction threads (defaults to one per core, at most 8)
 
         Returns:
             Dictionary with extraction statistics:
@@ -77,73 +79,54 @@ class SetupService:
                 - skipped: Number of files skipped (already exist)
                 - errors: List of error messages
         """
+        # Imported here: this module must stay cheap to import for the CLI
+        from .bundled_scenarios import BundledScenarioArchive
+
         if target_dir is None:
             target_dir = SetupService.get_user_scenarios_path()
 
         zip_file = SetupService.get_bundled_scenarios_zip()
 
-        stats = {
-            "total_files": 0,
-            "copied": 0,
-            "skipped": 0,
-            "errors": [],
-        }
+        try:
+            return BundledScenarioArchive.extract_all(
+                target_dir,
+                zip_path=zip_file,
+                force=force,
+                skip_cache=skip_cache,
+                workers=workers,
+            )
+        except Exception as e:
+            return {
+                "total_files": 0,
+                "copied": 0,
+                "skipped": 0,
+                "errors": [f"Error reading zip file: {str(e)}"],
+            }
 
-        # Ensure target directory exists
-        target_dir.mkdir(parents=True, exist_ok=True)
+    @staticmethod
+    def enable_lazy_scenarios(target_dir: Path | None = None) -> None:
+        """Serve bundled scenarios straight from scenarios.zip.
 
-        # Cache file patterns to skip
-        cache_filenames = {"_info.yaml", "_info.yml", "_stats.yaml", "_plot.webp"}
+        Scenarios are registered from the archive's index and each one is
+        extracted the first time it is loaded, so no up-front extraction is
+        needed.
 
-        try:
-            with zipfile.ZipFile(zip_file, "r") as zf:
-                for zip_info in zf.infolist():
-                    # Skip directories
-                    if zip_info.is_dir():
-                        continue
-
-                    # Get filename without scenarios/ prefix if present
-                    filename = zip_info.filename
-                    if filename.startswith("scenarios/"):
-                        filename = filename[len("scenarios/") :]
-
-                    # Skip hidden files and .DS_Store
-                    if Path(filename).name.startswith("."):
-                        continue
-
-                    # Skip cache files if requested
-                    if skip_cache and (
-                        Path(filename).name in cache_filenames or "/_plots/" in filename
-                    ):
-                        continue
-
-                    stats["total_files"] += 1
-
-                    target_file = target_dir / filename
-
-                    # Skip if file exists and force is False
-                    if target_file.exists() and not force:
-                        stats["skipped"] += 1
-                        continue
-
-                    # Extract file
-                    try:
-                        target_file.parent.mkdir(parents=True, exist_ok=True)
-                        with (
-                            zf.open(zip_info) as source,
-                            open(target_file, "wb") as target,
-                        ):
-                            shutil.copyfileobj(source, target)
-                        stats["copied"] += 1
-                    except Exception as e:
-                        stats["errors"].append(f"{filename}: {str(e)}")
-
-        except zipfile.BadZipFile as e:
-            stats["errors"].append(f"Invalid zip file: {str(e)}")
-        except Exception as e:
-            stats["errors"].append(f"Error reading zip file: {str(e)}")
+        Args:
+            target_dir: Scenarios directory (defaults to ~/negmas/app/scenarios/)
+        """
+        from .bundled_scenarios import BundledScenarioArchive
+
+        BundledScenarioArchive.enable(
+            target_dir or SetupService.get_user_scenarios_path()
+        )
+
+    @staticmethod
+    def lazy_scenarios_enabled(target_dir: Path | None = None) -> bool:
+        """Check whether bundled scenarios are served from scenarios.zip."""
+        from .bundled_scenarios import MARKER_FILE
 
-        return stats
+        target_dir = target_dir or SetupService.get_user_scenarios_path()
+        return (target_dir / MARKER_FILE).exists()
 
     @staticmethod
     def count_scenarios(directory: Path) -> int:
@@ -0,0 +1,535 @@
+"""File-lease work queue for running a tournament on several hosts.
+
+A sharded tournament is split into batches of scenarios. Each batch is the
+whole tournament (same competitors, opponents and settings) on its scenarios,
+so its runs and negotiator names are exactly those of the full tournament.
+Batches are JSON files in a queue directory on a filesystem shared by all
+hosts (e.g. NFS)::
+
+    <queue>/tournament.json     configuration of the tournament
+    <queue>/pending/<batch>     waiting to be claimed
+    <queue>/claimed/<batch>     being run (mtime is the lease heartbeat)
+    <queue>/done/<batch>        finished
+    <queue>/failed/<batch>      failed MAX_ATTEMPTS times
+    <queue>/results/<batch>/    tournament directory of the batch
+    <queue>/segments/<batch>/   live result segments of a batch, moved out of
+                                its results before they are combined
+    <queue>/cancel              present when the tournament was cancelled
+
+Workers (``negmas-app worker``) claim a batch by renaming it from pending/ to
+claimed/. Renames are atomic on POSIX filesystems including NFS (unlike the
+locks SQLite relies on), so exactly one worker wins and no service is needed.
+A worker touches its claim while the batch runs; claims not touched for
+LEASE_SECONDS belong to a dead worker and are returned to pending/ by whoever
+notices first. Lease ages are measured against a file touched just now, so
+all hosts use the clock of the filesystem's server. A requeued batch
+continues in its results directory, where negmas skips the runs that were
+already saved.
+
+The coordinator removes the queue once the batches were combined or the
+tournament was cancelled. When batches failed (or combining failed) the
+queue is kept, and running the same tournament again resumes it.
+
+Batches run with live result segments (see live_results) that the coordinator
+reads while they run, and are merged with combine_tournaments when all are
+done.
+"""
+
+import json
+import math
+import multiprocessing
+import os
+import shutil
+import socket
+import threading
+import time
+import uuid
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from ..models.tournament import TournamentConfig, TournamentStatus
+from .live_results import LIVE_RESULTS_DIR, segment_paths
+
+SHARDS_DIR = Path.home() / "negmas" / "app" / "shards"
+
+# A claim not touched for this long is taken to belong to a dead worker
+LEASE_SECONDS = 300.0
+# Workers touch their claims this often
+HEARTBEAT_SECONDS = 30.0
+# Workers look for new batches this often when idle
+POLL_SECONDS = 5.0
+# Batches are given up after failing (or losing their worker) this many times
+MAX_ATTEMPTS = 3
+
+_CONFIG_FILE = "tournament.json"
+_CANCEL_FILE = "cancel"
+_RESULTS_DIR = "results"
+_SEGMENTS_DIR = "segments"
+_STATES = ("pending", "claimed", "done", "failed")
+_TUPLE_FIELDS = {
+    "n_steps",
+    "time_limit",
+    "step_time_limit",
+    "negotiator_time_limit",
+    "hidden_time_limit",
+    "pend",
+    "pend_per_second",
+    "opponent_modeling_metrics",
+}
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    """Write JSON to a temporary name and rename it into place."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, indent=2, default=str))
+    os.replace(tmp, path)
+
+
+def _read_json(path: Path) -> dict[str, Any] | None:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _names(directory: Path) -> list[str]:
+    """Batch files of a state directory (not ones being moved)."""
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+    return sorted(n for n in names if n.endswith(".json") and not n.startswith("."))
+
+
+class ShardQueue:
+    """Batches of one sharded tournament in a queue directory."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    @classmethod
+    def create(
+        cls,
+        path: str | Path,
+        config: TournamentConfig,
+        scenario_paths: list[str],
+        scenarios_per_batch: int = 1,
+    ) -> "ShardQueue":
+        """Write the batches of a tournament to a new queue directory.
+
+        Args:
+            path: Queue directory (must not exist).
+            config: Tournament configuration. Batches run it on their
+                scenarios, without sharding.
+            scenario_paths: Scenarios in the order they should be claimed.
+            scenarios_per_batch: Scenarios in each batch.
+
+        Returns:
+            The queue.
+        """
+        queue = cls(path)
+        for state in _STATES:
+            (queue.path / state).mkdir(parents=True)
+        (queue.path / _RESULTS_DIR).mkdir()
+        size = max(1, scenarios_per_batch)
+        n_batches = math.ceil(len(scenario_paths) / size)
+        _write_json(
+            queue.path / _CONFIG_FILE,
+            {
+                "config": asdict(config),
+                "n_batches": n_batches,
+                "created_at": datetime.now().isoformat(),
+            },
+        )
+        for i in range(n_batches):
+            name = f"{i:06d}"
+            _write_json(
+                queue.path / "pending" / f"{name}.json",
+                {
+                    "batch": name,
+                    "scenario_paths": scenario_paths[i * size : (i + 1) * size],
+                    "attempts": 0,
+                },
+            )
+        return queue
+
+    @classmethod
+    def resume(
+        cls, root: str | Path | None, config: TournamentConfig
+    ) -> "ShardQueue | None":
+        """Find a kept queue of the same tournament and requeue its failures.
+
+        Args:
+            root: Shards directory to look in.
+            config: Configuration the queue must have been created with.
+
+        Returns:
+            The queue, or None if there is none to resume.
+        """
+        wanted = json.loads(json.dumps(asdict(config), default=str))
+        for queue in cls.find(root):
+            data = _read_json(queue.path / _CONFIG_FILE) or {}
+            if queue.cancelled or data.get("config") != wanted:
+                continue
+            for name in _names(queue.path / "failed"):
+                taken = queue._take(name[: -len(".json")], "failed")
+                if taken is None:
+                    continue
+                private, info = taken
+                info["attempts"] = 0
+                queue._put(private, info, "pending")
+            return queue
+        return None
+
+    @staticmethod
+    def find(root: str | Path | None = None) -> list["ShardQueue"]:
+        """Queues under a shards directory, oldest first."""
+        root = Path(root or SHARDS_DIR)
+        try:
+            names = sorted(os.listdir(root))
+        except OSError:
+            return []
+        return [
+            ShardQueue(root / name)
+            for name in names
+            if (root / name / _CONFIG_FILE).exists()
+        ]
+
+    def batch_config(self, batch: str) -> TournamentConfig:
+        """Configuration to run a batch with.
+
+        Raises:
+            FileNotFoundError: If the batch is not claimed.
+        """
+        info = _read_json(self.path / "claimed" / f"{batch}.json")
+        data = _read_json(self.path / _CONFIG_FILE)
+        if info is None or data is None:
+            raise FileNotFoundError(f"Batch {batch} is not claimed in {self.path}")
+        # JSON has no tuples: (min, max) ranges come back as lists
+        config = TournamentConfig(
+            **{
+                key: (
+                    tuple(value)
+                    if isinstance(value, list) and key in _TUPLE_FIELDS
+                    else value
+                )
+                for key, value in data["config"].items()
+            }
+        )
+        # Combined results are parquet: JSON columns merge and load cleanly
+        config.storage_format = "parquet"
+        config.scenario_paths = list(info["scenario_paths"])
+        config.save_path = str(self.result_path(batch))
+        # A requeued batch continues where its last worker stopped
+        config.path_exists = "continue"
+        config.sharded = False
+        config.shard_dir = None
+        return config
+
+    def result_path(self, batch: str) -> Path:
+        """Tournament directory of a batch."""
+        return self.path / _RESULTS_DIR / batch
+
+    def result_paths(self) -> list[Path]:
+        """Tournament directories of finished batches."""
+        return [self.result_path(name[:-5]) for name in _names(self.path / "done")]
+
+    def segment_paths(self) -> list[Path]:
+        """Live result segments written by all batches so far."""
+        segments = []
+        for directory in (self.path / _SEGMENTS_DIR, self.path / _RESULTS_DIR):
+            try:
+                batches = sorted(os.listdir(directory))
+            except OSError:
+                continue
+            for batch in batches:
+                segments.extend(segment_paths(directory / batch))
+        return segments
+
+    def set_aside_segments(self, batch: str) -> None:
+        """Move the live result segments of a batch out of its results.
+
+        negmas' saved results are what gets combined; the segments are kept
+        so a resumed tournament can show the runs of finished batches.
+        """
+        source = self.result_path(batch) / LIVE_RESULTS_DIR
+        if not source.is_dir():
+            return
+        target = self.path / _SEGMENTS_DIR / batch / LIVE_RESULTS_DIR
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.rmtree(target, ignore_errors=True)
+        os.rename(source, target)
+
+    def _now(self) -> float:
+        """Current time on the filesystem's server.
+
+        Leases are file mtimes set by the server, so their age is measured
+        against a file touched just now instead of this host's clock.
+        """
+        probe = self.path / f".clock.{socket.gethostname()}.{os.getpid()}"
+        try:
+            probe.touch()
+            return probe.stat().st_mtime
+        except OSError:
+            return time.time()
+
+    def _take(self, batch: str, state: str) -> tuple[Path, dict[str, Any]] | None:
+        """Move a batch file to a private name, so no one else can move it."""
+        private = self.path / state / f".{batch}.{uuid.uuid4().hex}.moving"
+        try:
+            os.rename(self.path / state / f"{batch}.json", private)
+        except FileNotFoundError:
+            return None
+        # The file keeps the mtime of the claim it was: make it fresh so
+        # requeue_expired does not take it for a dead mover's
+        try:
+            os.utime(private)
+        except FileNotFoundError:
+            return None
+        return private, _read_json(private) or {"batch": batch}
+
+    def _put(self, private: Path, info: dict[str, Any], state: str) -> None:
+        _write_json(private, info)
+        os.rename(private, self.path / state / f"{info['batch']}.json")
+
+    def claim(self, worker: str) -> str | None:
+        """Claim the first pending batch.
+
+        Returns:
+            The batch name, or None if nothing is pending.
+        """
+        for name in _names(self.path / "pending"):
+            batch = name[: -len(".json")]
+            taken = self._take(batch, "pending")
+            if taken is None:
+                # Another worker was faster
+                continue
+            private, info = taken
+            info["batch"] = batch
+            info["attempts"] = info.get("attempts", 0) + 1
+            info["worker"] = worker
+            info["claimed_at"] = datetime.now().isoformat()
+            # Written before it is visible in claimed/: a fresh lease
+            self._put(private, info, "claimed")
+            return batch
+        return None
+
+    def heartbeat(self, batch: str) -> bool:
+        """Renew the lease of a claimed batch.
+
+        Returns:
+            False if the batch is no longer claimed (its lease expired).
+        """
+        try:
+            os.utime(self.path / "claimed" / f"{batch}.json")
+            return True
+        except FileNotFoundError:
+            return False
+
+    def complete(self, batch: str) -> bool:
+        """Mark a claimed batch as done."""
+        taken = self._take(batch, "claimed")
+        if taken is None:
+            return False
+        self._put(*taken, "done")
+        return True
+
+    def fail(self, batch: str, error: str) -> bool:
+        """Requeue a claimed batch after an error, or give it up."""
+        taken = self._take(batch, "claimed")
+        if taken is None:
+            return False
+        private, info = taken
+        info["error"] = error
+        retry = info.get("attempts", 0) < MAX_ATTEMPTS
+        self._put(private, info, "pending" if retry else "failed")
+        return True
+
+    def release(self, batch: str) -> bool:
+        """Return a claimed batch to the queue without counting an attempt."""
+        taken = self._take(batch, "claimed")
+        if taken is None:
+            return False
+        private, info = taken
+        info["attempts"] = max(0, info.get("attempts", 1) - 1)
+        self._put(private, info, "pending")
+        return True
+
+    def requeue_expired(self, lease_seconds: float = LEASE_SECONDS) -> list[str]:
+        """Return claims whose lease expired to the queue.
+
+        Returns:
+            The requeued (or, after MAX_ATTEMPTS, failed) batches.
+        """
+        requeued = []
+        now = self._now()
+        # Batches whose mover died half-way
+        for state in _STATES:
+            try:
+                names = os.listdir(self.path / state)
+            except OSError:
+                continue
+            for name in names:
+                if not name.endswith(".moving"):
+                    continue
+                private = self.path / state / name
+                try:
+                    if now - private.stat().st_mtime > lease_seconds:
+                        batch = name.split(".")[1]
+                        os.rename(private, self.path / "pending" / f"{batch}.json")
+                        requeued.append(batch)
+                except FileNotFoundError:
+                    continue
+        for name in _names(self.path / "claimed"):
+            try:
+                age = now - (self.path / "claimed" / name).stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if age > lease_seconds and self.fail(name[:-5], "Worker lease expired"):
+                requeued.append(name[:-5])
+        return requeued
+
+    def status(self) -> dict[str, Any]:
+        """Number of batches in each state, workers and errors."""
+        claimed = [
+            _read_json(self.path / "claimed" / name) or {}
+            for name in _names(self.path / "claimed")
+        ]
+        failed = [
+            _read_json(self.path / "failed" / name) or {}
+            for name in _names(self.path / "failed")
+        ]
+        return {
+            **{state: len(_names(self.path / state)) for state in _STATES},
+            "workers": sorted({c["worker"] for c in claimed if c.get("worker")}),
+            "errors": {f.get("batch"): f.get("error") for f in failed},
+        }
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the tournament was cancelled."""
+        return (self.path / _CANCEL_FILE).exists()
+
+    def cancel(self) -> None:
+        """Tell workers to stop running batches of this tournament."""
+        (self.path / _CANCEL_FILE).touch()
+
+
+def _run_batch(queue_path: str, batch: str, njobs: int | None) -> None:
+    """Run a claimed batch (in a worker's child process)."""
+    from .tournament_manager import TournamentManager
+
+    config = ShardQueue(queue_path).batch_config(batch)
+    if njobs is not None:
+        config.njobs = njobs
+    session = TournamentManager().run_shard(config)
+    if session.status != TournamentStatus.COMPLETED:
+        raise SystemExit(session.error or f"Batch {batch} {session.status.value}")
+
+
+def run_batch(
+    queue: ShardQueue,
+    batch: str,
+    njobs: int | None = None,
+    heartbeat_seconds: float = HEARTBEAT_SECONDS,
+) -> bool:
+    """Run a claimed batch in a child process, renewing its lease.
+
+    The child is stopped when the tournament is cancelled or the lease was
+    lost (another worker may be running the batch by then).
+
+    Args:
+        queue: Queue of the batch.
+        batch: Claimed batch.
+        njobs: Parallel jobs on this host (defaults to the tournament's).
+        heartbeat_seconds: Interval between lease renewals.
+
+    Returns:
+        True if the batch finished.
+    """
+    # Spawned: the worker's threads and negmas' process pools do not fork well
+    process = multiprocessing.get_context("spawn").Process(
+        target=_run_batch, args=(str(queue.path), batch, njobs), daemon=False
+    )
+    process.start()
+    try:
+        while process.is_alive():
+            process.join(heartbeat_seconds)
+            if not process.is_alive():
+                break
+            if queue.cancelled or not queue.heartbeat(batch):
+                print(f"[ShardWorker] Stopping batch {batch} of {queue.path.name}")
+                process.terminate()
+                process.join()
+                return False
+    except KeyboardInterrupt:
+        # Let another worker take over right away
+        process.terminate()
+        process.join()
+        queue.release(batch)
+        raise
+    if process.exitcode == 0:
+        return queue.complete(batch)
+    queue.fail(batch, f"Worker process exited with code {process.exitcode}")
+    return False
+
+
+def run_worker(
+    root: str | Path | None = None,
+    njobs: int | None = None,
+    exit_when_idle: bool = False,
+    poll_seconds: float = POLL_SECONDS,
+    stop: threading.Event | None = None,
+) -> int:
+    """Claim and run batches of sharded tournaments until stopped.
+
+    Args:
+        root: Shards directory shared with the coordinator.
+        njobs: Parallel jobs on this host (defaults to each tournament's).
+        exit_when_idle: Return once no batch is pending.
+        poll_seconds: Wait between looking for batches when idle.
+        stop: Set to stop after the current batch.
+
+    Returns:
+        Number of batches run.
+    """
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    n_batches = 0
+    while stop is None or not stop.is_set():
+        claimed: tuple[ShardQueue, str] | None = None
+        for queue in ShardQueue.find(root):
+            if queue.cancelled:
+                continue
+            queue.requeue_expired()
+            batch = queue.claim(worker)
+            if batch is not None:
+                claimed = (queue, batch)
+                break
+        if claimed is None:
+            if exit_when_idle:
+                break
+            if stop is not None:
+                stop.wait(poll_seconds)
+            else:
+                time.sleep(poll_seconds)
+            continue
+        queue, batch = claimed
+        print(f"[ShardWorker] Running batch {batch} of {queue.path.name}")
+        started = time.perf_counter()
+        finished = run_batch(queue, batch, njobs)
+        print(
+            f"[ShardWorker] Batch {batch} of {queue.path.name} "
+            f"{'done' if finished else 'not finished'} in "
+            f"{time.perf_counter() - started:.1f}s"
+        )
+        n_batches += 1
+    return n_batches
+
+
+def remove(queue: ShardQueue) -> None:
+    """Delete a queue directory and its batch results."""
+    from .deletion_queue import DeletionQueue
+
+    DeletionQueue.delete([queue.path], label=f"shards {queue.path.name}")
@@ -0,0 +1,412 @@
+"""Persistent ledger of disk usage for tournament and negotiation storage.
+
+Walking every file of every saved tournament to report storage usage takes
+minutes once there are millions of negotiation files. Instead, each storage
+root (e.g. ~/negmas/app/tournaments) keeps a ledger with one entry per
+top-level directory: its total size, a per-extension breakdown and the size
+of redundant CSV files that have a parquet equivalent.
+
+Entries are recorded when a directory is written (a tournament finishes, is
+imported, combined or cleaned, a negotiation is saved) and forgotten when it
+is deleted. Each change is one line appended to a log next to the ledger, so
+saving a negotiation does not rewrite the ledger of all others; the log is
+folded into the ledger once it has grown as long as the ledger itself.
+
+A background reconciliation job rescans directories that are new or changed
+since they were recorded, so reports are read from the ledger without walking
+the tree. An entry keeps the modification times of the directory's
+subdirectories down to MTIME_DEPTH levels and of the files directly in it
+(metadata.yaml, config.yaml, ...): adding, removing or replacing a file
+changes one of them. Files rewritten in place deeper down are only noticed
+once something else in their directory changes.
+"""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+LEDGER_FILE = ".storage_ledger.json"
+LOG_FILE = ".storage_ledger.log"
+LEDGER_VERSION = 2
+
+# Appended changes kept at least before the log is folded into the ledger
+MIN_LOG_LINES = 100
+
+# Levels of subdirectories whose modification times an entry keeps
+MTIME_DEPTH = 2
+
+# Result tables that negmas may save as CSV and parquet at the same time
+REDUNDANT_BASES = ("all_scores", "details")
+
+# root -> (ledger file mtime_ns, bytes of the log read, log lines, entries)
+_LEDGERS: dict[str, tuple[int, int, int, dict[str, dict[str, Any]]]] = {}
+_lock = threading.Lock()
+# Roots with a reconciliation job running
+_reconciling: set[str] = set()
+
+
+def _redundant(name: str, siblings: set[str]) -> bool:
+    """Whether a file is a CSV copy of a parquet file next to it."""
+    for base in REDUNDANT_BASES:
+        if name in (f"{base}.csv", f"{base}.csv.gz"):
+            return f"{base}.parquet" in siblings
+    return False
+
+
+def _dir_mtime(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read_ledger(ledger_file: Path) -> dict[str, dict[str, Any]]:
+    """Entries of a ledger file (empty if missing, invalid or outdated)."""
+    try:
+        with open(ledger_file) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != LEDGER_VERSION:
+        return {}
+    return data.get("entries", {})
+
+
+def _apply(entries: dict[str, dict[str, Any]], line: bytes) -> None:
+    """Apply one logged change to the entries."""
+    try:
+        change = json.loads(line)
+    except ValueError:
+        return
+    if change.get("version") != LEDGER_VERSION:
+        return
+    if change.get("entry") is None:
+        entries.pop(change["name"], None)
+    else:
+        entries[change["name"]] = change["entry"]
+
+
+def _changed(path: Path, entry: dict[str, Any]) -> bool:
+    """Whether a directory changed since its entry was recorded."""
+    mtimes = entry.get("mtimes")
+    if not mtimes:
+        return True
+    for relative, mtime in mtimes.items():
+        if _dir_mtime(path / relative) != mtime:
+            return True
+    return False
+
+
+def format_size(size_bytes: int) -> str:
+    """Human readable size."""
+    if size_bytes < 1024:
+        return f"{size_bytes} B"
+    if size_bytes < 1024 * 1024:
+        return f"{size_bytes / 1024:.1f} KB"
+    if size_bytes < 1024 * 1024 * 1024:
+        return f"{size_bytes / (1024 * 1024):.1f} MB"
+    return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+
+
+class StorageLedger:
+    """Record and report disk usage per stored directory."""
+
+    @staticmethod
+    def scan(path: Path) -> dict[str, Any]:
+        """Measure a directory tree.
+
+        Returns:
+            Ledger entry with size_bytes, n_files, file_breakdown (extension ->
+            count and size_bytes), redundant (count and size_bytes) and mtimes
+            (relative path -> mtime_ns of the directory, its subdirectories
+            down to MTIME_DEPTH and its top-level files).
+        """
+        mtime = _dir_mtime(path)
+        entry: dict[str, Any] = {
+            "size_bytes": 0,
+            "n_files": 0,
+            "file_breakdown": {},
+            "redundant": {"count": 0, "size_bytes": 0},
+            "mtimes": {} if mtime is None else {".": mtime},
+            "scanned_at": time.time(),
+        }
+        breakdown = entry["file_breakdown"]
+        mtimes = entry["mtimes"]
+        stack = [(str(path), "", 0)]
+        while stack:
+            directory, relative, depth = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            names = {e.name for e in entries}
+            for item in entries:
+                item_relative = f"{relative}{item.name}"
+                try:
+                    if item.is_dir(follow_symlinks=False):
+                        if depth < MTIME_DEPTH:
+                            mtimes[item_relative] = item.stat(
+                                follow_symlinks=False
+                            ).st_mtime_ns
+                        stack.append((item.path, f"{item_relative}/", depth + 1))
+                        continue
+                    if not item.is_file():
+                        continue
+                    stat = item.stat()
+                    size = stat.st_size
+                except OSError:
+                    continue
+                if depth == 0:
+                    mtimes[item_relative] = stat.st_mtime_ns
+                entry["size_bytes"] += size
+                entry["n_files"] += 1
+                ext = os.path.splitext(item.name)[1] or "no_extension"
+                bucket = breakdown.setdefault(ext, {"count": 0, "size_bytes": 0})
+                bucket["count"] += 1
+                bucket["size_bytes"] += size
+                if _redundant(item.name, names):
+                    entry["redundant"]["count"] += 1
+                    entry["redundant"]["size_bytes"] += size
+        return entry
+
+    @staticmethod
+    def _load(root: Path) -> dict[str, dict[str, Any]]:
+        """Entries of a root's ledger and log (call with the lock held).
+
+        Only the part of the log appended since the last call is read.
+        """
+        ledger_file = root / LEDGER_FILE
+        mtime = _dir_mtime(ledger_file) or 0
+        cached = _LEDGERS.get(str(root))
+        try:
+            log_size = os.path.getsize(root / LOG_FILE)
+        except OSError:
+            log_size = 0
+        if cached is not None and cached[0] == mtime and cached[1] <= log_size:
+            _, offset, n_lines, entries = cached
+            if offset == log_size:
+                return entries
+            entries = dict(entries)
+        else:
+            offset, n_lines = 0, 0
+            entries = _read_ledger(ledger_file) if mtime else {}
+        try:
+            with open(root / LOG_FILE, "rb") as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # Being appended: read it next time
+                    offset += len(line)
+                    n_lines += 1
+                    _apply(entries, line)
+        except OSError:
+            pass
+        _LEDGERS[str(root)] = (mtime, offset, n_lines, entries)
+        return entries
+
+    @staticmethod
+    def _append(root: Path, name: str, entry: dict[str, Any] | None) -> None:
+        """Log a recorded (or, for None, forgotten) entry (call with the lock held)."""
+        root.mkdir(parents=True, exist_ok=True)
+        line = json.dumps({"version": LEDGER_VERSION, "name": name, "entry": entry})
+        # One write of a whole line with O_APPEND: processes do not interleave
+        fd = os.open(root / LOG_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, f"{line}\n".encode())
+        finally:
+            os.close(fd)
+        entries = StorageLedger._load(root)
+        n_lines = _LEDGERS[str(root)][2]
+        if n_lines >= max(MIN_LOG_LINES, len(entries)):
+            StorageLedger._compact(root)
+
+    @staticmethod
+    def _compact(root: Path) -> None:
+        """Fold the log into the ledger file (call with the lock held).
+
+        The log is renamed away first, so lines other processes append while
+        the ledger is written go to a new log instead of being lost.
+        """
+        log_file = root / LOG_FILE
+        folding = root / f"{LOG_FILE}.{os.getpid()}.folding"
+        try:
+            os.rename(log_file, folding)
+        except OSError:
+            return  # Another process is folding it
+        _LEDGERS.pop(str(root), None)
+        ledger_file = root / LEDGER_FILE
+        entries = _read_ledger(ledger_file)
+        with open(folding, "rb") as f:
+            for line in f:
+                _apply(entries, line)
+        tmp = ledger_file.with_name(f"{LEDGER_FILE}.{os.getpid()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump({"version": LEDGER_VERSION, "entries": entries}, f)
+        os.replace(tmp, ledger_file)
+        folding.unlink()
+
+    @staticmethod
+    def entries(root: Path) -> dict[str, dict[str, Any]]:
+        """All recorded entries of a root (directory name -> entry)."""
+        with _lock:
+            return dict(StorageLedger._load(Path(root)))
+
+    @staticmethod
+    def record(
+        root: Path,
+        name: str,
+        include: Callable[[Path], bool] | None = None,
+    ) -> dict[str, Any] | None:
+        """Measure a directory and store the result.
+
+        Args:
+            root: Storage root.
+            name: Directory name within the root.
+            include: Whether the directory counts in reports (e.g. is a valid
+                tournament); stored as the entry's "valid" flag.
+
+        Returns:
+            The new entry, or None if the directory does not exist.
+        """
+        root = Path(root)
+        path = root / name
+        if not path.is_dir():
+            StorageLedger.forget(root, name)
+            return None
+        entry = StorageLedger.scan(path)
+        entry["valid"] = include(path) if include else True
+        with _lock:
+            StorageLedger._append(root, name, entry)
+        return entry
+
+    @staticmethod
+    def record_in_background(
+        root: Path, name: str, include: Callable[[Path], bool] | None = None
+    ) -> threading.Thread:
+        """Record a directory on a daemon thread."""
+
+        def run() -> None:
+            try:
+                StorageLedger.record(root, name, include)
+            except Exception as e:
+                print(f"Warning: Failed to record storage for {name}: {e}")
+
+        thread = threading.Thread(target=run, daemon=True, name="storage-ledger")
+        thread.start()
+        return thread
+
+    @staticmethod
+    def forget(root: Path, name: str) -> None:
+        """Remove a directory's entry."""
+        root = Path(root)
+        with _lock:
+            if name in StorageLedger._load(root):
+                StorageLedger._append(root, name, None)
+
+    @staticmethod
+    def stale(root: Path) -> tuple[list[str], list[str]]:
+        """Directories the ledger does not describe correctly.
+
+        Needs the top-level listing and a stat of each modification time an
+        entry keeps (see scan), not a walk of the directories.
+
+        Returns:
+            Tuple of (names to rescan, recorded names that no longer exist).
+        """
+        root = Path(root)
+        recorded = StorageLedger.entries(root)
+        present: set[str] = set()
+        if root.exists():
+            with os.scandir(root) as it:
+                for item in it:
+                    if item.is_dir() and not item.name.startswith("."):
+                        present.add(item.name)
+        rescan = [
+            name
+            for name in present
+            if name not in recorded or _changed(root / name, recorded[name])
+        ]
+        gone = [name for name in recorded if name not in present]
+        return rescan, gone
+
+    @staticmethod
+    def reconcile(root: Path, include: Callable[[Path], bool] | None = None) -> int:
+        """Rescan new or changed directories and drop deleted ones.
+
+        Returns:
+            Number of directories rescanned.
+        """
+        root = Path(root)
+        rescan, gone = StorageLedger.stale(root)
+        for name in gone:
+            StorageLedger.forget(root, name)
+        for name in rescan:
+            StorageLedger.record(root, name, include)
+        return len(rescan)
+
+    @staticmethod
+    def reconcile_in_background(
+        root: Path, include: Callable[[Path], bool] | None = None
+    ) -> bool:
+        """Start a reconciliation job unless one is running for the root.
+
+        Returns:
+            True if a job was started.
+        """
+        key = str(root)
+        with _lock:
+            if key in _reconciling:
+                return False
+            _reconciling.add(key)
+
+        def run() -> None:
+            try:
+                StorageLedger.reconcile(root, include)
+            except Exception as e:
+                print(f"Warning: Storage reconciliation failed for {root}: {e}")
+            finally:
+                with _lock:
+                    _reconciling.discard(key)
+
+        threading.Thread(target=run, daemon=True, name="storage-reconcile").start()
+        return True
+
+    @staticmethod
+    def is_reconciling(root: Path) -> bool:
+        """Whether a reconciliation job is running for the root."""
+        with _lock:
+            return str(root) in _reconciling
+
+    @staticmethod
+    def summary(root: Path) -> dict[str, Any]:
+        """Aggregate the valid entries of a root.
+
+        Returns:
+            Dict with count, total_size_bytes, file_breakdown and
+            redundant_files (count and size_bytes).
+        """
+        result: dict[str, Any] = {
+            "count": 0,
+            "total_size_bytes": 0,
+            "file_breakdown": {},
+            "redundant_files": {"count": 0, "size_bytes": 0},
+        }
+        for entry in StorageLedger.entries(root).values():
+            if not entry.get("valid", True):
+                continue
+            result["count"] += 1
+            result["total_size_bytes"] += entry["size_bytes"]
+            for ext, bucket in entry["file_breakdown"].items():
+                total = result["file_breakdown"].setdefault(
+                    ext, {"count": 0, "size_bytes": 0}
+                )
+                total["count"] += bucket["count"]
+                total["size_bytes"] += bucket["size_bytes"]
+            result["redundant_files"]["count"] += entry["redundant"]["count"]
+            result["redundant_files"]["size_bytes"] += entry["redundant"]["size_bytes"]
+        return result
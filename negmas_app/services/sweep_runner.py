@@ -0,0 +1,524 @@
+"""Parameter sweeps: run a base negotiation over a grid/random set of parameters.
+
+A sweep takes a base configuration (a saved negotiation or a FullSessionPreset),
+expands the requested dimensions into points, repeats every point once per seed
+and runs all negotiations headless in a process pool. Results are streamed back
+as they complete together with running per-point aggregates.
+"""
+
+import asyncio
+import itertools
+import math
+import multiprocessing
+import os
+import random
+import statistics
+import time
+from collections.abc import AsyncGenerator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from typing import Any
+
+from ..models.negotiator import NegotiatorConfig
+from ..models.settings import FullSessionPreset
+from ..models.sweep import (
+    SweepConfig,
+    SweepDimension,
+    SweepPoint,
+    SweepPointSummary,
+    SweepRunResult,
+)
+from .negotiation_storage import NegotiationStorageService
+from .parameter_inspector import get_negotiator_parameters
+from .session_manager import _prepare_negotiation
+
+# Known mechanism parameter types (anything else is treated as float)
+_MECHANISM_PARAM_TYPES = {
+    "n_steps": "int",
+    "time_limit": "float",
+    "step_time_limit": "float",
+    "negotiator_time_limit": "float",
+    "hidden_time_limit": "float",
+    "pend": "float",
+    "pend_per_second": "float",
+    "one_offer_per_step": "bool",
+}
+
+# Most negotiations (points x seeds) a single sweep may run
+MAX_SWEEP_RUNS = 10_000
+
+_INT_TYPES = ("int", "optional_int")
+_FLOAT_TYPES = ("float", "optional_float")
+
+
+def _finite_or_none(value: Any) -> float | None:
+    """Convert to float, mapping None/NaN/Inf to None."""
+    if value is None:
+        return None
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def _run_sweep_point(
+    scenario_path: str,
+    mechanism_type: str,
+    mechanism_params: dict,
+    negotiator_configs: list[NegotiatorConfig],
+    scenario_options: dict,
+    share_ufuns: bool,
+    point_index: int,
+    seed: int,
+) -> SweepRunResult:
+    """Run one sweep negotiation to completion.
+
+    Module-level so it can be pickled into worker processes.
+    """
+    import numpy as np
+
+    random.seed(seed)
+    np.random.seed(seed % (2**32))
+
+    _start = time.perf_counter()
+    try:
+        prepared = _prepare_negotiation(
+            scenario_path,
+            mechanism_type,
+            mechanism_params,
+            negotiator_configs,
+            scenario_options,
+            share_ufuns,
+        )
+        if prepared is None:
+            return SweepRunResult(
+                point_index=point_index,
+                seed=seed,
+                end_reason="error",
+                error="Failed to load scenario",
+            )
+        scenario, mechanism, _, _ = prepared
+
+        mechanism.run()
+
+        agreement = mechanism.agreement
+        if agreement is not None:
+            utilities = [_finite_or_none(ufun(agreement)) for ufun in scenario.ufuns]
+            end_reason = "agreement"
+        else:
+            utilities = [
+                _finite_or_none(getattr(ufun, "reserved_value", None))
+                for ufun in scenario.ufuns
+            ]
+            if mechanism.state.broken or mechanism.state.has_error:
+                end_reason = "broken"
+            elif mechanism.state.timedout:
+                end_reason = "timedout"
+            else:
+                end_reason = "ended"
+
+        finite = [u for u in utilities if u is not None]
+        issue_names = [issue.name for issue in scenario.issues]
+        return SweepRunResult(
+            point_index=point_index,
+            seed=seed,
+            agreement=dict(zip(issue_names, agreement)) if agreement else None,
+            utilities=utilities,  # type: ignore[arg-type]
+            welfare=sum(finite) if len(finite) == len(utilities) else None,
+            n_steps=mechanism.state.step,
+            duration=time.perf_counter() - _start,
+            end_reason=end_reason,
+        )
+    except Exception as e:
+        return SweepRunResult(
+            point_index=point_index,
+            seed=seed,
+            duration=time.perf_counter() - _start,
+            end_reason="error",
+            error=str(e),
+        )
+
+
+def _cast_value(value: Any, ui_type: str | None) -> Any:
+    """Cast a sweep value to the parameter's type."""
+    if value is None or ui_type is None:
+        return value
+    if ui_type in _INT_TYPES:
+        return int(round(float(value)))
+    if ui_type in _FLOAT_TYPES:
+        return float(value)
+    if ui_type == "bool":
+        if isinstance(value, str):
+            return value.strip().lower() in ("1", "true", "yes", "on")
+        return bool(value)
+    return value
+
+
+def summarize_point(
+    point: SweepPoint, results: list[SweepRunResult]
+) -> SweepPointSummary:
+    """Aggregate the runs of a sweep point into one results-table row."""
+    ok = [r for r in results if r.error is None]
+    summary = SweepPointSummary(
+        index=point.index,
+        values=point.values,
+        n_runs=len(results),
+        n_errors=len(results) - len(ok),
+    )
+    if not ok:
+        return summary
+
+    summary.n_agreements = sum(1 for r in ok if r.end_reason == "agreement")
+    summary.agreement_rate = summary.n_agreements / len(ok)
+
+    n_negotiators = max(len(r.utilities) for r in ok)
+    for i in range(n_negotiators):
+        values = [
+            r.utilities[i]
+            for r in ok
+            if i < len(r.utilities) and r.utilities[i] is not None
+        ]
+        summary.mean_utilities.append(
+            statistics.fmean(values) if values else float("nan")
+        )
+
+    welfares = [r.welfare for r in ok if r.welfare is not None]
+    if welfares:
+        summary.mean_welfare = statistics.fmean(welfares)
+        summary.std_welfare = statistics.pstdev(welfares)
+    summary.mean_steps = statistics.fmean(r.n_steps for r in ok)
+    summary.mean_duration = statistics.fmean(r.duration for r in ok)
+    return summary
+
+
+class SweepRunner:
+    """Builds and runs parameter sweeps over a base negotiation."""
+
+    @staticmethod
+    def config_from_saved(session_id: str, **kwargs: Any) -> SweepConfig | None:
+        """Build a sweep config whose base is a saved negotiation.
+
+        Args:
+            session_id: ID of the saved negotiation.
+            **kwargs: Remaining SweepConfig fields (dimensions, mode, seeds, ...).
+
+        Returns:
+            The sweep config, or None if the negotiation was not found.
+
+        Raises:
+            ValueError: If the negotiation was saved without negotiator configs.
+        """
+        run_config = NegotiationStorageService.load_run_config(session_id)
+        if run_config is None:
+            return None
+        if not run_config["negotiator_configs"]:
+            raise ValueError(
+                "Cannot sweep: negotiation was saved without negotiator configurations"
+            )
+        return SweepConfig(
+            scenario_path=run_config["scenario_path"],
+            negotiator_configs=run_config["negotiator_configs"],
+            mechanism_type=run_config["mechanism_type"],
+            mechanism_params=run_config["mechanism_params"],
+            scenario_options=run_config["scenario_options"],
+            share_ufuns=run_config["share_ufuns"],
+            **kwargs,
+        )
+
+    @staticmethod
+    def config_from_preset(preset: FullSessionPreset, **kwargs: Any) -> SweepConfig:
+        """Build a sweep config whose base is a full session preset.
+
+        Args:
+            preset: The session preset.
+            **kwargs: Remaining SweepConfig fields (dimensions, mode, seeds, ...).
+        """
+        return SweepConfig(
+            scenario_path=preset.scenario_path,
+            negotiator_configs=[
+                NegotiatorConfig(
+                    type_name=n.type_name,
+                    name=n.name,
+                    source=n.source,
+                    params=dict(n.params),
+                )
+                for n in preset.negotiators
+            ],
+            mechanism_type=preset.mechanism_type,
+            mechanism_params=dict(preset.mechanism_params),
+            scenario_options={
+                "normalize": preset.normalize,
+                "ignore_discount": preset.ignore_discount,
+                "ignore_reserved": preset.ignore_reserved,
+            },
+            share_ufuns=preset.share_ufuns,
+            **kwargs,
+        )
+
+    @staticmethod
+    def resolve_dimension(
+        dimension: SweepDimension, negotiator_configs: list[NegotiatorConfig]
+    ) -> SweepDimension:
+        """Fill in the UI type of a dimension and validate it.
+
+        Negotiator parameter types come from parameter_inspector; bool and
+        choice parameters without explicit values sweep over all options.
+
+        Raises:
+            ValueError: If the dimension is invalid.
+        """
+        ui_type = dimension.ui_type
+        values = list(dimension.values)
+
+        if dimension.target == "negotiator":
+            idx = dimension.negotiator_index
+            if idx is None or not 0 <= idx < len(negotiator_configs):
+                raise ValueError(
+                    f"Invalid negotiator_index {idx} for parameter '{dimension.name}'"
+                )
+            type_name = negotiator_configs[idx].type_name
+            params = {p.name: p for p in get_negotiator_parameters(type_name)}
+            info = params.get(dimension.name)
+            if info is None:
+                raise ValueError(f"{type_name} has no parameter '{dimension.name}'")
+            if ui_type is None:
+                ui_type = info.ui_type
+            if not values and ui_type == "choice" and info.choices:
+                values = list(info.choices)
+        elif dimension.target == "mechanism":
+            if ui_type is None:
+                ui_type = _MECHANISM_PARAM_TYPES.get(dimension.name, "float")
+        else:
+            raise ValueError(f"Unknown sweep target: {dimension.target}")
+
+        if not values and ui_type == "bool":
+            values = [False, True]
+
+        if not values:
+            if dimension.min_value is None or dimension.max_value is None:
+                raise ValueError(
+                    f"Parameter '{dimension.name}' needs values or a min/max range"
+                )
+            if ui_type not in _INT_TYPES + _FLOAT_TYPES:
+                raise ValueError(
+                    f"Parameter '{dimension.name}' of type {ui_type} cannot be swept over a range"
+                )
+            if dimension.min_value > dimension.max_value:
+                raise ValueError(f"Parameter '{dimension.name}' has min > max")
+            if dimension.log_scale and dimension.min_value <= 0:
+                raise ValueError(
+                    f"Parameter '{dimension.name}' needs a positive min for log scale"
+                )
+
+        return replace(
+            dimension,
+            ui_type=ui_type,
+            values=[_cast_value(v, ui_type) for v in values],
+        )
+
+    @staticmethod
+    def _grid_values(dimension: SweepDimension) -> list[Any]:
+        """Expand a resolved dimension into its grid values."""
+        if dimension.values:
+            return dimension.values
+        lo, hi = float(dimension.min_value), float(dimension.max_value)  # type: ignore[arg-type]
+        n = max(1, dimension.n_values)
+        if n == 1 or lo == hi:
+            raw = [lo]
+        elif dimension.log_scale:
+            ratio = (hi / lo) ** (1 / (n - 1))
+            raw = [lo * ratio**i for i in range(n)]
+        else:
+            raw = [lo + (hi - lo) * i / (n - 1) for i in range(n)]
+        values = [_cast_value(v, dimension.ui_type) for v in raw]
+        # Integer ranges may collapse to duplicates
+        return list(dict.fromkeys(values))
+
+    @staticmethod
+    def _sample_value(dimension: SweepDimension, rng: random.Random) -> Any:
+        """Draw one random value for a resolved dimension."""
+        if dimension.values:
+            return rng.choice(dimension.values)
+        lo, hi = float(dimension.min_value), float(dimension.max_value)  # type: ignore[arg-type]
+        if dimension.log_scale:
+            value = math.exp(rng.uniform(math.log(lo), math.log(hi)))
+        else:
+            value = rng.uniform(lo, hi)
+        return _cast_value(value, dimension.ui_type)
+
+    @staticmethod
+    def generate_points(config: SweepConfig) -> list[SweepPoint]:
+        """Expand the sweep dimensions into points.
+
+        Grid mode takes the cartesian product of all dimension values; random
+        mode draws n_samples independent points. The config is not modified.
+
+        Raises:
+            ValueError: If a dimension is invalid or the sweep would run more
+                than MAX_SWEEP_RUNS negotiations.
+        """
+        dimensions = [
+            SweepRunner.resolve_dimension(d, config.negotiator_configs)
+            for d in config.dimensions
+        ]
+        keys = [d.key for d in dimensions]
+        if len(set(keys)) != len(keys):
+            raise ValueError("Each parameter can only be swept once")
+
+        n_seeds = len(config.seeds or [0])
+        if config.mode == "grid":
+            grids = [SweepRunner._grid_values(d) for d in dimensions]
+            n = math.prod(len(g) for g in grids)
+            combos = itertools.product(*grids)
+        elif config.mode == "random":
+            rng = random.Random(config.search_seed)
+            n = max(1, config.n_samples) if dimensions else 1
+            combos = (
+                tuple(SweepRunner._sample_value(d, rng) for d in dimensions)
+                for _ in range(n)
+            )
+        else:
+            raise ValueError(f"Unknown sweep mode: {config.mode}")
+        if n * n_seeds > MAX_SWEEP_RUNS:
+            raise ValueError(
+                f"Sweep has {n} points x {n_seeds} seeds = {n * n_seeds} runs "
+                f"(at most {MAX_SWEEP_RUNS} allowed)"
+            )
+
+        return [
+            SweepPoint(index=i, values=dict(zip(keys, combo)))
+            for i, combo in enumerate(combos)
+        ]
+
+    @staticmethod
+    def apply_point(
+        config: SweepConfig, point: SweepPoint
+    ) -> tuple[dict, list[NegotiatorConfig]]:
+        """Apply a point's values to the base configuration.
+
+        Returns:
+            Tuple of (mechanism_params, negotiator_configs) for the point.
+        """
+        mechanism_params = dict(config.mechanism_params)
+        negotiator_configs = [
+            replace(c, params=dict(c.params)) for c in config.negotiator_configs
+        ]
+        for dimension in config.dimensions:
+            value = point.values[dimension.key]
+            if dimension.target == "negotiator":
+                negotiator_configs[dimension.negotiator_index].params[  # type: ignore[index]
+                    dimension.name
+                ] = value
+            else:
+                mechanism_params[dimension.name] = value
+        return mechanism_params, negotiator_configs
+
+    @staticmethod
+    async def run_stream(
+        config: SweepConfig, points: list[SweepPoint] | None = None
+    ) -> AsyncGenerator[tuple[str, Any], None]:
+        """Run a sweep, yielding events as runs complete.
+
+        Events are (type, data) tuples:
+        - ("init", dict): points, dimension keys and total run count
+        - ("run", SweepRunResult): one finished run
+        - ("point", SweepPointSummary): updated aggregate of that run's point
+        - ("complete", dict): final results table and elapsed time
+
+        At most max_workers runs are submitted at a time; the rest are
+        submitted as runs finish. Pending runs are cancelled when the consumer
+        stops iterating.
+        """
+        if points is None:
+            points = SweepRunner.generate_points(config)
+        seeds = config.seeds or [0]
+        n_runs = len(points) * len(seeds)
+        max_workers = config.max_workers or os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, n_runs))
+
+        yield (
+            "init",
+            {
+                "points": points,
+                "dimensions": [d.key for d in config.dimensions],
+                "seeds": seeds,
+                "n_runs": n_runs,
+                "max_workers": max_workers,
+            },
+        )
+
+        _start = time.perf_counter()
+        points_by_index = {p.index: p for p in points}
+        results: dict[int, list[SweepRunResult]] = {p.index: [] for p in points}
+        # Spawn fresh workers: forking the server (threads, open sockets) is unsafe
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        queue = ((point, seed) for point in points for seed in seeds)
+        running: dict[asyncio.Future, tuple[int, int]] = {}
+
+        def submit_next() -> bool:
+            item = next(queue, None)
+            if item is None:
+                return False
+            point, seed = item
+            mechanism_params, negotiator_configs = SweepRunner.apply_point(
+                config, point
+            )
+            future = executor.submit(
+                _run_sweep_point,
+                config.scenario_path,
+                config.mechanism_type,
+                mechanism_params,
+                negotiator_configs,
+                config.scenario_options,
+                config.share_ufuns,
+                point.index,
+                seed,
+            )
+            running[asyncio.wrap_future(future)] = (point.index, seed)
+            return True
+
+        try:
+            while len(running) < max_workers and submit_next():
+                pass
+
+            while running:
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    point_index, seed = running.pop(task)
+                    try:
+                        result: SweepRunResult = task.result()
+                    except Exception as e:
+                        # The worker itself failed (e.g. a crashed process)
+                        result = SweepRunResult(
+                            point_index=point_index,
+                            seed=seed,
+                            end_reason="error",
+                            error=str(e) or type(e).__name__,
+                        )
+                    submit_next()
+                    results[result.point_index].append(result)
+                    yield ("run", result)
+                    yield (
+                        "point",
+                        summarize_point(
+                            points_by_index[result.point_index],
+                            results[result.point_index],
+                        ),
+                    )
+
+            yield (
+                "complete",
+                {
+                    "table": [summarize_point(p, results[p.index]) for p in points],
+                    "n_runs": n_runs,
+                    "duration": time.perf_counter() - _start,
+                },
+            )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
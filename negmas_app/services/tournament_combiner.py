@@ -0,0 +1,670 @@
+"""Combine saved tournaments with columnar I/O.
+
+Sources are found with a single directory walk that lists each directory once
+and never descends into tournaments. The merged details schema is unified from
+the sources' parquet metadata, then each source's details are streamed into
+one parquet file in row batches, with at most READ_AHEAD sources read ahead.
+Details are never held for all sources at once: CSV sources are parsed once
+for their schema and again while writing. Only running tournaments, whose
+details come from their (small) live segments, are kept from the first pass.
+
+With ``copy``, run and scenario artifacts are hardlinked into the combined
+tournament. They are copied only when the destination is on another
+filesystem, so combining does not double disk usage.
+
+Scenarios of the same name but different content in two sources are renamed
+in the later source (``N<i>`` prefix, as negmas does), both in its results and
+in the linked scenario folders.
+"""
+
+import ast
+import hashlib
+import os
+import shutil
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from negmas.helpers import shortest_unique_names
+from negmas.helpers.inout import load
+from negmas.tournaments.neg.simple.cartesian import (
+    SCENARIOS_DIR_NAME,
+    TOURNAMENT_DIRS,
+    SimpleTournamentResults,
+)
+
+from . import live_results
+
+# Same priority as negmas when several formats of a table exist
+TABLE_EXTENSIONS = (".parquet", ".csv.gz", ".csv")
+
+# Any of these marks a directory as a (possibly incomplete) tournament
+TOURNAMENT_MARKERS = ("config.yaml", "scores.csv", live_results.LIVE_RESULTS_DIR)
+TOURNAMENT_TABLES = ("details", "all_scores", "all_results")
+
+# Tables a tournament needs to be combined
+DETAILS = "details"
+ALL_SCORES = "all_scores"
+FINAL_SCORES = "scores"
+
+TOURNAMENT_COLUMN = "tournament"
+INDEX_COLUMN = "index"
+_INDEX_COLUMNS = (INDEX_COLUMN, "__index_level_0__")
+
+# Rows per batch streamed from a parquet details file
+BATCH_ROWS = 64 * 1024
+# Sources whose details are read while the current one is written
+READ_AHEAD = 2
+
+# Config entries that must agree for tournaments to be combined
+_MATCHING_CONFIG_KEYS = (
+    "competitors",
+    "competitor_names",
+    "competitor_params",
+    "opponents",
+    "opponent_names",
+    "opponent_params",
+)
+
+# Extra strings pandas (and therefore negmas) reads as missing from CSV
+_CSV_NULLS = [*pacsv.ConvertOptions().null_values, "None"]
+
+ProgressCallback = Callable[[dict[str, Any]], None]
+
+
+def _table_name(names: set[str], base: str) -> str | None:
+    """File name of the preferred format of a table, if any exists."""
+    for ext in TABLE_EXTENSIONS:
+        if f"{base}{ext}" in names:
+            return f"{base}{ext}"
+    return None
+
+
+def is_tournament(names: set[str]) -> bool:
+    """Whether a directory listing looks like a tournament.
+
+    Mirrors TournamentStorageService._check_tournament_files_exist.
+    """
+    if any(marker in names for marker in TOURNAMENT_MARKERS):
+        return True
+    return any(_table_name(names, base) for base in TOURNAMENT_TABLES)
+
+
+def is_complete(names: set[str]) -> bool:
+    """Whether a tournament listing has every table needed to combine it.
+
+    Running tournaments qualify through their live result segments.
+    """
+    if live_results.LIVE_RESULTS_DIR in names:
+        return True
+    return all(_table_name(names, base) for base in (DETAILS, ALL_SCORES, FINAL_SCORES))
+
+
+def _listing(path: Path) -> tuple[set[str], list[str]]:
+    """Names in a directory and its subdirectories, from one scandir."""
+    names: set[str] = set()
+    subdirs: list[str] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                names.add(entry.name)
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return names, sorted(subdirs)
+
+
+def discover(
+    paths: Iterable[str | Path], recursive: bool = True, complete_only: bool = False
+) -> list[Path]:
+    """Find tournament directories.
+
+    A given path that is a tournament is used as is. Otherwise, with
+    ``recursive``, its subdirectories are searched. The search does not descend
+    into tournaments, their artifact folders or hidden directories.
+
+    Args:
+        paths: Directories to search.
+        recursive: Search below paths that are not tournaments themselves.
+        complete_only: Only return tournaments with details, all_scores and
+            scores tables.
+
+    Returns:
+        Tournament directories in search order, without duplicates.
+    """
+    found: list[Path] = []
+    seen: set[str] = set()
+    skip = set(TOURNAMENT_DIRS)
+    for root in paths:
+        stack = [Path(root)]
+        while stack:
+            path = stack.pop()
+            names, subdirs = _listing(path)
+            if is_tournament(names):
+                key = str(path.absolute())
+                if key not in seen and (not complete_only or is_complete(names)):
+                    seen.add(key)
+                    found.append(path)
+                continue
+            if not recursive:
+                continue
+            stack.extend(
+                path / name
+                for name in reversed(subdirs)
+                if name not in skip and not name.startswith(".")
+            )
+    return found
+
+
+def _read_table(path: Path) -> pa.Table:
+    """Read a details/all_scores file as saved by negmas, without its index."""
+    if path.suffix == ".parquet":
+        table = pq.read_table(path)
+        table = table.drop_columns(
+            [c for c in _INDEX_COLUMNS if c in table.column_names]
+        )
+    else:
+        # Compression is detected from the extension
+        table = pacsv.read_csv(
+            path,
+            convert_options=pacsv.ConvertOptions(
+                strings_can_be_null=True, null_values=_CSV_NULLS
+            ),
+        )
+        # The first column is the DataFrame index
+        table = table.drop_columns([table.column_names[0]])
+    return table.replace_schema_metadata(None)
+
+
+def _parquet_columns(file: pq.ParquetFile) -> list[str]:
+    """Columns of a parquet details file, without its index."""
+    return [c for c in file.schema_arrow.names if c not in _INDEX_COLUMNS]
+
+
+def _with_tournament_field(schema: pa.Schema) -> pa.Schema:
+    """Schema of a source's details once the tournament column is set."""
+    column = pa.field(TOURNAMENT_COLUMN, pa.string())
+    if TOURNAMENT_COLUMN in schema.names:
+        return schema.set(schema.get_field_index(TOURNAMENT_COLUMN), column)
+    return schema.append(column)
+
+
+def _with_tournament(table: pa.Table, name: str) -> pa.Table:
+    column = pa.repeat(pa.scalar(name), table.num_rows)
+    if TOURNAMENT_COLUMN in table.column_names:
+        return table.set_column(
+            table.column_names.index(TOURNAMENT_COLUMN), TOURNAMENT_COLUMN, column
+        )
+    return table.append_column(TOURNAMENT_COLUMN, column)
+
+
+def unify_schemas(schemas: Iterable[pa.Schema]) -> pa.Schema:
+    """Schema all sources can be cast to.
+
+    Columns keep their type when all sources agree. Mixed numeric columns
+    become float64 and any other conflict becomes string. Columns that are
+    entirely null in a source do not take part (float64 if null everywhere).
+    """
+    types: dict[str, list[pa.DataType]] = {}
+    for schema in schemas:
+        for f in schema:
+            bucket = types.setdefault(f.name, [])
+            if not pa.types.is_null(f.type) and f.type not in bucket:
+                bucket.append(f.type)
+    fields = []
+    for name, candidates in types.items():
+        if not candidates:
+            # What pandas reads an empty CSV column as
+            type_ = pa.float64()
+        elif len(candidates) == 1:
+            type_ = candidates[0]
+        elif all(
+            pa.types.is_integer(t) or pa.types.is_floating(t) for t in candidates
+        ):
+            type_ = pa.float64()
+        else:
+            type_ = pa.string()
+        fields.append(pa.field(name, type_))
+    return pa.schema(fields)
+
+
+def _conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Reorder, add and cast columns of a table to a schema."""
+    columns = []
+    for f in schema:
+        if f.name not in table.column_names:
+            columns.append(pa.nulls(table.num_rows, f.type))
+            continue
+        column = table.column(f.name)
+        if column.type != f.type:
+            try:
+                column = column.cast(f.type)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                column = pa.array(
+                    [None if v is None else str(v) for v in column.to_pylist()],
+                    type=f.type,
+                )
+        columns.append(column)
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _with_index(table: pa.Table, start: int) -> pa.Table:
+    index = pa.array(range(start, start + table.num_rows), type=pa.int64())
+    return table.add_column(0, INDEX_COLUMN, index)
+
+
+def _partner_names(values: Iterable[Any]) -> set[str]:
+    """Negotiator names in partners values (tuples or their repr)."""
+    names: set[str] = set()
+    for value in values:
+        if isinstance(value, (list, tuple)):
+            names.update(value)
+        elif isinstance(value, str):
+            try:
+                parsed = ast.literal_eval(value)
+            except (ValueError, SyntaxError):
+                continue
+            if isinstance(parsed, (list, tuple)):
+                names.update(parsed)
+    return names
+
+
+def _unique(table: pa.Table, column: str) -> list[Any]:
+    if column not in table.column_names:
+        return []
+    return [v for v in pc.unique(table.column(column)).to_pylist() if v is not None]
+
+
+def _renamed(table: pa.Table, renames: dict[str, str]) -> pa.Table:
+    """Rename scenarios in every scenario column of a table."""
+    if not renames:
+        return table
+    for i, name in enumerate(table.column_names):
+        column = table.column(i)
+        if "scenario" not in name or not pa.types.is_string(column.type):
+            continue
+        for old, new in renames.items():
+            column = pc.if_else(pc.equal(column, old), new, column)
+        table = table.set_column(i, name, column)
+    return table
+
+
+def _scenario_fingerprint(path: Path) -> str:
+    """Hash of the files defining a scenario (not its cached stats)."""
+    digest = hashlib.sha1()
+    try:
+        names = sorted(os.listdir(path))
+    except OSError:
+        return ""
+    for name in names:
+        file = path / name
+        if name.startswith(("_", ".")) or not file.is_file():
+            continue
+        digest.update(name.encode())
+        digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+def _scenario_renames(sources: list[Path]) -> list[dict[str, str]]:
+    """Scenarios to rename in each source so different ones do not merge.
+
+    A scenario keeps its name in the first source that has it. A later source
+    with a different scenario of the same name gets it as N<i><name>.
+    """
+    listings = []
+    for path in sources:
+        try:
+            listings.append(sorted(os.listdir(path / SCENARIOS_DIR_NAME)))
+        except OSError:
+            listings.append([])
+    counts: dict[str, int] = {}
+    for names in listings:
+        for name in names:
+            counts[name] = counts.get(name, 0) + 1
+    first: dict[str, str] = {}
+    renames: list[dict[str, str]] = []
+    for i, (path, names) in enumerate(zip(sources, listings)):
+        source_renames: dict[str, str] = {}
+        for name in names:
+            if counts[name] < 2:
+                continue
+            fingerprint = _scenario_fingerprint(path / SCENARIOS_DIR_NAME / name)
+            if first.setdefault(name, fingerprint) != fingerprint:
+                source_renames[name] = f"N{i}{name}"
+        renames.append(source_renames)
+    return renames
+
+
+def _merge_configs(configs: list[dict[str, Any]]) -> dict[str, Any]:
+    """Merge the configs of tournaments being combined.
+
+    Entries all configs agree on are kept, others become None (as negmas'
+    combine_tournaments does). n_scenarios is left for the caller to set.
+
+    Raises:
+        ValueError: If the tournaments ran different competitors or opponents.
+    """
+    if len(configs) == 1:
+        return dict(configs[0])
+    first = configs[0]
+    for i, config in enumerate(configs[1:], 2):
+        for key in _MATCHING_CONFIG_KEYS:
+            if config.get(key) != first.get(key):
+                raise ValueError(
+                    f"Cannot combine tournaments with different {key}. "
+                    f"Tournament 1 has {first.get(key)}, "
+                    f"tournament {i} has {config.get(key)}"
+                )
+    merged: dict[str, Any] = {}
+    for config in configs:
+        for key in config:
+            if key in merged:
+                continue
+            values = [c[key] for c in configs if key in c]
+            merged[key] = values[0] if all(v == values[0] for v in values) else None
+    # A combined tournament has no single source path
+    merged["path"] = None
+    return merged
+
+
+class _Linker:
+    """Hardlink files, switching to copies after the first cross-device failure."""
+
+    def __init__(self):
+        self.can_link = True
+        self.linked = 0
+        self.copied = 0
+        self.skipped = 0
+
+    def file(self, src: str, dst: str) -> None:
+        if self.can_link:
+            try:
+                os.link(src, dst)
+                self.linked += 1
+                return
+            except FileExistsError:
+                self.skipped += 1
+                return
+            except OSError:
+                # EXDEV (another filesystem) or a filesystem without hardlinks
+                self.can_link = False
+        if os.path.lexists(dst):
+            self.skipped += 1
+            return
+        shutil.copy2(src, dst)
+        self.copied += 1
+
+    def tree(self, src: str, dst: str) -> None:
+        os.makedirs(dst, exist_ok=True)
+        with os.scandir(src) as it:
+            for entry in it:
+                target = os.path.join(dst, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    self.tree(entry.path, target)
+                else:
+                    self.file(entry.path, target)
+
+    def artifacts(
+        self, src: Path, dst: Path, renames: dict[str, str] | None = None
+    ) -> None:
+        """Link the artifact folders of one tournament into another.
+
+        Entries are claimed whole: a scenario or run folder that already
+        exists in the destination (e.g. the same scenario in two sources) is
+        kept as is. Scenarios in ``renames`` are linked under their new name.
+        """
+        for folder in TOURNAMENT_DIRS:
+            source = src / folder
+            if not source.is_dir():
+                continue
+            target = dst / folder
+            target.mkdir(parents=True, exist_ok=True)
+            names = renames if folder == SCENARIOS_DIR_NAME and renames else {}
+            with os.scandir(source) as it:
+                for entry in it:
+                    path = target / names.get(entry.name, entry.name)
+                    if entry.is_dir(follow_symlinks=False):
+                        try:
+                            path.mkdir()
+                        except FileExistsError:
+                            self.skipped += 1
+                            continue
+                        self.tree(entry.path, str(path))
+                    else:
+                        self.file(entry.path, str(path))
+
+
+@dataclass
+class _Source:
+    """A tournament being combined, before its details are written."""
+
+    path: Path
+    # Details schema (without index) and number of rows
+    schema: pa.Schema
+    n_details: int
+    # All scores (small, dropped once collected), and the details of live
+    # sources (not streamed)
+    scores: pa.Table | None
+    details: pa.Table | None = None
+
+
+@dataclass
+class CombinedTables:
+    """What was written by TournamentCombiner.combine."""
+
+    loaded_paths: list[Path] = field(default_factory=list)
+    config: dict[str, Any] | None = None
+    n_negotiations: int = 0
+    scenarios: set[str] = field(default_factory=set)
+    competitors: set[str] = field(default_factory=set)
+    artifacts: dict[str, int] = field(default_factory=dict)
+
+
+class TournamentCombiner:
+    """Merge the results and artifacts of complete tournaments."""
+
+    @staticmethod
+    def combine(
+        sources: list[Path],
+        dst: Path,
+        copy: bool = False,
+        workers: int | None = None,
+        progress: ProgressCallback | None = None,
+    ) -> CombinedTables:
+        """Write the combined results of tournaments to a directory.
+
+        Writes details.parquet, all_scores.parquet (both with a "tournament"
+        column naming the source), type_scores.csv and scores.csv.
+
+        Args:
+            sources: Complete tournament directories (see discover).
+            dst: Output directory (created if needed).
+            copy: Hardlink (or copy) scenarios, runs and plots of all sources
+                into dst.
+            workers: Threads reading sources and linking artifacts.
+            progress: Called with progress events: dicts with type "progress",
+                phase ("read", "write", "scores" or "link"), completed, total
+                and path.
+
+        Raises:
+            FileNotFoundError: If no source has any negotiation details.
+            ValueError: If the sources ran different competitors (see negmas'
+                combine_tournaments).
+        """
+        total = len(sources)
+        workers = max(1, min(workers or os.cpu_count() or 1, total or 1))
+
+        def report(phase: str, completed: int, path: Path | None = None) -> None:
+            if progress is not None:
+                progress(
+                    {
+                        "type": "progress",
+                        "phase": phase,
+                        "completed": completed,
+                        "total": total,
+                        "path": str(path) if path else None,
+                    }
+                )
+
+        names = shortest_unique_names([str(p.absolute()) for p in sources], sep=os.sep)
+        renames = _scenario_renames(sources)
+
+        def inspect(path: Path) -> _Source:
+            # Segments exist until negmas saved the complete results
+            live = live_results.read_tables(path)
+            if live is not None:
+                details, scores = live
+                return _Source(path, details.schema, details.num_rows, scores, details)
+            listing = set(os.listdir(path))
+            scores = _read_table(path / (_table_name(listing, ALL_SCORES) or ""))
+            details_path = path / (_table_name(listing, DETAILS) or "")
+            if details_path.suffix == ".parquet":
+                file = pq.ParquetFile(details_path)
+                schema = pa.schema(
+                    [file.schema_arrow.field(c) for c in _parquet_columns(file)]
+                )
+                return _Source(path, schema, file.metadata.num_rows, scores)
+            # CSV types are only known once parsed: parse again when writing
+            details = _read_table(details_path)
+            return _Source(path, details.schema, details.num_rows, scores)
+
+        def details_batches(source: _Source) -> Iterable[pa.Table]:
+            """Details of a source: parquet row batches, or one whole table."""
+            if source.details is not None:
+                return [source.details]
+            listing = set(os.listdir(source.path))
+            details_path = source.path / (_table_name(listing, DETAILS) or "")
+            if details_path.suffix != ".parquet":
+                return [_read_table(details_path)]
+
+            def batches() -> Iterator[pa.Table]:
+                file = pq.ParquetFile(details_path)
+                for batch in file.iter_batches(
+                    batch_size=BATCH_ROWS, columns=_parquet_columns(file)
+                ):
+                    yield pa.Table.from_batches([batch])
+
+            return batches()
+
+        with ThreadPoolExecutor(workers, thread_name_prefix="combine") as executor:
+            futures = [executor.submit(inspect, path) for path in sources]
+            result = CombinedTables()
+            loaded: list[tuple[_Source, str, dict[str, str]]] = []
+            score_tables: list[pa.Table] = []
+            for i, (path, name, future) in enumerate(zip(sources, names, futures)):
+                source = future.result()
+                report("read", i + 1, path)
+                # Sources without details are ignored, like negmas does
+                if source.n_details == 0:
+                    continue
+                result.loaded_paths.append(path)
+                loaded.append((source, name, renames[i]))
+                if source.scores is not None and source.scores.num_rows > 0:
+                    score_tables.append(
+                        _renamed(_with_tournament(source.scores, name), renames[i])
+                    )
+                source.scores = None
+            if not result.loaded_paths:
+                raise FileNotFoundError("Cannot find any records or details to use")
+
+            # Fail before writing anything if the tournaments do not match
+            configs = [
+                load(path / "config.yaml")
+                for path in result.loaded_paths
+                if (path / "config.yaml").exists()
+            ]
+            result.config = _merge_configs(configs) if configs else None
+            dst.mkdir(parents=True, exist_ok=True)
+
+            # Details: stream each source into one parquet file
+            schema = unify_schemas(
+                _with_tournament_field(source.schema) for source, _, _ in loaded
+            )
+            writer = pq.ParquetWriter(
+                dst / f"{DETAILS}.parquet",
+                schema.insert(0, pa.field(INDEX_COLUMN, pa.int64())),
+            )
+            pending: deque[Future] = deque()
+            next_read = 0
+
+            def read_ahead() -> None:
+                nonlocal next_read
+                while next_read < len(loaded) and len(pending) < READ_AHEAD:
+                    source = loaded[next_read][0]
+                    pending.append(executor.submit(details_batches, source))
+                    next_read += 1
+
+            try:
+                for i, (source, name, source_renames) in enumerate(loaded):
+                    read_ahead()
+                    batches = pending.popleft().result()
+                    # Release a live source's details as soon as it is written
+                    source.details = None
+                    for batch in batches:
+                        details = _renamed(
+                            _with_tournament(batch, name), source_renames
+                        )
+                        result.scenarios.update(map(str, _unique(details, "scenario")))
+                        result.competitors.update(
+                            _partner_names(_unique(details, "partners"))
+                        )
+                        writer.write_table(
+                            _with_index(
+                                _conform(details, schema), result.n_negotiations
+                            )
+                        )
+                        result.n_negotiations += details.num_rows
+                    del batches
+                    report("write", i + 1, source.path)
+            finally:
+                for future in pending:
+                    future.cancel()
+                writer.close()
+
+            if result.config is not None:
+                result.config["n_scenarios"] = len(result.scenarios)
+
+            # Scores: small enough to aggregate in memory
+            if score_tables:
+                schema = unify_schemas(t.schema for t in score_tables)
+                scores = pa.concat_tables([_conform(t, schema) for t in score_tables])
+                del score_tables
+                pq.write_table(_with_index(scores, 0), dst / f"{ALL_SCORES}.parquet")
+                summary = SimpleTournamentResults.from_records(
+                    config=result.config, scores=scores.to_pandas()
+                )
+                for df, base_name in (
+                    (summary.scores_summary, "type_scores"),
+                    (summary.final_scores, FINAL_SCORES),
+                ):
+                    if df is not None and len(df) > 0:
+                        df.to_csv(dst / f"{base_name}.csv", index_label="index")
+            report("scores", total)
+
+            if copy:
+                linkers = [_Linker() for _ in loaded]
+                futures = [
+                    executor.submit(linker.artifacts, source.path, dst, source_renames)
+                    for linker, (source, _, source_renames) in zip(linkers, loaded)
+                ]
+                for i, (path, future) in enumerate(
+                    zip(result.loaded_paths, futures), 1
+                ):
+                    future.result()
+                    report("link", i, path)
+                result.artifacts = {
+                    key: sum(getattr(linker, key) for linker in linkers)
+                    for key in ("linked", "copied", "skipped")
+                }
+        return result
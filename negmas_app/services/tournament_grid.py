@@ -0,0 +1,285 @@
+"""Dense array state of a running tournament grid.
+
+A cartesian tournament runs every (competitor, opponent, scenario,
+repetition, rotation) combination once. The state of each run is kept in
+NumPy arrays over those five axes instead of a growing list of CellUpdate
+objects, names are resolved to indices with dicts built once, and the whole
+grid can be shipped to a reconnecting client as a single snapshot.
+
+negmas does not report the repetition of a finished run, so runs fill the
+repetition slots of their (competitor, opponent, scenario, rotation) cell in
+order: slots below the completed count are complete, the next ones are
+running and the rest are pending.
+"""
+
+import base64
+import zlib
+from typing import Any
+
+import numpy as np
+
+from ..models.tournament import (
+    CellStatus,
+    NegotiationEndReason,
+    TournamentGridSnapshot,
+)
+
+STATUS_CODES = list(CellStatus)
+END_REASON_CODES = list(NegotiationEndReason)
+
+PENDING = STATUS_CODES.index(CellStatus.PENDING)
+RUNNING = STATUS_CODES.index(CellStatus.RUNNING)
+COMPLETE = STATUS_CODES.index(CellStatus.COMPLETE)
+_END_CODE = {reason: code for code, reason in enumerate(END_REASON_CODES)}
+
+# Utilities kept per run (bilateral negotiations)
+N_UTILITIES = 2
+
+
+def split_rotation(scenario_name: str) -> tuple[str, bool]:
+    """Strip the rotation suffix negmas adds to scenario names.
+
+    Rotated runs are named "<scenario>-<n>" with n > 0.
+
+    Returns:
+        Tuple of (base scenario name, rotated).
+    """
+    base, sep, suffix = scenario_name.rpartition("-")
+    if sep and suffix.isdigit() and int(suffix) > 0:
+        return base, True
+    return scenario_name, False
+
+
+def _encode(array: np.ndarray) -> str:
+    """Compress an array's bytes (C order, little endian) for JSON."""
+    data = np.ascontiguousarray(array).astype(array.dtype.newbyteorder("<"))
+    return base64.b64encode(zlib.compress(data.tobytes())).decode("ascii")
+
+
+class TournamentGrid:
+    """Status, end reason, utilities and steps of every run in a tournament."""
+
+    def __init__(
+        self,
+        competitors: list[str],
+        opponents: list[str],
+        scenarios: list[str],
+        n_repetitions: int,
+        rotate_ufuns: bool,
+    ) -> None:
+        self.scenarios = list(scenarios)
+        self.scenario_index = {name: i for i, name in enumerate(self.scenarios)}
+        # Runs per (competitor, opponent, scenario) cell when finished
+        self.cell_total = max(1, n_repetitions) * (2 if rotate_ufuns else 1)
+        self.competitors: list[str] = []
+        self.opponents: list[str] = []
+        self.competitor_index: dict[str, int] = {}
+        self.opponent_index: dict[str, int] = {}
+        self._allocate(
+            (
+                len(competitors),
+                len(opponents),
+                len(scenarios),
+                max(1, n_repetitions),
+                2 if rotate_ufuns else 1,
+            )
+        )
+        self.set_names(competitors, opponents)
+
+    def _allocate(self, shape: tuple[int, ...]) -> None:
+        old = getattr(self, "status", None)
+        arrays = {
+            "status": np.full(shape, PENDING, dtype=np.int8),
+            "end_reason": np.full(shape, -1, dtype=np.int8),
+            "utilities": np.full((*shape, N_UTILITIES), np.nan, dtype=np.float32),
+            "n_steps": np.full(shape, -1, dtype=np.int32),
+        }
+        counters = {
+            "n_done": np.zeros(shape[:3] + shape[4:], dtype=np.int32),
+            "n_running": np.zeros(shape[:3] + shape[4:], dtype=np.int32),
+        }
+        if old is not None:
+            # Keep what overlaps (names can change size before runs start)
+            common = tuple(slice(min(a, b)) for a, b in zip(old.shape, shape))
+            for name, array in arrays.items():
+                array[common] = getattr(self, name)[common]
+            counter_common = common[:3] + common[4:]
+            for name, array in counters.items():
+                array[counter_common] = getattr(self, name)[counter_common]
+        for name, array in {**arrays, **counters}.items():
+            setattr(self, name, array)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """(competitors, opponents, scenarios, repetitions, rotations)."""
+        return self.status.shape
+
+    def set_names(self, competitors: list[str], opponents: list[str] | None) -> None:
+        """Use the given names for rows and columns.
+
+        Without opponents, competitors play each other. Names are replaced
+        (e.g. placeholders by the names negmas generated) without touching
+        recorded runs unless the number of names changes.
+        """
+        opponents = opponents or competitors
+        if competitors == self.competitors and opponents == self.opponents:
+            return
+        self.competitors = list(competitors)
+        self.opponents = list(opponents)
+        self.competitor_index = {name: i for i, name in enumerate(self.competitors)}
+        self.opponent_index = {name: i for i, name in enumerate(self.opponents)}
+        shape = (len(competitors), len(opponents), *self.shape[2:])
+        if shape != self.shape:
+            self._allocate(shape)
+
+    def locate(
+        self, partners: list[str], scenario_name: str
+    ) -> tuple[int, int, int, bool]:
+        """Grid indices of a run.
+
+        Unknown names map to index 0.
+
+        Returns:
+            Tuple of (competitor_idx, opponent_idx, scenario_idx, rotated).
+        """
+        comp_idx = opp_idx = 0
+        if len(partners) >= 2:
+            p0, p1 = partners[0], partners[1]
+            comp_idx = self.competitor_index.get(p0, 0)
+            opp_idx = self.opponent_index.get(p1, self.competitor_index.get(p1, 0))
+        base, rotated = split_rotation(scenario_name)
+        scenario_idx = self.scenario_index.get(
+            base, self.scenario_index.get(scenario_name, 0)
+        )
+        return comp_idx, opp_idx, scenario_idx, rotated
+
+    def _cell(self, c: int, o: int, s: int, rotated: bool) -> tuple[int, ...]:
+        n_c, n_o, n_s, _, n_k = self.shape
+        return (
+            min(c, n_c - 1),
+            min(o, n_o - 1),
+            min(s, n_s - 1),
+            min(int(rotated), n_k - 1),
+        )
+
+    def mark_running(self, c: int, o: int, s: int, rotated: bool) -> int:
+        """Mark the next pending slot of a cell as running.
+
+        Returns:
+            The repetition slot.
+        """
+        if 0 in self.shape:
+            return 0
+        c, o, s, k = cell = self._cell(c, o, s, rotated)
+        rep = int(self.n_done[cell] + self.n_running[cell])
+        if rep < self.shape[3]:
+            self.status[c, o, s, rep, k] = RUNNING
+        self.n_running[cell] += 1
+        return rep
+
+    def record(
+        self,
+        c: int,
+        o: int,
+        s: int,
+        rotated: bool,
+        end_reason: NegotiationEndReason,
+        utilities: list[float] | None = None,
+        n_steps: int | None = None,
+    ) -> int:
+        """Store a finished run in the next slot of its cell.
+
+        Returns:
+            The repetition slot.
+        """
+        if 0 in self.shape:
+            return 0
+        c, o, s, k = cell = self._cell(c, o, s, rotated)
+        rep = int(self.n_done[cell])
+        if rep >= self.shape[3]:
+            # More runs than expected (e.g. a continued tournament): grow
+            self._allocate((*self.shape[:3], 2 * self.shape[3], self.shape[4]))
+        if self.n_running[cell] > 0:
+            # The run held this slot (the first running one)
+            self.n_running[cell] -= 1
+        index = (c, o, s, rep, k)
+        self.status[index] = COMPLETE
+        self.end_reason[index] = _END_CODE[end_reason]
+        if utilities:
+            values = [
+                float(u) if u is not None else np.nan for u in utilities[:N_UTILITIES]
+            ]
+            self.utilities[index][: len(values)] = values
+        self.n_steps[index] = -1 if n_steps is None else int(n_steps)
+        self.n_done[cell] += 1
+        return rep
+
+    @property
+    def n_completed(self) -> int:
+        """Number of finished runs."""
+        return int(self.n_done.sum())
+
+    def cell_states(self) -> dict[str, dict[str, Any]]:
+        """Per (competitor, opponent, scenario) counts of started cells.
+
+        Keys are "competitor::opponent::scenario" as used by the frontend.
+        """
+        finished = self.status == COMPLETE
+        completed = finished.sum(axis=(3, 4))
+        running = self.n_running.sum(axis=3)
+        codes = self.end_reason
+        agreements = (codes == _END_CODE[NegotiationEndReason.AGREEMENT]).sum(
+            axis=(3, 4)
+        )
+        timeouts = (codes == _END_CODE[NegotiationEndReason.TIMEOUT]).sum(axis=(3, 4))
+        errors = np.isin(
+            codes,
+            [
+                _END_CODE[NegotiationEndReason.ERROR],
+                _END_CODE[NegotiationEndReason.BROKEN],
+            ],
+        ).sum(axis=(3, 4))
+
+        states: dict[str, dict[str, Any]] = {}
+        for c, o, s in np.argwhere((completed > 0) | (running > 0)):
+            n_completed = int(completed[c, o, s])
+            n_running = int(running[c, o, s])
+            n_errors = int(errors[c, o, s])
+            n_agreements = int(agreements[c, o, s])
+            if n_completed < self.cell_total:
+                status = "running"
+            elif n_errors > 0:
+                status = "error"
+            elif n_agreements > 0:
+                status = "complete"
+            else:
+                status = "timeout"
+            if n_running and status != "complete":
+                status = "running"
+            key = f"{self.competitors[c]}::{self.opponents[o]}::{self.scenarios[s]}"
+            states[key] = {
+                "status": status,
+                "total": self.cell_total,
+                "completed": n_completed,
+                "agreements": n_agreements,
+                "timeouts": int(timeouts[c, o, s]),
+                "errors": n_errors,
+                "running": n_running,
+            }
+        return states
+
+    def snapshot(self) -> TournamentGridSnapshot:
+        """The whole grid as one compact message."""
+        return TournamentGridSnapshot(
+            competitors=list(self.competitors),
+            opponents=list(self.opponents),
+            scenarios=list(self.scenarios),
+            shape=list(self.shape),
+            n_completed=self.n_completed,
+            status=_encode(self.status),
+            end_reason=_encode(self.end_reason),
+            utilities=_encode(self.utilities),
+            n_steps=_encode(self.n_steps),
+            status_codes=[status.value for status in STATUS_CODES],
+            end_reason_codes=[reason.value for reason in END_REASON_CODES],
+        )
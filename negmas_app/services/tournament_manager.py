@@ -9,10 +9,11 @@ import multiprocessing
 import queue
 import shutil
 import threading
+import time
 import uuid
 import warnings
 from collections.abc import AsyncGenerator, Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from functools import partial
 from pathlib import Path
@@ -20,7 +21,6 @@ from typing import Any
 
 from negmas import Scenario
 from negmas.sao import SAOMechanism, SAONegotiator
-from negmas.tournaments.neg import cartesian_tournament, continue_cartesian_tournament
 
 from ..models.tournament import (
     TournamentConfig,
@@ -35,10 +35,24 @@ from ..models.tournament import (
     CellUpdate,
     LeaderboardEntry,
     TournamentGridInit,
+    TournamentGridSnapshot,
 )
+from .concurrency_controller import MB, ConcurrencyController
 from .scenario_loader import ScenarioLoader
 from .negotiator_factory import _get_class_for_type
 from .settings_service import SettingsService
+from .live_results import LIVE_RESULTS_DIR, LiveResultsWriter, read_segment
+from .result_cache import TournamentResultCache, is_deterministic, negotiator_names
+from .runtime_predictor import (
+    EtaTracker,
+    RuntimePredictor,
+    longest_first,
+    scenario_costs,
+)
+from .shard_broker import POLL_SECONDS, SHARDS_DIR, ShardQueue
+from .shard_broker import remove as remove_shards
+from .tournament_grid import TournamentGrid, split_rotation
+from .worker_pool import CallbackRelay, WorkerPool
 
 
 # Global multiprocessing manager for creating picklable queues and shared state
@@ -97,6 +111,23 @@ def _apply_normalization(
         return scenario
 
 
+# Keys combine_tournaments writes about its sources
+_COMBINE_KEYS = (
+    "combined",
+    "combined_from",
+    "combined_at",
+    "n_source_tournaments",
+    "competitor_types",
+    "opponent_types",
+)
+
+
+def _params(params: list[dict] | None, types: list[type]) -> list[dict]:
+    """One parameter dict per negotiator type (empty where not given)."""
+    padded = [dict(p or {}) for p in params or []]
+    return padded + [{} for _ in range(len(types) - len(padded))]
+
+
 @dataclass
 class TournamentState:
     """Shared state for a running tournament, updated by callbacks."""
@@ -104,13 +135,17 @@ class TournamentState:
     # Grid structure (set at start)
     grid_init: TournamentGridInit | None = None
 
-    # Mapping from (competitor, opponent, scenario, rep, rotated) -> cell index
-    cell_index_map: dict[tuple[str, str, str, int, bool], int] = field(
-        default_factory=dict
-    )
+    # State of every run (competitor x opponent x scenario x rep x rotation)
+    grid: TournamentGrid | None = None
+
+    # Appends each finished negotiation to parquet segments in the save path
+    live_results: LiveResultsWriter | None = None
+
+    # Estimates the remaining time from predicted run times
+    eta: EtaTracker | None = None
 
-    # All cell updates (completed cells)
-    completed_cells: list[CellUpdate] = field(default_factory=list)
+    # Number of parallel negotiations (adaptive_njobs only)
+    concurrency: ConcurrencyController | None = None
 
     # Currently running cell (if any)
     current_cell: CellUpdate | None = None
@@ -154,6 +189,27 @@ class TournamentState:
     # This mirrors what negmas writes to config.yaml
     config: dict[str, Any] = field(default_factory=dict)
 
+    def set_grid_init(self, grid_init: TournamentGridInit) -> None:
+        """Set the grid structure, keeping recorded runs if only names changed."""
+        previous = self.grid_init
+        self.grid_init = grid_init
+        if (
+            self.grid is None
+            or previous is None
+            or previous.scenarios != grid_init.scenarios
+            or previous.n_repetitions != grid_init.n_repetitions
+            or previous.rotate_ufuns != grid_init.rotate_ufuns
+        ):
+            self.grid = TournamentGrid(
+                grid_init.competitors,
+                grid_init.opponents,
+                grid_init.scenarios,
+                grid_init.n_repetitions,
+                grid_init.rotate_ufuns,
+            )
+        else:
+            self.grid.set_names(grid_init.competitors, grid_init.opponents)
+
     def emit_setup_progress(self, message: str, current: int, total: int) -> None:
         """Emit a setup progress event (for both SSE and polling)."""
         data = {"message": message, "current": current, "total": total}
@@ -169,6 +225,32 @@ class TournamentState:
         self.live_negotiations.pop(run_id, None)
 
 
+@dataclass
+class _RunStart:
+    """The parts of negmas' RunInfo used by the before-start callback.
+
+    Sent back from pool workers instead of the RunInfo, which holds the
+    whole scenario.
+    """
+
+    scenario_name: str
+    partner_names: list[str]
+    rep: int
+    config: dict[str, Any]
+
+
+def _run_start(info: Any) -> _RunStart:
+    """Summarize a RunInfo (a _RunStart is returned as is)."""
+    if isinstance(info, _RunStart):
+        return info
+    return _RunStart(
+        scenario_name=info.s.outcome_space.name or "unknown",
+        partner_names=list(info.partner_names) if info.partner_names else [],
+        rep=info.rep,
+        config=getattr(info, "config", {}) or {},
+    )
+
+
 # Module-level callback functions for negotiation monitoring
 # These match NegMAS signature: Callable[[str | int, SAOState], None]
 # NegMAS wraps these with _PicklableCallback internally using cloudpickle,
@@ -311,6 +393,8 @@ class TournamentManager:
         self._tournament_states: dict[str, TournamentState] = {}
         self._background_threads: dict[str, threading.Thread] = {}
         self.scenario_loader = ScenarioLoader()
+        # Warm processes shared by the parallel negotiations of all tournaments
+        self.worker_pool = WorkerPool()
         # Default tournaments directory
         self.tournaments_dir = Path.home() / "negmas" / "app" / "tournaments"
         self.tournaments_dir.mkdir(exist_ok=True, parents=True)
@@ -424,8 +508,8 @@ class TournamentManager:
 
         # Start the tournament in a background thread
         thread = threading.Thread(
-            target=self._run_tournament_in_background,
-            args=(session_id,),
+            target=self.worker_pool.call,
+            args=(self._run_tournament_in_background, session_id),
             daemon=True,
         )
         self._background_threads[session_id] = thread
@@ -568,6 +652,7 @@ class TournamentManager:
             "self_play": config.self_play,
             "randomize_runs": config.randomize_runs,
             "sort_runs": config.sort_runs,
+            "order_runs_by_cost": config.order_runs_by_cost,
             # Mechanism settings
             "mechanism_type": config.mechanism_type,
             "n_steps": config.n_steps,
@@ -599,6 +684,10 @@ class TournamentManager:
             "ignore_reserved": config.ignore_reserved,
             # Execution
             "njobs": config.njobs,
+            "adaptive_njobs": config.adaptive_njobs,
+            "memory_limit_mb": config.memory_limit_mb,
+            "use_result_cache": config.use_result_cache,
+            "sharded": config.sharded,
             "verbosity": config.verbosity,
             "raise_exceptions": config.raise_exceptions,
             # Opponent modeling
@@ -610,7 +699,10 @@ class TournamentManager:
         }
 
     def _create_callbacks(
-        self, session_id: str, config: TournamentConfig
+        self,
+        session_id: str,
+        config: TournamentConfig,
+        names: dict[str, list[str]] | None = None,
     ) -> tuple[
         Callable[[Any], None],
         Callable[[Any], None],
@@ -625,6 +717,13 @@ class TournamentManager:
         These callbacks update the shared TournamentState and push events
         to the event queue for SSE streaming.
 
+        Args:
+            session_id: Tournament session.
+            config: Tournament configuration.
+            names: competitor_names and opponent_names to use instead of the
+                ones negmas reports (runs of sub-tournaments belong to the
+                whole tournament's grid).
+
         Returns:
             Tuple of (before_start_callback, after_construction_callback,
                      after_end_callback, progress_callback, neg_start_callback,
@@ -669,12 +768,13 @@ class TournamentManager:
                 return
 
             # Extract info about the upcoming negotiation
-            scenario_name = info.s.outcome_space.name or "unknown"
-            partner_names = list(info.partner_names) if info.partner_names else []
-            rep = info.rep
+            run = _run_start(info)
+            scenario_name = run.scenario_name
+            partner_names = run.partner_names
+            rep = run.rep
 
             # Get name lists from config (negmas passes this with correct order)
-            run_config = getattr(info, "config", {}) or {}
+            run_config = {**run.config, **(names or {})}
             config_competitor_names = run_config.get("competitor_names", [])
             config_opponent_names = run_config.get("opponent_names", [])
 
@@ -685,7 +785,7 @@ class TournamentManager:
                 state.competitor_names = config_competitor_names
                 # Emit updated grid_init with actual names
                 if state.grid_init:
-                    state.grid_init = TournamentGridInit(
+                    grid_init = TournamentGridInit(
                         competitors=config_competitor_names,
                         opponents=config_opponent_names or config_competitor_names,
                         scenarios=state.scenario_names,
@@ -694,46 +794,23 @@ class TournamentManager:
                         total_negotiations=state.grid_init.total_negotiations,
                         storage_path=state.grid_init.storage_path,
                     )
+                    state.set_grid_init(grid_init)
                     state.event_queue.put(("grid_init", state.grid_init))
             if config_opponent_names and state.opponent_names[0].startswith(
                 ("Opponent ", "Competitor ")
             ):
                 state.opponent_names = config_opponent_names
 
-            # Parse scenario name for rotation suffix (e.g., "domain-1" -> base="domain", rotated=True)
-            base_scenario_name = scenario_name
-            rotated = False
-            if "-" in scenario_name:
-                parts = scenario_name.rsplit("-", 1)
-                if len(parts) == 2 and parts[1].isdigit():
-                    rotation_idx = int(parts[1])
-                    if rotation_idx > 0:
-                        rotated = True
-                        base_scenario_name = parts[0]
-
-            # Determine competitor/opponent indices using config name lists
-            comp_idx = 0
-            opp_idx = 0
-
-            if len(partner_names) >= 2:
-                p0, p1 = partner_names[0], partner_names[1]
-                # Use config names for lookup (they're in the same order as types)
-                if config_competitor_names and p0 in config_competitor_names:
-                    comp_idx = config_competitor_names.index(p0)
-
-                # For opponent index: if no explicit opponents (empty list), use competitor_names
-                # Otherwise use opponent_names
-                if config_opponent_names and p1 in config_opponent_names:
-                    opp_idx = config_opponent_names.index(p1)
-                elif config_competitor_names and p1 in config_competitor_names:
-                    # No explicit opponents - competitors play each other
-                    opp_idx = config_competitor_names.index(p1)
-
-            scenario_idx = 0
-            if base_scenario_name in state.scenario_names:
-                scenario_idx = state.scenario_names.index(base_scenario_name)
-            elif scenario_name in state.scenario_names:
-                scenario_idx = state.scenario_names.index(scenario_name)
+            grid = state.grid
+            if grid is None:
+                return
+            # Resolve indices with the name lists from negmas (same order as types)
+            if config_competitor_names:
+                grid.set_names(config_competitor_names, config_opponent_names)
+            comp_idx, opp_idx, scenario_idx, rotated = grid.locate(
+                partner_names, scenario_name
+            )
+            grid.mark_running(comp_idx, opp_idx, scenario_idx, rotated)
 
             # Create run_start update
             cell_start = CellUpdate(
@@ -776,7 +853,7 @@ class TournamentManager:
             run_id = record.get("run_id")  # Unique ID for loading negotiation data
 
             # Get name lists from config (negmas passes this with correct order)
-            run_config = run_config or {}
+            run_config = {**(run_config or {}), **(names or {})}
             config_competitor_names = run_config.get("competitor_names", [])
             config_opponent_names = run_config.get("opponent_names", [])
 
@@ -790,44 +867,26 @@ class TournamentManager:
             else:
                 end_reason = NegotiationEndReason.TIMEOUT
 
-            # Parse scenario name for rotation suffix (e.g., "domain-1" -> base="domain", rotated=True)
+            grid = state.grid
+            if grid is None:
+                return
             # negmas appends "-N" to scenario names for rotated runs where N > 0
-            base_scenario_name = scenario_name
-            rotated = False
-            if "-" in scenario_name:
-                parts = scenario_name.rsplit("-", 1)
-                if len(parts) == 2 and parts[1].isdigit():
-                    rotation_idx = int(parts[1])
-                    if rotation_idx > 0:
-                        rotated = True
-                        base_scenario_name = parts[0]
-
-            # Get indices using config name lists
-            comp_idx = 0
-            opp_idx = 0
-            scenario_idx = 0
-            rep = 0
-
-            if len(partners) >= 2:
-                p0, p1 = partners[0], partners[1]
-                # Use config names for lookup (they're in the same order as types)
-                if config_competitor_names and p0 in config_competitor_names:
-                    comp_idx = config_competitor_names.index(p0)
-
-                # For opponent index: if no explicit opponents (empty list), use competitor_names
-                # Otherwise use opponent_names
-                if config_opponent_names and p1 in config_opponent_names:
-                    opp_idx = config_opponent_names.index(p1)
-                elif config_competitor_names and p1 in config_competitor_names:
-                    # No explicit opponents - competitors play each other
-                    opp_idx = config_competitor_names.index(p1)
-
-            # Try to match the base scenario name to our list
-            if base_scenario_name in state.scenario_names:
-                scenario_idx = state.scenario_names.index(base_scenario_name)
-            elif scenario_name in state.scenario_names:
-                # Fallback to exact match (for non-rotated or differently named scenarios)
-                scenario_idx = state.scenario_names.index(scenario_name)
+            base_scenario_name, _ = split_rotation(scenario_name)
+            # Resolve indices with the name lists from negmas (same order as types)
+            if config_competitor_names:
+                grid.set_names(config_competitor_names, config_opponent_names)
+            comp_idx, opp_idx, scenario_idx, rotated = grid.locate(
+                partners, scenario_name
+            )
+            rep = grid.record(
+                comp_idx,
+                opp_idx,
+                scenario_idx,
+                rotated,
+                end_reason,
+                utilities=list(utilities) if utilities else None,
+                n_steps=n_steps,
+            )
 
             # Get scenario path
             scenario_path = None
@@ -851,10 +910,16 @@ class TournamentManager:
                 run_id=str(run_id) if run_id is not None else None,
             )
 
-            state.completed_cells.append(cell_complete)
             state.current_cell = None
             state.event_queue.put(("run_complete", cell_complete))
 
+            # Make the result readable before the tournament finishes
+            if state.live_results is not None:
+                try:
+                    state.live_results.append(record)
+                except Exception as e:
+                    print(f"[TournamentManager] Failed to write live results: {e}")
+
             # Track completed negotiation with details for the Negotiations panel
             competitor_name = partners[0] if len(partners) >= 1 else "Unknown"
             opponent_name = partners[1] if len(partners) >= 2 else "Unknown"
@@ -888,14 +953,21 @@ class TournamentManager:
             state.event_queue.put(("leaderboard", leaderboard))
 
             # Update progress
-            completed = len(state.completed_cells)
+            completed = grid.n_completed
             total = state.progress.total if state.progress else 0
+            if state.eta is not None:
+                state.eta.completed(scenario_name)
             state.progress = TournamentProgress(
                 completed=completed,
                 total=total,
                 current_scenario=scenario_name,
                 current_partners=list(partners) if partners else None,
                 percent=(completed / total * 100) if total > 0 else 0,
+                eta_seconds=state.eta.eta() if state.eta is not None else None,
+                workers=state.concurrency.workers if state.concurrency else None,
+                workers_reason=(
+                    state.concurrency.reason if state.concurrency else None
+                ),
             )
             state.event_queue.put(("progress", state.progress))
 
@@ -915,6 +987,8 @@ class TournamentManager:
             """
             if self._cancel_flags.get(session_id, False):
                 return
+            if config_dict and names:
+                config_dict = {**config_dict, **names}
 
             # On first call with config, extract competitor/opponent names
             # This happens during setup (step 1 of 3) before negotiations start
@@ -933,7 +1007,7 @@ class TournamentManager:
 
                 # Emit updated grid_init with real names
                 if state.grid_init and competitor_names:
-                    state.grid_init = TournamentGridInit(
+                    grid_init = TournamentGridInit(
                         competitors=state.competitor_names,
                         opponents=state.opponent_names,
                         scenarios=state.scenario_names,
@@ -942,6 +1016,7 @@ class TournamentManager:
                         total_negotiations=state.grid_init.total_negotiations,
                         storage_path=state.grid_init.storage_path,
                     )
+                    state.set_grid_init(grid_init)
                     state.event_queue.put(("grid_init", state.grid_init))
 
             # Emit a setup_progress event (for both SSE and polling)
@@ -1150,12 +1225,66 @@ class TournamentManager:
 
         return entries
 
-    def _run_tournament_in_background(self, session_id: str) -> None:
+    def _scenario_costs(
+        self,
+        config: TournamentConfig,
+        scenarios: list[Scenario],  # type: ignore[type-arg]
+        competitors: list[type],
+        opponents: list[type] | None,
+    ) -> tuple[list[float], bool]:
+        """Predicted mean time of a run on each scenario.
+
+        Returns:
+            Tuple of (costs, predicted). Without enough timing history in the
+            saved tournaments every run costs 1 and predicted is False.
+        """
+        from negmas.helpers.types import get_full_type_name
+
+        predictor: RuntimePredictor | None = None
+        try:
+            predictor = RuntimePredictor.from_saved_tournaments()
+        except Exception as e:
+            print(f"[TournamentManager] Failed to predict run times: {e}")
+        if predictor is None and config.order_runs_by_cost:
+            print("[TournamentManager] No timing history: keeping the run order")
+        first_types = [get_full_type_name(c) for c in competitors]
+        second_types = (
+            [get_full_type_name(c) for c in opponents]
+            if opponents is not None
+            else first_types
+        )
+        costs = scenario_costs(
+            predictor,
+            scenarios,
+            first_types,
+            second_types,
+            n_steps=config.n_steps,
+            time_limit=config.time_limit,
+            self_play=config.self_play or opponents is not None,
+        )
+        return costs, predictor is not None
+
+    def _run_tournament_in_background(
+        self, session_id: str, keep_live_results: bool = False
+    ) -> None:
         """Run the tournament in a background thread using cartesian_tournament.
 
         This method is called in a separate thread and uses callbacks to
         update the shared TournamentState.
+
+        Args:
+            session_id: Tournament session.
+            keep_live_results: Keep the live result segments (continuing
+                existing ones) after negmas saved the results, for batches
+                of sharded tournaments whose coordinator reads them.
         """
+        # Deferred: negmas.tournaments pulls in scikit-learn and would
+        # otherwise dominate app startup
+        from negmas.tournaments.neg import (
+            cartesian_tournament,
+            continue_cartesian_tournament,
+        )
+
         session = self.sessions.get(session_id)
         state = self._tournament_states.get(session_id)
 
@@ -1172,6 +1301,10 @@ class TournamentManager:
                 and config.save_path
                 and config.path_exists == "continue"
             )
+            if config.save_path:
+                state.live_results = LiveResultsWriter(
+                    config.save_path, resume=bool(is_continue) or keep_live_results
+                )
 
             if is_continue:
                 # Use continue_cartesian_tournament for existing tournaments
@@ -1240,12 +1373,14 @@ class TournamentManager:
                     )
                     # Load njobs from saved config (default to -1 for serial)
                     config.njobs = saved_config.get("njobs", -1)
+                    config.adaptive_njobs = saved_config.get("adaptive_njobs", False)
+                    config.memory_limit_mb = saved_config.get("memory_limit_mb")
                     config.final_score_stat = saved_config.get(
                         "final_score_stat", "mean"
                     )
 
                     # Emit grid_init so frontend can display the grid
-                    state.grid_init = TournamentGridInit(
+                    grid_init = TournamentGridInit(
                         competitors=state.competitor_names,
                         opponents=state.opponent_names,
                         scenarios=scenario_names,
@@ -1254,6 +1389,7 @@ class TournamentManager:
                         total_negotiations=total_negotiations,
                         storage_path=config.save_path,
                     )
+                    state.set_grid_init(grid_init)
                     state.event_queue.put(("grid_init", state.grid_init))
 
                     # Load existing completed negotiations from results folder
@@ -1267,66 +1403,31 @@ class TournamentManager:
                     )
                     n_already_completed = len(existing_negotiations)
 
-                    if n_already_completed > 0:
-                        # Build cell states from existing negotiations
-                        _, cell_states_dict = (
-                            TournamentStorageService._build_grid_structures(
-                                Path(config.save_path), existing_negotiations
+                    if n_already_completed > 0 and state.grid is not None:
+                        # Fill the grid with the runs already on disk and
+                        # send it in one message
+                        for neg in existing_negotiations:
+                            raw = neg.get("raw_data") or {}
+                            if raw.get("has_error") or raw.get("broken"):
+                                end_reason = NegotiationEndReason.BROKEN
+                            elif neg.get("has_agreement"):
+                                end_reason = NegotiationEndReason.AGREEMENT
+                            else:
+                                end_reason = NegotiationEndReason.TIMEOUT
+                            indices = state.grid.locate(
+                                list(neg.get("partners") or []),
+                                str(neg.get("scenario") or ""),
+                            )
+                            state.grid.record(
+                                *indices,
+                                end_reason,
+                                utilities=neg.get("utilities"),
+                                n_steps=raw.get("last_step"),
                             )
+                        state.event_queue.put(
+                            ("grid_snapshot", state.grid.snapshot())
                         )
 
-                        # Emit cell states for each completed cell
-                        for cell_id, cell_data in cell_states_dict.items():
-                            # Parse cell_id to get indices
-                            parts = cell_id.split("::")
-                            if len(parts) >= 3:
-                                competitor, opponent, scenario = (
-                                    parts[0],
-                                    parts[1],
-                                    parts[2],
-                                )
-
-                                # Find indices
-                                comp_idx = (
-                                    state.competitor_names.index(competitor)
-                                    if competitor in state.competitor_names
-                                    else 0
-                                )
-                                opp_idx = (
-                                    state.opponent_names.index(opponent)
-                                    if opponent in state.opponent_names
-                                    else 0
-                                )
-                                scenario_idx = (
-                                    scenario_names.index(scenario)
-                                    if scenario in scenario_names
-                                    else 0
-                                )
-
-                                # Determine end reason from cell data
-                                if cell_data.get("errors", 0) > 0:
-                                    end_reason = NegotiationEndReason.BROKEN
-                                elif cell_data.get("agreements", 0) > 0:
-                                    end_reason = NegotiationEndReason.AGREEMENT
-                                elif cell_data.get("timeouts", 0) > 0:
-                                    end_reason = NegotiationEndReason.TIMEOUT
-                                else:
-                                    end_reason = NegotiationEndReason.TIMEOUT
-
-                                # Create cell update for completed cell
-                                cell_update = CellUpdate(
-                                    competitor_idx=comp_idx,
-                                    opponent_idx=opp_idx,
-                                    scenario_idx=scenario_idx,
-                                    repetition=0,
-                                    rotated=False,
-                                    status=CellStatus.COMPLETE,
-                                    end_reason=end_reason,
-                                    utilities=cell_data.get("utilities"),
-                                )
-                                state.completed_cells.append(cell_update)
-                                state.event_queue.put(("run_complete", cell_update))
-
                     # Initialize progress with already-completed count
                     state.progress = TournamentProgress(
                         completed=n_already_completed,
@@ -1372,17 +1473,22 @@ class TournamentManager:
                         "ignore", message="invalid value encountered"
                     )
                     warnings.filterwarnings("ignore", message="Degrees of freedom")
-                    results = continue_cartesian_tournament(
-                        path=Path(config.save_path),
-                        verbosity=config.verbosity,
-                        njobs=config.njobs,  # Use config value (loaded from saved config)
-                        before_start_callback=before_start_callback,
-                        progress_callback=progress_callback,
-                        neg_start_callback=neg_start_callback,
-                        after_construction_callback=after_construction_callback,
-                        neg_progress_callback=neg_progress_callback,
-                        neg_end_callback=neg_end_callback,
-                        after_end_callback=after_end_callback,
+                    results = self._cartesian(
+                        session_id,
+                        continue_cartesian_tournament,
+                        dict(
+                            path=Path(config.save_path),
+                            verbosity=config.verbosity,
+                            # Use config value (loaded from saved config)
+                            njobs=config.njobs,
+                            before_start_callback=before_start_callback,
+                            progress_callback=progress_callback,
+                            neg_start_callback=neg_start_callback,
+                            after_construction_callback=after_construction_callback,
+                            neg_progress_callback=neg_progress_callback,
+                            neg_end_callback=neg_end_callback,
+                            after_end_callback=after_end_callback,
+                        ),
                     )
 
                 if results is None:
@@ -1447,6 +1553,10 @@ class TournamentManager:
                     results_path=str(results.path) if results.path else None,
                 )
 
+                # negmas saved the complete results: drop the live segments
+                if state.live_results is not None and not keep_live_results:
+                    state.live_results.discard()
+
                 # Clean up redundant CSV files if parquet equivalents exist
                 if config.save_path and config.storage_format == "parquet":
                     removed = self._cleanup_redundant_csvs(Path(config.save_path))
@@ -1455,6 +1565,12 @@ class TournamentManager:
                             f"[TournamentManager] Cleaned up {len(removed)} redundant CSV files"
                         )
 
+                # Record the tournament's disk usage for storage stats
+                if config.save_path:
+                    from .tournament_storage import TournamentStorageService
+
+                    TournamentStorageService.record_storage(config.save_path)
+
                 state.status = TournamentStatus.COMPLETED
                 session.status = TournamentStatus.COMPLETED
                 session.end_time = datetime.now()
@@ -1595,6 +1711,21 @@ class TournamentManager:
                 # When no explicit opponents, opponents = competitors
                 state.opponent_names = placeholder_competitor_names
 
+            # Start the scenarios predicted to take longest first
+            costs, predicted = self._scenario_costs(
+                config, scenarios, competitors, opponents
+            )
+            ordered = config.order_runs_by_cost and predicted
+            if ordered:
+                order = longest_first(costs)
+                scenarios = [scenarios[i] for i in order]
+                scenario_names = [scenario_names[i] for i in order]
+                scenario_paths = [scenario_paths[i] for i in order]
+                costs = [costs[i] for i in order]
+                state.scenarios = scenarios
+                state.scenario_names = scenario_names
+                state.scenario_paths = scenario_paths
+
             # Emit progress for building tournament configuration
             state.event_queue.put(
                 (
@@ -1635,15 +1766,57 @@ class TournamentManager:
                 total_negotiations=total_negotiations,
                 storage_path=config.save_path,
             )
-            state.grid_init = grid_init
+            state.set_grid_init(grid_init)
             state.progress = TournamentProgress(
                 completed=0, total=total_negotiations, percent=0.0
             )
+            state.eta = EtaTracker(
+                dict(zip(scenario_names, costs)),
+                runs_per_scenario=total_negotiations // n_scenarios,
+            )
 
             # Emit grid_init event
             state.event_queue.put(("grid_init", grid_init))
             state.event_queue.put(("progress", state.progress))
 
+            # Reuse identical runs of earlier tournaments (opt-in)
+            # (sharded tournaments use the caches of the hosts running batches)
+            result_cache: TournamentResultCache | None = None
+            if config.use_result_cache and not config.sharded:
+                if not config.save_path:
+                    print("[TournamentManager] Result cache needs a save path")
+                elif not is_deterministic(config):
+                    print(
+                        "[TournamentManager] Result cache not used: settings are "
+                        "drawn from ranges"
+                    )
+                else:
+                    result_cache = TournamentResultCache(
+                        config, scenario_paths, scenario_names, competitors, opponents
+                    )
+
+            # Cached runs and runs of batches are reported with the names of
+            # the whole tournament's negotiators
+            names: dict[str, list[str]] | None = None
+            if result_cache is not None:
+                names = {
+                    "competitor_names": result_cache.competitor_names,
+                    "opponent_names": result_cache.opponent_names,
+                }
+            elif config.sharded:
+                names = {
+                    "competitor_names": negotiator_names(
+                        competitors, _params(config.competitor_params, competitors)
+                    ),
+                    "opponent_names": (
+                        negotiator_names(
+                            opponents, _params(config.opponent_params, opponents)
+                        )
+                        if opponents is not None
+                        else []
+                    ),
+                }
+
             # Create callbacks
             (
                 before_cb,
@@ -1653,7 +1826,7 @@ class TournamentManager:
                 neg_start_cb,
                 neg_progress_cb,
                 neg_end_cb,
-            ) = self._create_callbacks(session_id, config)
+            ) = self._create_callbacks(session_id, config, names=names)
 
             # Get mechanism class
             mechanism_class = self._get_mechanism_class(config.mechanism_type)
@@ -1701,6 +1874,12 @@ class TournamentManager:
                 "neg_end_callback": neg_end_cb,
             }
 
+            # negmas runs scenarios in the order given unless runs are
+            # randomized or sorted
+            if ordered:
+                tournament_kwargs["randomize_runs"] = False
+                tournament_kwargs["sort_runs"] = False
+
             # Add storage format if specified
             if config.storage_format is not None:
                 tournament_kwargs["storage_format"] = config.storage_format
@@ -1773,11 +1952,22 @@ class TournamentManager:
             with warnings.catch_warnings():
                 warnings.filterwarnings("ignore", message="invalid value encountered")
                 warnings.filterwarnings("ignore", message="Degrees of freedom")
-                results = cartesian_tournament(**tournament_kwargs)  # type: ignore[arg-type]
+                if config.sharded and names is not None:
+                    results = self._run_sharded(
+                        session_id, config, scenario_paths, names, after_end_cb
+                    )
+                elif result_cache is not None:
+                    results = self._run_with_result_cache(
+                        session_id, config, tournament_kwargs, result_cache
+                    )
+                else:
+                    results = self._cartesian(
+                        session_id, cartesian_tournament, tournament_kwargs
+                    )
 
             # Extract actual competitor/opponent names from results.config
             # These are the standardized names negmas generated, in the same order as we passed the types
-            if results.config:
+            if results is not None and results.config:
                 actual_competitor_names = results.config.get("competitor_names", [])
                 actual_opponent_names = results.config.get("opponent_names", [])
                 if actual_competitor_names:
@@ -1803,7 +1993,7 @@ class TournamentManager:
                     total_negotiations=total_negotiations,
                     storage_path=config.save_path,
                 )
-                state.grid_init = updated_grid_init
+                state.set_grid_init(updated_grid_init)
                 state.event_queue.put(("grid_init", updated_grid_init))
 
             # Check if cancelled
@@ -1842,38 +2032,24 @@ class TournamentManager:
             if results.details is not None and "agreement" in results.details.columns:
                 total_agreements = int(results.details["agreement"].notna().sum())
 
-            # Build negotiation_results from completed_cells
+            # Build negotiation_results from the completed negotiations
             negotiation_results: list[NegotiationResult] = []
-            for cell in state.completed_cells:
-                scenario_name = (
-                    state.scenario_names[cell.scenario_idx]
-                    if cell.scenario_idx < len(state.scenario_names)
-                    else "unknown"
-                )
-                competitor_name = (
-                    state.competitor_names[cell.competitor_idx]
-                    if cell.competitor_idx < len(state.competitor_names)
-                    else "unknown"
-                )
-                opponent_name = (
-                    state.opponent_names[cell.opponent_idx]
-                    if cell.opponent_idx < len(state.opponent_names)
-                    else "unknown"
-                )
-
+            scenario_paths = dict(zip(state.scenario_names, state.scenario_paths))
+            for neg in state.completed_negotiations:
+                end_reason = NegotiationEndReason(neg["result"])
                 neg_result = NegotiationResult(
-                    scenario=scenario_name,
-                    partners=[competitor_name, opponent_name],
-                    agreement=cell.agreement,
-                    utilities=cell.utilities,
+                    scenario=neg["scenario"],
+                    partners=[neg["competitor"], neg["opponent"]],
+                    agreement=tuple(neg["agreement"]) if neg["agreement"] else None,
+                    utilities=neg["utilities"],
                     advantages=None,  # Not tracked in cells
-                    has_error=cell.end_reason
+                    has_error=end_reason
                     in (NegotiationEndReason.ERROR, NegotiationEndReason.BROKEN),
-                    error_details=cell.error,
+                    error_details=neg["error_details"],
                     execution_time=None,  # Not tracked
-                    end_reason=cell.end_reason,
-                    scenario_path=cell.scenario_path,
-                    n_steps=cell.n_steps,
+                    end_reason=end_reason,
+                    scenario_path=scenario_paths.get(neg["scenario"]),
+                    n_steps=neg["n_steps"],
                 )
                 negotiation_results.append(neg_result)
 
@@ -1888,6 +2064,10 @@ class TournamentManager:
                 results_path=str(results.path) if results.path else None,
             )
 
+            # negmas saved the complete results: drop the live segments
+            if state.live_results is not None and not keep_live_results:
+                state.live_results.discard()
+
             # Clean up redundant CSV files if parquet equivalents exist
             if config.save_path and config.storage_format == "parquet":
                 removed = self._cleanup_redundant_csvs(Path(config.save_path))
@@ -1896,6 +2076,12 @@ class TournamentManager:
                         f"[TournamentManager] Cleaned up {len(removed)} redundant CSV files"
                     )
 
+            # Record the tournament's disk usage for storage stats
+            if config.save_path:
+                from .tournament_storage import TournamentStorageService
+
+                TournamentStorageService.record_storage(config.save_path)
+
             state.status = TournamentStatus.COMPLETED
             session.status = TournamentStatus.COMPLETED
             session.end_time = datetime.now()
@@ -1934,6 +2120,398 @@ class TournamentManager:
             session.error = f"{str(e)}\n\nFull traceback written to /tmp/negmas-tournament-error.log"
             session.end_time = datetime.now()
             state.event_queue.put(("error", str(e)))
+        finally:
+            # Keep what finished readable after a cancel or failure
+            if state.live_results is not None:
+                try:
+                    state.live_results.flush()
+                except Exception as e:
+                    print(f"[TournamentManager] Failed to write live results: {e}")
+
+    def _cartesian(
+        self, session_id: str, function: Callable[..., Any], kwargs: dict[str, Any]
+    ) -> Any:
+        """Call (continue_)cartesian_tournament, on the warm pool if leased.
+
+        Parallel runs execute the negotiations, and with them the before-start
+        and after-end callbacks, in the worker pool's processes. These
+        callbacks update this manager's state, so they are relayed back here.
+        With adaptive_njobs the session's ConcurrencyController (kept across
+        the calls of a tournament) chooses how many run at once.
+
+        Returns:
+            What the function returns.
+        """
+        if not self.worker_pool.leased:
+            return function(**kwargs)
+        controller = self._concurrency(session_id)
+        if controller is not None:
+            kwargs = {**kwargs, "njobs": 0}
+        elif kwargs.get("njobs", -1) < 0:
+            return function(**kwargs)
+        with CallbackRelay(_create_mp_queue()) as relay:
+            kwargs = {
+                **kwargs,
+                "before_start_callback": relay.wrap(
+                    kwargs.get("before_start_callback"), prepare=_run_start
+                ),
+                "after_end_callback": relay.wrap(kwargs.get("after_end_callback")),
+            }
+            if controller is None:
+                return function(**kwargs)
+            with self.worker_pool.controlled(controller):
+                return function(**kwargs)
+
+    def _concurrency(self, session_id: str) -> ConcurrencyController | None:
+        """The session's ConcurrencyController (None without adaptive_njobs)."""
+        session = self.sessions.get(session_id)
+        state = self._tournament_states.get(session_id)
+        if session is None or state is None or not session.config.adaptive_njobs:
+            return None
+        if state.concurrency is None:
+            memory_limit = session.config.memory_limit_mb
+
+            def on_change(workers: int, reason: str) -> None:
+                if state.progress is not None:
+                    state.progress = replace(
+                        state.progress, workers=workers, workers_reason=reason
+                    )
+                    state.event_queue.put(("progress", state.progress))
+
+            state.concurrency = ConcurrencyController(
+                self.worker_pool.size,
+                memory_limit=memory_limit * MB if memory_limit else None,
+                on_change=on_change,
+            )
+            print(
+                f"[TournamentManager] Adaptive njobs for {session_id}: up to "
+                f"{self.worker_pool.size} workers"
+            )
+        return state.concurrency
+
+    def run_shard(self, config: TournamentConfig) -> TournamentSession:
+        """Run a batch of a sharded tournament in this thread.
+
+        Live result segments are kept so the coordinator sees every record
+        (see shard_broker). The warm worker pool is not used, as the batch
+        process only lives for one batch.
+
+        Returns:
+            The finished session.
+        """
+        session = self.create_session(config)
+        self._run_tournament_in_background(session.id, keep_live_results=True)
+        return session
+
+    def _run_sharded(
+        self,
+        session_id: str,
+        config: TournamentConfig,
+        scenario_paths: list[str],
+        names: dict[str, list[str]],
+        after_end_callback: Callable[[dict[str, Any]], None],
+    ) -> Any:
+        """Run a tournament as batches of scenarios on shard workers.
+
+        The batches are written to a work queue (see shard_broker) from which
+        `negmas-app worker` processes on any host claim and run them. Records
+        of running batches are read from their live result segments and
+        replayed through the after-end callback, so the grid, leaderboard,
+        progress and live results update as for a tournament run here. When
+        all batches are done their results are merged into the tournament's
+        directory with combine_tournaments.
+
+        The queue is removed once the batches were combined or the tournament
+        was cancelled. Otherwise it is kept with the finished batches, and
+        running the same tournament again requeues its failed batches and
+        continues.
+
+        Returns:
+            The tournament's SimpleTournamentResults, or None if cancelled.
+
+        Raises:
+            RuntimeError: If batches failed on all their attempts or the
+                results could not be combined.
+        """
+        from negmas.helpers.inout import dump, load
+        from negmas.tournaments.neg.simple import SimpleTournamentResults
+
+        from .tournament_storage import TournamentStorageService
+
+        state = self._tournament_states[session_id]
+        path = Path(config.save_path or self.tournaments_dir / session_id)
+        shard_root = Path(config.shard_dir or SHARDS_DIR)
+        shards = ShardQueue.resume(shard_root, config)
+        if shards is not None:
+            print(
+                f"[TournamentManager] Tournament {session_id} continues the "
+                f"kept queue {shards.path}"
+            )
+        else:
+            shards = ShardQueue.create(
+                shard_root / session_id,
+                config,
+                scenario_paths,
+                scenarios_per_batch=config.scenarios_per_shard,
+            )
+        print(
+            f"[TournamentManager] Tournament {session_id} queued for workers: "
+            f"run `negmas-app worker --shard-dir {shards.path.parent}` on each host"
+        )
+        replayed: set[Path] = set()
+
+        def replay() -> None:
+            for segment in shards.segment_paths():
+                if segment in replayed:
+                    continue
+                try:
+                    records = read_segment(segment)
+                except (OSError, ValueError) as e:
+                    print(f"[TournamentManager] Failed to read {segment}: {e}")
+                    continue
+                replayed.add(segment)
+                for record in records:
+                    after_end_callback(record)
+
+        try:
+            while True:
+                replay()
+                if self._cancel_flags.get(session_id, False):
+                    shards.cancel()
+                    remove_shards(shards)
+                    return None
+                shards.requeue_expired()
+                status = shards.status()
+                if not status["pending"] and not status["claimed"]:
+                    break
+                time.sleep(POLL_SECONDS)
+            replay()
+            if status["failed"]:
+                errors = "; ".join(f"{b}: {e}" for b, e in status["errors"].items())
+                raise RuntimeError(f"{status['failed']} batches failed: {errors}")
+
+            # negmas' saved results are complete while the segments of a
+            # batch whose worker died may lack or repeat runs
+            result_paths = shards.result_paths()
+            for result_path in result_paths:
+                shards.set_aside_segments(result_path.name)
+            combined = TournamentStorageService.combine_tournaments(
+                input_paths=[str(p) for p in result_paths],
+                output_path=str(path),
+                recursive=False,
+                copy=True,
+            )
+            if not combined.success:
+                raise RuntimeError(f"Failed to combine batches: {combined.error}")
+        except Exception as e:
+            raise RuntimeError(
+                f"{e}. The queue and the finished batches are kept in "
+                f"{shards.path}: run the tournament again to retry the failed "
+                "batches and continue"
+            ) from e
+        remove_shards(shards)
+
+        # Present the merged batches as the configured tournament (the
+        # combine's record of its sources is gone with the queue)
+        tournament_config = {
+            key: value
+            for key, value in load(path / "config.yaml").items()
+            if key not in _COMBINE_KEYS
+        }
+        tournament_config.update(
+            self._build_config_for_display(
+                config,
+                state.scenario_names,
+                names["competitor_names"],
+                names["opponent_names"] or names["competitor_names"],
+            ),
+            n_batches=len(result_paths),
+        )
+        dump(tournament_config, path / "config.yaml")
+        (path / "metadata.yaml").unlink(missing_ok=True)
+        return SimpleTournamentResults.load(
+            path, must_have_details=False, memory_optimization="balanced"
+        )
+
+    def _run_with_result_cache(
+        self,
+        session_id: str,
+        config: TournamentConfig,
+        tournament_kwargs: dict[str, Any],
+        cache: TournamentResultCache,
+    ) -> Any:
+        """Run a tournament reusing cached runs and cache its new runs.
+
+        Cached records are replayed through the after-end callback so the grid,
+        leaderboard and live results include them. Missing cells run as
+        cartesian sub-tournaments into the tournament's directory, and the
+        results of all records are then computed and saved as negmas would.
+        Without cache hits (or when negmas continues an existing directory)
+        the tournament runs normally.
+
+        Returns:
+            The tournament's SimpleTournamentResults.
+        """
+        from negmas.helpers.inout import dump
+        from negmas.tournaments.neg import cartesian_tournament
+        from negmas.tournaments.neg.simple import SimpleTournamentResults
+
+        from .deletion_queue import DeletionQueue
+
+        path = Path(config.save_path or "")
+        after_end_callback = tournament_kwargs["after_end_callback"]
+        new_records: list[dict[str, Any]] = []
+
+        def collect(
+            record: dict[str, Any], run_config: dict[str, Any] | None = None
+        ) -> None:
+            new_records.append(record)
+            after_end_callback(record, run_config)
+
+        kwargs = {**tournament_kwargs, "after_end_callback": collect}
+        existing = path.exists() and any(
+            p.name != LIVE_RESULTS_DIR and not p.name.startswith(".")
+            for p in path.iterdir()
+        )
+        plan = None
+        if not existing or config.path_exists == "overwrite":
+            plan = cache.plan()
+        if plan is None or not plan.cached:
+            results = self._cartesian(session_id, cartesian_tournament, kwargs)
+            n_stored = cache.store(new_records)
+            print(f"[TournamentManager] Stored {n_stored} runs in the result cache")
+            return results
+
+        print(
+            f"[TournamentManager] Reusing {len(plan.cached)} of {plan.n_runs} runs "
+            f"from the result cache ({len(plan.parts)} sub-tournaments to run)"
+        )
+        if existing:
+            DeletionQueue.delete([path])
+        path.mkdir(parents=True, exist_ok=True)
+
+        names = {
+            "competitor_names": cache.competitor_names,
+            "opponent_names": cache.opponent_names,
+        }
+        for record in plan.cached:
+            after_end_callback(record, names)
+        # Cached runs took no time: estimate the remaining time from new runs
+        state = self._tournament_states.get(session_id)
+        if state is not None and state.eta is not None:
+            state.eta.restart()
+
+        scenarios = tournament_kwargs["scenarios"]
+        first_types = tournament_kwargs["competitors"]
+        first_params = tournament_kwargs.get("competitor_params") or [
+            {} for _ in first_types
+        ]
+        if cache.explicit_opponents:
+            second_types = tournament_kwargs["opponents"]
+            second_params = tournament_kwargs.get("opponent_params") or [
+                {} for _ in second_types
+            ]
+        else:
+            second_types, second_params = first_types, first_params
+        part_config: dict[str, Any] = {}
+        for part in plan.parts:
+            if self._cancel_flags.get(session_id, False):
+                break
+            part_results = self._cartesian(
+                session_id,
+                cartesian_tournament,
+                {
+                    **kwargs,
+                    "competitors": [first_types[i] for i in part.competitors],
+                    "competitor_params": [first_params[i] for i in part.competitors],
+                    "competitor_names": [
+                        cache.competitor_names[i] for i in part.competitors
+                    ],
+                    "opponents": [second_types[i] for i in part.opponents],
+                    "opponent_params": [second_params[i] for i in part.opponents],
+                    "opponent_names": [cache.second_names[i] for i in part.opponents],
+                    "scenarios": [scenarios[i] for i in part.scenarios],
+                    # Pairs are already filtered by the plan
+                    "self_play": True,
+                    "path_exists": "continue",
+                },
+            )
+            part_config = dict(part_results.config or {})
+
+        n_stored = cache.store(new_records)
+        print(f"[TournamentManager] Stored {n_stored} runs in the result cache")
+        for record in new_records:
+            record["scored_indices"] = cache.scored_indices(
+                list(record.get("partners") or [])
+            )
+
+        # The whole tournament's config (parts saved their own)
+        tournament_config = {
+            **self._build_config_for_display(
+                config,
+                cache.scenario_names,
+                cache.competitor_names,
+                cache.opponent_names,
+            ),
+            **part_config,
+            "n_scenarios": len(scenarios),
+            "n_competitors": len(first_types),
+            "competitors": [name for name, _ in cache.first],
+            "competitor_names": cache.competitor_names,
+            "competitor_params": first_params,
+            "competitor_type_map": dict(
+                zip(cache.competitor_names, [name for name, _ in cache.first])
+            ),
+            "opponents": (
+                [name for name, _ in cache.second] if cache.explicit_opponents else []
+            ),
+            "n_opponents": len(cache.opponent_names),
+            "opponent_names": cache.opponent_names,
+            "opponent_params": second_params if cache.explicit_opponents else [],
+            "opponent_type_map": (
+                dict(zip(cache.opponent_names, [name for name, _ in cache.second]))
+                if cache.explicit_opponents
+                else {}
+            ),
+            "self_play": config.self_play,
+            "path": str(path),
+        }
+        results = SimpleTournamentResults.from_records(
+            config=tournament_config,
+            results=plan.cached + new_records,
+            final_score_stat=(config.final_score_metric, config.final_score_stat),
+            path=path,
+        )
+        if self._cancel_flags.get(session_id, False):
+            return results
+
+        # Same default format as cartesian_tournament
+        storage_format = config.storage_format or {
+            "speed": "csv",
+            "balanced": "gzip",
+        }.get(config.storage_optimization, "parquet")
+        results.save(
+            path,
+            storage_optimization=config.storage_optimization,
+            storage_format=storage_format,  # type: ignore[arg-type]
+        )
+        dump(tournament_config, path / "config.yaml")
+        # Scenarios whose runs all came from the cache
+        for name, scenario in zip(cache.scenario_names, scenarios):
+            scenario_path = path / "scenarios" / name
+            if scenario_path.exists():
+                continue
+            try:
+                scenario.dumpas(
+                    scenario_path,
+                    type="yml",
+                    compact=False,
+                    save_stats=config.save_stats,
+                    save_info=True,
+                )
+            except Exception as e:
+                print(f"[TournamentManager] Failed to save scenario {name}: {e}")
+        return results
 
     async def run_tournament_stream(
         self,
@@ -1942,6 +2520,7 @@ class TournamentManager:
         TournamentProgress
         | TournamentSession
         | TournamentGridInit
+        | TournamentGridSnapshot
         | CellUpdate
         | list[LeaderboardEntry]
         | dict[str, Any],
@@ -1957,6 +2536,7 @@ class TournamentManager:
 
         Yields:
             - TournamentGridInit: Initial grid structure
+            - TournamentGridSnapshot: All runs so far (on reconnect)
             - CellUpdate: Cell status updates (running/complete)
             - list[LeaderboardEntry]: Leaderboard updates
             - TournamentProgress: Progress updates
@@ -1973,8 +2553,8 @@ class TournamentManager:
         if thread is None or not thread.is_alive():
             # Start the tournament in a background thread
             thread = threading.Thread(
-                target=self._run_tournament_in_background,
-                args=(session_id,),
+                target=self.worker_pool.call,
+                args=(self._run_tournament_in_background, session_id),
                 daemon=True,
             )
             self._background_threads[session_id] = thread
@@ -1983,8 +2563,9 @@ class TournamentManager:
             # Tournament already running - send current state first
             if state.grid_init:
                 yield state.grid_init
-            for cell in state.completed_cells:
-                yield cell
+            if state.grid is not None:
+                # The whole grid in one message instead of one per run
+                yield state.grid.snapshot()
             if state.leaderboard:
                 yield state.leaderboard
             if state.progress:
@@ -2027,6 +2608,8 @@ class TournamentManager:
                     yield event_data
                 elif event_type == "run_complete":
                     yield event_data
+                elif event_type == "grid_snapshot":
+                    yield event_data
                 elif event_type == "leaderboard":
                     yield event_data
                 elif event_type == "progress":
@@ -2062,6 +2645,8 @@ class TournamentManager:
         Returns:
             Completed TournamentSession.
         """
+        from negmas.tournaments.neg import cartesian_tournament
+
         session = self.sessions.get(session_id)
         if session is None or session.config is None:
             raise ValueError(f"Session not found: {session_id}")
@@ -2119,6 +2704,15 @@ class TournamentManager:
                     session.error = "At least 2 competitors required when no opponents"
                     return session
 
+            # Start the scenarios predicted to take longest first
+            ordered = False
+            if config.order_runs_by_cost:
+                costs, ordered = await asyncio.to_thread(
+                    self._scenario_costs, config, scenarios, competitors, opponents
+                )
+                if ordered:
+                    scenarios = [scenarios[i] for i in longest_first(costs)]
+
             mechanism_class = self._get_mechanism_class(config.mechanism_type)
 
             tournament_kwargs: dict[str, Any] = {
@@ -2146,6 +2740,9 @@ class TournamentManager:
                 "verbosity": config.verbosity,
                 "path": Path(config.save_path) if config.save_path else None,
             }
+            if ordered:
+                tournament_kwargs["randomize_runs"] = False
+                tournament_kwargs["sort_runs"] = False
 
             if opponents is not None:
                 tournament_kwargs["opponents"] = opponents
@@ -2174,6 +2771,7 @@ class TournamentManager:
                 tournament_kwargs["pend_per_second"] = config.pend_per_second
 
             results = await asyncio.to_thread(
+                self.worker_pool.call,
                 cartesian_tournament,
                 **tournament_kwargs,  # type: ignore[arg-type]
             )
@@ -2227,6 +2825,12 @@ class TournamentManager:
                         f"[TournamentManager] Cleaned up {len(removed)} redundant CSV files"
                     )
 
+            # Record the tournament's disk usage for storage stats
+            if config.save_path:
+                from .tournament_storage import TournamentStorageService
+
+                TournamentStorageService.record_storage(config.save_path)
+
             session.status = TournamentStatus.COMPLETED
             session.end_time = datetime.now()
 
@@ -5,19 +5,28 @@ import csv
 import json
 import logging
 import math
+import os
 import shutil
 import warnings
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 import yaml
 
 from negmas.mechanisms import CompletedRun
-from negmas.tournaments.neg import SimpleTournamentResults
-from negmas.tournaments.neg import combine_tournaments as negmas_combine_tournaments
+
+from . import live_results
+from .deletion_queue import DeletionQueue
+from .scenario_stats_store import ScenarioStatsStore
+from .storage_ledger import StorageLedger, format_size
+
+if TYPE_CHECKING:
+    # negmas.tournaments pulls in scikit-learn; it is imported where used
+    from negmas.tournaments.neg import SimpleTournamentResults
 
 logger = logging.getLogger(__name__)
 
@@ -137,7 +146,9 @@ class TournamentStorageService:
     TOURNAMENTS_DIR = Path.home() / "negmas" / "app" / "tournaments"
 
     # Cache for loaded tournament results (path -> SimpleTournamentResults)
-    _results_cache: dict[str, SimpleTournamentResults] = {}
+    _results_cache: dict[str, "SimpleTournamentResults"] = {}
+    # Results of running tournaments (path -> (n_segments, results))
+    _live_results_cache: dict[str, tuple[int, "SimpleTournamentResults"]] = {}
 
     @staticmethod
     def _parse_python_list_string(s: str) -> list[str] | None:
@@ -248,7 +259,7 @@ class TournamentStorageService:
         return obj
 
     @classmethod
-    def _load_results(cls, path: Path) -> SimpleTournamentResults | None:
+    def _load_results(cls, path: Path) -> "SimpleTournamentResults | None":
         """Load tournament results using SimpleTournamentResults.load().
 
         This handles all storage formats (csv, gzip, parquet) automatically.
@@ -259,6 +270,13 @@ class TournamentStorageService:
         Returns:
             SimpleTournamentResults or None if loading fails.
         """
+        from negmas.tournaments.neg import SimpleTournamentResults
+
+        # Running (or interrupted) tournaments: read their live segments
+        segments = live_results.segment_paths(path)
+        if segments:
+            return cls._load_live_results(path, len(segments))
+
         path_str = str(path)
         if path_str in cls._results_cache:
             return cls._results_cache[path_str]
@@ -281,6 +299,40 @@ class TournamentStorageService:
             logger.error(f"Error loading tournament results from {path}: {e}")
             return None
 
+    @classmethod
+    def _load_live_results(
+        cls, path: Path, n_segments: int
+    ) -> "SimpleTournamentResults | None":
+        """Build results from the live segments of a running tournament.
+
+        Cached until another segment is written.
+        """
+        from negmas.tournaments.neg import SimpleTournamentResults
+
+        path_str = str(path)
+        cached = cls._live_results_cache.get(path_str)
+        if cached is not None and cached[0] == n_segments:
+            return cached[1]
+        try:
+            records = live_results.read_records(path)
+            if not records:
+                return None
+            config_file = path / "config.yaml"
+            config = (
+                yaml.safe_load(config_file.read_text()) if config_file.exists() else {}
+            )
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore", message="invalid value encountered")
+                warnings.filterwarnings("ignore", message="Degrees of freedom")
+                results = SimpleTournamentResults.from_records(
+                    config=config or {}, results=pd.DataFrame(records), path=path
+                )
+        except Exception as e:
+            logger.error(f"Error loading live results from {path}: {e}")
+            return None
+        cls._live_results_cache[path_str] = (n_segments, results)
+        return results
+
     @classmethod
     def clear_cache(cls, tournament_id: str | None = None) -> None:
         """Clear the results cache.
@@ -292,20 +344,26 @@ class TournamentStorageService:
         if tournament_id:
             path_str = str(cls.TOURNAMENTS_DIR / tournament_id)
             cls._results_cache.pop(path_str, None)
+            cls._live_results_cache.pop(path_str, None)
         else:
             cls._results_cache.clear()
+            cls._live_results_cache.clear()
 
     @classmethod
     def _check_tournament_files_exist(cls, path: Path) -> bool:
         """Check if a directory contains tournament files.
 
         Checks for config.yaml (incomplete/continuable tournaments),
-        scores.csv (complete), or any format of details/all_scores.
+        scores.csv (complete), live result segments (running) or any format
+        of details/all_scores.
         """
         # config.yaml indicates a tournament that can be continued
         if (path / "config.yaml").exists():
             return True
 
+        if (path / live_results.LIVE_RESULTS_DIR).exists():
+            return True
+
         # scores.csv is present for completed tournaments
         if (path / "scores.csv").exists():
             return True
@@ -318,6 +376,26 @@ class TournamentStorageService:
 
         return False
 
+    @classmethod
+    def record_storage(cls, path: str | Path, background: bool = True) -> None:
+        """Update the storage ledger entry of a saved tournament.
+
+        Args:
+            path: Tournament directory (ignored unless in TOURNAMENTS_DIR).
+            background: Measure the directory on a background thread.
+        """
+        path = Path(path)
+        if path.parent.resolve() != cls.TOURNAMENTS_DIR.resolve():
+            return
+        if background:
+            StorageLedger.record_in_background(
+                cls.TOURNAMENTS_DIR, path.name, cls._check_tournament_files_exist
+            )
+        else:
+            StorageLedger.record(
+                cls.TOURNAMENTS_DIR, path.name, cls._check_tournament_files_exist
+            )
+
     @classmethod
     def list_saved_tournaments(
         cls, archived: bool | None = None, tags: list[str] | None = None
@@ -1691,6 +1769,11 @@ class TournamentStorageService:
             if stats_yaml.exists():
                 with open(stats_yaml, "r") as f:
                     stats = yaml.safe_load(f)
+                # Split format: the frontier lives in a binary sidecar
+                if isinstance(stats, dict) and not stats.get("pareto_utils"):
+                    pareto_utils = ScenarioStatsStore.load_pareto_utils(scenario_dir)
+                    if pareto_utils is not None:
+                        stats["pareto_utils"] = pareto_utils.tolist()
             elif stats_json.exists():
                 with open(stats_json, "r") as f:
                     stats = json.load(f)
@@ -1959,12 +2042,13 @@ class TournamentStorageService:
         if not path.exists():
             return False
 
-        try:
-            shutil.rmtree(path)
-            return True
-        except Exception as e:
-            logger.info(f"Error deleting tournament {tournament_id}: {e}")
+        # Instant rename; the files are deleted in the background
+        job = DeletionQueue.delete([path], label=f"tournament {tournament_id}")
+        if job.errors:
+            logger.info(f"Error deleting tournament {tournament_id}: {job.errors[0]}")
             return False
+        StorageLedger.forget(cls.TOURNAMENTS_DIR, tournament_id)
+        return True
 
     @classmethod
     def _get_metadata_path(cls, tournament_id: str) -> Path:
@@ -2252,8 +2336,6 @@ class TournamentStorageService:
         Returns:
             Dict with outcome_space_data in the format expected by the UI, or None.
         """
-        from negmas import Scenario
-
         from .outcome_analysis import compute_outcome_space_data
 
         path = cls.TOURNAMENTS_DIR / tournament_id
@@ -2263,8 +2345,8 @@ class TournamentStorageService:
             return None
 
         try:
-            # Load the scenario using negmas - this gives us ufuns and outcome_space
-            scenario = Scenario.load(scenario_dir, load_stats=True, load_info=True)
+            # Load the scenario with its stats (Pareto frontier from the sidecars)
+            scenario = ScenarioStatsStore.load_scenario(scenario_dir)
 
             # Compute outcome space data
             osd = compute_outcome_space_data(
@@ -2750,9 +2832,7 @@ class TournamentStorageService:
 
         if scenario_dir.exists():
             try:
-                from negmas import Scenario
-
-                scenario = Scenario.load(scenario_dir, load_stats=True, load_info=True)
+                scenario = ScenarioStatsStore.load_scenario(scenario_dir)
                 if scenario:
                     ufuns = list(scenario.ufuns) if scenario.ufuns else []
 
@@ -3241,6 +3321,7 @@ class TournamentStorageService:
 
             # Clear any cache for this tournament
             cls.clear_cache(output_id)
+            cls.record_storage(dest)
 
             return ImportResult(
                 success=True,
@@ -3376,6 +3457,34 @@ class TournamentStorageService:
 
         return paths_remapped
 
+    @classmethod
+    def _collect_tournament_paths(
+        cls,
+        tournament_ids: list[str] | None = None,
+        input_paths: list[str] | None = None,
+        recursive: bool = True,
+    ) -> list[Path]:
+        """Tournament directories selected by IDs and/or searched paths.
+
+        Returns:
+            Unique tournament directories, IDs first, in search order.
+        """
+        from .tournament_combiner import discover
+
+        paths = [cls.TOURNAMENTS_DIR / tid for tid in tournament_ids or []]
+        found = discover(paths, recursive=False)
+        found += discover(
+            [p for p in input_paths or [] if Path(p).is_dir()], recursive=recursive
+        )
+        seen: set[str] = set()
+        unique_paths: list[Path] = []
+        for p in found:
+            ps = str(p.absolute())
+            if ps not in seen:
+                seen.add(ps)
+                unique_paths.append(p)
+        return unique_paths
+
     @classmethod
     def preview_combine_tournaments(
         cls,
@@ -3400,48 +3509,15 @@ class TournamentStorageService:
             CombinePreview with analysis of the combination.
         """
         try:
-            # Collect tournament paths
-            paths_to_combine: list[Path] = []
-
-            # Mode 1: Combine by tournament IDs
-            if tournament_ids:
-                for tid in tournament_ids:
-                    tpath = cls.TOURNAMENTS_DIR / tid
-                    if tpath.exists() and cls._check_tournament_files_exist(tpath):
-                        paths_to_combine.append(tpath)
-
-            # Mode 2: Combine by filesystem paths
-            if input_paths:
-                for input_path in input_paths:
-                    p = Path(input_path)
-                    if not p.exists():
-                        continue
-                    if p.is_file():
-                        continue
-                    if cls._check_tournament_files_exist(p):
-                        paths_to_combine.append(p)
-                    elif recursive:
-                        for child in p.rglob("*"):
-                            if child.is_dir() and cls._check_tournament_files_exist(
-                                child
-                            ):
-                                paths_to_combine.append(child)
-
-            if not paths_to_combine:
+            unique_paths = cls._collect_tournament_paths(
+                tournament_ids, input_paths, recursive
+            )
+            if not unique_paths:
                 return CombinePreview(
                     valid=False,
                     error="No valid tournament directories found",
                 )
 
-            # Remove duplicates
-            seen: set[str] = set()
-            unique_paths: list[Path] = []
-            for p in paths_to_combine:
-                ps = str(p.absolute())
-                if ps not in seen:
-                    seen.add(ps)
-                    unique_paths.append(p)
-
             # Analyze each tournament
             source_tournaments: list[dict] = []
             all_competitors: dict[str, CompetitorInfo] = {}  # short_name -> info
@@ -3706,6 +3782,7 @@ class TournamentStorageService:
         recursive: bool = True,
         metadata: dict[str, Any] | None = None,
         copy: bool = False,
+        progress: Callable[[dict[str, Any]], None] | None = None,
     ) -> CombineResult:
         """Combine multiple tournaments into a single result.
 
@@ -3713,6 +3790,11 @@ class TournamentStorageService:
         1. Combine by tournament IDs (from saved tournaments table)
         2. Combine by filesystem paths (recursively finds all tournaments)
 
+        Sources are read in parallel and the merged results are written as
+        parquet (see TournamentCombiner). Only complete tournaments (with
+        details, all_scores and scores) and running ones (from their live
+        result segments) are combined.
+
         Args:
             tournament_ids: List of tournament IDs from saved tournaments
             input_paths: List of filesystem paths to search for tournaments
@@ -3720,58 +3802,30 @@ class TournamentStorageService:
             output_path: Custom output path (if None, saves to tournaments dir)
             recursive: If True, recursively search input_paths for tournaments
             metadata: Additional metadata to save in config.yaml
-            copy: If True, copy scenarios and runs from source tournaments so the
-                combined tournament can be displayed like a normal tournament
+            copy: If True, hardlink scenarios and runs from source tournaments
+                (copying across filesystems) so the combined tournament can be
+                displayed like a normal tournament
+            progress: Called with progress events while combining
 
         Returns:
             CombineResult with success status, output location, and statistics.
         """
+        from .tournament_combiner import TournamentCombiner, is_complete
+
         try:
-            # Collect tournament paths
-            paths_to_combine: list[Path] = []
-
-            # Mode 1: Combine by tournament IDs
-            if tournament_ids:
-                for tid in tournament_ids:
-                    tpath = cls.TOURNAMENTS_DIR / tid
-                    if tpath.exists() and cls._check_tournament_files_exist(tpath):
-                        paths_to_combine.append(tpath)
-
-            # Mode 2: Combine by filesystem paths
-            if input_paths:
-                for input_path in input_paths:
-                    p = Path(input_path)
-                    if not p.exists():
-                        continue
-                    if p.is_file():
-                        # Skip files
-                        continue
-                    # Check if it's a tournament directory itself
-                    if cls._check_tournament_files_exist(p):
-                        paths_to_combine.append(p)
-                    elif recursive:
-                        # Recursively find tournaments
-                        for child in p.rglob("*"):
-                            if child.is_dir() and cls._check_tournament_files_exist(
-                                child
-                            ):
-                                paths_to_combine.append(child)
+            discovered = cls._collect_tournament_paths(
+                tournament_ids, input_paths, recursive
+            )
+            # Only tournaments with details, all_scores and scores (or live
+            # result segments while running) can be merged
+            unique_paths = [p for p in discovered if is_complete(set(os.listdir(p)))]
 
-            if not paths_to_combine:
+            if not unique_paths:
                 return CombineResult(
                     success=False,
                     error="No valid tournament directories found",
                 )
 
-            # Remove duplicates while preserving order
-            seen: set[str] = set()
-            unique_paths: list[Path] = []
-            for p in paths_to_combine:
-                ps = str(p.absolute())
-                if ps not in seen:
-                    seen.add(ps)
-                    unique_paths.append(p)
-
             # Generate output path
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             if output_name:
@@ -3788,51 +3842,17 @@ class TournamentStorageService:
             else:
                 final_output_path = cls.TOURNAMENTS_DIR / output_id
 
-            # Use negmas combine_tournaments function which handles copy
-            combined_results = negmas_combine_tournaments(
+            combined = TournamentCombiner.combine(
                 unique_paths,
-                dst=final_output_path,
-                recursive=False,  # We already did the recursion
-                recalc_details=False,
-                recalc_scores=False,
-                must_have_details=True,
-                verbosity=0,
-                add_tournament_column=True,
-                complete_only=True,
+                final_output_path,
                 copy=copy,
+                progress=progress,
             )
 
-            if combined_results is None:
-                return CombineResult(
-                    success=False,
-                    error="Failed to combine tournaments - no valid results found",
-                )
-
-            # Get loaded paths from the combined results
-            loaded_paths = unique_paths  # All paths we attempted to combine
-
-            # Compute statistics from the combined results
-            details_df = combined_results.details
-            n_negotiations = len(details_df) if details_df is not None else 0
-            n_scenarios = 0
-            n_competitors = 0
-
-            if details_df is not None and len(details_df) > 0:
-                if "scenario" in details_df.columns:
-                    n_scenarios = int(details_df["scenario"].nunique())
-                if "partners" in details_df.columns:
-                    all_partners: set[str] = set()
-                    for partners_val in details_df["partners"].dropna():
-                        if isinstance(partners_val, (list, tuple)):
-                            all_partners.update(partners_val)
-                        elif isinstance(partners_val, str):
-                            try:
-                                parsed = ast.literal_eval(partners_val)
-                                if isinstance(parsed, (list, tuple)):
-                                    all_partners.update(parsed)
-                            except (ValueError, SyntaxError):
-                                pass
-                    n_competitors = len(all_partners)
+            loaded_paths = combined.loaded_paths
+            n_negotiations = combined.n_negotiations
+            n_scenarios = len(combined.scenarios)
+            n_competitors = len(combined.competitors)
 
             # Save config with metadata
             config: dict[str, Any] = {
@@ -3846,15 +3866,15 @@ class TournamentStorageService:
             }
 
             # Add metadata from original tournaments if available
-            if combined_results.config:
-                config["competitor_types"] = combined_results.config.get(
+            if combined.config:
+                config["competitor_types"] = combined.config.get(
                     "competitor_types", []
                 )
-                config["competitor_names"] = combined_results.config.get(
+                config["competitor_names"] = combined.config.get(
                     "competitor_names", []
                 )
-                config["opponent_types"] = combined_results.config.get("opponent_types")
-                config["opponent_names"] = combined_results.config.get("opponent_names")
+                config["opponent_types"] = combined.config.get("opponent_types")
+                config["opponent_names"] = combined.config.get("opponent_names")
 
             # Add custom metadata
             if metadata:
@@ -3899,6 +3919,8 @@ class TournamentStorageService:
                 "total_competitors": n_competitors,
                 "source_tournaments": source_tournaments_info,
             }
+            if combined.artifacts:
+                metadata_yaml["artifacts"] = combined.artifacts
 
             # Add custom metadata
             if metadata:
@@ -3909,6 +3931,7 @@ class TournamentStorageService:
 
             # Clear cache for the new tournament
             cls.clear_cache(output_id)
+            cls.record_storage(final_output_path)
 
             return CombineResult(
                 success=True,
@@ -3949,32 +3972,12 @@ class TournamentStorageService:
             List of dicts with tournament info (path, id, n_negotiations, etc.)
         """
         found: list[dict] = []
-        seen: set[str] = set()
-
-        for input_path in paths:
-            p = Path(input_path)
-            if not p.exists():
-                continue
-
-            # Check if it's a tournament directory itself
-            if cls._check_tournament_files_exist(p):
-                ps = str(p.absolute())
-                if ps not in seen:
-                    seen.add(ps)
-                    summary = cls._load_tournament_summary(p)
-                    if summary:
-                        found.append(summary)
-
-            elif recursive and p.is_dir():
-                # Recursively find tournaments
-                for child in p.rglob("*"):
-                    if child.is_dir():
-                        cs = str(child.absolute())
-                        if cs not in seen and cls._check_tournament_files_exist(child):
-                            seen.add(cs)
-                            summary = cls._load_tournament_summary(child)
-                            if summary:
-                                found.append(summary)
+        for path in cls._collect_tournament_paths(
+            input_paths=paths, recursive=recursive
+        ):
+            summary = cls._load_tournament_summary(path)
+            if summary:
+                found.append(summary)
 
         return found
 
@@ -4074,78 +4077,41 @@ class TournamentStorageService:
             except Exception as e:
                 stats["errors"].append({"path": str(path), "error": str(e)})
 
+            cls.record_storage(path, background=False)
+
         return stats
 
     @classmethod
-    def get_storage_stats(cls) -> dict[str, Any]:
+    def get_storage_stats(cls, refresh: bool = False) -> dict[str, Any]:
         """Get storage statistics for all tournaments.
 
+        Statistics are read from the storage ledger. Tournaments that are new
+        or changed since they were recorded are rescanned by a background job
+        (and counted in "pending" until then).
+
+        Args:
+            refresh: Rescan new or changed tournaments before answering.
+
         Returns:
             Dict with total size, number of tournaments, and breakdown by file type.
         """
-        stats: dict[str, Any] = {
-            "total_tournaments": 0,
-            "total_size_bytes": 0,
-            "total_size_human": "",
-            "file_breakdown": {},
-            "redundant_files": {
-                "count": 0,
-                "size_bytes": 0,
-            },
-        }
-
-        if not cls.TOURNAMENTS_DIR.exists():
-            return stats
-
-        for path in cls.TOURNAMENTS_DIR.iterdir():
-            if not path.is_dir():
-                continue
-
-            if not cls._check_tournament_files_exist(path):
-                continue
-
-            stats["total_tournaments"] += 1
-
-            # Analyze files
-            for file in path.rglob("*"):
-                if file.is_file():
-                    try:
-                        size = file.stat().st_size
-                        stats["total_size_bytes"] += size
-
-                        # Track by extension
-                        ext = file.suffix or "no_extension"
-                        if ext not in stats["file_breakdown"]:
-                            stats["file_breakdown"][ext] = {"count": 0, "size_bytes": 0}
-                        stats["file_breakdown"][ext]["count"] += 1
-                        stats["file_breakdown"][ext]["size_bytes"] += size
-
-                        # Check for redundant files
-                        if file.name in ["all_scores.csv", "details.csv"]:
-                            parquet_equiv = file.with_suffix(".parquet")
-                            if parquet_equiv.exists():
-                                stats["redundant_files"]["count"] += 1
-                                stats["redundant_files"]["size_bytes"] += size
-                        elif file.name.endswith(".csv.gz"):
-                            base = file.name.replace(".csv.gz", "")
-                            if base in ["all_scores", "details"]:
-                                parquet_equiv = file.parent / f"{base}.parquet"
-                                if parquet_equiv.exists():
-                                    stats["redundant_files"]["count"] += 1
-                                    stats["redundant_files"]["size_bytes"] += size
-
-                    except Exception:
-                        pass
-
-        # Human readable size
-        size_bytes = stats["total_size_bytes"]
-        if size_bytes < 1024:
-            stats["total_size_human"] = f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            stats["total_size_human"] = f"{size_bytes / 1024:.1f} KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            stats["total_size_human"] = f"{size_bytes / (1024 * 1024):.1f} MB"
-        else:
-            stats["total_size_human"] = f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+        root = cls.TOURNAMENTS_DIR
+        rescan, gone = StorageLedger.stale(root)
+        if refresh:
+            StorageLedger.reconcile(root, cls._check_tournament_files_exist)
+            rescan = []
+        elif rescan or gone:
+            StorageLedger.reconcile_in_background(
+                root, cls._check_tournament_files_exist
+            )
 
-        return stats
+        summary = StorageLedger.summary(root)
+        return {
+            "total_tournaments": summary["count"],
+            "total_size_bytes": summary["total_size_bytes"],
+            "total_size_human": format_size(summary["total_size_bytes"]),
+            "file_breakdown": summary["file_breakdown"],
+            "redundant_files": summary["redundant_files"],
+            "pending": len(rescan),
+            "reconciling": StorageLedger.is_reconciling(root),
+        }
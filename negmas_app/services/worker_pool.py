@@ -0,0 +1,525 @@
+"""Long-lived pool of warm processes running tournament negotiations.
+
+negmas runs the negotiations of a parallel (or timed) tournament in a
+``pebble.ProcessPool`` it creates for every ``cartesian_tournament`` call.
+Each new pool starts fresh processes that import negmas, the Genius, negolog
+and LLM negotiator packages and unpickle the scenarios again before the first
+negotiation can run, which takes tens of seconds for big configurations.
+
+``WorkerPool`` keeps one pool alive instead, started by the first tournament.
+Its processes import the negotiator libraries once when they start, and are
+replaced after ``tournament_worker_max_tasks`` negotiations to bound leaks.
+Code running inside ``WorkerPool.lease()`` has negmas' per-call pools routed
+to the warm pool: while any lease is active ``pebble.ProcessPool`` is
+replaced by a subclass that hands out a ``_Lease`` there, which limits the
+call to the number of workers negmas asked for (the tournament's njobs) while
+sharing the processes with other tournaments. Callbacks that must run in
+this process are wrapped with a ``CallbackRelay``. Inside
+``WorkerPool.controlled()`` a ``ConcurrencyController`` sets that limit
+instead, from the resources the negotiations measured in the workers.
+
+Scenarios are sent to workers by reference during a lease (a ``copyreg``
+reducer registered while leases are active). Each scenario is pickled once
+into a spool file, negotiation payloads only name that file, and
+every worker keeps the scenarios it read in a small cache. Workers still
+unpickle a fresh copy per negotiation, as negotiations may change them.
+"""
+
+import importlib
+import multiprocessing
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Iterator
+from concurrent.futures import CancelledError, Future
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable
+
+from .concurrency_controller import ConcurrencyController, measured
+from .settings_service import SettingsService
+
+# Imported by every worker when it starts, with the negotiator source they
+# belong to (skipped when the source is disabled). Optional packages that are
+# not installed (or fail to import) are skipped.
+PRELOAD_MODULES = (
+    (None, "negmas.sao"),
+    (None, "negmas.gb"),
+    (None, "negmas.tournaments.neg.simple.cartesian"),
+    ("genius", "negmas.genius"),
+    ("genius-reimplemented", "negmas_genius_agents"),
+    ("negolog", "negmas_negolog"),
+    ("llm", "negmas_llm"),
+    # Callbacks relayed from workers refer to it
+    (None, "negmas_app.services.tournament_manager"),
+)
+
+# Pickled scenarios each worker keeps
+SCENARIO_CACHE_SIZE = 32
+
+_local = threading.local()
+_install_lock = threading.Lock()
+# Leases active in this process: pebble and pickling are patched while > 0
+_active_leases = 0
+# pebble's own ProcessPool
+_pebble_pool: Any = None
+
+# Pickled scenarios read by this (worker) process, by spool file
+_scenario_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+
+def _warm_up(modules: tuple[str, ...]) -> None:
+    """Pool initializer: import the negotiator libraries once per process."""
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass
+
+
+def _ready() -> int:
+    return os.getpid()
+
+
+def _load_scenario(path: str) -> Any:
+    """Unpickle a spooled scenario, reading each spool file once per worker."""
+    import cloudpickle
+
+    data = _scenario_cache.get(path)
+    if data is None:
+        data = Path(path).read_bytes()
+        _scenario_cache[path] = data
+        while len(_scenario_cache) > SCENARIO_CACHE_SIZE:
+            _scenario_cache.popitem(last=False)
+    else:
+        _scenario_cache.move_to_end(path)
+    return cloudpickle.loads(data)
+
+
+class _ScenarioSpool:
+    """Pickled scenarios of a lease, written once and shared by all workers."""
+
+    def __init__(self) -> None:
+        self.directory = Path(tempfile.mkdtemp(prefix="negmas-app-scenarios-"))
+        self.writing = False
+        # id -> (scenario, spool file); the scenario is kept so its id is not
+        # reused while the lease is active
+        self._paths: dict[int, tuple[Any, str]] = {}
+
+    def path(self, scenario: Any) -> str:
+        import cloudpickle
+
+        entry = self._paths.get(id(scenario))
+        if entry is None:
+            path = self.directory / f"{len(self._paths):06d}.pkl"
+            self.writing = True
+            try:
+                path.write_bytes(cloudpickle.dumps(scenario))
+            finally:
+                self.writing = False
+            entry = self._paths[id(scenario)] = (scenario, str(path))
+        return entry[1]
+
+    def remove(self) -> None:
+        self._paths.clear()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def _reduce_scenario(scenario: Any) -> Any:
+    """Pickle scenarios by spool file inside a lease, normally otherwise."""
+    spool = getattr(_local, "spool", None)
+    if spool is None or spool.writing:
+        return scenario.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+    return _load_scenario, (spool.path(scenario),)
+
+
+class _Lease:
+    """Stand-in for the ``pebble.ProcessPool`` of one negmas call.
+
+    Implements the part of pebble's pool used by negmas' run_isolated_tasks.
+    At most ``max_workers`` tasks (or the workers of the thread's
+    ConcurrencyController) run in the shared pool at once; the rest wait
+    here. Leaving the ``with`` block (or ``stop``) cancels whatever did
+    not finish, terminating the workers running it.
+    """
+
+    def __init__(self, pool: "WorkerPool", max_workers: int) -> None:
+        self._pool = pool
+        self._max_workers = max(1, max_workers)
+        self._waiting: deque[tuple[Future, Callable, tuple, dict, Any]] = deque()
+        self._running: dict[Future, Future] = {}
+        self._lock = threading.RLock()
+        self._stopped = False
+        self._controller: ConcurrencyController | None = getattr(
+            _local, "controller", None
+        )
+
+    def __enter__(self) -> "_Lease":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.stop()
+
+    def schedule(
+        self,
+        function: Callable,
+        args: tuple = (),
+        kwargs: dict | None = None,
+        timeout: float | None = None,
+    ) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError("The pool is not running")
+            self._waiting.append((future, function, tuple(args), kwargs or {}, timeout))
+            self._submit()
+        return future
+
+    @property
+    def _limit(self) -> int:
+        if self._controller is not None:
+            return self._controller.workers
+        return self._max_workers
+
+    def _submit(self) -> None:
+        while self._waiting and len(self._running) < self._limit and not self._stopped:
+            future, function, args, kwargs, timeout = self._waiting.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            if self._controller is not None:
+                args, kwargs = (function, args, kwargs), {}
+                function = measured
+            task = self._pool.schedule(function, args, kwargs, timeout)
+            self._running[future] = task
+            task.add_done_callback(lambda task, future=future: self._done(future, task))
+
+    def _done(self, future: Future, task: Future) -> None:
+        result: Any = None
+        ok = not task.cancelled() and task.exception() is None
+        if ok:
+            result = task.result()
+            if self._controller is not None:
+                # Decide before submitting the next tasks
+                result, usage = result
+                self._controller.record(usage)
+        elif self._controller is not None and not task.cancelled():
+            # Failed negotiations are measured too, unless the worker timed
+            # out or died
+            usage = getattr(task.exception(), "usage", None)
+            if usage is not None:
+                self._controller.record(usage)
+            else:
+                self._controller.failed()
+        with self._lock:
+            self._running.pop(future, None)
+            self._submit()
+        if ok:
+            future.set_result(result)
+        elif task.cancelled():
+            future.set_exception(CancelledError())
+        else:
+            future.set_exception(task.exception())  # type: ignore[arg-type]
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stopped = True
+            waiting, self._waiting = self._waiting, deque()
+            running = list(self._running.values())
+        for future, *_ in waiting:
+            future.cancel()
+        for task in running:
+            task.cancel()
+
+    def close(self) -> None:
+        """Nothing to do: the shared pool stays open."""
+
+    def join(self, timeout: float | None = None) -> None:
+        """Nothing to do: the shared pool's workers keep running."""
+
+
+class RemoteCallback:
+    """Picklable callback sending its calls to a CallbackRelay.
+
+    ``prepare`` (a picklable function) replaces the first argument before it
+    is sent, to send only what the callback needs.
+    """
+
+    def __init__(
+        self, queue: Any, key: int, prepare: Callable[[Any], Any] | None = None
+    ) -> None:
+        self.queue = queue
+        self.key = key
+        self.prepare = prepare
+
+    def __call__(self, *args: Any) -> None:
+        if self.prepare is not None and args:
+            args = (self.prepare(args[0]), *args[1:])
+        self.queue.put((self.key, args))
+
+
+class CallbackRelay:
+    """Calls callbacks of negotiations running in workers in this process.
+
+    negmas calls the before-start and after-end callbacks where the
+    negotiation runs. Callbacks updating state of this process are wrapped
+    with ``wrap``; their calls come back through a multiprocessing manager
+    queue and run in a thread here. Leaving the ``with`` block waits until
+    all calls made so far ran.
+    """
+
+    def __init__(self, queue: Any) -> None:
+        """Create a relay.
+
+        Args:
+            queue: ``multiprocessing.Manager().Queue()`` (picklable).
+        """
+        self.queue = queue
+        self._callbacks: list[Callable] = []
+        self._thread: threading.Thread | None = None
+
+    def wrap(
+        self, callback: Callable | None, prepare: Callable[[Any], Any] | None = None
+    ) -> RemoteCallback | None:
+        """Picklable stand-in for a callback (None stays None)."""
+        if callback is None:
+            return None
+        self._callbacks.append(callback)
+        return RemoteCallback(self.queue, len(self._callbacks) - 1, prepare)
+
+    def __enter__(self) -> "CallbackRelay":
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.queue.put((None, ()))
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            key, args = self.queue.get()
+            if key is None:
+                return
+            try:
+                self._callbacks[key](*args)
+            except Exception as e:
+                print(f"[WorkerPool] Relayed callback failed: {e}")
+
+
+def _original_pool() -> Any:
+    """pebble's own ProcessPool, also while leases replace it."""
+    global _pebble_pool
+    with _install_lock:
+        if _pebble_pool is None:
+            import pebble
+
+            _pebble_pool = pebble.ProcessPool
+        return _pebble_pool
+
+
+def _install() -> None:
+    """Route pebble pools created inside leases to the warm pool.
+
+    negmas imports ``ProcessPool`` from pebble on every call. While a lease
+    is active it is replaced with a subclass handing out ``_Lease`` objects
+    in threads holding a lease (and real pools elsewhere), and scenarios
+    pickle through the lease's spool. The last lease to end (``_uninstall``)
+    restores both.
+    """
+    global _active_leases
+    base = _original_pool()
+    with _install_lock:
+        _active_leases += 1
+        if _active_leases > 1:
+            return
+        import copyreg
+
+        import pebble
+        from negmas.inout import Scenario
+
+        class ProcessPool(base):  # type: ignore[misc, valid-type]
+            def __new__(cls, max_workers: int = 1, *args: Any, **kwargs: Any):
+                pool = getattr(_local, "pool", None)
+                if pool is None:
+                    return super().__new__(cls)
+                return _Lease(pool, max_workers)
+
+        pebble.ProcessPool = ProcessPool
+        copyreg.pickle(Scenario, _reduce_scenario)
+
+
+def _uninstall() -> None:
+    """End a lease started with ``_install``."""
+    global _active_leases
+    with _install_lock:
+        _active_leases -= 1
+        if _active_leases > 0:
+            return
+        import copyreg
+
+        import pebble
+        from negmas.inout import Scenario
+
+        pebble.ProcessPool = _pebble_pool
+        copyreg.dispatch_table.pop(Scenario, None)
+
+
+class WorkerPool:
+    """Warm negotiation processes shared by the tournaments of a manager."""
+
+    def __init__(self, workers: int | None = None, max_tasks: int | None = None):
+        """Create the pool (processes start on first use or ``start``).
+
+        Args:
+            workers: Number of processes, or None for the tournament_workers
+                setting (0 meaning one per core).
+            max_tasks: Negotiations after which a process is replaced (0 for
+                never), or None for the tournament_worker_max_tasks setting.
+        """
+        self.workers = workers
+        self.max_tasks = max_tasks
+        self._pool: Any = None
+        self._shape: tuple[int, int] | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _preload_modules() -> tuple[str, ...]:
+        disabled = set(SettingsService.load_negotiator_sources().disabled_sources)
+        return tuple(
+            module for source, module in PRELOAD_MODULES if source not in disabled
+        )
+
+    def _wanted_shape(self) -> tuple[int, int]:
+        settings = SettingsService.load_performance()
+        workers = self.workers
+        if workers is None:
+            workers = settings.tournament_workers
+        max_tasks = self.max_tasks
+        if max_tasks is None:
+            max_tasks = settings.tournament_worker_max_tasks
+        return max(1, workers or os.cpu_count() or 1), max(0, max_tasks)
+
+    def _get_pool(self) -> Any:
+        """Get the pebble pool, replacing it if its settings changed."""
+        process_pool = _original_pool()
+        shape = self._wanted_shape()
+        old = None
+        with self._lock:
+            if self._pool is not None and self._shape == shape:
+                return self._pool
+            old = self._pool
+            self._pool = process_pool(
+                max_workers=shape[0],
+                max_tasks=shape[1],
+                initializer=_warm_up,
+                initargs=(self._preload_modules(),),
+                context=multiprocessing.get_context("spawn"),
+            )
+            self._shape = shape
+            pool = self._pool
+        if old is not None:
+            # Tasks already running finish in the old pool
+            old.close()
+            print(
+                f"[WorkerPool] Resized to {shape[0]} workers "
+                f"(recycled after {shape[1] or 'no'} tasks)"
+            )
+        return pool
+
+    @property
+    def size(self) -> int:
+        """Number of processes in the pool."""
+        return self._wanted_shape()[0]
+
+    @property
+    def leased(self) -> bool:
+        """Whether the current thread runs negmas' pools in this pool."""
+        return getattr(_local, "pool", None) is self
+
+    @property
+    def running(self) -> bool:
+        """Whether the pool's processes were started."""
+        return self._pool is not None
+
+    def start(self) -> Future:
+        """Start the processes now instead of on first use.
+
+        Returns:
+            Future finishing once a worker imported the preloaded modules.
+        """
+        return self._get_pool().schedule(_ready)
+
+    def schedule(
+        self,
+        function: Callable,
+        args: tuple = (),
+        kwargs: dict | None = None,
+        timeout: float | None = None,
+    ) -> Future:
+        """Run a function in a warm process.
+
+        Args:
+            function: Picklable function.
+            args: Positional arguments.
+            kwargs: Keyword arguments.
+            timeout: Seconds after which the process running the function is
+                terminated and the future fails with TimeoutError.
+
+        Returns:
+            pebble future of the result.
+        """
+        return self._get_pool().schedule(
+            function, args=args, kwargs=kwargs or {}, timeout=timeout
+        )
+
+    @contextmanager
+    def lease(self) -> Iterator["WorkerPool"]:
+        """Run negmas' process pools of the current thread in this pool."""
+        if getattr(_local, "pool", None) is not None:
+            # Nested lease: the outer one routes already
+            yield self
+            return
+        _install()
+        _local.pool = self
+        _local.spool = _ScenarioSpool()
+        try:
+            yield self
+        finally:
+            spool = _local.spool
+            _local.pool = None
+            _local.spool = None
+            spool.remove()
+            _uninstall()
+
+    @contextmanager
+    def controlled(self, controller: ConcurrencyController) -> Iterator[None]:
+        """Let a controller limit the negmas calls of the current thread."""
+        previous = getattr(_local, "controller", None)
+        _local.controller = controller
+        try:
+            yield
+        finally:
+            _local.controller = previous
+
+    def call(self, function: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Call a function inside a lease (for ``asyncio.to_thread``).
+
+        Starts the processes first, so they warm up while the function
+        prepares its negotiations.
+        """
+        self._get_pool()
+        with self.lease():
+            return function(*args, **kwargs)
+
+    def shutdown(self) -> None:
+        """Terminate the processes. The pool restarts if used again."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._shape = None
+        if pool is not None:
+            pool.stop()
+            pool.join()
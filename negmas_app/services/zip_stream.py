@@ -0,0 +1,135 @@
+"""Streaming ZIP archives for downloads.
+
+Archives are produced as a sequence of byte chunks while files are read, so a
+download starts immediately and neither a temporary archive nor a whole file
+is ever held in memory. Entries use data descriptors (sizes are written after
+each entry's data), which every common unzip tool supports.
+"""
+
+import io
+import zipfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+# Size of reads from source files
+CHUNK_SIZE = 1024 * 1024
+
+# Rows converted from parquet to CSV at a time
+CSV_BATCH_ROWS = 50_000
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, unseekable stream collecting the bytes zipfile writes."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        """Return and forget everything written so far."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_file(path: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Read a file in chunks."""
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+def iter_parquet_as_csv(path: Path, batch_rows: int = CSV_BATCH_ROWS) -> Iterator[bytes]:
+    """Convert a parquet file to CSV, one row batch at a time.
+
+    The output matches ``pd.read_parquet(path).to_csv(index=False)``.
+    """
+    import pyarrow.parquet as pq
+
+    parquet = pq.ParquetFile(path)
+    header = True
+    for batch in parquet.iter_batches(batch_size=batch_rows):
+        yield batch.to_pandas().to_csv(index=False, header=header).encode()
+        header = False
+    if header:
+        # No rows: still write the header
+        yield parquet.schema_arrow.empty_table().to_pandas().to_csv(
+            index=False
+        ).encode()
+
+
+def _can_convert(path: Path) -> bool:
+    """Whether a parquet file's metadata can be read (checked before streaming)."""
+    try:
+        import pyarrow.parquet as pq
+
+        pq.ParquetFile(path)
+        return True
+    except Exception as e:
+        print(f"Failed to convert parquet to CSV: {e}")
+        return False
+
+
+def directory_entries(
+    directory: Path,
+    arc_root: str | None = None,
+    csv_from_parquet: Iterable[str] = (),
+) -> Iterator[tuple[str, Iterable[bytes]]]:
+    """Archive entries for all files under a directory.
+
+    Args:
+        directory: Directory to archive.
+        arc_root: Name of the top-level folder in the archive (defaults to the
+            directory name).
+        csv_from_parquet: Names of parquet files to add as CSV instead. Files
+            that cannot be read as parquet are added unchanged.
+
+    Yields:
+        Tuples of (archive name, chunks), with chunks read lazily.
+    """
+    arc_root = directory.name if arc_root is None else arc_root
+    convert = set(csv_from_parquet)
+    for path in sorted(directory.rglob("*")):
+        if not path.is_file():
+            continue
+        arcname = f"{arc_root}/{path.relative_to(directory).as_posix()}"
+        if path.name in convert and _can_convert(path):
+            yield arcname[: -len(path.suffix)] + ".csv", iter_parquet_as_csv(path)
+        else:
+            yield arcname, iter_file(path)
+
+
+def stream_zip(
+    entries: Iterable[tuple[str, Iterable[bytes]]],
+    compression: int = zipfile.ZIP_DEFLATED,
+) -> Iterator[bytes]:
+    """Build a ZIP archive incrementally.
+
+    Args:
+        entries: Tuples of (archive name, chunks). Chunks are consumed one at a
+            time, so they can be produced lazily.
+        compression: zipfile compression method.
+
+    Yields:
+        Consecutive chunks of the archive.
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", compression=compression) as zf:
+        for arcname, chunks in entries:
+            # Sizes are unknown up front: allow entries over 2 GiB
+            with zf.open(arcname, "w", force_zip64=True) as entry:
+                for chunk in chunks:
+                    entry.write(chunk)
+                    if data := sink.drain():
+                        yield data
+            if data := sink.drain():
+                yield data
+    # Central directory
+    if data := sink.drain():
+        yield data
@@ -11,10 +11,13 @@ export const useNegotiationsStore = defineStore('negotiations', () => {
   const currentSession = ref(null)
   const loading = ref(false)
   
-  // Saved negotiations
+  // Saved negotiations (the pages loaded so far, filtered by the server)
+  const SAVED_PAGE_SIZE = 100
   const savedNegotiations = ref([])
+  const savedNegotiationsTotal = ref(0)
   const savedNegotiationsLoading = ref(false)
   const tagFilter = ref('')
+  const savedSearch = ref('')
   const showArchived = ref(false)
   const availableTags = ref([])
   
@@ -146,23 +149,61 @@ export const useNegotiationsStore = defineStore('negotiations', () => {
   // Saved Negotiations
   // ============================================================================
 
-  async function loadSavedNegotiations() {
+  /**
+   * Load the first page of saved negotiations, or the next one if more is true
+   */
+  async function loadSavedNegotiations(more = false) {
+    const offset = more ? savedNegotiations.value.length : 0
+    await fetchSavedNegotiations(offset, SAVED_PAGE_SIZE)
+  }
+
+  /**
+   * Reload all saved negotiations loaded so far (e.g. after a change)
+   */
+  async function refreshSavedNegotiations() {
+    await fetchSavedNegotiations(
+      0, Math.max(savedNegotiations.value.length, SAVED_PAGE_SIZE)
+    )
+  }
+
+  async function fetchSavedNegotiations(offset, limit) {
+    const more = offset > 0
+    const params = new URLSearchParams({
+      include_archived: showArchived.value,
+      offset,
+      limit,
+    })
+    if (tagFilter.value) params.append('tags', tagFilter.value)
+    if (savedSearch.value) params.append('search', savedSearch.value)
     savedNegotiationsLoading.value = true
     try {
-      const response = await fetch(
-        `/api/negotiation/saved/list?include_archived=${showArchived.value}`
-      )
+      const response = await fetch(`/api/negotiation/saved/list?${params}`)
       const data = await response.json()
-      savedNegotiations.value = data.negotiations || []
-      availableTags.value = data.tags || []
+      const page = data.negotiations || []
+      savedNegotiations.value = more ? [...savedNegotiations.value, ...page] : page
+      savedNegotiationsTotal.value = data.total ?? savedNegotiations.value.length
+      if (!more) await loadTags()
     } catch (error) {
       console.error('[negotiations store] Failed to load saved negotiations:', error)
-      savedNegotiations.value = []
+      if (!more) {
+        savedNegotiations.value = []
+        savedNegotiationsTotal.value = 0
+      }
     } finally {
       savedNegotiationsLoading.value = false
     }
   }
 
+  async function loadTags() {
+    try {
+      const response = await fetch('/api/negotiation/tags')
+      const data = await response.json()
+      availableTags.value = data.tags || []
+    } catch (error) {
+      console.error('[negotiations store] Failed to load tags:', error)
+    }
+  }
+
   async function loadSavedNegotiation(sessionId) {
     try {
       const response = await fetch(`/api/negotiation/saved/${sessionId}`)
@@ -177,7 +218,7 @@ export const useNegotiationsStore = defineStore('negotiations', () => {
   async function archiveNegotiation(sessionId) {
     try {
       await fetch(`/api/negotiation/saved/${sessionId}/archive`, { method: 'POST' })
-      await loadSavedNegotiations()
+      await refreshSavedNegotiations()
     } catch (error) {
       console.error('[negotiations store] Failed to archive negotiation:', error)
     }
@@ -186,7 +227,7 @@ export const useNegotiationsStore = defineStore('negotiations', () => {
   async function unarchiveNegotiation(sessionId) {
     try {
       await fetch(`/api/negotiation/saved/${sessionId}/unarchive`, { method: 'POST' })
-      await loadSavedNegotiations()
+      await refreshSavedNegotiations()
     } catch (error) {
       console.error('[negotiations store] Failed to unarchive negotiation:', error)
     }
@@ -195,7 +236,7 @@ export const useNegotiationsStore = defineStore('negotiations', () => {
   async function deleteNegotiation(sessionId) {
     try {
       await fetch(`/api/negotiation/saved/${sessionId}`, { method: 'DELETE' })
-      await loadSavedNegotiations()
+      await refreshSavedNegotiations()
     } catch (error) {
       console.error('[negotiations store] Failed to delete negotiation:', error)
     }
@@ -292,7 +333,7 @@ export const useNegotiationsStore = defineStore('negotiations', () => {
         throw new Error(`Delete failed: ${errorData.detail || response.statusText}`)
       }
       const result = await response.json()
-      await loadSavedNegotiations()
+      await refreshSavedNegotiations()
       return result
     } catch (error) {
       console.error('[negotiations store] Failed to delete saved negotiation:', error)
@@ -324,7 +365,7 @@ export const useNegotiationsStore = defineStore('negotiations', () => {
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({ tags })
       })
-      await loadSavedNegotiations()
+      await refreshSavedNegotiations()
       return await response.json()
     } catch (error) {
       console.error('[negotiations store] Failed to update tags:', error)
@@ -400,8 +441,10 @@ export const useNegotiationsStore = defineStore('negotiations', () => {
     currentSession,
     loading,
     savedNegotiations,
+    savedNegotiationsTotal,
     savedNegotiationsLoading,
     tagFilter,
+    savedSearch,
     showArchived,
     availableTags,
     sessionPresets,
@@ -417,6 +460,7 @@ export const useNegotiationsStore = defineStore('negotiations', () => {
     pauseSession,
     resumeSession,
     loadSavedNegotiations,
+    refreshSavedNegotiations,
     loadSavedNegotiation,
     archiveNegotiation,
     unarchiveNegotiation,
@@ -228,8 +228,10 @@ describe('Negotiations Store', () => {
       const store = useNegotiationsStore()
       await store.loadSavedNegotiations()
 
-      // API uses query param for archive filtering
-      expect(global.fetch).toHaveBeenCalledWith('/api/negotiation/saved/list?include_archived=false')
+      // API uses query params for archive filtering and paging
+      expect(global.fetch).toHaveBeenCalledWith(
+        '/api/negotiation/saved/list?include_archived=false&offset=0&limit=100'
+      )
       expect(store.savedNegotiations).toEqual(mockNegotiations)
     })
 
@@ -311,15 +313,21 @@ describe('Negotiations Store', () => {
       ]
       const mockTags = ['test', 'demo', 'important']
 
-      global.fetch.mockResolvedValueOnce({
-        ok: true,
-        json: async () => ({ negotiations: mockNegotiations, tags: mockTags }),
-      })
+      global.fetch
+        .mockResolvedValueOnce({
+          ok: true,
+          json: async () => ({ negotiations: mockNegotiations }),
+        })
+        .mockResolvedValueOnce({
+          ok: true,
+          json: async () => ({ tags: mockTags }),
+        })
 
       const store = useNegotiationsStore()
       await store.loadSavedNegotiations()
 
-      // availableTags is now returned from the API response
+      // availableTags come from the tags endpoint, not the listed page
+      expect(global.fetch).toHaveBeenLastCalledWith('/api/negotiation/tags')
       const availableTags = store.availableTags || []
       expect(availableTags).toContain('test')
       expect(availableTags).toContain('demo')
@@ -0,0 +1,106 @@
+"""Tests for parallel bulk stats calculation."""
+
+import shutil
+
+import pytest
+
+from negmas_app.models.settings import PerformanceSettings
+from negmas_app.services import bulk_stats
+from negmas_app.services.bulk_stats import MIN_ITEM_TIMEOUT, BulkStatsRunner
+from negmas_app.services.scenario_stats_store import ScenarioStatsStore
+
+
+@pytest.fixture
+def scenario_dirs(tmp_path, sample_scenario_path):
+    """Two writable copies of the sample scenario without cached stats."""
+    if sample_scenario_path is None:
+        pytest.skip("No sample scenario available")
+    paths = []
+    for i in range(2):
+        path = tmp_path / f"scenario{i}"
+        shutil.copytree(sample_scenario_path, path)
+        ScenarioStatsStore.remove(path)
+        paths.append(str(path))
+    return paths
+
+
+async def _collect(stream) -> list[dict]:
+    return [event async for event in stream]
+
+
+class TestScheduling:
+    """Test ordering and per-item timeouts."""
+
+    def test_largest_first(self, tmp_path):
+        """Known outcome counts come first, then larger definition files."""
+        small, large, unknown = (tmp_path / n for n in ("small", "large", "unknown"))
+        for path, n_outcomes in ((small, 10), (large, 1000), (unknown, None)):
+            path.mkdir()
+            (path / "domain.yml").write_text("x" * 100)
+            if n_outcomes is not None:
+                (path / "_info.yml").write_text(f"n_outcomes: {n_outcomes}\n")
+
+        ordered = BulkStatsRunner.order_paths([str(small), str(unknown), str(large)])
+
+        assert ordered == [(str(large), 1000), (str(small), 10), (str(unknown), None)]
+
+    def test_timeout_scales_with_size(self):
+        """Timeouts are proportional to max_outcomes_stats with a floor."""
+        settings = PerformanceSettings(max_outcomes_stats=1000, stats_timeout=600.0)
+
+        assert BulkStatsRunner.item_timeout(1000, settings) == 600.0
+        assert BulkStatsRunner.item_timeout(10_000, settings) == 600.0
+        assert BulkStatsRunner.item_timeout(500, settings) == 300.0
+        assert BulkStatsRunner.item_timeout(1, settings) == MIN_ITEM_TIMEOUT
+        assert BulkStatsRunner.item_timeout(None, settings) == 600.0
+        settings.stats_timeout = None
+        assert BulkStatsRunner.item_timeout(1000, settings) is None
+
+
+class TestRunStream:
+    """Test the process pool pipeline."""
+
+    async def test_calculates_all(self, scenario_dirs):
+        """Every scenario gets a progress event and its stats saved."""
+        events = await _collect(
+            BulkStatsRunner.run_stream(scenario_dirs, force=True, max_workers=2)
+        )
+
+        progress = [e for e in events if e["type"] == "progress"]
+        assert sorted(e["current_path"] for e in progress) == sorted(scenario_dirs)
+        assert [e["completed"] for e in progress] == [1, 2]
+        assert all("error" not in e for e in progress)
+        assert events[-1] == {
+            "type": "complete",
+            "completed": 2,
+            "total": 2,
+            "errors": [],
+        }
+        assert all(ScenarioStatsStore.exists(path) for path in scenario_dirs)
+
+    async def test_timed_out_items_are_killed(self, scenario_dirs, monkeypatch):
+        """Items past their deadline are reported as errors and their workers stop."""
+        processes = []
+        kill_pool = bulk_stats._kill_pool
+
+        def recording_kill(executor):
+            processes.extend((executor._processes or {}).values())
+            kill_pool(executor)
+
+        monkeypatch.setattr(bulk_stats, "_kill_pool", recording_kill)
+        monkeypatch.setattr(
+            BulkStatsRunner, "item_timeout", staticmethod(lambda n, s: 0.0)
+        )
+
+        events = await _collect(
+            BulkStatsRunner.run_stream(scenario_dirs, force=True, max_workers=1)
+        )
+
+        assert events[-1]["completed"] == 2
+        errors = events[-1]["errors"]
+        assert sorted(e["path"] for e in errors) == sorted(scenario_dirs)
+        assert all("Timed out" in e["error"] for e in errors)
+        assert processes
+        for process in processes:
+            process.join(timeout=10)
+            assert not process.is_alive()
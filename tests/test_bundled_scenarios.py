@@ -0,0 +1,93 @@
+"""Tests for serving bundled scenarios straight from scenarios.zip."""
+
+import pytest
+from negmas import Scenario, scenario_registry
+
+from negmas_app.services.bundled_scenarios import BundledScenarioArchive
+from negmas_app.services.setup_service import SetupService
+
+
+@pytest.fixture
+def zip_path():
+    try:
+        return SetupService.get_bundled_scenarios_zip()
+    except FileNotFoundError:
+        pytest.skip("Bundled scenarios.zip not available")
+
+
+@pytest.fixture
+def lazy_root(tmp_path):
+    """A scenarios directory in lazy mode; registry entries are removed after."""
+    root = tmp_path / "scenarios"
+    BundledScenarioArchive.enable(root)
+    yield root
+    for key in [k for k in scenario_registry if str(k).startswith(str(tmp_path))]:
+        del scenario_registry[key]
+
+
+class TestArchiveIndex:
+    """Test reading the central directory."""
+
+    def test_groups_members_by_scenario(self, zip_path):
+        """macOS metadata and dotfiles are not part of any scenario."""
+        index = BundledScenarioArchive.index(zip_path)
+
+        assert "anac2011/Laptop" in index
+        assert len(index["anac2011/Laptop"]) == 3
+        assert not any("__MACOSX" in rel or "/." in f"/{rel}" for rel in index)
+        assert BundledScenarioArchive.index(zip_path) is index
+
+
+class TestLazyScenarios:
+    """Test registering and loading without extracting up front."""
+
+    def test_registers_without_extracting(self, lazy_root, zip_path):
+        registered = BundledScenarioArchive.register_lazy(lazy_root, zip_path)
+
+        path = lazy_root / "anac2011" / "Laptop"
+        info = scenario_registry[str(path.resolve())]
+        assert registered == len(BundledScenarioArchive.index(zip_path))
+        assert info.n_outcomes == 27 and info.n_negotiators == 2
+        assert {"anac", "anac2011", "yaml", "bilateral"} <= set(info.tags)
+        assert not path.exists()
+
+    def test_extracts_on_first_load(self, lazy_root, zip_path):
+        path = lazy_root / "anac2011" / "Laptop"
+
+        assert BundledScenarioArchive.ensure_scenario_files(path, lazy_root, zip_path)
+        assert not BundledScenarioArchive.ensure_scenario_files(
+            path, lazy_root, zip_path
+        )
+        assert sorted(p.name for p in path.iterdir()) == [
+            "buyer.yml",
+            "laptop_domain.yml",
+            "seller.yml",
+        ]
+        # No temporary directories are left behind
+        assert [p.name for p in path.parent.iterdir()] == ["Laptop"]
+        assert Scenario.load(path).outcome_space.cardinality == 27
+
+    def test_disabled_without_marker(self, tmp_path, zip_path):
+        path = tmp_path / "anac2011" / "Laptop"
+
+        assert not BundledScenarioArchive.ensure_scenario_files(
+            path, tmp_path, zip_path
+        )
+        assert not path.exists()
+
+
+class TestExtractAll:
+    """Test the parallel bulk extractor."""
+
+    def test_extracts_then_skips(self, tmp_path, zip_path):
+        stats = BundledScenarioArchive.extract_all(tmp_path, zip_path, workers=4)
+
+        assert stats["errors"] == []
+        assert stats["total_files"] > 0
+        assert stats["copied"] == stats["total_files"]
+        assert (tmp_path / "anac2011" / "Laptop" / "laptop_domain.yml").exists()
+        assert not (tmp_path / "__MACOSX").exists()
+
+        again = BundledScenarioArchive.extract_all(tmp_path, zip_path, workers=4)
+        assert again["copied"] == 0
+        assert again["skipped"] == stats["total_files"]
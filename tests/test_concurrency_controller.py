@@ -0,0 +1,103 @@
+"""Tests for choosing the number of parallel negotiations while running."""
+
+import time
+
+import pytest
+
+from negmas_app.services import concurrency_controller
+from negmas_app.services.concurrency_controller import (
+    MB,
+    ConcurrencyController,
+    RunUsage,
+    measured,
+)
+
+
+def _memory(monkeypatch, total_mb, available_mb):
+    monkeypatch.setattr(
+        concurrency_controller,
+        "system_memory",
+        lambda: (total_mb * MB, available_mb * MB),
+    )
+
+
+class TestConcurrencyController:
+    """Test the decisions of the controller."""
+
+    def test_keeps_cores_busy(self, monkeypatch):
+        _memory(monkeypatch, 16000, 12000)
+        changes = []
+        controller = ConcurrencyController(
+            8, cores=2, on_change=lambda *change: changes.append(change)
+        )
+        assert controller.workers == 1
+        assert controller.memory_limit == int(16000 * MB * 0.85)
+
+        # Busy negotiations: one per core
+        assert controller.record(RunUsage(memory=10 * MB, cpu=1.0, wall=1.0)) == 2
+        assert changes == [(2, controller.reason)]
+        # Waiting negotiations (10% CPU): up to ten per core, within the pool
+        for _ in range(10):
+            controller.record(RunUsage(memory=10 * MB, cpu=0.1, wall=1.0))
+        assert controller.workers == 8
+        assert controller.reason == "all 8 workers of the pool"
+        assert [workers for workers, _ in changes][-1] == 8
+
+    def test_memory_ceiling(self, monkeypatch):
+        _memory(monkeypatch, 8000, 7000)
+        controller = ConcurrencyController(16, memory_limit=4000 * MB, cores=16)
+
+        # 3000 MB left under the ceiling, 1000 MB per negotiation
+        controller.record(RunUsage(memory=1000 * MB, cpu=1.0, wall=1.0))
+        assert controller.workers == 4
+        assert controller.reason.startswith("memory bound")
+
+        # The system now uses 6000 MB: two negotiations too many
+        _memory(monkeypatch, 8000, 2000)
+        controller.record(RunUsage(memory=500 * MB, cpu=1.0, wall=1.0))
+        assert controller.workers == 2
+        assert controller.reason.startswith("over the memory ceiling")
+        _memory(monkeypatch, 8000, 1000)
+        controller.record(RunUsage(memory=500 * MB, cpu=1.0, wall=1.0))
+        assert controller.workers == 1
+
+    def test_without_memory_information(self, monkeypatch):
+        monkeypatch.setattr(concurrency_controller, "system_memory", lambda: None)
+        controller = ConcurrencyController(4, cores=4)
+        assert controller.memory_limit is None
+        controller.record(RunUsage(memory=10_000 * MB, cpu=2.0, wall=2.0))
+        assert controller.workers == 4
+
+
+def test_measured():
+    result, usage = measured(time.sleep, (0.1,), {})
+    assert result is None
+    assert usage.wall >= 0.1 and usage.cpu < usage.wall
+    assert usage.memory >= 0
+
+    big, usage = measured(bytearray, (64 * MB,), {})
+    assert usage.memory >= 32 * MB
+
+    # Measured on its own, not as the peak of the whole worker
+    del big
+    _, usage = measured(bytearray, (8 * MB,), {})
+    assert 4 * MB <= usage.memory < 32 * MB
+
+
+def test_system_memory():
+    total, available = concurrency_controller.system_memory()
+    assert 0 < available <= total
+
+
+def test_failed_negotiations_count(monkeypatch):
+    monkeypatch.setattr(concurrency_controller, "system_memory", lambda: None)
+    with pytest.raises(ValueError) as error:
+        measured(int, ("x",), {})
+    assert error.value.usage.wall >= 0
+
+    controller = ConcurrencyController(4, cores=4)
+    for _ in range(concurrency_controller.UNMEASURED_FAILURES - 1):
+        assert controller.failed() == 1
+    # Nothing measured: decide as if negotiations used a whole core
+    assert controller.failed() == 4
+    assert controller.reason.endswith("failed unmeasured")
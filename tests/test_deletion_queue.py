@@ -0,0 +1,72 @@
+"""Tests for background deletion through the trash."""
+
+import os
+
+import pytest
+
+from negmas_app.services import deletion_queue
+from negmas_app.services.deletion_queue import TRASH_DIR_NAME, DeletionQueue
+from negmas_app.services.tournament_storage import TournamentStorageService
+
+
+def _make_tree(path, n_dirs=3, n_files=20):
+    """Write a directory tree with n_dirs * n_files small files."""
+    for i in range(n_dirs):
+        sub = path / f"d{i}" / "nested"
+        sub.mkdir(parents=True)
+        for j in range(n_files):
+            (sub / f"f{j}.txt").write_text("x" * 10)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def small_batches(monkeypatch):
+    monkeypatch.setattr(deletion_queue, "UNLINK_BATCH", 7)
+
+
+class TestDeletionQueue:
+    """Test moving to trash and reclaiming space."""
+
+    def test_deletes_in_background(self, tmp_path):
+        target = _make_tree(tmp_path / "big")
+        single = tmp_path / "file.txt"
+        single.write_text("abc")
+
+        job = DeletionQueue.delete([target, single, tmp_path / "missing"])
+
+        # Gone from view before the files are deleted
+        assert not target.exists() and not single.exists()
+        assert job.n_targets == 2
+        assert len(job.errors) == 1 and "missing" in job.errors[0]
+        assert DeletionQueue.wait(timeout=10)
+        assert job.status == "done"
+        assert job.files_deleted == 61 and job.bytes_freed == 603
+        assert os.listdir(tmp_path / TRASH_DIR_NAME) == []
+        status = DeletionQueue.status()
+        assert status["pending"] == 0
+        assert status["jobs"][0]["id"] == job.id
+
+    def test_resumes_leftovers(self, tmp_path):
+        trash = tmp_path / TRASH_DIR_NAME
+        _make_tree(trash / "abc_interrupted", n_dirs=1, n_files=5)
+
+        job = DeletionQueue.resume(trash)
+
+        assert job is not None and job.n_targets == 1
+        assert DeletionQueue.wait(timeout=10)
+        assert job.files_deleted == 5
+        assert os.listdir(trash) == []
+        # Checked once per process
+        assert DeletionQueue.resume(trash) is None
+
+    def test_delete_tournament(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            TournamentStorageService, "TOURNAMENTS_DIR", tmp_path / "tournaments"
+        )
+        _make_tree(tmp_path / "tournaments" / "t1")
+
+        assert TournamentStorageService.delete_tournament("t1")
+        assert not TournamentStorageService.delete_tournament("t1")
+        assert os.listdir(tmp_path / "tournaments") == [TRASH_DIR_NAME]
+        assert DeletionQueue.wait(timeout=10)
+        assert os.listdir(tmp_path / "tournaments" / TRASH_DIR_NAME) == []
@@ -0,0 +1,84 @@
+"""Import-time budget for the CLI and the backend.
+
+Each check runs in a fresh interpreter so that modules imported by other
+tests do not hide regressions.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Seconds; generous enough for slow CI machines, tight enough to catch the CLI
+# importing the backend again (which takes several seconds)
+CLI_IMPORT_BUDGET = 1.5
+APP_IMPORT_BUDGET = 8.0
+
+# Modules that short CLI commands must not import
+CLI_FORBIDDEN_MODULES = ["negmas", "fastapi", "pandas", "matplotlib", "plotly"]
+
+# Modules that creating the app must not import (only needed by workers/handlers)
+APP_FORBIDDEN_MODULES = ["sklearn", "matplotlib.pyplot"]
+
+
+def _measure_import(code: str) -> dict:
+    """Run code in a fresh interpreter, returning elapsed time and loaded modules."""
+    script = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{code}\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestImportTime:
+    """Fail when startup regresses past its budget."""
+
+    def test_cli_import_is_light(self):
+        """Importing the CLI must not import the backend or heavy libraries."""
+        measured = _measure_import("import negmas_app.main")
+
+        loaded = [m for m in CLI_FORBIDDEN_MODULES if m in measured["modules"]]
+        assert loaded == [], f"CLI import pulled in {loaded}"
+        assert measured["elapsed"] < CLI_IMPORT_BUDGET, (
+            f"CLI import took {measured['elapsed']:.2f}s "
+            f"(budget {CLI_IMPORT_BUDGET}s)"
+        )
+
+    @pytest.mark.parametrize(
+        "module",
+        ["negmas_app.services.setup_service", "negmas_app.routers.system"],
+    )
+    def test_single_module_import_is_isolated(self, module):
+        """Importing one service or router must not import the others."""
+        measured = _measure_import(f"import {module}")
+
+        others = [
+            m
+            for m in measured["modules"]
+            if m.startswith(("negmas_app.services.", "negmas_app.routers."))
+            and m != module
+            and m != "negmas_app.services.settings_service"
+        ]
+        assert others == []
+
+    def test_app_import_within_budget(self):
+        """Creating the app must stay within budget and skip worker-only libraries."""
+        measured = _measure_import("import negmas_app.main\nnegmas_app.main.app")
+
+        loaded = [m for m in APP_FORBIDDEN_MODULES if m in measured["modules"]]
+        assert loaded == [], f"App import pulled in {loaded}"
+        assert measured["elapsed"] < APP_IMPORT_BUDGET, (
+            f"App import took {measured['elapsed']:.2f}s "
+            f"(budget {APP_IMPORT_BUDGET}s)"
+        )
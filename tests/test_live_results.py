@@ -0,0 +1,149 @@
+"""Tests for live results segments of running tournaments."""
+
+import shutil
+import time
+
+import pandas as pd
+import pytest
+
+from negmas_app.services import live_results
+from negmas_app.services.live_results import LiveResultsWriter
+from negmas_app.services.tournament_combiner import TournamentCombiner
+from negmas_app.services.tournament_storage import TournamentStorageService
+
+
+@pytest.fixture(scope="module")
+def finished(tmp_path_factory):
+    """A small real tournament and the records its after-end callback got."""
+    from negmas.inout import Scenario
+    from negmas.outcomes import make_issue, make_os
+    from negmas.preferences import LinearAdditiveUtilityFunction as U
+    from negmas.sao import AspirationNegotiator, NaiveTitForTatNegotiator
+    from negmas.tournaments.neg import cartesian_tournament
+
+    issues = [make_issue(5, "price"), make_issue(3, "quantity")]
+    scenario = Scenario(
+        outcome_space=make_os(issues, name="Market"),
+        ufuns=(
+            U.random(issues=issues, reserved_value=0.0),
+            U.random(issues=issues, reserved_value=0.0),
+        ),
+    )
+    path = tmp_path_factory.mktemp("tournaments") / "t1"
+    records = []
+    cartesian_tournament(
+        competitors=[AspirationNegotiator, NaiveTitForTatNegotiator],
+        scenarios=[scenario],
+        n_repetitions=1,
+        n_steps=10,
+        path=path,
+        njobs=-1,
+        verbosity=0,
+        save_scenario_figs=False,
+        plot_fraction=0.0,
+        analysis_plots=False,
+        after_end_callback=lambda record: records.append(record),
+    )
+    return path, records
+
+
+def _live_copy(finished, tmp_path, segment_rows=2):
+    """Tournament directory as it looks while running: config and segments."""
+    path, records = finished
+    live = tmp_path / path.name
+    live.mkdir()
+    shutil.copy(path / "config.yaml", live / "config.yaml")
+    writer = LiveResultsWriter(live, segment_rows=segment_rows)
+    for record in records:
+        writer.append(record)
+    writer.flush()
+    return live
+
+
+class TestLiveResultsWriter:
+    """Test writing and reading segments."""
+
+    def test_segments_round_trip(self, tmp_path):
+        writer = LiveResultsWriter(tmp_path, segment_rows=2)
+        records = [
+            {"run_id": "a", "partners": ("A", "B"), "utilities": [0.5, 0.25]},
+            {"run_id": "b", "partners": ("B", "A"), "agreement": None},
+            {"run_id": "c", "agreement": (1, "x"), "n_steps": 3},
+        ]
+        for record in records:
+            writer.append(record)
+
+        # Only full segments are visible until flushed
+        assert len(live_results.segment_paths(tmp_path)) == 1
+        writer.flush()
+        assert [p.name for p in live_results.segment_paths(tmp_path)] == [
+            "segment-000000.parquet",
+            "segment-000001.parquet",
+        ]
+        read = live_results.read_records(tmp_path)
+        assert [r["run_id"] for r in read] == ["a", "b", "c"]
+        assert read[0]["partners"] == ["A", "B"]
+        assert read[0]["utilities"] == [0.5, 0.25]
+        assert read[2]["agreement"] == [1, "x"] and read[2]["n_steps"] == 3
+        assert read[1]["agreement"] is None and read[1]["n_steps"] is None
+
+        # Continuing keeps segments and numbering, a new run starts over
+        resumed = LiveResultsWriter(tmp_path, resume=True)
+        resumed.append({"run_id": "d"})
+        resumed.flush()
+        assert live_results.segment_paths(tmp_path)[-1].name == (
+            "segment-000002.parquet"
+        )
+        assert len(live_results.read_records(tmp_path)) == 4
+        LiveResultsWriter(tmp_path)
+        assert live_results.read_records(tmp_path) == []
+
+    def test_old_records_written_without_new_ones(self, tmp_path):
+        writer = LiveResultsWriter(tmp_path, segment_seconds=0.2)
+        writer.append({"run_id": "a"})
+        assert live_results.segment_paths(tmp_path) == []
+        deadline = time.monotonic() + 10
+        while not live_results.segment_paths(tmp_path):
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+        assert [r["run_id"] for r in live_results.read_records(tmp_path)] == ["a"]
+        assert writer._timer is None
+
+    def test_discard(self, tmp_path):
+        writer = LiveResultsWriter(tmp_path, segment_rows=1)
+        writer.append({"run_id": "a"})
+        writer.discard()
+        assert not (tmp_path / live_results.LIVE_RESULTS_DIR).exists()
+
+
+class TestLiveTournament:
+    """Test reading a running tournament from its segments."""
+
+    def test_loads_results(self, finished, tmp_path, monkeypatch):
+        monkeypatch.setattr(TournamentStorageService, "TOURNAMENTS_DIR", tmp_path)
+        TournamentStorageService.clear_cache()
+        path, records = finished
+        live = _live_copy(finished, tmp_path)
+
+        results = TournamentStorageService._load_results(live)
+
+        assert results is not None
+        assert len(results.details) == len(records)
+        assert set(results.scores["strategy"]) == {
+            "AspirationNegotiator",
+            "NaiveTitForTatNegotiator",
+        }
+        assert len(results.scores_summary) > 0
+        TournamentStorageService.clear_cache()
+
+    def test_combines_running_tournament(self, finished, tmp_path):
+        path, records = finished
+        live = _live_copy(finished, tmp_path)
+
+        combined = TournamentCombiner.combine([live], tmp_path / "out")
+
+        details = pd.read_parquet(tmp_path / "out" / "details.parquet")
+        scores = pd.read_parquet(tmp_path / "out" / "all_scores.parquet")
+        assert combined.n_negotiations == len(details) == len(records)
+        assert len(scores) == 2 * len(records)
+        assert (tmp_path / "out" / "scores.csv").exists()
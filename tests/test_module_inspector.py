@@ -0,0 +1,114 @@
+"""Tests for module inspection caching and screening custom paths."""
+
+import sys
+from collections import OrderedDict
+
+import pytest
+
+from negmas_app.services import module_inspector, registry_service
+from negmas_app.services.module_inspector import (
+    inspect_module_ast,
+    inspect_module_dynamic,
+    screen_modules,
+)
+
+NEGOTIATOR = """
+from negmas.sao import SAONegotiator
+
+class Mine(SAONegotiator):
+    pass
+"""
+
+UNRELATED = """
+raise RuntimeError("executed")
+
+class Helper:
+    pass
+"""
+
+DERIVED = """
+from base_stuff import MyBase
+
+class Leaf(MyBase):
+    pass
+"""
+
+
+@pytest.fixture
+def custom_dir(tmp_path, monkeypatch):
+    """A custom negotiators directory and empty inspection caches."""
+    monkeypatch.setattr(
+        module_inspector, "SCREEN_CACHE_FILE", tmp_path / "module_screen.json"
+    )
+    monkeypatch.setattr(module_inspector, "_screen_cache", None)
+    monkeypatch.setattr(module_inspector, "_inspection_cache", OrderedDict())
+    directory = tmp_path / "custom"
+    directory.mkdir()
+    (directory / "neg.py").write_text(NEGOTIATOR)
+    (directory / "util.py").write_text(UNRELATED)
+    (directory / "derived.py").write_text(DERIVED)
+    (directory / "base_stuff.py").write_text("class MyBase:\n    pass\n")
+    (directory / "broken.py").write_text("class (:\n")
+    return directory
+
+
+class TestScreening:
+    """Test deciding which modules to import."""
+
+    def test_screen_modules(self, custom_dir, monkeypatch):
+        files = sorted(custom_dir.glob("*.py"))
+        screened = {p.name: ok for p, ok in screen_modules(files).items()}
+        assert screened == {
+            "base_stuff.py": False,
+            "broken.py": True,  # importing it reports the error
+            "derived.py": True,  # MyBase could be anything
+            "neg.py": True,
+            "util.py": False,
+        }
+        assert module_inspector.SCREEN_CACHE_FILE.exists()
+
+        # Read back after a restart, without parsing
+        monkeypatch.setattr(module_inspector, "_screen_cache", None)
+        monkeypatch.setattr(module_inspector, "_may_define_classes", pytest.fail)
+        assert screen_modules(files) == dict(zip(files, screened.values()))
+
+    def test_registration_imports_candidates_only(self, custom_dir, monkeypatch):
+        imported = []
+        monkeypatch.setattr(
+            registry_service,
+            "_register_from_module",
+            lambda module, source: imported.append(module.__name__) or 1,
+        )
+        monkeypatch.setattr(sys, "path", list(sys.path))
+        for name in ("neg", "derived", "broken", "base_stuff"):
+            # Removed again after the test
+            monkeypatch.setitem(sys.modules, name, None)
+            monkeypatch.delitem(sys.modules, name)
+        count = registry_service.register_custom_modules(
+            [(custom_dir, "mine"), (custom_dir / "neg.py", "single")]
+        )
+        # broken.py fails to import; util.py is never executed
+        assert sorted(imported) == ["derived", "neg", "neg"]
+        assert count == 3
+
+
+class TestInspectionCache:
+    """Test reusing inspections of unchanged files."""
+
+    def test_ast_results_cached_by_content(self, custom_dir):
+        path = str(custom_dir / "neg.py")
+        first = inspect_module_ast(path)
+        assert [c.name for c in first.classes] == ["Mine"]
+        assert inspect_module_ast(path) is first
+
+        (custom_dir / "neg.py").write_text(NEGOTIATOR + "class Two(Mine):\n    pass\n")
+        assert inspect_module_ast(path) is not first
+
+    def test_dynamic_skips_unrelated_modules(self, custom_dir):
+        result = inspect_module_dynamic(str(custom_dir / "util.py"))
+        assert result.error is None and result.classes == []
+
+        path = str(custom_dir / "neg.py")
+        first = inspect_module_dynamic(path)
+        assert [c.name for c in first.classes] == ["Mine"]
+        assert inspect_module_dynamic(path) is first
@@ -0,0 +1,121 @@
+"""Tests for the saved negotiations index."""
+
+import shutil
+
+import pytest
+import yaml
+from negmas import make_issue
+from negmas.outcomes import make_os
+from negmas.preferences import LinearAdditiveUtilityFunction as U
+from negmas.sao import AspirationNegotiator, SAOMechanism
+
+from negmas_app.services import negotiation_storage
+from negmas_app.services.negotiation_index import NegotiationIndex
+from negmas_app.services.negotiation_storage import NegotiationStorageService
+
+
+@pytest.fixture(scope="module")
+def template(tmp_path_factory):
+    """A negotiation saved in CompletedRun format."""
+    os_ = make_os([make_issue(5, "price")])
+    mechanism = SAOMechanism(outcome_space=os_, n_steps=5)
+    for i in range(2):
+        mechanism.add(
+            AspirationNegotiator(name=f"a{i}"),
+            ufun=U.random(os_, reserved_value=0.0),
+        )
+    mechanism.run()
+    return mechanism.save(
+        parent=tmp_path_factory.mktemp("template"),
+        name="template",
+        single_file=False,
+        overwrite=True,
+        warn_if_existing=False,
+    )
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    monkeypatch.setattr(negotiation_storage, "NEGOTIATIONS_DIR", tmp_path / "neg")
+    monkeypatch.setattr(negotiation_storage, "ARCHIVE_DIR", tmp_path / "archive")
+    yield tmp_path
+    NegotiationIndex.close_all()
+
+
+def _add(template, root, session_id, end_time, scenario="Laptop", tags=()):
+    """Copy the template as a saved negotiation with the given metadata."""
+    path = root / session_id
+    shutil.copytree(template, path)
+    (path / "metadata.yaml").write_text(
+        yaml.dump(
+            {
+                "session_id": session_id,
+                "scenario_name": scenario,
+                "end_time": end_time,
+                "tags": list(tags),
+            }
+        )
+    )
+    return path
+
+
+def _ids(**kwargs):
+    negotiations, _ = NegotiationStorageService.query_saved_negotiations(**kwargs)
+    return [n["id"] for n in negotiations]
+
+
+class TestNegotiationIndex:
+    """Test listing from the index and keeping it up to date."""
+
+    def test_lists_pages_and_filters(self, storage, template):
+        neg = storage / "neg"
+        _add(template, neg, "n1", "2026-01-01T00:00:00", tags=["x"])
+        _add(template, neg, "n2", "2026-01-03T00:00:00", "Camera", ["x", "y"])
+        _add(template, neg, "n3", "2026-01-02T00:00:00")
+        (neg / "broken").mkdir()
+        _add(template, storage / "archive", "old", "2025-01-01T00:00:00")
+
+        assert _ids() == ["n2", "n3", "n1"]
+        assert _ids(include_archived=True) == ["n2", "n3", "n1", "old"]
+        page, total = NegotiationStorageService.query_saved_negotiations(
+            offset=1, limit=1
+        )
+        assert [n["id"] for n in page] == ["n3"] and total == 3
+        assert _ids(tags=["y"]) == ["n2"]
+        assert _ids(search="cam") == ["n2"]
+        assert _ids(search="A1") == ["n2", "n3", "n1"]
+        assert _ids(search="a1_") == []
+        assert NegotiationStorageService.get_all_tags() == ["x", "y"]
+        summary = NegotiationStorageService.list_saved_negotiations()[0]
+        assert summary["negotiator_names"] == ["a0", "a1"]
+        assert summary["scenario_name"] == "Camera"
+
+    def test_updates_on_changes(self, storage, template):
+        neg = storage / "neg"
+        _add(template, neg, "n1", "2026-01-01T00:00:00")
+        _add(template, neg, "n2", "2026-01-02T00:00:00")
+        assert _ids() == ["n2", "n1"]
+
+        assert NegotiationStorageService.add_tag("n1", "keep")
+        assert NegotiationStorageService.archive_negotiation("n2")
+        assert _ids() == ["n1"]
+        assert _ids(include_archived=True) == ["n2", "n1"]
+        assert _ids(tags=["keep"]) == ["n1"]
+
+        assert NegotiationStorageService.delete_negotiation("n1")
+        assert NegotiationStorageService.unarchive_negotiation("n2")
+        assert _ids() == ["n2"]
+        assert NegotiationStorageService.get_all_tags() == []
+        # Every change was indexed as it happened
+        assert NegotiationStorageService.reconcile_index(force=True) == 0
+
+    def test_reconciles_outside_changes(self, storage, template):
+        neg = storage / "neg"
+        _add(template, neg, "n1", "2026-01-01T00:00:00")
+        assert _ids() == ["n1"]
+
+        _add(template, neg, "n2", "2026-01-02T00:00:00")
+        shutil.rmtree(neg / "n1")
+        # Listing stays served from the index until a refresh
+        assert _ids() == ["n1"]
+        assert _ids(refresh=True) == ["n2"]
@@ -0,0 +1,76 @@
+"""Tests for retrying failed negotiation preview renders."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from negmas_app.services import negotiation_preview_service as previews
+from negmas_app.services.negotiation_preview_service import NegotiationPreviewService
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    """Render previews in a thread with a replaceable result."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    outcome: dict = {"result": RuntimeError("no display")}
+
+    def render(session_dir, session=None):
+        result = outcome["result"]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(previews, "_get_preview_pool", lambda: executor)
+    monkeypatch.setattr(previews, "_render_previews_in_worker", render)
+    monkeypatch.setattr(previews, "_preview_jobs", {})
+    monkeypatch.setattr(previews, "_preview_failures", {})
+    monkeypatch.setattr(previews, "_preview_unavailable", {})
+    yield outcome
+    executor.shutdown()
+
+
+def _request(session_dir, preview_type="timeline"):
+    """Request a preview and wait for the render it started."""
+    result = NegotiationPreviewService.get_or_schedule_preview(
+        session_dir, preview_type
+    )
+    job = previews._preview_jobs.get(str(session_dir))
+    if job is not None:
+        job.exception(timeout=10)
+        # Done callbacks run right after the result is set
+        while str(session_dir) in previews._preview_jobs:
+            time.sleep(0.01)
+    return result
+
+
+def test_failed_render_reported_and_retried(renders, tmp_path, monkeypatch):
+    assert _request(tmp_path) == (None, True, None)
+
+    # Reported until the retry delay passed
+    path, pending, failure = _request(tmp_path)
+    assert (path, pending) == (None, False)
+    assert failure.attempts == 1 and failure.error == "no display"
+    assert 0 < failure.retry_in <= previews.PREVIEW_RETRY_DELAY
+
+    monkeypatch.setattr(previews, "PREVIEW_RETRY_DELAY", 0.0)
+    previews._preview_failures[str(tmp_path)].retry_at = 0.0
+    renders["result"] = {"timeline": True, "histogram": False}
+    assert _request(tmp_path)[1]
+    failure = previews._preview_failures[str(tmp_path)]
+    assert failure.attempts == 2 and "histogram" in failure.error
+
+    # Given up after MAX_PREVIEW_ATTEMPTS
+    assert _request(tmp_path)[1]
+    failure = _request(tmp_path)[2]
+    assert failure.attempts == previews.MAX_PREVIEW_ATTEMPTS
+    assert failure.retry_in is None
+    assert not previews._preview_jobs
+
+
+def test_unavailable_panels_not_rendered_again(renders, tmp_path):
+    renders["result"] = {"timeline": True, "histogram": True}
+    _request(tmp_path, "utility2d")
+    # No outcome space: nothing to render, no failure either
+    assert _request(tmp_path, "utility2d") == (None, False, None)
+    assert not previews._preview_failures
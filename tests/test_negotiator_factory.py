@@ -4,6 +4,7 @@ import pytest
 from negmas.negotiators import Negotiator
 
 from negmas_app.models.negotiator import NegotiatorConfig
+from negmas_app.services import negotiator_factory
 from negmas_app.services.negotiator_factory import (
     NegotiatorFactory,
     NEGOTIATOR_REGISTRY,
@@ -11,11 +12,17 @@ from negmas_app.services.negotiator_factory import (
 )
 
 
+@pytest.fixture(autouse=True, scope="module")
+def registry_ready():
+    """Discovery is deferred; make sure the registry is populated."""
+    NegotiatorFactory.ensure_registry()
+
+
 class TestNegotiatorDiscovery:
     """Test negotiator discovery functionality."""
 
     def test_registry_not_empty(self):
-        """Registry should have negotiators after module load."""
+        """Registry should have negotiators once ensured."""
         assert len(NEGOTIATOR_REGISTRY) > 0
 
     def test_native_negotiators_discovered(self):
@@ -200,3 +207,81 @@ class TestNegotiatorSources:
         initial_count = len(NEGOTIATOR_REGISTRY)
         NegotiatorFactory.refresh_registry()
         assert len(NEGOTIATOR_REGISTRY) >= initial_count
+
+
+class TestNegotiatorManifest:
+    """Test the persisted discovery manifest."""
+
+    @pytest.fixture
+    def manifest_file(self, tmp_path, monkeypatch):
+        """Point the manifest at a temporary file and restore the registry."""
+        path = tmp_path / "negotiator_manifest.json"
+        monkeypatch.setattr(negotiator_factory, "MANIFEST_FILE", path)
+        saved = dict(NEGOTIATOR_REGISTRY)
+        yield path
+        NEGOTIATOR_REGISTRY.clear()
+        NEGOTIATOR_REGISTRY.update(saved)
+        negotiator_factory._registry_stale.clear()
+
+    def test_discovery_writes_manifest(self, manifest_file):
+        """refresh_registry should persist the discovered entries."""
+        NegotiatorFactory.refresh_registry()
+        assert manifest_file.exists()
+
+        NEGOTIATOR_REGISTRY.clear()
+        assert negotiator_factory._load_manifest()
+        assert not negotiator_factory._registry_stale.is_set()
+        assert len(NEGOTIATOR_REGISTRY) > 0
+        assert all(entry.cls is None for entry in NEGOTIATOR_REGISTRY.values())
+
+    def test_manifest_classes_imported_on_create(self, manifest_file):
+        """Entries loaded from the manifest should import their class lazily."""
+        NegotiatorFactory.refresh_registry()
+        NEGOTIATOR_REGISTRY.clear()
+        negotiator_factory._load_manifest()
+
+        type_name = next(
+            k
+            for k in NEGOTIATOR_REGISTRY
+            if k.split("#")[0]
+            == "negmas.gb.negotiators.timebased.AspirationNegotiator"
+        )
+        negotiator = NegotiatorFactory.create(
+            NegotiatorConfig(type_name=type_name, name="lazy")
+        )
+        assert isinstance(negotiator, Negotiator)
+        assert NEGOTIATOR_REGISTRY[type_name].cls is not None
+
+    def test_version_change_marks_stale(self, manifest_file, monkeypatch):
+        """A manifest written for other package versions should be revalidated."""
+        NegotiatorFactory.refresh_registry()
+        monkeypatch.setattr(
+            negotiator_factory, "_distribution_version", lambda name: "0.0.0"
+        )
+
+        assert negotiator_factory._load_manifest()
+        assert negotiator_factory._registry_stale.is_set()
+
+    def test_sources_change_during_discovery(self, manifest_file, monkeypatch):
+        """A sources change while discovery runs should trigger another run."""
+        runs = []
+
+        def discover():
+            runs.append(1)
+            if len(runs) == 1:
+                negotiator_factory._on_settings_changed("negotiator_sources")
+
+        monkeypatch.setattr(negotiator_factory, "_discover_all_negotiators", discover)
+        monkeypatch.setattr(negotiator_factory, "_discovery_thread", None)
+        NegotiatorFactory.refresh_registry()
+        assert len(runs) == 2
+        # Rerun by the running discovery, not by another thread
+        assert negotiator_factory._discovery_thread is None
+        assert not negotiator_factory._registry_stale.is_set()
+        assert not negotiator_factory._rerun_requested.is_set()
+
+    def test_missing_or_invalid_manifest(self, manifest_file):
+        """Missing or corrupt manifests should not be loaded."""
+        assert not negotiator_factory._load_manifest()
+        manifest_file.write_text("{not json")
+        assert not negotiator_factory._load_manifest()
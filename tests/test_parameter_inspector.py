@@ -0,0 +1,82 @@
+"""Tests for the negotiator parameter manifest."""
+
+import json
+
+import pytest
+
+from negmas_app.services import parameter_inspector
+from negmas_app.services.parameter_inspector import (
+    get_negotiator_parameters,
+    save_parameter_cache,
+    warm_parameter_cache,
+)
+
+TYPES = ["negmas.sao.AspirationNegotiator", "negmas.sao.NaiveTitForTatNegotiator"]
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    """Use an empty manifest in a temporary directory."""
+    path = tmp_path / "negotiator_params.json"
+    monkeypatch.setattr(parameter_inspector, "CACHE_FILE", path)
+    monkeypatch.setattr(parameter_inspector, "_PARAMETER_CACHE", {})
+    monkeypatch.setattr(parameter_inspector, "_manifest", None)
+    monkeypatch.setattr(parameter_inspector, "SAVE_DELAY", 60.0)
+    yield path
+    parameter_inspector.clear_parameter_cache()
+
+
+def _restart(monkeypatch):
+    """Forget what this process inspected, as after a restart."""
+    monkeypatch.setattr(parameter_inspector, "_PARAMETER_CACHE", {})
+    monkeypatch.setattr(parameter_inspector, "_manifest", None)
+
+
+class TestParameterManifest:
+    """Test loading, batching and invalidating the manifest."""
+
+    def test_inspections_saved_in_batches(self, cache_file, monkeypatch):
+        params = [get_negotiator_parameters(t) for t in TYPES]
+        assert all(params)
+        # Written after SAVE_DELAY, once for both types
+        assert not cache_file.exists()
+        save_parameter_cache()
+        data = json.loads(cache_file.read_text())
+        assert data["version"] == parameter_inspector.MANIFEST_VERSION
+        assert set(data["entries"]) == set(TYPES)
+        assert data["entries"][TYPES[0]]["package"].startswith("negmas==")
+
+        _restart(monkeypatch)
+        monkeypatch.setattr(
+            parameter_inspector, "_inspect_negotiator_class", pytest.fail
+        )
+        assert get_negotiator_parameters(TYPES[0]) == params[0]
+
+    def test_other_package_version_reinspected(self, cache_file, monkeypatch):
+        warm_parameter_cache(TYPES)
+        data = json.loads(cache_file.read_text())
+        data["entries"][TYPES[0]]["package"] = "negmas==0.0.1"
+        data["entries"][TYPES[0]]["params"] = []
+        cache_file.write_text(json.dumps(data))
+
+        _restart(monkeypatch)
+        assert get_negotiator_parameters(TYPES[0])
+        assert get_negotiator_parameters(TYPES[1])
+        assert parameter_inspector._manifest_dirty
+
+    def test_warm_up(self, cache_file, monkeypatch):
+        assert warm_parameter_cache(TYPES) == 2
+        assert set(json.loads(cache_file.read_text())["entries"]) == set(TYPES)
+        assert warm_parameter_cache(TYPES) == 0
+
+        _restart(monkeypatch)
+        assert warm_parameter_cache(TYPES) == 0
+        assert set(parameter_inspector._PARAMETER_CACHE) == set(TYPES)
+
+    def test_old_or_invalid_file_ignored(self, cache_file):
+        cache_file.write_text(json.dumps({TYPES[0]: []}))
+        assert get_negotiator_parameters(TYPES[0])
+        cache_file.write_text("{")
+        parameter_inspector._manifest = None
+        parameter_inspector._PARAMETER_CACHE.clear()
+        assert get_negotiator_parameters(TYPES[0])
@@ -0,0 +1,172 @@
+"""Tests for reusing negotiation results across tournaments."""
+
+from pathlib import Path
+
+import pytest
+from negmas.sao import (
+    AspirationNegotiator,
+    BoulwareTBNegotiator,
+    NaiveTitForTatNegotiator,
+)
+
+from negmas_app.models.tournament import TournamentConfig, TournamentStatus
+from negmas_app.services import result_cache
+from negmas_app.services.result_cache import (
+    ResultCache,
+    TournamentResultCache,
+    is_deterministic,
+    scenario_fingerprint,
+)
+from negmas_app.services.tournament_manager import TournamentManager
+
+TYPES = [AspirationNegotiator, NaiveTitForTatNegotiator, BoulwareTBNegotiator]
+TYPE_NAMES = [
+    "negmas.sao.AspirationNegotiator",
+    "negmas.sao.NaiveTitForTatNegotiator",
+    "negmas.sao.BoulwareTBNegotiator",
+]
+
+
+@pytest.fixture(autouse=True)
+def cache_file(tmp_path, monkeypatch):
+    path = tmp_path / "cache" / "results.sqlite"
+    monkeypatch.setattr(result_cache, "CACHE_FILE", path)
+    return path
+
+
+def _scenarios(tmp_path, names=("S1", "S2")):
+    paths = []
+    for name in names:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "domain.yml").write_text(f"name: {name}\n")
+        paths.append(str(tmp_path / name))
+    return paths
+
+
+def _records(cache):
+    """One record per run of a tournament, as negmas reports them."""
+    records = []
+    for a, b in cache._pairs():
+        for s, name in enumerate(cache.scenario_names):
+            for rotation in cache.rotations:
+                for rep in range(cache.n_repetitions):
+                    records.append(
+                        {
+                            "partners": [
+                                cache.competitor_names[a],
+                                cache.second_names[b],
+                            ],
+                            "scenario": f"{name}-{rotation}" if rotation else name,
+                            "rep": rep,
+                            "agreement": [a, b, s],
+                            "utilities": [0.5, 0.25],
+                        }
+                    )
+    return records
+
+
+class TestResultCache:
+    """Test keys, storage and planning."""
+
+    def test_fingerprint_ignores_app_caches(self, tmp_path):
+        path = Path(_scenarios(tmp_path, ["S"])[0])
+        fingerprint = scenario_fingerprint(path)
+
+        (path / "_stats.yaml").write_text("stats: 1\n")
+        (path / "_plots").mkdir()
+        (path / "_plots" / "plot.webp").write_bytes(b"x")
+        assert scenario_fingerprint(path) == fingerprint
+        (path / "domain.yml").write_text("name: other\n")
+        assert scenario_fingerprint(path) != fingerprint
+
+    def test_only_fixed_settings_are_cached(self):
+        assert is_deterministic(TournamentConfig([], [], n_steps=100))
+        assert not is_deterministic(TournamentConfig([], [], n_steps=(10, 100)))
+
+    def test_reuses_league_and_plans_missing(self, tmp_path):
+        paths = _scenarios(tmp_path)
+        config = TournamentConfig(TYPE_NAMES[:2], paths, n_repetitions=2)
+        league = TournamentResultCache(config, paths, ["S1", "S2"], TYPES[:2])
+        assert league.plan().cached == []
+        assert league.store(_records(league) + [{"has_error": True}]) == 32
+
+        # Add a competitor: only its pairings are missing
+        config = TournamentConfig(TYPE_NAMES, paths, n_repetitions=2)
+        bigger = TournamentResultCache(config, paths, ["S1", "S2"], TYPES)
+        plan = bigger.plan()
+
+        assert plan.n_runs == 72 and len(plan.cached) == 32
+        parts = [(p.competitors, p.opponents, p.scenarios) for p in plan.parts]
+        assert parts == [([0, 1], [2], [0, 1]), ([2], [0, 1, 2], [0, 1])]
+        cached = {
+            (tuple(r["partners"]), r["scenario"], r["rep"]): r for r in plan.cached
+        }
+        partners = ("AspirationNegotiator", "NaiveTitForTatNegotiator")
+        record = cached[(partners, "S2-1", 1)]
+        assert record["agreement"] == [0, 1, 1]
+        assert record["scored_indices"] is None
+
+        # Different settings do not match
+        config = TournamentConfig(TYPE_NAMES[:2], paths, n_repetitions=2, n_steps=50)
+        other = TournamentResultCache(config, paths, ["S1", "S2"], TYPES[:2])
+        assert other.plan().cached == []
+        assert ResultCache.stats()["n_runs"] == 32
+        assert ResultCache.clear() == 32
+
+    def test_explicit_opponents(self, tmp_path):
+        paths = _scenarios(tmp_path, ["S1"])
+        config = TournamentConfig(
+            TYPE_NAMES[:1], paths, opponent_types=TYPE_NAMES[1:], rotate_ufuns=False
+        )
+        cache = TournamentResultCache(config, paths, ["S1"], TYPES[:1], TYPES[1:])
+        cache.store(_records(cache))
+
+        plan = cache.plan()
+
+        assert plan.parts == [] and len(plan.cached) == 2
+        assert all(r["scored_indices"] == [0] for r in plan.cached)
+
+
+class TestTournamentWithCache:
+    """Test running tournaments that reuse cached runs."""
+
+    @staticmethod
+    async def _run(paths, save_path, n_competitors):
+        manager = TournamentManager()
+        session = manager.create_session(
+            TournamentConfig(
+                competitor_types=TYPE_NAMES[:n_competitors],
+                scenario_paths=paths,
+                n_repetitions=1,
+                rotate_ufuns=False,
+                n_steps=20,
+                save_path=str(save_path),
+                use_result_cache=True,
+            )
+        )
+        events = [e async for e in manager.run_tournament_stream(session.id)]
+        return events[-1]
+
+    @pytest.mark.asyncio
+    async def test_adds_competitor(self, sample_scenario_paths, tmp_path):
+        if not sample_scenario_paths:
+            pytest.skip("No sample scenarios available")
+        paths = sample_scenario_paths[:1]
+
+        first = await self._run(paths, tmp_path / "t1", 2)
+        assert first.status == TournamentStatus.COMPLETED
+        assert ResultCache.stats()["n_runs"] == 4
+
+        second = await self._run(paths, tmp_path / "t2", 3)
+        assert second.status == TournamentStatus.COMPLETED
+        assert second.results.total_negotiations == 9
+        assert ResultCache.stats()["n_runs"] == 9
+        assert (tmp_path / "t2" / "config.yaml").exists()
+
+        # Everything cached: nothing is negotiated, same scores
+        third = await self._run(paths, tmp_path / "t3", 3)
+        assert third.results.total_negotiations == 9
+        assert not (tmp_path / "t3" / "negotiations").exists()
+        assert [(s.name, s.score) for s in third.results.final_scores] == [
+            (s.name, s.score) for s in second.results.final_scores
+        ]
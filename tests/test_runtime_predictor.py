@@ -0,0 +1,190 @@
+"""Tests for run-time prediction, cost-aware run ordering and the ETA."""
+
+import json
+from math import log
+
+import pandas as pd
+import pytest
+
+from negmas_app.models.tournament import (
+    CellUpdate,
+    TournamentConfig,
+    TournamentProgress,
+    TournamentStatus,
+)
+from negmas_app.services import runtime_predictor
+from negmas_app.services.runtime_predictor import (
+    EtaTracker,
+    RuntimePredictor,
+    longest_first,
+    scenario_costs,
+)
+from negmas_app.services.tournament_manager import TournamentManager
+
+FAST = "negmas.sao.FastNegotiator"
+SLOW = "negmas.sao.SlowNegotiator"
+
+
+def _history():
+    """Timed runs: seconds = 1e-4 * sqrt(outcomes) * steps, 4x with SLOW."""
+    rows = []
+    for n_outcomes in (10, 100, 1000):
+        for n_steps in (10, 100):
+            for types in ([FAST, FAST], [FAST, SLOW], [SLOW, FAST]):
+                factor = 4.0 if SLOW in types else 1.0
+                rows.append(
+                    (1e-4 * n_outcomes**0.5 * n_steps * factor, n_outcomes, n_steps)
+                    + (types,)
+                )
+    return rows
+
+
+class TestRuntimePredictor:
+    """Test fitting and predicting."""
+
+    def test_fit_and_predict(self):
+        seconds, n_outcomes, n_steps, types = zip(*_history())
+
+        predictor = RuntimePredictor.fit(seconds, n_outcomes, n_steps, types)
+
+        assert predictor is not None and predictor.n_samples == 18
+        assert predictor.size_coef == pytest.approx(0.5, abs=0.05)
+        assert predictor.steps_coef == pytest.approx(1.0, abs=0.1)
+        slow = predictor.predict([FAST, SLOW], 100, 100)
+        fast = predictor.predict([FAST, FAST], 100, 100)
+        assert slow / fast == pytest.approx(4.0, rel=0.3)
+        assert predictor.predict([FAST, FAST], 1000, 100) > fast
+        # Unknown types are average and time limits cap predictions
+        assert fast < predictor.predict(["x", "y"], 100, 100) < slow
+        assert predictor.predict([SLOW, SLOW], 1000, 100, time_limit=0.01) == 0.01
+
+    def test_fit_needs_samples_and_fixes_constant_limits(self):
+        assert RuntimePredictor.fit([1.0], [10], [100], [[FAST]]) is None
+
+        rows = [r for r in _history() if r[2] == 100] * 2
+        predictor = RuntimePredictor.fit(*zip(*rows))
+
+        # All runs had 100 steps: time is taken as proportional to steps
+        assert predictor.steps_coef == 1.0
+        ratio = predictor.predict([FAST], 100, 1000) / predictor.predict(
+            [FAST], 100, 100
+        )
+        assert ratio == pytest.approx(1001 / 101)
+
+    def test_from_saved_tournaments(self, tmp_path):
+        tournament = tmp_path / "t1"
+        for name, n_values in (("Small", 3), ("Big", 30)):
+            scenario = tournament / "scenarios" / name
+            scenario.mkdir(parents=True)
+            values = "\n".join(f"  - v{i}" for i in range(n_values))
+            (scenario / f"{name}.yml").write_text(
+                f"issues:\n- name: i\n  type: CategoricalIssue\n  values:\n{values}\n"
+                f"name: {name}\ntype: negmas.outcomes.CartesianOutcomeSpace\n"
+            )
+            (scenario / "0_u.yml").write_text("type: LinearAdditiveUtilityFunction\n")
+        rows = [
+            {
+                "execution_time": (0.3 if scenario.startswith("Big") else 0.01) * k,
+                "n_steps": 100,
+                "step": 50,
+                "negotiator_types": json.dumps([FAST, FAST]),
+                "scenario": scenario,
+                "has_error": False,
+            }
+            for scenario in ("Small", "Big", "Big-1")
+            for k in (1, 1.1, 1.2, 0.9)
+        ]
+        pd.DataFrame(rows).to_parquet(tournament / "details.parquet")
+
+        predictor = RuntimePredictor.from_saved_tournaments(tmp_path)
+
+        assert predictor is not None and predictor.n_samples == 12
+        assert predictor.predict([FAST, FAST], 30, 100) == pytest.approx(0.3, rel=0.2)
+        # Cached until the details change
+        assert RuntimePredictor.from_saved_tournaments(tmp_path) is predictor
+        pd.DataFrame(rows[:4]).to_parquet(tournament / "details.parquet")
+        assert RuntimePredictor.from_saved_tournaments(tmp_path) is None
+
+
+class _Scenario:
+    def __init__(self, n_outcomes):
+        self.outcome_space = type("OS", (), {"cardinality": n_outcomes})()
+
+
+class TestOrderingAndEta:
+    """Test scenario costs, run order and the remaining-time estimate."""
+
+    def test_scenario_costs(self):
+        predictor = RuntimePredictor(size_coef=1.0, type_effects={SLOW: log(4)})
+        scenarios = [_Scenario(10), _Scenario(1000), _Scenario(float("inf"))]
+
+        costs = scenario_costs(predictor, scenarios, [FAST, SLOW], [FAST, SLOW])
+
+        # Mean over pairings: (1 + 4 + 4 + 16) / 4 per outcome
+        assert costs[0] == pytest.approx(10 * 25 / 4, rel=1e-6)
+        assert longest_first(costs) == [1, 0, 2]
+        no_self_play = scenario_costs(
+            predictor, scenarios[:1], [FAST, SLOW], [FAST, SLOW], self_play=False
+        )
+        assert no_self_play[0] == pytest.approx(10 * 4, rel=1e-6)
+        assert scenario_costs(None, scenarios, [FAST], [FAST]) == [1.0] * 3
+
+    def test_eta(self):
+        eta = EtaTracker({"A": 3.0, "B": 1.0}, runs_per_scenario=2)
+        assert eta.total == 8.0 and eta.eta() is None
+
+        eta._started -= 6.0
+        eta.completed("A-1")
+        # 6s for 3 of 8 cost units
+        assert eta.eta() == pytest.approx(10.0, rel=0.01)
+
+        eta.restart()
+        assert eta.total == 5.0 and eta.eta() is None
+        eta.completed("B")
+        assert eta.eta() == pytest.approx(0.0, abs=0.1)
+
+
+class TestTournamentOrdering:
+    """Test longest-first ordering in a running tournament."""
+
+    @pytest.mark.asyncio
+    async def test_runs_largest_scenario_first(
+        self, sample_scenario_paths, monkeypatch
+    ):
+        if len(sample_scenario_paths) < 2:
+            pytest.skip("No sample scenarios available")
+        # Time grows with the outcome space
+        predictor = RuntimePredictor(size_coef=1.0)
+        monkeypatch.setattr(
+            RuntimePredictor,
+            "from_saved_tournaments",
+            classmethod(lambda cls, tournaments_dir=None: predictor),
+        )
+        manager = TournamentManager()
+        session = manager.create_session(
+            TournamentConfig(
+                competitor_types=[
+                    "negmas.sao.AspirationNegotiator",
+                    "negmas.sao.NaiveTitForTatNegotiator",
+                ],
+                scenario_paths=sample_scenario_paths,
+                n_repetitions=1,
+                rotate_ufuns=False,
+                n_steps=10,
+                njobs=-1,
+                randomize_runs=True,
+                order_runs_by_cost=True,
+            )
+        )
+
+        events = [e async for e in manager.run_tournament_stream(session.id)]
+
+        assert events[-1].status == TournamentStatus.COMPLETED
+        state = manager.get_tournament_state(session.id)
+        sizes = [runtime_predictor._n_outcomes(s) for s in state.scenarios]
+        assert sizes == sorted(sizes, reverse=True)
+        started = [e for e in events if isinstance(e, CellUpdate)]
+        assert started[0].scenario_idx == 0
+        progress = [e for e in events if isinstance(e, TournamentProgress)]
+        assert progress[-1].eta_seconds is not None
+        assert progress[-1].eta_seconds < 1.0
@@ -178,10 +178,69 @@ class TestSavedNegotiationsAPI:
             response = client.post(f"/api/negotiation/saved/{session_id}/unarchive")
             assert response.status_code == 200
 
+    def test_preview_not_found(self, client: TestClient):
+        """Test requesting a preview for a negotiation that does not exist."""
+        response = client.get("/api/negotiation/saved/does-not-exist/preview/timeline")
+        assert response.status_code == 404
+
+    def test_download_not_found(self, client: TestClient):
+        """Test downloading a negotiation that does not exist."""
+        response = client.get("/api/negotiation/saved/does-not-exist/download")
+        assert response.status_code == 404
+
+    def test_preview_rendered_in_background(
+        self,
+        client: TestClient,
+        sample_scenario_path: str,
+        native_negotiator_types: list[str],
+    ):
+        """Test that previews are served as a placeholder until rendered."""
+        if sample_scenario_path is None:
+            pytest.skip("No sample scenario available")
+
+        response = client.post(
+            "/api/negotiation/start_background",
+            json={
+                "scenario_path": sample_scenario_path,
+                "negotiators": [
+                    {"type_name": native_negotiator_types[0], "name": "PrevAgent1"},
+                    {"type_name": native_negotiator_types[1], "name": "PrevAgent2"},
+                ],
+                "mechanism_type": "SAOMechanism",
+                "mechanism_params": {"n_steps": 5},
+                "step_delay": 0.0,
+                "auto_save": True,
+            },
+        )
+        session_id = response.json()["session_id"]
+        time.sleep(2)
+
+        url = f"/api/negotiation/saved/{session_id}/preview/timeline"
+        response = client.get(url)
+        if response.status_code == 404:
+            pytest.skip("Negotiation was not saved")
+
+        # Placeholder (202) until the background render finishes
+        deadline = time.time() + 60
+        while response.status_code == 202 and time.time() < deadline:
+            assert response.headers["content-type"].startswith("image/svg+xml")
+            time.sleep(0.5)
+            response = client.get(url)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("image/")
+
+        client.delete(f"/api/negotiation/saved/{session_id}")
+
 
 class TestSavedTournamentsAPI:
     """Tests for /api/tournament/saved endpoints."""
 
+    def test_download_not_found(self, client: TestClient):
+        """Test downloading a tournament that does not exist."""
+        response = client.get("/api/tournament/saved/does-not-exist/download")
+        assert response.status_code == 404
+
     def test_list_saved_tournaments_empty(self, client: TestClient):
         """Test listing saved tournaments."""
         response = client.get("/api/tournament/saved/list")
@@ -0,0 +1,155 @@
+"""Tests for the indexed scenario catalog."""
+
+import time
+
+import pytest
+
+from negmas_app.models import ScenarioInfo, ScenarioQuery
+from negmas_app.services.scenario_catalog import (
+    ScenarioCatalog,
+    enrich_from_sidecars,
+    query_from_filter_data,
+)
+
+
+def _info(name, n_outcomes=None, opposition=None, tags=(), source="app", n=2):
+    return ScenarioInfo(
+        path=f"/scenarios/{name}",
+        name=name,
+        n_negotiators=n,
+        n_outcomes=n_outcomes,
+        opposition=opposition,
+        tags=list(tags),
+        source=source,
+    )
+
+
+@pytest.fixture
+def catalog():
+    return ScenarioCatalog(
+        [
+            _info("Laptop", 27, 0.27, ["anac", "xml", "normalized"]),
+            _info("Camera", 3600, 0.5, ["anac", "xml"]),
+            _info("Grocery", 1600, None, ["yaml"], source="user"),
+            _info("Party", None, 0.8, ["anac", "yaml"], n=3),
+        ]
+    )
+
+
+def _names(catalog, **kwargs):
+    scenarios, _ = catalog.query(ScenarioQuery(**kwargs))
+    return [s.name for s in scenarios]
+
+
+class TestScenarioCatalog:
+    """Test filtering, sorting and pagination."""
+
+    def test_no_filters_keeps_registry_order(self, catalog):
+        assert _names(catalog) == ["Laptop", "Camera", "Grocery", "Party"]
+
+    def test_ranges_keep_unknown_values(self, catalog):
+        """Range bounds are inclusive and rows with unknown values match."""
+        assert _names(catalog, min_outcomes=1600) == ["Camera", "Grocery", "Party"]
+        assert _names(catalog, min_opposition=0.3, max_opposition=0.5) == [
+            "Camera",
+            "Grocery",
+        ]
+        assert _names(catalog, min_negotiators=3) == ["Party"]
+
+    def test_tags_search_and_flags(self, catalog):
+        assert _names(catalog, tags=["anac", "xml"]) == ["Laptop", "Camera"]
+        assert _names(catalog, search="CAM") == ["Camera"]
+        assert _names(catalog, search="yam") == ["Grocery", "Party"]
+        assert _names(catalog, normalized=False, anac=True) == ["Camera", "Party"]
+        assert _names(catalog, format="yaml") == ["Grocery", "Party"]
+        assert _names(catalog, source="user") == ["Grocery"]
+
+    def test_reverse_stays_within_source(self, catalog):
+        assert _names(catalog, anac=True, reverse=True) == ["Grocery"]
+        assert _names(catalog, source="app", format="xml", reverse=True) == ["Party"]
+
+    def test_sort_and_paginate(self, catalog):
+        """Unknown values sort last in both directions."""
+        assert _names(catalog, sort_by="n_outcomes") == [
+            "Laptop",
+            "Grocery",
+            "Camera",
+            "Party",
+        ]
+        assert _names(catalog, sort_by="opposition", descending=True) == [
+            "Party",
+            "Camera",
+            "Laptop",
+            "Grocery",
+        ]
+        page, total = catalog.query(ScenarioQuery(sort_by="name", offset=1, limit=2))
+        assert [s.name for s in page] == ["Grocery", "Laptop"]
+        assert total == 4
+
+        with pytest.raises(ValueError):
+            catalog.query(ScenarioQuery(sort_by="unknown"))
+
+    def test_upsert_and_remove(self, catalog):
+        catalog.upsert(_info("Camera", 10, 0.5, ["anac"]))
+        catalog.upsert(_info("Itex", 180, 0.6))
+        catalog.remove("/scenarios/Laptop")
+
+        assert _names(catalog, max_outcomes=200) == ["Camera", "Party", "Itex"]
+
+    def test_saved_filter_data(self, catalog):
+        """Saved picker filters map onto queries; explicit values override."""
+        data = {
+            "search": "",
+            "source": "",
+            "minOutcomes": 100,
+            "maxOutcomes": None,
+            "anac": True,
+            "format": "",
+            "reverseFilter": False,
+        }
+        query = query_from_filter_data(data, sort_by="name")
+
+        assert query.min_outcomes == 100 and query.anac is True
+        assert query.source is None and query.format is None
+        assert _names(catalog, **vars(query)) == ["Camera", "Party"]
+        assert query_from_filter_data(data, anac=False).anac is False
+
+    def test_query_latency_is_flat(self):
+        """Queries over 20k scenarios stay well under the picker budget."""
+        infos = [
+            _info(f"s{i}", i * 7 % 5000, (i % 100) / 100, ["anac"] if i % 3 else [])
+            for i in range(20_000)
+        ]
+        big = ScenarioCatalog(infos)
+        big.query(ScenarioQuery())  # Build indexes
+
+        start = time.perf_counter()
+        for _ in range(10):
+            _, total = big.query(
+                ScenarioQuery(
+                    search="s1",
+                    tags=["anac"],
+                    min_outcomes=100,
+                    max_opposition=0.5,
+                    sort_by="n_outcomes",
+                    limit=50,
+                )
+            )
+        assert total > 0
+        assert (time.perf_counter() - start) / 10 < 0.05
+
+
+class TestSidecars:
+    """Test filling values the registry lacks."""
+
+    def test_reads_info_and_stats_header(self, tmp_path):
+        (tmp_path / "_info.yml").write_text("n_outcomes: 42\nrational_fraction: 0.5\n")
+        (tmp_path / "_stats.yaml").write_text("opposition: 0.25\nutility_ranges: []\n")
+        info = ScenarioInfo(path=str(tmp_path), name="x", n_negotiators=2)
+
+        enrich_from_sidecars(info)
+
+        assert info.n_outcomes == 42
+        assert info.rational_fraction == 0.5
+        assert info.opposition == 0.25
+        assert info.has_stats and info.has_info
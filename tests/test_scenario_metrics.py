@@ -0,0 +1,159 @@
+"""Tests for the batched scenario metrics kernel."""
+
+import asyncio
+import math
+import os
+import shutil
+
+import numpy as np
+import pytest
+from negmas import Scenario
+from negmas.outcomes import make_issue, make_os
+from negmas.preferences import LinearAdditiveUtilityFunction, MappingUtilityFunction
+from negmas.preferences.ops import is_rational, opposition_level
+
+from negmas_app.services import scenario_metrics
+from negmas_app.services.scenario_metrics import (
+    ScenarioMetricsService,
+    compute_utility_matrix,
+    metrics_from_utilities,
+)
+
+
+@pytest.fixture
+def scenario_dir(tmp_path, sample_scenario_path):
+    """A writable copy of the sample scenario."""
+    if sample_scenario_path is None:
+        pytest.skip("No sample scenario available")
+    path = tmp_path / "scenario"
+    shutil.copytree(sample_scenario_path, path)
+    ScenarioMetricsService.clear_cache()
+    yield path
+    ScenarioMetricsService.clear_cache()
+
+
+class TestMetricsKernel:
+    """Test that the kernel matches negmas' per-outcome functions."""
+
+    def test_matches_negmas(self, scenario_dir):
+        """Rational fraction and opposition should match is_rational/opposition_level."""
+        scenario = Scenario.load(scenario_dir)
+        # Make some outcomes irrational so the fraction is not trivially 1
+        for ufun in scenario.ufuns:
+            ufun.reserved_value = 0.5
+        outcomes = list(scenario.outcome_space.enumerate_or_sample())
+
+        metrics = ScenarioMetricsService.compute(scenario)
+
+        expected_fraction = sum(
+            1 for o in outcomes if is_rational(scenario.ufuns, o)
+        ) / len(outcomes)
+        expected_opposition = opposition_level(
+            scenario.ufuns, outcomes=outcomes, max_tests=len(outcomes)
+        )
+        assert metrics.n_evaluated == len(outcomes)
+        assert not metrics.sampled
+        assert metrics.rational_fraction == pytest.approx(expected_fraction)
+        assert metrics.opposition == pytest.approx(expected_opposition)
+        assert metrics.reserved_values == [0.5] * len(scenario.ufuns)
+        for ufun, (lo, hi) in zip(scenario.ufuns, metrics.utility_ranges):
+            values = [float(ufun(o)) for o in outcomes]
+            assert (lo, hi) == pytest.approx((min(values), max(values)))
+
+    def test_utility_matrix_edge_cases(self):
+        """NaN counts as rational, no rational outcome gives infinite opposition."""
+        utils = np.array([[0.9, 0.1], [np.nan, 0.8], [0.2, 0.2]])
+
+        metrics = metrics_from_utilities(utils, [0.3, None])
+
+        assert metrics.rational_fraction == pytest.approx(2 / 3)
+        assert metrics.individual_rational_fractions == pytest.approx([2 / 3, 1.0])
+        assert metrics.opposition == pytest.approx(math.hypot(0.1, 0.9))
+        assert metrics.utility_ranges[0] == pytest.approx((0.2, 0.9))
+
+        none_rational = metrics_from_utilities(utils, [1.0, 1.0])
+        assert none_rational.rational_fraction == 0.0
+        assert math.isinf(none_rational.opposition)
+
+
+class TestUtilityMatrix:
+    """Test evaluating linear ufuns per issue value."""
+
+    def test_linear_ufuns_match_calls(self, scenario_dir):
+        scenario = Scenario.load(scenario_dir)
+        outcomes = list(scenario.outcome_space.enumerate_or_sample())
+        expected = np.array([[float(u(o)) for u in scenario.ufuns] for o in outcomes])
+        vectorized = scenario_metrics._linear_utilities
+        utils = compute_utility_matrix(scenario.ufuns, outcomes)
+        assert np.allclose(utils, expected)
+        encoded = scenario_metrics._encode_outcomes(outcomes)
+        for ufun in scenario.ufuns:
+            assert vectorized(ufun, encoded, len(outcomes)) is not None
+
+    def test_other_ufuns_called_per_outcome(self):
+        issues = [make_issue(values=3, name="a"), make_issue(values=["x", "y"])]
+        outcomes = list(make_os(issues).enumerate())
+        linear = LinearAdditiveUtilityFunction(
+            values=[lambda v: v / 2, {"x": 0.0, "y": 1.0}],
+            weights=[0.5, 0.5],
+            bias=0.1,
+            issues=issues,
+        )
+        custom = MappingUtilityFunction(lambda o: o[0] * 0.25, issues=issues)
+        utils = compute_utility_matrix([linear, custom], outcomes)
+        assert np.allclose(utils[:, 0], [float(linear(o)) for o in outcomes])
+        assert np.allclose(utils[:, 1], [o[0] * 0.25 for o in outcomes])
+
+
+class TestMetricsCache:
+    """Test the fingerprint cache."""
+
+    def test_cached_until_definition_changes(self, scenario_dir, monkeypatch):
+        """Metrics should be reused until a scenario file changes."""
+        calls = []
+        compute = ScenarioMetricsService.compute
+
+        def counting_compute(*args, **kwargs):
+            calls.append(1)
+            return compute(*args, **kwargs)
+
+        monkeypatch.setattr(
+            ScenarioMetricsService, "compute", staticmethod(counting_compute)
+        )
+
+        first = ScenarioMetricsService.get(scenario_dir)
+        assert ScenarioMetricsService.get(scenario_dir) is first
+
+        # App cache files do not invalidate the metrics
+        (scenario_dir / "_info.yaml").write_text("n_outcomes: 1\n")
+        ScenarioMetricsService.get(scenario_dir)
+        assert len(calls) == 1
+
+        definition = next(
+            p
+            for p in scenario_dir.iterdir()
+            if p.is_file() and not p.name.startswith("_")
+        )
+        st = definition.stat()
+        os.utime(definition, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        ScenarioMetricsService.get(scenario_dir)
+        assert len(calls) == 2
+
+    async def test_get_async_runs_in_process(self, scenario_dir, monkeypatch):
+        """Missing metrics should be computed in a worker process and cached."""
+        monkeypatch.setattr(
+            ScenarioMetricsService,
+            "compute",
+            staticmethod(pytest.fail),  # not in this process
+        )
+        try:
+            first, second = await asyncio.gather(
+                ScenarioMetricsService.get_async(scenario_dir),
+                ScenarioMetricsService.get_async(scenario_dir),
+            )
+            assert first.rational_fraction is not None
+            assert second == first
+            assert await ScenarioMetricsService.get_async(scenario_dir) is first
+            assert not scenario_metrics._pending
+        finally:
+            scenario_metrics.shutdown_metrics_pool()
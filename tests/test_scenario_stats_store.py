@@ -0,0 +1,189 @@
+"""Tests for the split (header + binary sidecar) scenario stats format."""
+
+import shutil
+
+import numpy as np
+import pytest
+from negmas import Scenario
+from negmas.helpers.inout import dump
+from negmas.mechanisms import CompletedRun
+
+from negmas_app.services.negotiation_storage import NegotiationStorageService
+from negmas_app.services.outcome_analysis import compute_outcome_space_data
+from negmas_app.services.scenario_loader import ScenarioLoader
+from negmas_app.services.scenario_stats_store import (
+    PARETO_OUTCOMES_FILE_NAME,
+    PARETO_UTILS_FILE_NAME,
+    STATS_FILE_NAME,
+    ScenarioStatsStore,
+)
+from negmas_app.services.tournament_storage import TournamentStorageService
+
+
+@pytest.fixture
+def scenario_dir(tmp_path, sample_scenario_path):
+    """A writable copy of the sample scenario without cached stats."""
+    if sample_scenario_path is None:
+        pytest.skip("No sample scenario available")
+    path = tmp_path / "scenario"
+    shutil.copytree(sample_scenario_path, path)
+    ScenarioStatsStore.remove(path)
+    return path
+
+
+@pytest.fixture
+def scenario_with_stats(scenario_dir):
+    """The scenario with stats computed (not yet saved)."""
+    scenario = Scenario.load(scenario_dir)
+    scenario.calc_stats()
+    return scenario
+
+
+class TestScenarioStatsStore:
+    """Test saving and loading split stats."""
+
+    def test_save_writes_small_header_and_sidecars(
+        self, scenario_dir, scenario_with_stats
+    ):
+        """The frontier should go to .npy files, not the YAML header."""
+        assert ScenarioStatsStore.save(scenario_with_stats, scenario_dir)
+
+        header = ScenarioStatsStore.load_header(scenario_dir)
+        assert header["pareto_utils"] in ([], ())
+        assert header["pareto_outcomes"] == []
+        assert header["opposition"] == pytest.approx(
+            scenario_with_stats.stats.opposition
+        )
+
+        utils = np.load(scenario_dir / PARETO_UTILS_FILE_NAME)
+        outcomes = np.load(scenario_dir / PARETO_OUTCOMES_FILE_NAME)
+        n_pareto = len(scenario_with_stats.stats.pareto_utils)
+        assert utils.shape == (n_pareto, len(scenario_with_stats.ufuns))
+        assert outcomes.shape == (
+            n_pareto,
+            len(scenario_with_stats.outcome_space.issues),
+        )
+        assert ScenarioStatsStore.count_pareto(scenario_dir) == n_pareto
+
+    def test_load_scenario_round_trip(self, scenario_dir, scenario_with_stats):
+        """Loading should restore the frontier from the sidecars."""
+        expected = scenario_with_stats.stats
+        ScenarioStatsStore.save(scenario_with_stats, scenario_dir)
+
+        loaded = ScenarioStatsStore.load_scenario(scenario_dir)
+
+        assert np.allclose(loaded.stats.pareto_utils, expected.pareto_utils)
+        assert [tuple(o) for o in loaded.stats.pareto_outcomes] == [
+            tuple(o) for o in expected.pareto_outcomes
+        ]
+
+        header_only = ScenarioStatsStore.load_scenario(scenario_dir, load_pareto=False)
+        assert not header_only.stats.pareto_utils
+
+    def test_sidecar_is_memory_mapped(self, scenario_dir, scenario_with_stats):
+        """Frontier loads should map the file instead of reading it."""
+        ScenarioStatsStore.save(scenario_with_stats, scenario_dir)
+
+        utils = ScenarioStatsStore.load_pareto_utils(scenario_dir)
+
+        assert isinstance(utils, np.memmap)
+
+    def test_excluded_frontier_removes_stale_sidecars(
+        self, scenario_dir, scenario_with_stats
+    ):
+        """Saving without the frontier should not leave old sidecars behind."""
+        ScenarioStatsStore.save(scenario_with_stats, scenario_dir)
+        ScenarioStatsStore.save(
+            scenario_with_stats,
+            scenario_dir,
+            include_pareto_utils=False,
+            include_pareto_outcomes=False,
+        )
+
+        assert (scenario_dir / STATS_FILE_NAME).exists()
+        assert not (scenario_dir / PARETO_UTILS_FILE_NAME).exists()
+        assert not (scenario_dir / PARETO_OUTCOMES_FILE_NAME).exists()
+        assert ScenarioStatsStore.remove(scenario_dir) == 1
+
+    def test_legacy_inline_stats_still_read(self, scenario_dir, scenario_with_stats):
+        """Stats files written by negmas with the frontier inline still load."""
+        stats = scenario_with_stats.stats
+        dump(stats.to_dict(), scenario_dir / STATS_FILE_NAME)
+
+        loaded = ScenarioStatsStore.load_scenario(scenario_dir)
+
+        assert len(loaded.stats.pareto_utils) == len(stats.pareto_utils)
+        assert ScenarioStatsStore.count_pareto(scenario_dir) is None
+
+
+class TestStatsReaders:
+    """Test that stats consumers read the split format."""
+
+    def test_get_scenario_stats_counts_frontier(
+        self, scenario_dir, scenario_with_stats
+    ):
+        """get_scenario_stats should report the frontier size from the sidecar."""
+        ScenarioStatsStore.save(scenario_with_stats, scenario_dir)
+
+        info = ScenarioLoader().get_scenario_stats(scenario_dir)
+
+        assert info.has_stats
+        assert info.n_pareto_outcomes == len(scenario_with_stats.stats.pareto_utils)
+        assert info.opposition == pytest.approx(scenario_with_stats.stats.opposition)
+
+    def test_outcome_space_uses_sidecar(self, scenario_dir, scenario_with_stats):
+        """Outcome space data should take the frontier from the sidecar."""
+        ScenarioStatsStore.save(scenario_with_stats, scenario_dir)
+        scenario = Scenario.load(scenario_dir, load_stats=True)
+
+        data = compute_outcome_space_data(scenario, scenario_path=str(scenario_dir))
+
+        assert len(data.pareto_utilities) == len(
+            scenario_with_stats.stats.pareto_utils
+        )
+
+    def test_readers_restore_frontier(
+        self, client, tmp_path, monkeypatch, scenario_dir, scenario_with_stats
+    ):
+        """Every reader of saved scenarios should see the sidecar frontier."""
+        ScenarioStatsStore.save(scenario_with_stats, scenario_dir)
+        expected = scenario_with_stats.stats.pareto_utils
+        outcome = scenario_with_stats.stats.pareto_outcomes[0]
+        issues = scenario_with_stats.outcome_space.issues
+
+        # Optimality of a Pareto-optimal agreement (distance 0 to the frontier)
+        response = client.post(
+            "/api/negotiation/calculate-stats",
+            json={
+                "scenario_path": str(scenario_dir),
+                "agreement": {i.name: v for i, v in zip(issues, outcome)},
+            },
+        )
+        assert response.status_code == 200
+        stats = response.json()["optimality_stats"]
+        assert stats["pareto_optimality"] == pytest.approx(1.0)
+
+        # Reloaded negotiations
+        run = CompletedRun(
+            history=[],
+            history_type="history",
+            scenario=None,
+            agreement=None,
+            agreement_stats=None,
+            outcome_stats={},
+            config={},
+            metadata={"scenario_path": str(scenario_dir)},
+        )
+        session = NegotiationStorageService._session_from_completed_run(
+            run, "reloaded", str(tmp_path)
+        )
+        assert len(session.outcome_space_data.pareto_utilities) == len(expected)
+
+        # Scenarios of saved tournaments
+        monkeypatch.setattr(TournamentStorageService, "TOURNAMENTS_DIR", tmp_path)
+        shutil.copytree(scenario_dir, tmp_path / "t1" / "scenarios" / "s")
+        data = TournamentStorageService.get_outcome_space_data("t1", "s")
+        assert len(data["pareto_utilities"]) == len(expected)
+        response = client.get("/api/tournament/saved/t1/scenario/s/serialized")
+        assert response.status_code == 200
+        assert len(response.json()["data"]["stats"]["pareto_utils"]) == len(expected)
@@ -0,0 +1,81 @@
+"""Tests for request latency, event loop and cache metrics."""
+
+import asyncio
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from negmas_app.services import server_metrics
+from negmas_app.services.server_metrics import (
+    LoopMonitor,
+    record_cache,
+    render_metrics,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_metrics():
+    server_metrics.reset_metrics()
+    yield
+    server_metrics.reset_metrics()
+
+
+def test_latency_per_route(client: TestClient):
+    for _ in range(2):
+        assert client.get("/api/system/deletions").status_code == 200
+    client.get("/api/tournament/no-such-session")
+    record_cache("scenario_info", True)
+    record_cache("scenario_info", False)
+    record_cache("scenario_info", True)
+
+    text = client.get("/api/system/metrics").text
+    assert (
+        'negmas_app_request_duration_seconds_count{method="GET",'
+        'route="/api/system/deletions"} 2'
+    ) in text
+    # Grouped by route template, not by path
+    assert 'route="/api/tournament/{session_id}"' in text
+    assert "no-such-session" not in text
+    assert (
+        'negmas_app_responses_total{method="GET",route="/api/system/deletions",'
+        'status="200"} 2'
+    ) in text
+    assert 'negmas_app_cache_hit_ratio{cache="scenario_info"} 0.6667' in text
+    assert "negmas_app_active_negotiations 0" in text
+    assert "negmas_app_active_tournaments 0" in text
+
+
+def test_loop_monitor_captures_stall():
+    def blocking_handler():
+        time.sleep(0.5)
+
+    async def main():
+        monitor = LoopMonitor(threshold=0.2, interval=0.05)
+        monitor.start()
+        await asyncio.sleep(0.2)
+
+        async def handler():
+            blocking_handler()
+
+        await asyncio.create_task(handler(), name="slow-request")
+        await asyncio.sleep(0.2)
+        monitor.stop()
+        return monitor
+
+    monitor = asyncio.run(main())
+    assert monitor.n_stalls == 1
+    stall = monitor.stalls[0]
+    assert "blocking_handler" in stall.stack
+    assert stall.task is not None and stall.task.startswith("slow-request")
+    assert stall.duration is not None and stall.duration >= 0.4
+    assert monitor.lag.count > 3
+
+    server_metrics._monitor = monitor
+    try:
+        text = render_metrics()
+        assert "negmas_app_event_loop_stalls_total 1" in text
+        assert 'negmas_app_event_loop_lag_seconds_bucket{le="+Inf"}' in text
+        assert server_metrics.recent_stalls()[0]["task"] == stall.task
+    finally:
+        server_metrics._monitor = None
@@ -0,0 +1,87 @@
+"""Tests for settings caching and change notification."""
+
+import json
+import os
+
+import pytest
+from negmas_app.models.settings import PerformanceSettings
+from negmas_app.services import settings_service
+from negmas_app.services.settings_service import SettingsService
+
+
+@pytest.fixture
+def settings_dir(tmp_path, monkeypatch):
+    """Point the settings service at a temporary directory."""
+    monkeypatch.setattr(settings_service, "SETTINGS_DIR", tmp_path)
+    monkeypatch.setattr(
+        settings_service, "PERFORMANCE_SETTINGS_FILE", tmp_path / "performance.json"
+    )
+    SettingsService.clear_cache()
+    yield tmp_path
+    SettingsService.clear_cache()
+
+
+class TestSettingsCache:
+    """Test the in-memory settings cache."""
+
+    def test_save_then_load(self, settings_dir):
+        """Saved settings should be returned by the next load."""
+        SettingsService.save_performance(PerformanceSettings(preview_workers=3))
+        assert SettingsService.load_performance().preview_workers == 3
+
+    def test_unchanged_file_not_reread(self, settings_dir, monkeypatch):
+        """Loading unchanged settings should not open the file again."""
+        SettingsService.save_performance(PerformanceSettings(preview_workers=3))
+
+        def fail_open(*args, **kwargs):
+            raise AssertionError("settings file was re-read")
+
+        monkeypatch.setattr("builtins.open", fail_open)
+        assert SettingsService.load_performance().preview_workers == 3
+
+    def test_loaded_copy_is_independent(self, settings_dir):
+        """Mutating a loaded object must not affect later loads."""
+        SettingsService.save_performance(PerformanceSettings(preview_workers=3))
+        settings = SettingsService.load_performance()
+        settings.preview_workers = 7
+        assert SettingsService.load_performance().preview_workers == 3
+
+    def test_external_change_detected(self, settings_dir):
+        """Edits made outside the service should invalidate the cache."""
+        SettingsService.save_performance(PerformanceSettings(preview_workers=3))
+        SettingsService.load_performance()
+
+        path = settings_dir / "performance.json"
+        data = json.loads(path.read_text())
+        data["preview_workers"] = 12
+        path.write_text(json.dumps(data))
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert SettingsService.load_performance().preview_workers == 12
+
+
+class TestSettingsChangeListeners:
+    """Test change notification hooks."""
+
+    def test_listener_notified_on_save_and_external_change(self, settings_dir):
+        """Listeners should receive the settings name on every change."""
+        changes: list[str] = []
+        SettingsService.add_change_listener(changes.append)
+        try:
+            SettingsService.save_performance(PerformanceSettings())
+            assert changes == ["performance"]
+
+            path = settings_dir / "performance.json"
+            path.write_text(json.dumps({"preview_workers": 5, "extra": "x" * 10}))
+            SettingsService.load_performance()
+            assert changes == ["performance", "performance"]
+
+            # Unchanged file: no notification
+            SettingsService.load_performance()
+            assert len(changes) == 2
+        finally:
+            SettingsService.remove_change_listener(changes.append)
+
+        SettingsService.save_performance(PerformanceSettings())
+        assert len(changes) == 2
@@ -0,0 +1,175 @@
+"""Tests for sharded tournaments: the work queue, workers and the coordinator."""
+
+import os
+import threading
+import time
+
+import pytest
+from negmas.helpers.inout import load
+
+from negmas_app.models.tournament import (
+    TournamentConfig,
+    TournamentProgress,
+    TournamentStatus,
+)
+from negmas_app.services import shard_broker, tournament_manager
+from negmas_app.services.shard_broker import ShardQueue, run_worker
+from negmas_app.services.tournament_manager import TournamentManager
+from negmas_app.services.tournament_storage import TournamentStorageService
+
+
+def _config(scenario_paths=(), **kwargs):
+    return TournamentConfig(
+        competitor_types=[
+            "negmas.sao.AspirationNegotiator",
+            "negmas.sao.NaiveTitForTatNegotiator",
+        ],
+        scenario_paths=list(scenario_paths),
+        **kwargs,
+    )
+
+
+class TestShardQueue:
+    """Test claiming, leases and batch states."""
+
+    def test_claims_batches_once(self, tmp_path):
+        queue = ShardQueue.create(
+            tmp_path / "t1",
+            _config(n_steps=(10, 20), sharded=True),
+            ["s1", "s2", "s3"],
+            scenarios_per_batch=2,
+        )
+
+        assert ShardQueue.find(tmp_path)[0].path == queue.path
+        assert queue.claim("a") == "000000"
+        assert queue.claim("b") == "000001"
+        assert queue.claim("c") is None
+        config = queue.batch_config("000001")
+        assert config.scenario_paths == ["s3"]
+        assert config.n_steps == (10, 20)
+        assert not config.sharded and config.path_exists == "continue"
+        assert config.save_path == str(queue.result_path("000001"))
+
+        assert queue.complete("000000")
+        assert not queue.complete("000000")
+        status = queue.status()
+        assert (status["pending"], status["claimed"], status["done"]) == (0, 1, 1)
+        assert status["workers"] == ["b"]
+        assert queue.result_paths() == [queue.result_path("000000")]
+
+    def test_expired_leases_and_failures(self, tmp_path):
+        queue = ShardQueue.create(tmp_path / "t1", _config(), ["s1"])
+        batch = queue.claim("a")
+
+        assert queue.requeue_expired() == []
+        # The worker died: its claim is not touched any more
+        claim = queue.path / "claimed" / f"{batch}.json"
+        os.utime(claim, (time.time() - 1000, time.time() - 1000))
+        assert queue.requeue_expired() == [batch]
+        assert not queue.heartbeat(batch)
+
+        for attempt in range(2, shard_broker.MAX_ATTEMPTS + 1):
+            assert queue.claim("b") == batch
+            assert queue.fail(batch, f"error {attempt}")
+        status = queue.status()
+        assert status["failed"] == 1 and status["pending"] == 0
+        assert status["errors"] == {batch: f"error {shard_broker.MAX_ATTEMPTS}"}
+
+    def test_leases_use_server_clock(self, tmp_path, monkeypatch):
+        queue = ShardQueue.create(tmp_path / "t1", _config(), ["s1", "s2"])
+        batch = queue.claim("a")
+        # This host's clock is far ahead of the file server's
+        now = time.time
+        monkeypatch.setattr(shard_broker.time, "time", lambda: now() + 1000)
+        assert queue.requeue_expired() == []
+
+        # A batch being moved is fresh, whatever the age of its claim
+        claim = queue.path / "claimed" / f"{batch}.json"
+        os.utime(claim, (now() - 1000, now() - 1000))
+        private, _ = queue._take(batch, "claimed")
+        assert queue.requeue_expired() == []
+        assert private.exists()
+
+    def test_resume_kept_queue(self, tmp_path):
+        config = _config(n_steps=(10, 20), sharded=True)
+        queue = ShardQueue.create(tmp_path / "t1", config, ["s1", "s2"])
+        for _ in range(shard_broker.MAX_ATTEMPTS):
+            batch = queue.claim("a")
+            queue.fail(batch, "error")
+        assert queue.complete(queue.claim("a"))
+        assert queue.status()["failed"] == 1
+
+        assert ShardQueue.resume(tmp_path, _config(n_steps=10, sharded=True)) is None
+        resumed = ShardQueue.resume(tmp_path, _config(n_steps=(10, 20), sharded=True))
+        assert resumed.path == queue.path
+        status = queue.status()
+        assert (status["pending"], status["done"], status["failed"]) == (1, 1, 0)
+        assert queue.claim("b") == batch
+
+    def test_release_and_cancel(self, tmp_path):
+        queue = ShardQueue.create(tmp_path / "t1", _config(), ["s1"])
+        batch = queue.claim("a")
+        assert queue.release(batch)
+        assert queue.claim("b") == batch
+        info = shard_broker._read_json(queue.path / "claimed" / f"{batch}.json")
+        assert info["attempts"] == 1 and info["worker"] == "b"
+
+        assert not queue.cancelled
+        queue.cancel()
+        assert queue.cancelled
+
+
+class TestShardedTournament:
+    """Test running a tournament on a worker."""
+
+    @pytest.mark.asyncio
+    async def test_worker_runs_batches(
+        self, sample_scenario_paths, tmp_path, monkeypatch
+    ):
+        if len(sample_scenario_paths) < 2:
+            pytest.skip("No sample scenarios available")
+        monkeypatch.setattr(tournament_manager, "POLL_SECONDS", 0.1)
+        shard_dir = tmp_path / "shards"
+        stop = threading.Event()
+        worker = threading.Thread(
+            target=run_worker,
+            args=(shard_dir,),
+            kwargs={"poll_seconds": 0.1, "stop": stop},
+            daemon=True,
+        )
+        worker.start()
+        manager = TournamentManager()
+        session = manager.create_session(
+            _config(
+                scenario_paths=sample_scenario_paths[:2],
+                n_repetitions=1,
+                rotate_ufuns=False,
+                n_steps=10,
+                save_path=str(tmp_path / "t1"),
+                sharded=True,
+                shard_dir=str(shard_dir),
+            )
+        )
+
+        try:
+            events = [e async for e in manager.run_tournament_stream(session.id)]
+        finally:
+            stop.set()
+            worker.join(60)
+
+        assert events[-1].status == TournamentStatus.COMPLETED
+        results = events[-1].results
+        assert results.total_negotiations == 8
+        assert {s.name for s in results.final_scores} == {
+            "AspirationNegotiator",
+            "NaiveTitForTatNegotiator",
+        }
+        progress = [e for e in events if isinstance(e, TournamentProgress)]
+        assert progress[-1].completed == progress[-1].total == 8
+        saved = TournamentStorageService._load_results(tmp_path / "t1")
+        assert saved is not None and len(saved.details) == 8
+        config = load(tmp_path / "t1" / "config.yaml")
+        assert config["sharded"] and config["n_batches"] == 2
+        assert "combined_from" not in config
+        assert (tmp_path / "t1" / "scenarios").is_dir()
+        assert ShardQueue.find(shard_dir) == []
@@ -0,0 +1,128 @@
+"""Tests for the storage size ledger."""
+
+import os
+
+import pytest
+
+from negmas_app.services import storage_ledger
+from negmas_app.services.storage_ledger import StorageLedger
+from negmas_app.services.tournament_storage import TournamentStorageService
+
+
+def _write(path, size):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+
+
+@pytest.fixture
+def root(tmp_path):
+    """A storage root with one tournament-like directory."""
+    root = tmp_path / "tournaments"
+    _write(root / "t1" / "scores.csv", 10)
+    _write(root / "t1" / "details.parquet", 100)
+    _write(root / "t1" / "details.csv", 300)
+    _write(root / "t1" / "negotiations" / "n1.parquet", 50)
+    return root
+
+
+def _touch_later(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestStorageLedger:
+    """Test recording, persistence and reconciliation."""
+
+    def test_scan(self, root):
+        entry = StorageLedger.scan(root / "t1")
+
+        assert entry["size_bytes"] == 460
+        assert entry["n_files"] == 4
+        assert entry["file_breakdown"][".parquet"] == {"count": 2, "size_bytes": 150}
+        assert entry["redundant"] == {"count": 1, "size_bytes": 300}
+
+    def test_record_persists(self, root):
+        StorageLedger.record(root, "t1")
+        storage_ledger._LEDGERS.clear()  # Read back from disk
+
+        summary = StorageLedger.summary(root)
+        assert summary["count"] == 1
+        assert summary["total_size_bytes"] == 460
+
+        StorageLedger.forget(root, "t1")
+        assert StorageLedger.summary(root)["count"] == 0
+
+    def test_reconcile_new_changed_and_deleted(self, root):
+        StorageLedger.record(root, "t1")
+        _write(root / "t2" / "scores.csv", 5)
+        _write(root / "t1" / "all_scores.csv", 40)
+        _touch_later(root / "t1")
+
+        assert sorted(StorageLedger.stale(root)[0]) == ["t1", "t2"]
+        assert StorageLedger.reconcile(root) == 2
+        assert StorageLedger.stale(root) == ([], [])
+        assert StorageLedger.summary(root)["total_size_bytes"] == 505
+
+        (root / "t2" / "scores.csv").unlink()
+        (root / "t2").rmdir()
+        assert StorageLedger.stale(root) == ([], ["t2"])
+        StorageLedger.reconcile(root)
+        assert StorageLedger.summary(root)["count"] == 1
+
+    def test_nested_changes_are_stale(self, root):
+        _write(root / "t1" / "metadata.yaml", 5)
+        StorageLedger.record(root, "t1")
+        assert StorageLedger.stale(root) == ([], [])
+
+        # A file added inside a subdirectory
+        _write(root / "t1" / "negotiations" / "n2.parquet", 20)
+        _touch_later(root / "t1" / "negotiations")
+        assert StorageLedger.stale(root)[0] == ["t1"]
+        StorageLedger.reconcile(root)
+        assert StorageLedger.summary(root)["total_size_bytes"] == 485
+
+        # A top-level file rewritten in place
+        _write(root / "t1" / "metadata.yaml", 7)
+        _touch_later(root / "t1" / "metadata.yaml")
+        assert StorageLedger.stale(root)[0] == ["t1"]
+
+    def test_changes_appended_and_folded(self, root, monkeypatch):
+        monkeypatch.setattr(storage_ledger, "MIN_LOG_LINES", 4)
+        for name in ("t2", "t3"):
+            _write(root / name / "scores.csv", 1)
+        StorageLedger.record(root, "t1")
+        StorageLedger.record(root, "t2")
+        StorageLedger.forget(root, "t2")
+        # Appended to the log, the ledger is not rewritten
+        assert not (root / storage_ledger.LEDGER_FILE).exists()
+        assert len((root / storage_ledger.LOG_FILE).read_text().splitlines()) == 3
+
+        StorageLedger.record(root, "t3")
+        assert (root / storage_ledger.LEDGER_FILE).exists()
+        assert not (root / storage_ledger.LOG_FILE).exists()
+        StorageLedger.record(root, "t2")
+
+        storage_ledger._LEDGERS.clear()  # Read back from disk
+        assert sorted(StorageLedger.entries(root)) == ["t1", "t2", "t3"]
+        assert StorageLedger.summary(root)["total_size_bytes"] == 462
+
+
+class TestTournamentStorageStats:
+    """Test that tournament stats are served from the ledger."""
+
+    def test_stats_from_ledger(self, root, monkeypatch):
+        monkeypatch.setattr(TournamentStorageService, "TOURNAMENTS_DIR", root)
+        _write(root / "not-a-tournament" / "notes.txt", 1000)
+
+        stats = TournamentStorageService.get_storage_stats(refresh=True)
+
+        assert stats["total_tournaments"] == 1
+        assert stats["total_size_bytes"] == 460
+        assert stats["redundant_files"] == {"count": 1, "size_bytes": 300}
+        assert stats["pending"] == 0
+
+        # Cleanup removes the redundant CSV and updates the ledger
+        TournamentStorageService.cleanup_tournament_storage("t1")
+        stats = TournamentStorageService.get_storage_stats()
+        assert stats["total_size_bytes"] == 160
+        assert stats["redundant_files"]["count"] == 0
@@ -0,0 +1,296 @@
+"""Tests for the parameter sweep runner."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from negmas_app.models.negotiator import NegotiatorConfig
+from negmas_app.models.session import NegotiationSession, SessionStatus
+from negmas_app.models.sweep import (
+    SweepConfig,
+    SweepDimension,
+    SweepPoint,
+    SweepRunResult,
+)
+from negmas_app.services import negotiation_storage, sweep_runner
+from negmas_app.services.negotiation_storage import NegotiationStorageService
+from negmas_app.services.sweep_runner import SweepRunner, summarize_point
+
+
+def _base_config(scenario_path: str = "unused", **kwargs) -> SweepConfig:
+    return SweepConfig(
+        scenario_path=scenario_path,
+        negotiator_configs=[
+            NegotiatorConfig(type_name="negmas.sao.AspirationNegotiator", name="A"),
+            NegotiatorConfig(type_name="negmas.sao.AspirationNegotiator", name="B"),
+        ],
+        mechanism_params={"n_steps": 20},
+        **kwargs,
+    )
+
+
+class TestSweepPoints:
+    """Test expansion of sweep dimensions into points."""
+
+    def test_grid_cartesian_product(self):
+        """Grid mode should take the product of all dimension values."""
+        config = _base_config(
+            dimensions=[
+                SweepDimension(target="mechanism", name="n_steps", values=[10, 20]),
+                SweepDimension(
+                    target="mechanism",
+                    name="time_limit",
+                    min_value=1.0,
+                    max_value=3.0,
+                    n_values=3,
+                ),
+            ]
+        )
+
+        points = SweepRunner.generate_points(config)
+
+        assert len(points) == 6
+        assert points[0].values == {"n_steps": 10, "time_limit": 1.0}
+        assert points[-1].values == {"n_steps": 20, "time_limit": 3.0}
+
+    def test_int_range_deduplicated(self):
+        """Integer ranges that collapse to the same values should not repeat."""
+        config = _base_config(
+            dimensions=[
+                SweepDimension(
+                    target="mechanism",
+                    name="n_steps",
+                    min_value=1,
+                    max_value=2,
+                    n_values=5,
+                )
+            ]
+        )
+
+        points = SweepRunner.generate_points(config)
+
+        assert [p.values["n_steps"] for p in points] == [1, 2]
+
+    def test_random_mode_is_seeded(self):
+        """Random mode should draw n_samples reproducible points within range."""
+        dims = [
+            SweepDimension(
+                target="mechanism", name="time_limit", min_value=1.0, max_value=10.0
+            )
+        ]
+        a = SweepRunner.generate_points(
+            _base_config(dimensions=dims, mode="random", n_samples=7, search_seed=3)
+        )
+        b = SweepRunner.generate_points(
+            _base_config(dimensions=dims, mode="random", n_samples=7, search_seed=3)
+        )
+
+        assert len(a) == 7
+        assert [p.values for p in a] == [p.values for p in b]
+        assert all(1.0 <= p.values["time_limit"] <= 10.0 for p in a)
+
+    def test_negotiator_param_uses_inspected_type(self):
+        """Negotiator parameter types should come from parameter_inspector."""
+        config = _base_config(
+            dimensions=[
+                SweepDimension(
+                    target="negotiator",
+                    name="tolerance",
+                    negotiator_index=0,
+                    values=["0.1", 0.2],
+                )
+            ]
+        )
+
+        points = SweepRunner.generate_points(config)
+
+        assert [p.values["0.tolerance"] for p in points] == [0.1, 0.2]
+        mechanism_params, configs = SweepRunner.apply_point(config, points[1])
+        assert configs[0].params == {"tolerance": 0.2}
+        assert config.negotiator_configs[0].params == {}
+        assert mechanism_params == {"n_steps": 20}
+
+    def test_invalid_dimensions_rejected(self):
+        """Unknown parameters and missing ranges should raise ValueError."""
+        with pytest.raises(ValueError):
+            SweepRunner.generate_points(
+                _base_config(
+                    dimensions=[
+                        SweepDimension(
+                            target="negotiator",
+                            name="no_such_param",
+                            negotiator_index=0,
+                            values=[1],
+                        )
+                    ]
+                )
+            )
+        with pytest.raises(ValueError):
+            SweepRunner.generate_points(
+                _base_config(
+                    dimensions=[SweepDimension(target="mechanism", name="n_steps")]
+                )
+            )
+
+    def test_config_not_modified(self):
+        """Resolving the dimensions should not change the caller's config."""
+        dimension = SweepDimension(target="mechanism", name="n_steps", values=["5"])
+        config = _base_config(dimensions=[dimension])
+
+        assert SweepRunner.generate_points(config)[0].values == {"n_steps": 5}
+        assert config.dimensions == [dimension]
+        assert dimension.ui_type is None and dimension.values == ["5"]
+
+    def test_oversized_sweep_rejected(self, monkeypatch):
+        """Sweeps with more runs than MAX_SWEEP_RUNS should raise ValueError."""
+        monkeypatch.setattr(sweep_runner, "MAX_SWEEP_RUNS", 8)
+        dims = [
+            SweepDimension(target="mechanism", name="n_steps", values=[1, 2]),
+            SweepDimension(target="mechanism", name="time_limit", values=[1, 2]),
+        ]
+        assert len(SweepRunner.generate_points(_base_config(dimensions=dims))) == 4
+        with pytest.raises(ValueError, match="at most 8"):
+            SweepRunner.generate_points(_base_config(dimensions=dims, seeds=[0, 1, 2]))
+        with pytest.raises(ValueError):
+            SweepRunner.generate_points(
+                _base_config(dimensions=dims[:1], mode="random", n_samples=9)
+            )
+
+
+class TestSweepSummary:
+    """Test per-point aggregation."""
+
+    def test_summarize_point(self):
+        """Aggregates should ignore failed runs."""
+        point = SweepPoint(index=0, values={"n_steps": 10})
+        results = [
+            SweepRunResult(
+                point_index=0,
+                seed=0,
+                utilities=[0.8, 0.4],
+                welfare=1.2,
+                n_steps=5,
+                end_reason="agreement",
+            ),
+            SweepRunResult(
+                point_index=0,
+                seed=1,
+                utilities=[0.0, 0.0],
+                welfare=0.0,
+                n_steps=10,
+                end_reason="timedout",
+            ),
+            SweepRunResult(point_index=0, seed=2, end_reason="error", error="boom"),
+        ]
+
+        summary = summarize_point(point, results)
+
+        assert summary.n_runs == 3
+        assert summary.n_errors == 1
+        assert summary.agreement_rate == 0.5
+        assert summary.mean_utilities == pytest.approx([0.4, 0.2])
+        assert summary.mean_welfare == pytest.approx(0.6)
+        assert summary.mean_steps == 7.5
+
+
+class TestSweepRun:
+    """Test running a sweep end to end."""
+
+    async def test_run_stream(self, sample_scenario_path):
+        """Should stream one run event per point and seed and a final table."""
+        if sample_scenario_path is None:
+            pytest.skip("No sample scenario available")
+
+        config = _base_config(
+            sample_scenario_path,
+            dimensions=[
+                SweepDimension(target="mechanism", name="n_steps", values=[5, 10])
+            ],
+            seeds=[0, 1],
+            max_workers=1,
+        )
+
+        events = [event async for event in SweepRunner.run_stream(config)]
+
+        types = [t for t, _ in events]
+        assert types[0] == "init"
+        assert types[-1] == "complete"
+        assert types.count("run") == 4
+        table = events[-1][1]["table"]
+        assert [row.n_runs for row in table] == [2, 2]
+        assert all(row.n_errors == 0 for row in table)
+
+    async def test_failed_runs_reported_and_bounded(self, monkeypatch):
+        """At most max_workers runs are in flight; failed workers give errors."""
+        lock = threading.Lock()
+        counts = {"submitted": 0, "finished": 0, "max_in_flight": 0}
+
+        def run(*args):
+            point_index, seed = args[-2:]
+            time.sleep(0.01)
+            with lock:
+                counts["finished"] += 1
+            if seed == 1:
+                raise RuntimeError("worker died")
+            return SweepRunResult(point_index, seed, end_reason="agreement")
+
+        class Executor(ThreadPoolExecutor):
+            def __init__(self, max_workers, mp_context=None):
+                super().__init__(max_workers)
+
+            def submit(self, fn, *args):
+                with lock:
+                    counts["submitted"] += 1
+                    in_flight = counts["submitted"] - counts["finished"]
+                    counts["max_in_flight"] = max(counts["max_in_flight"], in_flight)
+                return super().submit(fn, *args)
+
+        monkeypatch.setattr(sweep_runner, "_run_sweep_point", run)
+        monkeypatch.setattr(sweep_runner, "ProcessPoolExecutor", Executor)
+        config = _base_config(
+            dimensions=[
+                SweepDimension(target="mechanism", name="n_steps", values=[1, 2, 3])
+            ],
+            seeds=[0, 1],
+            max_workers=2,
+        )
+
+        events = [event async for event in SweepRunner.run_stream(config)]
+
+        assert counts["submitted"] == 6
+        assert counts["max_in_flight"] <= 2
+        errors = [r for t, r in events if t == "run" and r.end_reason == "error"]
+        assert sorted((r.point_index, r.error) for r in errors) == [
+            (i, "worker died") for i in range(3)
+        ]
+        assert [row.n_errors for row in events[-1][1]["table"]] == [1, 1, 1]
+
+
+class TestSweepFromSaved:
+    """Test sweeping a saved negotiation."""
+
+    def test_share_ufuns_round_trip(self, tmp_path, monkeypatch):
+        """share_ufuns should be saved and used by sweeps of the negotiation."""
+        monkeypatch.setattr(negotiation_storage, "NEGOTIATIONS_DIR", tmp_path)
+        configs = _base_config().negotiator_configs
+        session = NegotiationSession(
+            id="shared",
+            status=SessionStatus.COMPLETED,
+            scenario_path="some/scenario",
+            scenario_name="scenario",
+        )
+        for share_ufuns in (True, False):
+            NegotiationStorageService.save_negotiation(
+                session,
+                configs,
+                None,
+                {"normalize": True, "share_ufuns": share_ufuns},
+                {"generate_previews": False, "save_scenario": False},
+            )
+            run_config = NegotiationStorageService.load_run_config("shared")
+            assert run_config["share_ufuns"] is share_ufuns
+            assert run_config["scenario_options"]["normalize"] is True
+
+            config = SweepRunner.config_from_saved("shared", seeds=[0])
+            assert config.share_ufuns is share_ufuns
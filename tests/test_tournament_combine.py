@@ -0,0 +1,201 @@
+"""Tests for combining saved tournaments."""
+
+import os
+
+import pandas as pd
+import pytest
+import yaml
+
+from negmas_app.services import tournament_combiner
+from negmas_app.services.tournament_combiner import TournamentCombiner, discover
+from negmas_app.services.tournament_storage import TournamentStorageService
+
+
+def _make_tournament(path, scenario, fmt="csv", utility_type=float, n=2):
+    """Write a small complete tournament as negmas saves it."""
+    path.mkdir(parents=True)
+    details = pd.DataFrame(
+        {
+            "scenario": [scenario] * n,
+            "partners": ["('A', 'B')"] * n,
+            "run_id": [f"{path.name}_{i}" for i in range(n)],
+            "n_steps": list(range(n)),
+        }
+    )
+    scores = pd.DataFrame(
+        {
+            "strategy": ["A", "B"] * n,
+            "utility": [utility_type(i % 2) for i in range(2 * n)],
+            "advantage": [0.5 + 0.1 * (i % 2) for i in range(2 * n)],
+            "scenario": [scenario] * (2 * n),
+        }
+    )
+    for df, name in ((details, "details"), (scores, "all_scores")):
+        if fmt == "parquet":
+            df.reset_index().to_parquet(path / f"{name}.parquet", index=False)
+        else:
+            df.to_csv(path / f"{name}.csv", index_label="index")
+    pd.DataFrame({"strategy": ["A", "B"], "score": [0.5, 0.6]}).to_csv(
+        path / "scores.csv", index_label="index"
+    )
+    (path / "config.yaml").write_text(
+        yaml.dump({"competitors": ["A", "B"], "n_repetitions": 1})
+    )
+    (path / "scenarios" / scenario).mkdir(parents=True)
+    (path / "scenarios" / scenario / "domain.yml").write_text("issues: []\n")
+    (path / "results").mkdir()
+    for run_id in details["run_id"]:
+        (path / "results" / f"{run_id}.json").write_text("{}")
+    return path
+
+
+class TestDiscover:
+    """Test finding tournaments with a single walk."""
+
+    def test_finds_nested_tournaments(self, tmp_path):
+        first = _make_tournament(tmp_path / "a" / "t1", "S1")
+        second = _make_tournament(tmp_path / "b" / "c" / "t2", "S2")
+        # Incomplete: only a config
+        (tmp_path / "b" / "t3").mkdir()
+        (tmp_path / "b" / "t3" / "config.yaml").write_text("{}")
+        # Not searched: inside a tournament
+        _make_tournament(first / "scenarios" / "nested", "S3")
+
+        assert discover([tmp_path]) == [first, second, tmp_path / "b" / "t3"]
+        assert discover([tmp_path], complete_only=True) == [first, second]
+        assert discover([tmp_path], recursive=False) == []
+        assert discover([first, first], recursive=False) == [first]
+
+
+class TestCombine:
+    """Test merging results and artifacts."""
+
+    def test_merges_mixed_formats(self, tmp_path):
+        sources = [
+            _make_tournament(tmp_path / "src" / "t1", "S1", "csv", int, n=2),
+            _make_tournament(tmp_path / "src" / "t2", "S2", "parquet", float, n=3),
+        ]
+        events = []
+
+        combined = TournamentCombiner.combine(
+            sources, tmp_path / "out", workers=2, progress=events.append
+        )
+
+        details = pd.read_parquet(tmp_path / "out" / "details.parquet")
+        scores = pd.read_parquet(tmp_path / "out" / "all_scores.parquet")
+        assert combined.n_negotiations == len(details) == 5
+        assert list(details["index"]) == list(range(5))
+        assert list(details["tournament"]) == ["t1"] * 2 + ["t2"] * 3
+        assert combined.scenarios == {"S1", "S2"}
+        assert combined.competitors == {"A", "B"}
+        assert len(scores) == 10 and scores["utility"].dtype == "float64"
+        assert combined.config["n_scenarios"] == 2
+        final = pd.read_csv(tmp_path / "out" / "scores.csv")
+        assert list(final["strategy"]) == ["B", "A"]
+        assert (tmp_path / "out" / "type_scores.csv").exists()
+        assert {e["phase"] for e in events} == {"read", "write", "scores"}
+        assert not (tmp_path / "out" / "results").exists()
+
+    def test_hardlinks_artifacts(self, tmp_path):
+        sources = [
+            _make_tournament(tmp_path / "t1", "Shared"),
+            _make_tournament(tmp_path / "t2", "Shared"),
+        ]
+
+        combined = TournamentCombiner.combine(sources, tmp_path / "out", copy=True)
+
+        out = tmp_path / "out"
+        assert len(os.listdir(out / "results")) == 4
+        assert os.listdir(out / "scenarios") == ["Shared"]
+        # Same file, no second copy on disk
+        src = sources[0] / "results" / "t1_0.json"
+        assert os.stat(src).st_ino == os.stat(out / "results" / "t1_0.json").st_ino
+        assert combined.artifacts["linked"] == 5
+        assert combined.artifacts["copied"] == 0
+        assert combined.artifacts["skipped"] == 1
+
+    def test_streams_parquet_details(self, tmp_path, monkeypatch):
+        sources = [
+            _make_tournament(tmp_path / "t1", "S1", "parquet", n=5),
+            _make_tournament(tmp_path / "t2", "S2", "csv", n=3),
+        ]
+        monkeypatch.setattr(tournament_combiner, "BATCH_ROWS", 2)
+        read = []
+        read_table = tournament_combiner._read_table
+        monkeypatch.setattr(
+            tournament_combiner,
+            "_read_table",
+            lambda path: read.append(path.name) or read_table(path),
+        )
+
+        combined = TournamentCombiner.combine(sources, tmp_path / "out")
+
+        details = pd.read_parquet(tmp_path / "out" / "details.parquet")
+        assert combined.n_negotiations == 8
+        assert list(details["index"]) == list(range(8))
+        assert list(details["n_steps"]) == [0, 1, 2, 3, 4, 0, 1, 2]
+        # Parquet details are streamed, CSV ones parsed for the schema and again
+        assert "details.parquet" not in read
+        assert read.count("details.csv") == 2
+
+    def test_renames_different_scenarios_of_same_name(self, tmp_path):
+        sources = [
+            _make_tournament(tmp_path / "t1", "Shared"),
+            _make_tournament(tmp_path / "t2", "Shared"),
+            _make_tournament(tmp_path / "t3", "Shared"),
+        ]
+        (sources[1] / "scenarios" / "Shared" / "domain.yml").write_text("x: 1\n")
+        # Cached stats do not make a scenario different
+        (sources[2] / "scenarios" / "Shared" / "_stats.yaml").write_text("{}\n")
+
+        combined = TournamentCombiner.combine(sources, tmp_path / "out", copy=True)
+
+        out = tmp_path / "out"
+        assert sorted(os.listdir(out / "scenarios")) == ["N1Shared", "Shared"]
+        assert (out / "scenarios" / "N1Shared" / "domain.yml").read_text() == "x: 1\n"
+        assert combined.scenarios == {"Shared", "N1Shared"}
+        details = pd.read_parquet(out / "details.parquet")
+        assert list(details["scenario"]) == ["Shared"] * 2 + ["N1Shared"] * 2 + [
+            "Shared"
+        ] * 2
+        scores = pd.read_parquet(out / "all_scores.parquet")
+        assert set(scores[scores["tournament"] == "t2"]["scenario"]) == {"N1Shared"}
+
+
+class TestCombineService:
+    """Test the storage service entry point."""
+
+    @pytest.fixture
+    def storage(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            TournamentStorageService, "TOURNAMENTS_DIR", tmp_path / "tournaments"
+        )
+        return tmp_path
+
+    def test_combines_saved_tournaments(self, storage):
+        _make_tournament(storage / "tournaments" / "t1", "S1")
+        _make_tournament(storage / "tournaments" / "t2", "S2", "parquet")
+
+        result = TournamentStorageService.combine_tournaments(
+            tournament_ids=["t1", "t2", "missing"], output_name="both"
+        )
+
+        assert result.success, result.error
+        assert result.n_tournaments == 2
+        assert result.n_negotiations == 4
+        assert result.n_scenarios == 2
+        out = storage / "tournaments" / result.output_id
+        config = yaml.safe_load((out / "config.yaml").read_text())
+        assert config["combined"] and len(config["combined_from"]) == 2
+
+    def test_rejects_different_competitors(self, storage):
+        _make_tournament(storage / "tournaments" / "t1", "S1")
+        other = _make_tournament(storage / "tournaments" / "t2", "S2")
+        (other / "config.yaml").write_text(yaml.dump({"competitors": ["C"]}))
+
+        result = TournamentStorageService.combine_tournaments(
+            tournament_ids=["t1", "t2"]
+        )
+
+        assert not result.success
+        assert "different competitors" in result.error
@@ -0,0 +1,104 @@
+"""Tests for the array-backed tournament grid."""
+
+import base64
+import zlib
+
+import numpy as np
+
+from negmas_app.models.tournament import NegotiationEndReason
+from negmas_app.services.tournament_grid import (
+    COMPLETE,
+    PENDING,
+    RUNNING,
+    TournamentGrid,
+    split_rotation,
+)
+
+
+def _decode(data, dtype, shape):
+    raw = zlib.decompress(base64.b64decode(data))
+    return np.frombuffer(raw, dtype=np.dtype(dtype).newbyteorder("<")).reshape(shape)
+
+
+def _grid(n_repetitions=2):
+    return TournamentGrid(
+        ["Competitor 1", "Competitor 2"],
+        ["Competitor 1", "Competitor 2"],
+        ["Laptop", "Camera"],
+        n_repetitions=n_repetitions,
+        rotate_ufuns=True,
+    )
+
+
+class TestTournamentGrid:
+    """Test indexing, recording and snapshots."""
+
+    def test_split_rotation(self):
+        assert split_rotation("Laptop-1") == ("Laptop", True)
+        assert split_rotation("Laptop-0") == ("Laptop-0", False)
+        assert split_rotation("my-domain") == ("my-domain", False)
+
+    def test_locates_with_negmas_names(self):
+        grid = _grid()
+        grid.set_names(["A", "B"], [])
+
+        assert grid.opponents == ["A", "B"]
+        assert grid.locate(["B", "A"], "Camera-1") == (1, 0, 1, True)
+        assert grid.locate(["A", "B"], "Laptop") == (0, 1, 0, False)
+        # Unknown names fall back to the first row/column/scenario
+        assert grid.locate(["X", "Y"], "Other") == (0, 0, 0, False)
+
+    def test_records_runs_in_slots(self):
+        grid = _grid()
+        assert grid.mark_running(0, 1, 0, False) == 0
+        assert grid.mark_running(0, 1, 0, False) == 1
+        assert list(grid.status[0, 1, 0, :, 0]) == [RUNNING, RUNNING]
+
+        grid.record(0, 1, 0, False, NegotiationEndReason.AGREEMENT, [0.5, 0.7], 12)
+        assert list(grid.status[0, 1, 0, :, 0]) == [COMPLETE, RUNNING]
+        grid.record(0, 1, 0, False, NegotiationEndReason.TIMEOUT, None, 100)
+        grid.record(0, 1, 0, True, NegotiationEndReason.BROKEN, [0.1, None], 3)
+
+        assert grid.n_completed == 3
+        np.testing.assert_allclose(grid.utilities[0, 1, 0, 0, 0], [0.5, 0.7])
+        assert np.isnan(grid.utilities[0, 1, 0, 0, 1, 1])
+        assert grid.status[1, 1, 1].tolist() == [[PENDING] * 2] * 2
+        states = grid.cell_states()
+        assert list(states) == ["Competitor 1::Competitor 2::Laptop"]
+        assert states["Competitor 1::Competitor 2::Laptop"] == {
+            "status": "running",
+            "total": 4,
+            "completed": 3,
+            "agreements": 1,
+            "timeouts": 1,
+            "errors": 1,
+            "running": 0,
+        }
+
+        grid.record(0, 1, 0, True, NegotiationEndReason.TIMEOUT)
+        assert grid.cell_states()["Competitor 1::Competitor 2::Laptop"]["status"] == (
+            "error"
+        )
+        # Extra runs (e.g. a continued tournament) grow the repetition axis
+        grid.record(0, 1, 0, True, NegotiationEndReason.AGREEMENT)
+        assert grid.shape == (2, 2, 2, 4, 2) and grid.n_completed == 5
+
+    def test_snapshot_round_trip(self):
+        grid = _grid(n_repetitions=1)
+        grid.set_names(["A", "B"], ["A", "B"])
+        grid.record(1, 0, 1, True, NegotiationEndReason.AGREEMENT, [0.25, 1.0], 7)
+
+        snapshot = grid.snapshot()
+
+        shape = tuple(snapshot.shape)
+        assert shape == (2, 2, 2, 1, 2) and snapshot.n_completed == 1
+        assert snapshot.competitors == ["A", "B"]
+        status = _decode(snapshot.status, np.int8, shape)
+        reasons = _decode(snapshot.end_reason, np.int8, shape)
+        utilities = _decode(snapshot.utilities, np.float32, (*shape, 2))
+        n_steps = _decode(snapshot.n_steps, np.int32, shape)
+        assert snapshot.status_codes[status[1, 0, 1, 0, 1]] == "complete"
+        assert (status == PENDING).sum() == status.size - 1
+        assert snapshot.end_reason_codes[reasons[1, 0, 1, 0, 1]] == "agreement"
+        assert utilities[1, 0, 1, 0, 1].tolist() == [0.25, 1.0]
+        assert n_steps[1, 0, 1, 0, 1] == 7
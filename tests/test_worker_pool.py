@@ -0,0 +1,189 @@
+"""Tests for the warm worker pool shared by tournaments."""
+
+import copyreg
+import os
+import time
+from pathlib import Path
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+
+import cloudpickle
+import pebble
+import pytest
+from negmas.inout import Scenario
+
+from negmas_app.models.tournament import (
+    TournamentConfig,
+    TournamentProgress,
+    TournamentStatus,
+)
+from negmas_app.services import concurrency_controller, worker_pool
+from negmas_app.services.concurrency_controller import ConcurrencyController
+from negmas_app.services.tournament_manager import TournamentManager
+from negmas_app.services.worker_pool import WorkerPool
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        # Only what the tests need, to start quickly
+        monkeypatch.setattr(worker_pool, "PRELOAD_MODULES", ((None, "negmas.sao"),))
+        pool = WorkerPool(workers=1, max_tasks=0)
+        pool.start().result(timeout=120)
+    yield pool
+    pool.shutdown()
+
+
+class TestWorkerPool:
+    """Test routing negmas' pools to the warm pool."""
+
+    def test_lease_routes_pebble_pools(self, pool):
+        with pool.lease():
+            with pebble.ProcessPool(max_workers=1) as lease:
+                assert isinstance(lease, worker_pool._Lease)
+                futures = [lease.schedule(time.sleep, args=(0.2,)) for _ in range(3)]
+                # One task at a time for a single-worker call
+                assert len(lease._running) == 1 and len(lease._waiting) == 2
+                assert [f.result(timeout=60) for f in futures] == [None] * 3
+                pids = {lease.schedule(os.getpid).result(timeout=60) for _ in range(4)}
+            assert pids <= set(pool._pool._pool_manager.worker_manager.workers)
+
+        # Patched only while a lease is active
+        assert pebble.ProcessPool is worker_pool._pebble_pool
+        assert Scenario not in copyreg.dispatch_table
+        outside = pebble.ProcessPool(max_workers=1)
+        outside.stop()
+        outside.join()
+
+    def test_timeouts_and_stop(self, pool):
+        with pool.lease():
+            with pebble.ProcessPool(max_workers=2) as lease:
+                slow = lease.schedule(time.sleep, args=(30,), timeout=0.5)
+                with pytest.raises(FuturesTimeoutError):
+                    slow.result(timeout=60)
+                waiting = [lease.schedule(time.sleep, args=(30,)) for _ in range(3)]
+                lease.stop()
+                assert waiting[-1].cancelled()
+                with pytest.raises(RuntimeError):
+                    lease.schedule(os.getpid)
+        # The pool replaced the terminated workers
+        assert pool.schedule(os.getpid).result(timeout=60) > 0
+
+    def test_controller_limits_lease(self, pool, monkeypatch):
+        monkeypatch.setattr(concurrency_controller, "system_memory", lambda: None)
+        controller = ConcurrencyController(3, cores=1)
+        with pool.lease(), pool.controlled(controller):
+            with pebble.ProcessPool(max_workers=1) as lease:
+                futures = [lease.schedule(time.sleep, args=(0.2,)) for _ in range(4)]
+                assert len(lease._running) == 1
+                assert futures[0].result(timeout=60) is None
+                # Sleeping uses no CPU: as many as the controller allows
+                assert controller.workers == 3
+                assert len(lease._running) == 3
+                assert [f.result(timeout=60) for f in futures] == [None] * 4
+                # Failed negotiations are measured as well
+                with pytest.raises(ValueError):
+                    lease.schedule(int, args=("x",)).result(timeout=60)
+        assert controller.n_runs == 5
+        assert worker_pool._local.controller is None
+
+    def test_scenarios_are_spooled(self, pool, sample_scenario_path):
+        if sample_scenario_path is None:
+            pytest.skip("No sample scenarios available")
+        from negmas_app.services.scenario_loader import ScenarioLoader
+
+        scenario = ScenarioLoader().load_scenario(sample_scenario_path)
+        plain = cloudpickle.dumps(scenario)
+
+        with pool.lease():
+            spool = worker_pool._local.spool
+            first = cloudpickle.dumps([scenario])
+            second = cloudpickle.dumps([scenario])
+            assert len(first) < len(plain) and first == second
+            assert len(os.listdir(spool.directory)) == 1
+            loaded = cloudpickle.loads(first)[0]
+            assert loaded is not scenario
+            assert loaded.outcome_space.cardinality == (
+                scenario.outcome_space.cardinality
+            )
+        assert not spool.directory.exists()
+        assert cloudpickle.dumps(scenario) == plain
+
+
+def _smallest(paths, n):
+    """The n scenarios with the smallest files (some have huge outcome spaces)."""
+    return sorted(
+        paths, key=lambda p: sum(f.stat().st_size for f in Path(p).rglob("*"))
+    )[:n]
+
+
+class TestTournamentsUsePool:
+    """Test running tournaments on the manager's pool."""
+
+    @pytest.mark.asyncio
+    async def test_tournaments_reuse_workers(
+        self, pool, sample_scenario_paths, monkeypatch
+    ):
+        if len(sample_scenario_paths) < 2:
+            pytest.skip("No sample scenarios available")
+        scheduled = []
+        schedule = pool.schedule
+        monkeypatch.setattr(
+            pool, "schedule", lambda *args: scheduled.append(args) or schedule(*args)
+        )
+        manager = TournamentManager()
+        manager.worker_pool = pool
+        pools = []
+        for _ in range(2):
+            session = manager.create_session(
+                TournamentConfig(
+                    competitor_types=[
+                        "negmas.sao.AspirationNegotiator",
+                        "negmas.sao.NaiveTitForTatNegotiator",
+                    ],
+                    scenario_paths=_smallest(sample_scenario_paths, 2),
+                    n_repetitions=1,
+                    rotate_ufuns=False,
+                    n_steps=10,
+                    njobs=2,
+                )
+            )
+            events = [e async for e in manager.run_tournament_stream(session.id)]
+            assert events[-1].status == TournamentStatus.COMPLETED
+            assert events[-1].results.total_negotiations == 8
+            assert events[-1].results.final_scores
+            pools.append(pool._pool)
+
+        # Every negotiation ran in the pool (none fell back to this process)
+        assert len(scheduled) == 16
+        assert pools[0] is not None and pools[0] is pools[1]
+
+    @pytest.mark.asyncio
+    async def test_adaptive_njobs(self, pool, sample_scenario_paths):
+        if len(sample_scenario_paths) < 2:
+            pytest.skip("No sample scenarios available")
+        manager = TournamentManager()
+        manager.worker_pool = pool
+        session = manager.create_session(
+            TournamentConfig(
+                competitor_types=[
+                    "negmas.sao.AspirationNegotiator",
+                    "negmas.sao.NaiveTitForTatNegotiator",
+                ],
+                scenario_paths=_smallest(sample_scenario_paths, 2),
+                n_repetitions=1,
+                rotate_ufuns=False,
+                n_steps=10,
+                adaptive_njobs=True,
+                memory_limit_mb=100_000,
+            )
+        )
+        events = [e async for e in manager.run_tournament_stream(session.id)]
+
+        assert events[-1].status == TournamentStatus.COMPLETED
+        assert events[-1].results.total_negotiations == 8
+        progress = [e for e in events if isinstance(e, TournamentProgress)]
+        assert progress[-1].completed == 8
+        assert progress[-1].workers == 1 and progress[-1].workers_reason
+        controller = manager._tournament_states[session.id].concurrency
+        assert controller is not None and controller.n_runs == 8
+        assert controller.memory_limit == 100_000 * 1024 * 1024
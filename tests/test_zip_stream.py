@@ -0,0 +1,52 @@
+"""Tests for streaming ZIP archives."""
+
+import io
+import zipfile
+
+import pandas as pd
+
+from negmas_app.services.zip_stream import directory_entries, stream_zip
+
+
+def _read_zip(chunks) -> zipfile.ZipFile:
+    return zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+
+
+class TestStreamZip:
+    """Test building archives incrementally."""
+
+    def test_yields_while_writing(self):
+        """Chunks are produced per entry, before the archive is complete."""
+        entries = [(f"f{i}.bin", [bytes([i]) * 100_000]) for i in range(3)]
+
+        chunks = list(stream_zip(entries, compression=zipfile.ZIP_STORED))
+
+        assert len(chunks) > 3
+        zf = _read_zip(chunks)
+        assert zf.testzip() is None
+        assert zf.read("f2.bin") == b"\x02" * 100_000
+
+    def test_converts_parquet_to_csv(self, tmp_path):
+        """Parquet offers become the same CSV pandas writes, in row batches."""
+        session = tmp_path / "session"
+        (session / "sub").mkdir(parents=True)
+        df = pd.DataFrame({"step": range(120_000), "offer": ["(1, 2)"] * 120_000})
+        df.to_parquet(session / "offers.parquet")
+        (session / "sub" / "run.yaml").write_text("a: 1\n")
+        (session / "broken.parquet").write_bytes(b"not parquet")
+
+        zf = _read_zip(
+            stream_zip(
+                directory_entries(
+                    session, csv_from_parquet={"offers.parquet", "broken.parquet"}
+                )
+            )
+        )
+
+        assert sorted(zf.namelist()) == [
+            "session/broken.parquet",
+            "session/offers.csv",
+            "session/sub/run.yaml",
+        ]
+        assert zf.read("session/offers.csv") == df.to_csv(index=False).encode()
+        assert zf.read("session/broken.parquet") == b"not parquet"